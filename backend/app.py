@@ -41,18 +41,66 @@ jwt = JWTManager(app)
 # JSON 인코딩 설정 (한글 지원)
 app.config['JSON_AS_ASCII'] = False
 
+# 응답 인코더 (orjson이 있으면 사용, Accept: application/x-msgpack 요청 시 MessagePack)
+from app.services.encoding import FastJSONProvider
+app.json_provider_class = FastJSONProvider
+app.json = FastJSONProvider(app)
+
 # 파일 업로드 설정
 app.config['MAX_CONTENT_LENGTH'] = 16 * 1024 * 1024  # 16MB
 
+# 카탈로그 캐시 설정 (memory 또는 redis)
+app.config['CATALOG_CACHE_BACKEND'] = os.getenv('CATALOG_CACHE_BACKEND', 'memory')
+app.config['CATALOG_CACHE_TTL'] = int(os.getenv('CATALOG_CACHE_TTL', 300))  # 초
+app.config['CATALOG_CACHE_SIZE'] = int(os.getenv('CATALOG_CACHE_SIZE', 1024))
+app.config['REDIS_URL'] = os.getenv('REDIS_URL', 'redis://localhost:6379/0')
+# 웹 워커 수 (gunicorn WEB_CONCURRENCY), 2 이상이면 CATALOG_CACHE_BACKEND=redis 필요
+app.config['WEB_WORKERS'] = int(os.getenv('WEB_CONCURRENCY', 1))
+
+# 카탈로그 변경 피드 설정 (최근 N초 이내 변경은 다음 동기화에 반영)
+app.config['CATALOG_CHANGES_SETTLE_SECONDS'] = int(os.getenv('CATALOG_CHANGES_SETTLE_SECONDS', 2))
+
+# 병렬 하위 조회 설정 (취미 상세 묶음 등, 작업마다 DB 연결을 하나씩 사용)
+app.config['PARALLEL_QUERY_WORKERS'] = int(os.getenv('PARALLEL_QUERY_WORKERS', 4))
+app.config['PARALLEL_QUERY_TIMEOUT'] = int(os.getenv('PARALLEL_QUERY_TIMEOUT', 10))  # 초
+
+# 삭제 데이터 정리 설정 (PURGE_INTERVAL_HOURS가 0이면 앱 안에서 주기 실행하지 않음)
+app.config['PURGE_RETENTION_DAYS'] = int(os.getenv('PURGE_RETENTION_DAYS', 30))
+app.config['PURGE_CHUNK_SIZE'] = int(os.getenv('PURGE_CHUNK_SIZE', 100))
+app.config['PURGE_INTERVAL_HOURS'] = float(os.getenv('PURGE_INTERVAL_HOURS', 0))
+
+# 미디어 메타데이터 수집 설정 (flask media refresh)
+app.config['MEDIA_FETCH_TIMEOUT'] = int(os.getenv('MEDIA_FETCH_TIMEOUT', 10))  # 초
+
+# 모임 회원 수 카운터 설정 (가입/탈퇴 증분을 나누어 기록할 샤드 수, member_count 합산 주기)
+# MEMBER_COUNT_FLUSH_SECONDS를 0으로 두면 앱 안에서 합산하지 않음 (cron에서 flask gatherings flush-member-counts 실행)
+app.config['MEMBER_COUNT_SHARDS'] = int(os.getenv('MEMBER_COUNT_SHARDS', 8))
+app.config['MEMBER_COUNT_FLUSH_SECONDS'] = float(os.getenv('MEMBER_COUNT_FLUSH_SECONDS', 30))
+
+# 취미별로 메모리에 유지할 인기 모임 수 (취미 상세, 추천, 취미별 모임 첫 페이지에 사용)
+app.config['TOP_GATHERINGS_PER_HOBBY'] = int(os.getenv('TOP_GATHERINGS_PER_HOBBY', 20))
+
+# 추천 모임 후보로 취미마다 더 조회할 사용자 지역(시/도)/온라인 모임 수 (회원 수 순)
+app.config['RECOMMENDATION_LOCAL_CANDIDATES'] = int(os.getenv('RECOMMENDATION_LOCAL_CANDIDATES', 50))
+
+# 모임 패싯 집계(지역/모임 유형/취미별 모임 수)를 원본과 맞추는 주기
+# 0이면 앱 안에서 맞추지 않음 (cron에서 flask gatherings rebuild facets 실행)
+app.config['GATHERING_FACETS_REFRESH_SECONDS'] = float(os.getenv('GATHERING_FACETS_REFRESH_SECONDS', 0))
+
 # 모델 임포트 및 DB 초기화
 from app.models import db
 from app.models.user import User, UserProfile, SurveyQuestion, SurveyResponse
-from app.models.hobby import Hobby, UserHobbyRating, Gathering
+from app.models.hobby import Hobby, HobbyKeyword, HobbyMedia, UserHobbyRating, HobbyRecentReview, HobbySegmentRating, ReviewTerm, HobbyRatingStats, Gathering, GatheringMember, GatheringMemberShard, GatheringSchedule, GatheringTerm, GatheringFacetCount
+from app.models.region import Region
 from app.models.admin import AdminUser, AdminActivityLog, UserFeedback, Announcement, UserNotification
 
 db.init_app(app)
 migrate = Migrate(app, db)
 
+# 카탈로그 캐시 초기화
+from app.services.catalog_cache import catalog_cache
+catalog_cache.init_app(app)
+
 # Blueprint 등록
 from app.api.users import users_bp
 from app.api.auth import auth_bp
@@ -69,17 +117,41 @@ app.register_blueprint(hobbies_bp)
 app.register_blueprint(recommendations_bp)
 app.register_blueprint(gatherings_bp)
 
-# 로깅 설정
+# CLI 명령 그룹 등록
+from app.commands.catalog import catalog_cli
+from app.commands.purge import purge_cli
+from app.commands.media import media_cli
+from app.commands.regions import regions_cli
+from app.commands.gatherings import gatherings_cli
+app.cli.add_command(catalog_cli)
+app.cli.add_command(purge_cli)
+app.cli.add_command(media_cli)
+app.cli.add_command(regions_cli)
+app.cli.add_command(gatherings_cli)
+
+# 로깅 설정 (LOG_FILE: 로그 파일 경로, 기본 app.log)
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
     handlers=[
-        logging.FileHandler('app.log', encoding='utf-8'),
+        logging.FileHandler(os.getenv('LOG_FILE', 'app.log'), encoding='utf-8'),
         logging.StreamHandler()
     ]
 )
 logger = logging.getLogger(__name__)
 
+# 삭제 데이터 주기 정리 (설정한 경우)
+from app.services.purge import start_purge_scheduler
+start_purge_scheduler(app)
+
+# 모임 회원 수 주기 합산
+from app.services.membership import start_member_count_flusher
+start_member_count_flusher(app)
+
+# 모임 패싯 집계 주기 보정
+from app.services.facets import start_facet_refresher
+start_facet_refresher(app)
+
 
 # ============================================
 # 에러 핸들러 (예외 처리)
@@ -277,8 +349,20 @@ def make_shell_context():
         'SurveyQuestion': SurveyQuestion,
         'SurveyResponse': SurveyResponse,
         'Hobby': Hobby,
+        'HobbyKeyword': HobbyKeyword,
+        'HobbyMedia': HobbyMedia,
         'UserHobbyRating': UserHobbyRating,
+        'HobbyRecentReview': HobbyRecentReview,
+        'HobbySegmentRating': HobbySegmentRating,
+        'ReviewTerm': ReviewTerm,
+        'HobbyRatingStats': HobbyRatingStats,
         'Gathering': Gathering,
+        'GatheringMember': GatheringMember,
+        'GatheringMemberShard': GatheringMemberShard,
+        'GatheringSchedule': GatheringSchedule,
+        'GatheringTerm': GatheringTerm,
+        'GatheringFacetCount': GatheringFacetCount,
+        'Region': Region,
         'AdminUser': AdminUser,
         'AdminActivityLog': AdminActivityLog,
         'UserFeedback': UserFeedback,
@@ -6,21 +6,55 @@
 from flask import Blueprint, request, jsonify
 from flask_jwt_extended import jwt_required, get_jwt_identity
 from app.models import db
-from app.models.hobby import Hobby, Gathering
+from app.models.hobby import Hobby, Gathering, GatheringSchedule
 from app.models.user import User
+from app.services.http_cache import conditional_get
+from app.services.encoding import hobby_fragment
+from app.services.hobby_summary import hobby_summaries
+from app.services.geo import find_nearby_gatherings
+from app.services.regions import assign_region, resolve_region_ids, gathering_region_condition, region_index
+from app.services.membership import join_gathering, leave_gathering, member_counts
+from app.services.schedules import replace_schedules, parse_meets_between, gatherings_meeting_between
+from app.services.gathering_search import reindex_gatherings, ranked_matches, word_conditions
+from app.services.facets import facet_keys, record_facet_change, facet_counts, region_facet
+from app.services.top_gatherings import top_gatherings, top_gatherings_size, active_gathering_count
+from app.services.gathering_recommendations import (
+    MEETING_TYPES, hobby_traits, gathering_table, region_scores, meeting_scores, rank_gatherings
+)
+from app.api.recommendations import calculate_hobby_score
 import logging
+import math
 from sqlalchemy import and_, or_, desc
+from sqlalchemy.exc import IntegrityError
 
 logger = logging.getLogger(__name__)
 
 gatherings_bp = Blueprint('gatherings', __name__, url_prefix='/api/gatherings')
 
+NEARBY_MAX_RADIUS_KM = 100
+# 바뀌면 검색 색인을 다시 만드는 필드 (색인어, 색인 행의 필터 컬럼, 활성 여부)
+SEARCH_INDEXED_FIELDS = {'name', 'description', 'region', 'location', 'meeting_type', 'is_active'}
+
+
+def _apply_coordinates(gathering, data):
+    """요청의 latitude/longitude 반영 (둘 중 하나라도 있을 때), 잘못된 값이면 오류 메시지 반환"""
+    if 'latitude' not in data and 'longitude' not in data:
+        return None
+
+    try:
+        gathering.set_coordinates(data.get('latitude'), data.get('longitude'))
+    except (TypeError, ValueError):
+        return '위도(latitude)와 경도(longitude)는 함께 지정해야 하며, 각각 -90~90, -180~180 범위의 숫자여야 합니다.'
+    return None
+
 
 @gatherings_bp.route('', methods=['GET'])
 def get_gatherings():
     """
     모임 목록 조회 (필터링 지원)
-    GET /api/gatherings?hobby_id=1&region=서울&meeting_type=offline&page=1&per_page=20
+    GET /api/gatherings?hobby_id=1&region=서울&meeting_type=offline&page=1&per_page=20&fields=...
+    GET /api/gatherings?meets_between=2026-10-24,2026-10-25 (해당 기간에 정기 일정이 있는 모임)
+    GET /api/gatherings?search=등산 동호회 (활성 모임 검색, 관련도순)
     """
     try:
         # 쿼리 파라미터
@@ -28,6 +62,7 @@ def get_gatherings():
         region = request.args.get('region')
         meeting_type = request.args.get('meeting_type')
         search = request.args.get('search')
+        meets_between = request.args.get('meets_between')
         is_active = request.args.get('is_active', 'true').lower() == 'true'
         page = request.args.get('page', 1, type=int)
         per_page = request.args.get('per_page', 20, type=int)
@@ -35,8 +70,28 @@ def get_gatherings():
         # 페이지네이션 제한
         per_page = min(per_page, 100)
 
+        # 모임 기간 (시작,끝)
+        window = None
+        if meets_between:
+            try:
+                window = parse_meets_between(meets_between)
+            except ValueError as e:
+                return jsonify({
+                    'error': 'Bad Request',
+                    'message': str(e)
+                }), 400
+
+        # 필드 프로젝션 (요청한 컬럼만 조회)
+        try:
+            fields = Gathering.parse_fields(request.args.get('fields'))
+        except ValueError as e:
+            return jsonify({
+                'error': 'Bad Request',
+                'message': str(e)
+            }), 400
+
         # 기본 쿼리
-        query = Gathering.query
+        query = Gathering.query.options(*Gathering.load_options(fields))
 
         # 활성 모임만 조회 (기본)
         if is_active:
@@ -46,51 +101,52 @@ def get_gatherings():
         if hobby_id:
             query = query.filter(Gathering.hobby_id == hobby_id)
 
-        # 지역 필터
+        # 지역 필터 (지역 사전으로 해석한 ID, 하위 지역 포함, region_id가 없는 모임은 문자열로 확인)
+        region_ids = resolve_region_ids(region) if region else None
         if region:
-            query = query.filter(Gathering.region.ilike(f'%{region}%'))
+            query = query.filter(gathering_region_condition(Gathering.region_id, region, Gathering.region))
 
         # 모임 유형 필터
         if meeting_type:
             query = query.filter(Gathering.meeting_type == meeting_type)
 
-        # 검색 (모임명, 설명)
+        # 기간 필터 (일정 테이블의 요일/시간대 인덱스로 모임 ID 조회)
+        if window:
+            query = query.filter(Gathering.gathering_id.in_(gatherings_meeting_between(*window)))
+
+        # 검색 (모임명, 설명): 역색인에서 필터까지 적용한 후보를 관련도순으로, 원문은 후보만 확인
+        order_by = (desc(Gathering.created_at),)
         if search:
-            search_pattern = f'%{search}%'
-            query = query.filter(
-                or_(
-                    Gathering.name.ilike(search_pattern),
-                    Gathering.description.ilike(search_pattern)
+            try:
+                ranked = ranked_matches(
+                    search,
+                    hobby_id=hobby_id or None,
+                    region_ids=region_ids,
+                    meeting_type=meeting_type or None
                 )
+            except ValueError as e:
+                return jsonify({
+                    'error': 'Bad Request',
+                    'message': str(e)
+                }), 400
+            query = query.join(ranked, Gathering.gathering_id == ranked.c.gathering_id).filter(
+                *word_conditions(search)
             )
+            order_by = (desc(ranked.c.score), desc(Gathering.gathering_id))
 
         # 페이지네이션
-        pagination = query.order_by(desc(Gathering.created_at)).paginate(
+        pagination = query.order_by(*order_by).paginate(
             page=page,
             per_page=per_page,
             error_out=False
         )
 
-        # 결과 구성 (취미 정보 포함)
+        # 결과 구성 (취미 요약은 페이지 전체에 대해 한 번에 조회)
+        hobbies = hobby_summaries(gathering.hobby_id for gathering in pagination.items)
         gatherings = []
         for gathering in pagination.items:
-            gathering_dict = gathering.to_dict()
-
-            # 관련 취미 정보 추가
-            hobby = Hobby.query.filter_by(
-                hobby_id=gathering.hobby_id,
-                is_deleted=False
-            ).first()
-
-            if hobby:
-                gathering_dict['hobby'] = {
-                    'hobby_id': hobby.hobby_id,
-                    'name': hobby.name,
-                    'category': hobby.category
-                }
-            else:
-                gathering_dict['hobby'] = None
-
+            gathering_dict = gathering.to_dict(fields=fields)
+            gathering_dict['hobby'] = hobbies.get(gathering.hobby_id)
             gatherings.append(gathering_dict)
 
         return jsonify({
@@ -131,8 +187,15 @@ def get_gathering_detail(gathering_id):
                 'message': '모임을 찾을 수 없습니다.'
             }), 404
 
-        # 상세 정보 구성
+        # 상세 정보 구성 (회원 수는 아직 합산되지 않은 가입/탈퇴까지 반영)
         gathering_dict = gathering.to_dict()
+        gathering_dict['member_count'] = member_counts([gathering_id]).get(gathering_id, gathering.member_count)
+        gathering_dict['schedules'] = [
+            schedule.to_dict()
+            for schedule in GatheringSchedule.query.filter_by(gathering_id=gathering_id).order_by(
+                GatheringSchedule.weekday, GatheringSchedule.start_minute
+            )
+        ]
 
         # 관련 취미 상세 정보 추가
         hobby = Hobby.query.filter_by(
@@ -141,7 +204,7 @@ def get_gathering_detail(gathering_id):
         ).first()
 
         if hobby:
-            gathering_dict['hobby'] = hobby.to_dict(include_stats=True)
+            gathering_dict['hobby'] = hobby_fragment(hobby)
         else:
             gathering_dict['hobby'] = None
 
@@ -223,13 +286,30 @@ def create_gathering():
             region=data['region'],
             meeting_type=meeting_type,
             schedule_info=data.get('schedule_info'),
-            member_count=data.get('member_count', 0),
+            member_count=0,
             contact_info=data.get('contact_info'),
             website_url=data.get('website_url'),
             is_active=data.get('is_active', True)
         )
 
+        # 좌표 (선택)
+        error = _apply_coordinates(new_gathering, data)
+        if error:
+            return jsonify({
+                'error': 'Bad Request',
+                'message': error
+            }), 400
+
+        # 정규화된 지역 ID
+        assign_region(new_gathering)
+
         db.session.add(new_gathering)
+        db.session.flush()
+
+        # 정기 일정 (schedule_info 해석), 검색 색인, 패싯 집계
+        replace_schedules({new_gathering.gathering_id: new_gathering.schedule_info})
+        reindex_gatherings([new_gathering.gathering_id])
+        record_facet_change([], facet_keys(new_gathering))
         db.session.commit()
 
         logger.info(f"사용자 {current_user_id}가 모임 '{new_gathering.name}' 생성 (ID: {new_gathering.gathering_id})")
@@ -284,9 +364,10 @@ def update_gathering(gathering_id):
             }), 404
 
         # 수정 가능한 필드들
+        # (member_count는 가입/탈퇴로만 바뀜)
         updatable_fields = [
             'name', 'description', 'location', 'region',
-            'meeting_type', 'schedule_info', 'member_count',
+            'meeting_type', 'schedule_info',
             'contact_info', 'website_url', 'is_active'
         ]
 
@@ -298,13 +379,35 @@ def update_gathering(gathering_id):
                     'message': 'meeting_type은 online, offline, hybrid 중 하나여야 합니다.'
                 }), 400
 
-        # 필드 업데이트
+        # 필드 업데이트 (패싯 집계는 변경 전후 차이만 반영)
+        facets_before = facet_keys(gathering)
         updated_fields = []
         for field in updatable_fields:
             if field in data:
                 setattr(gathering, field, data[field])
                 updated_fields.append(field)
 
+        # 좌표 (geohash 함께 갱신)
+        error = _apply_coordinates(gathering, data)
+        if error:
+            db.session.rollback()
+            return jsonify({
+                'error': 'Bad Request',
+                'message': error
+            }), 400
+        updated_fields.extend(field for field in ('latitude', 'longitude') if field in data)
+
+        if 'region' in updated_fields or 'location' in updated_fields:
+            assign_region(gathering)
+
+        if 'schedule_info' in updated_fields:
+            replace_schedules({gathering.gathering_id: gathering.schedule_info})
+
+        if set(updated_fields) & SEARCH_INDEXED_FIELDS:
+            reindex_gatherings([gathering.gathering_id])
+
+        record_facet_change(facets_before, facet_keys(gathering))
+
         if not updated_fields:
             return jsonify({
                 'error': 'Bad Request',
@@ -362,8 +465,12 @@ def delete_gathering(gathering_id):
                 'message': '모임을 찾을 수 없습니다.'
             }), 404
 
-        # 실제 삭제 대신 비활성화
+        # 실제 삭제 대신 비활성화 (검색 색인, 패싯 집계에서 제외)
+        facets_before = facet_keys(gathering)
         gathering.is_active = False
+        db.session.flush()
+        reindex_gatherings([gathering_id])
+        record_facet_change(facets_before, [])
         db.session.commit()
 
         logger.info(f"사용자 {current_user_id}가 모임 {gathering_id} 삭제 (비활성화)")
@@ -382,34 +489,114 @@ def delete_gathering(gathering_id):
         }), 500
 
 
+@gatherings_bp.route('/<int:gathering_id>/join', methods=['POST'])
+@jwt_required()
+def join(gathering_id):
+    """
+    모임 가입
+    POST /api/gatherings/<gathering_id>/join
+    """
+    try:
+        current_user_id = int(get_jwt_identity())
+
+        gathering = Gathering.query.filter_by(gathering_id=gathering_id).first()
+        if not gathering:
+            return jsonify({
+                'error': 'Gathering Not Found',
+                'message': '모임을 찾을 수 없습니다.'
+            }), 404
+
+        if not gathering.is_active:
+            return jsonify({
+                'error': 'Bad Request',
+                'message': '비활성화된 모임에는 가입할 수 없습니다.'
+            }), 400
+
+        try:
+            joined = join_gathering(gathering_id, current_user_id)
+        except IntegrityError:
+            # 같은 사용자의 동시 가입 요청
+            db.session.rollback()
+            joined = False
+
+        if not joined:
+            db.session.rollback()
+            return jsonify({
+                'error': 'Conflict',
+                'message': '이미 가입한 모임입니다.'
+            }), 409
+
+        db.session.commit()
+        logger.info(f"사용자 {current_user_id}가 모임 {gathering_id} 가입")
+
+        return jsonify({
+            'status': 'success',
+            'message': '모임에 가입했습니다.',
+            'data': {
+                'gathering_id': gathering_id,
+                'is_member': True,
+                'member_count': member_counts([gathering_id]).get(gathering_id, 0)
+            }
+        }), 200
+
+    except Exception as e:
+        db.session.rollback()
+        logger.error(f"모임 가입 오류: {str(e)}", exc_info=True)
+        return jsonify({
+            'error': 'Server Error',
+            'message': '모임 가입 중 오류가 발생했습니다.'
+        }), 500
+
+
+@gatherings_bp.route('/<int:gathering_id>/leave', methods=['POST'])
+@jwt_required()
+def leave(gathering_id):
+    """
+    모임 탈퇴
+    POST /api/gatherings/<gathering_id>/leave
+    """
+    try:
+        current_user_id = int(get_jwt_identity())
+
+        if not leave_gathering(gathering_id, current_user_id):
+            db.session.rollback()
+            return jsonify({
+                'error': 'Not Found',
+                'message': '가입하지 않은 모임입니다.'
+            }), 404
+
+        db.session.commit()
+        logger.info(f"사용자 {current_user_id}가 모임 {gathering_id} 탈퇴")
+
+        return jsonify({
+            'status': 'success',
+            'message': '모임에서 탈퇴했습니다.',
+            'data': {
+                'gathering_id': gathering_id,
+                'is_member': False,
+                'member_count': member_counts([gathering_id]).get(gathering_id, 0)
+            }
+        }), 200
+
+    except Exception as e:
+        db.session.rollback()
+        logger.error(f"모임 탈퇴 오류: {str(e)}", exc_info=True)
+        return jsonify({
+            'error': 'Server Error',
+            'message': '모임 탈퇴 중 오류가 발생했습니다.'
+        }), 500
+
+
 @gatherings_bp.route('/regions', methods=['GET'])
+@conditional_get('gatherings', 'facets')
 def get_regions():
     """
     사용 가능한 지역 목록 조회
     GET /api/gatherings/regions
     """
     try:
-        # 활성 모임들의 지역 목록
-        from sqlalchemy import func
-
-        regions = db.session.query(
-            Gathering.region,
-            func.count(Gathering.gathering_id).label('count')
-        ).filter(
-            Gathering.is_active == True
-        ).group_by(
-            Gathering.region
-        ).order_by(
-            desc(func.count(Gathering.gathering_id))
-        ).all()
-
-        region_list = [
-            {
-                'region': region,
-                'count': count
-            }
-            for region, count in regions
-        ]
+        # 활성 모임들의 시/도별 모임 수 (패싯 집계, region 필터에 정식 명칭 그대로 사용 가능)
+        region_list = region_facet(facet_counts()['region'])
 
         return jsonify({
             'status': 'success',
@@ -427,11 +614,51 @@ def get_regions():
         }), 500
 
 
+@gatherings_bp.route('/facets', methods=['GET'])
+@conditional_get('gatherings', 'facets')
+def get_gathering_facets():
+    """
+    모임 필터용 패싯 (지역/모임 유형/취미별 활성 모임 수)
+    GET /api/gatherings/facets
+    """
+    try:
+        counts = facet_counts()
+
+        hobby_counts = [(int(value), count) for value, count in counts['hobby']]
+        summaries = hobby_summaries([hobby_id for hobby_id, _ in hobby_counts])
+        # 삭제된 취미(요약 없음)의 모임은 목록과 합계에서 함께 제외
+        hobbies = [
+            dict(summaries[hobby_id], count=count)
+            for hobby_id, count in hobby_counts
+            if hobby_id in summaries
+        ]
+
+        return jsonify({
+            'status': 'success',
+            'data': {
+                'regions': region_facet(counts['region']),
+                'meeting_types': [
+                    {'meeting_type': meeting_type, 'count': count}
+                    for meeting_type, count in counts['meeting_type']
+                ],
+                'hobbies': hobbies,
+                'total': sum(hobby['count'] for hobby in hobbies)
+            }
+        }), 200
+
+    except Exception as e:
+        logger.error(f"모임 패싯 조회 오류: {str(e)}", exc_info=True)
+        return jsonify({
+            'error': 'Server Error',
+            'message': '모임 패싯 조회 중 오류가 발생했습니다.'
+        }), 500
+
+
 @gatherings_bp.route('/hobby/<int:hobby_id>', methods=['GET'])
 def get_gatherings_by_hobby(hobby_id):
     """
     특정 취미의 모임 목록 조회
-    GET /api/gatherings/hobby/<hobby_id>?region=서울&page=1
+    GET /api/gatherings/hobby/<hobby_id>?region=서울&page=1&fields=...
     """
     try:
         # 취미 존재 확인
@@ -445,36 +672,80 @@ def get_gatherings_by_hobby(hobby_id):
         # 쿼리 파라미터
         region = request.args.get('region')
         meeting_type = request.args.get('meeting_type')
-        page = request.args.get('page', 1, type=int)
+        page = max(request.args.get('page', 1, type=int), 1)
         per_page = request.args.get('per_page', 20, type=int)
-        per_page = min(per_page, 100)
+        per_page = min(max(per_page, 1), 100)
+
+        # 필드 프로젝션 (요청한 컬럼만 조회)
+        try:
+            fields = Gathering.parse_fields(request.args.get('fields'))
+        except ValueError as e:
+            return jsonify({
+                'error': 'Bad Request',
+                'message': str(e)
+            }), 400
+
+        # 필터가 없으면 메모리에 유지되는 인기 모임 목록과 활성 모임 수 사용 (COUNT 쿼리 없음)
+        offset = (page - 1) * per_page
+        if not region and not meeting_type:
+            total = active_gathering_count(hobby_id)
+            if offset + per_page <= top_gatherings_size():
+                gatherings = [
+                    {name: item[name] for name in fields} if fields else item
+                    for item in top_gatherings(hobby_id, per_page, offset)
+                ]
+            else:
+                rows = Gathering.query.options(*Gathering.load_options(fields)).filter_by(
+                    hobby_id=hobby_id,
+                    is_active=True
+                ).order_by(
+                    desc(Gathering.member_count), Gathering.gathering_id
+                ).offset(offset).limit(per_page).all()
+                gatherings = [gathering.to_dict(fields=fields) for gathering in rows]
+
+            total_pages = math.ceil(total / per_page)
+            return jsonify({
+                'status': 'success',
+                'data': {
+                    'hobby': hobby_fragment(hobby),
+                    'gatherings': gatherings,
+                    'pagination': {
+                        'current_page': page,
+                        'per_page': per_page,
+                        'total_pages': total_pages,
+                        'total_items': total,
+                        'has_next': page < total_pages,
+                        'has_prev': page > 1
+                    }
+                }
+            }), 200
 
         # 쿼리 구성
-        query = Gathering.query.filter_by(
+        query = Gathering.query.options(*Gathering.load_options(fields)).filter_by(
             hobby_id=hobby_id,
             is_active=True
         )
 
         if region:
-            query = query.filter(Gathering.region.ilike(f'%{region}%'))
+            query = query.filter(gathering_region_condition(Gathering.region_id, region, Gathering.region))
 
         if meeting_type:
             query = query.filter(Gathering.meeting_type == meeting_type)
 
         # 페이지네이션
-        pagination = query.order_by(desc(Gathering.member_count)).paginate(
+        pagination = query.order_by(desc(Gathering.member_count), Gathering.gathering_id).paginate(
             page=page,
             per_page=per_page,
             error_out=False
         )
 
         # 결과 구성
-        gatherings = [gathering.to_dict() for gathering in pagination.items]
+        gatherings = [gathering.to_dict(fields=fields) for gathering in pagination.items]
 
         return jsonify({
             'status': 'success',
             'data': {
-                'hobby': hobby.to_dict(include_stats=True),
+                'hobby': hobby_fragment(hobby),
                 'gatherings': gatherings,
                 'pagination': {
                     'current_page': pagination.page,
@@ -499,37 +770,35 @@ def get_gatherings_by_hobby(hobby_id):
 def get_popular_gatherings():
     """
     인기 모임 조회 (회원 수 기준)
-    GET /api/gatherings/popular?limit=10
+    GET /api/gatherings/popular?limit=10&fields=...
     """
     try:
         limit = request.args.get('limit', 10, type=int)
         limit = min(limit, 50)
 
+        # 필드 프로젝션 (요청한 컬럼만 조회)
+        try:
+            fields = Gathering.parse_fields(request.args.get('fields'))
+        except ValueError as e:
+            return jsonify({
+                'error': 'Bad Request',
+                'message': str(e)
+            }), 400
+
         # 회원 수가 많은 순으로 조회
-        gatherings = Gathering.query.filter_by(
+        gatherings = Gathering.query.options(*Gathering.load_options(fields)).filter_by(
             is_active=True
         ).order_by(
             desc(Gathering.member_count)
         ).limit(limit).all()
 
-        # 결과 구성 (취미 정보 포함)
+        # 결과 구성 (취미 요약은 한 번에 조회)
+        hobbies = hobby_summaries(gathering.hobby_id for gathering in gatherings)
         popular_gatherings = []
         for gathering in gatherings:
-            gathering_dict = gathering.to_dict()
-
-            # 관련 취미 정보
-            hobby = Hobby.query.filter_by(
-                hobby_id=gathering.hobby_id,
-                is_deleted=False
-            ).first()
-
-            if hobby:
-                gathering_dict['hobby'] = {
-                    'hobby_id': hobby.hobby_id,
-                    'name': hobby.name,
-                    'category': hobby.category
-                }
-
+            gathering_dict = gathering.to_dict(fields=fields)
+            if gathering.hobby_id in hobbies:
+                gathering_dict['hobby'] = hobbies[gathering.hobby_id]
             popular_gatherings.append(gathering_dict)
 
         return jsonify({
@@ -546,3 +815,173 @@ def get_popular_gatherings():
             'error': 'Server Error',
             'message': '인기 모임 조회 중 오류가 발생했습니다.'
         }), 500
+
+
+@gatherings_bp.route('/nearby', methods=['GET'])
+@conditional_get('gatherings')
+def get_nearby_gatherings():
+    """
+    주변 모임 조회 (가까운 순)
+    GET /api/gatherings/nearby?lat=37.57&lng=126.98&radius_km=5&hobby_id=1&limit=20&fields=...
+    """
+    try:
+        latitude = request.args.get('lat', type=float)
+        longitude = request.args.get('lng', type=float)
+        radius_km = request.args.get('radius_km', 5, type=float)
+        hobby_id = request.args.get('hobby_id', type=int)
+        limit = request.args.get('limit', 20, type=int)
+        limit = max(1, min(limit, 100))
+
+        if latitude is None or longitude is None or not (-90 <= latitude <= 90 and -180 <= longitude <= 180):
+            return jsonify({
+                'error': 'Bad Request',
+                'message': 'lat(-90~90)과 lng(-180~180)가 필요합니다.'
+            }), 400
+
+        if not (0 < radius_km <= NEARBY_MAX_RADIUS_KM):
+            return jsonify({
+                'error': 'Bad Request',
+                'message': f'radius_km는 0보다 크고 {NEARBY_MAX_RADIUS_KM} 이하여야 합니다.'
+            }), 400
+
+        # 필드 프로젝션 (요청한 컬럼만 조회)
+        try:
+            fields = Gathering.parse_fields(request.args.get('fields'))
+        except ValueError as e:
+            return jsonify({
+                'error': 'Bad Request',
+                'message': str(e)
+            }), 400
+
+        # geohash 후보 셀 안에서 거리 계산 후 가까운 순으로 자름
+        matches = find_nearby_gatherings(latitude, longitude, radius_km, hobby_id=hobby_id, limit=limit)
+
+        gatherings_by_id = {}
+        if matches:
+            gatherings_by_id = {
+                gathering.gathering_id: gathering
+                for gathering in Gathering.query.options(*Gathering.load_options(fields)).filter(
+                    Gathering.gathering_id.in_([gathering_id for gathering_id, _ in matches])
+                )
+            }
+
+        # 결과 구성 (취미 요약은 한 번에 조회)
+        hobbies = hobby_summaries(gathering.hobby_id for gathering in gatherings_by_id.values())
+        nearby_gatherings = []
+        for gathering_id, distance in matches:
+            gathering = gatherings_by_id.get(gathering_id)
+            if gathering is None:
+                continue
+            gathering_dict = gathering.to_dict(fields=fields)
+            gathering_dict['distance_km'] = round(distance, 3)
+            gathering_dict['hobby'] = hobbies.get(gathering.hobby_id)
+            nearby_gatherings.append(gathering_dict)
+
+        return jsonify({
+            'status': 'success',
+            'data': {
+                'gatherings': nearby_gatherings,
+                'total': len(nearby_gatherings),
+                'radius_km': radius_km
+            }
+        }), 200
+
+    except Exception as e:
+        logger.error(f"주변 모임 조회 오류: {str(e)}", exc_info=True)
+        return jsonify({
+            'error': 'Server Error',
+            'message': '주변 모임 조회 중 오류가 발생했습니다.'
+        }), 500
+
+
+@gatherings_bp.route('/recommended', methods=['GET'])
+@jwt_required()
+def get_recommended_gatherings():
+    """
+    추천 모임 조회 (추천 취미 + 거주 지역 + 모임 방식 선호)
+    GET /api/gatherings/recommended?limit=10&hobby_limit=5&meeting_type=offline,hybrid&fields=...
+    meeting_type을 생략하면 프로필의 사회성 선호로 모임 방식 선호를 정합니다.
+    """
+    try:
+        current_user_id = get_jwt_identity()
+        limit = request.args.get('limit', 10, type=int)
+        limit = max(1, min(limit, 50))
+        hobby_limit = request.args.get('hobby_limit', 5, type=int)
+        hobby_limit = max(1, min(hobby_limit, 10))
+
+        preferred = [value.strip() for value in request.args.get('meeting_type', '').split(',') if value.strip()]
+        if any(value not in MEETING_TYPES for value in preferred):
+            return jsonify({
+                'error': 'Bad Request',
+                'message': 'meeting_type은 online, offline, hybrid 중에서 선택해야 합니다.'
+            }), 400
+
+        # 필드 프로젝션 (모임 항목에 포함할 필드)
+        try:
+            fields = Gathering.parse_fields(request.args.get('fields'))
+        except ValueError as e:
+            return jsonify({
+                'error': 'Bad Request',
+                'message': str(e)
+            }), 400
+
+        user = User.query.filter_by(user_id=current_user_id, is_deleted=False).first()
+        if not user:
+            return jsonify({
+                'error': 'User Not Found',
+                'message': '사용자를 찾을 수 없습니다.'
+            }), 404
+
+        if not user.profile:
+            return jsonify({
+                'error': 'Profile Not Found',
+                'message': '프로필이 없습니다. 먼저 설문에 응답해주세요.',
+                'action_required': '설문 응답',
+                'survey_endpoint': '/api/survey/questions'
+            }), 400
+
+        # 1. 프로필 기반 상위 추천 취미 (취미 속성은 메모리 캐시)
+        hobby_scores = sorted(
+            ((traits.hobby_id, calculate_hobby_score(traits, user.profile)) for traits in hobby_traits()),
+            key=lambda item: (-item[1], item[0])
+        )[:hobby_limit]
+
+        # 2. 추천 취미의 후보 모임(전국 인기 + 사용자 지역/온라인)에서 한 번에 점수 계산
+        regions = region_scores(region_index(), user.location)
+        ranked = rank_gatherings(
+            gathering_table((hobby_id for hobby_id, _ in hobby_scores), regions),
+            dict(hobby_scores),
+            regions,
+            meeting_scores(user.profile, preferred),
+            limit=limit
+        )
+
+        # 결과 구성 (취미 요약은 한 번에 조회, 공유 목록의 딕셔너리는 복사해서 사용)
+        hobbies = hobby_summaries(hobby_id for hobby_id, _ in hobby_scores)
+        gatherings = []
+        for item in ranked:
+            gathering = item['gathering']
+            gathering_dict = {name: gathering[name] for name in fields} if fields else dict(gathering)
+            gathering_dict['hobby'] = hobbies.get(gathering['hobby_id'])
+            gathering_dict['recommendation_score'] = item['recommendation_score']
+            gathering_dict['score_breakdown'] = item['score_breakdown']
+            gatherings.append(gathering_dict)
+
+        return jsonify({
+            'status': 'success',
+            'data': {
+                'gatherings': gatherings,
+                'total': len(gatherings),
+                'recommended_hobbies': [
+                    {'hobby': hobbies.get(hobby_id), 'match_score': score}
+                    for hobby_id, score in hobby_scores
+                ]
+            }
+        }), 200
+
+    except Exception as e:
+        logger.error(f"추천 모임 조회 오류: {str(e)}", exc_info=True)
+        return jsonify({
+            'error': 'Server Error',
+            'message': '추천 모임 조회 중 오류가 발생했습니다.'
+        }), 500
@@ -3,26 +3,56 @@
 취미 목록 조회, 상세 조회, 평가 등
 """
 
-from flask import Blueprint, request, jsonify
+from flask import Blueprint, request, jsonify, current_app
 from flask_jwt_extended import jwt_required, get_jwt_identity
 from app.models import db
 from app.models.hobby import Hobby, UserHobbyRating
-from app.models.user import User
+from app.services.catalog_cache import catalog_cache
+from app.services.http_cache import conditional_get
+from app.services.encoding import hobby_fragment
+from app.services.hobby_bundle import build_hobby_detail, get_hobby_bundle
+from app.services.top_gatherings import top_gatherings
+from app.services.change_feed import InvalidChangeToken, get_hobby_changes
+from app.services.media_manifest import get_media_manifest
+from app.services.review_search import search_reviews
+from app.services.rating_writer import (
+    MAX_BATCH_SIZE, parse_rating_input, find_active_hobbies, find_rating_targets,
+    lock_rating_user, save_ratings
+)
+from app.services.rating_stats import get_rating_stats
 import logging
+from urllib.parse import urlencode
 from sqlalchemy import or_, and_, func
 
 logger = logging.getLogger(__name__)
 
 hobbies_bp = Blueprint('hobbies', __name__, url_prefix='/api/hobbies')
 
+# 평가 목록 기본 필드
+RATING_LIST_FIELDS = ['rating_id', 'rating', 'review_text', 'experienced', 'created_at']
+
+# 일괄 조회 최대 ID 개수
+MAX_BATCH_FETCH = 100
+
 
 @hobbies_bp.route('', methods=['GET'])
+@conditional_get('catalog')
 def get_hobbies():
     """
     취미 목록 조회 (필터링, 검색 지원)
-    GET /api/hobbies?category=...&search=...&indoor_outdoor=...&social_individual=...&budget=...&difficulty_min=...&difficulty_max=...&page=1&per_page=20
+    GET /api/hobbies?category=...&search=...&indoor_outdoor=...&social_individual=...&budget=...&difficulty_min=...&difficulty_max=...&page=1&per_page=20&fields=...&media=manifest
     """
     try:
+        # 캐시 조회 (쿼리 파라미터 조합별)
+        cache_key = 'hobbies:list:' + urlencode(sorted(request.args.items(multi=True)))
+        cache_version = catalog_cache.version()  # 조회 전 버전 (읽는 중 변경되면 이전 버전 키에 저장)
+        cached = catalog_cache.get(cache_key, cache_version)
+        if cached is not None:
+            return jsonify({
+                'status': 'success',
+                'data': cached
+            }), 200
+
         # 쿼리 파라미터
         category = request.args.get('category')
         search = request.args.get('search')
@@ -33,9 +63,20 @@ def get_hobbies():
         difficulty_max = request.args.get('difficulty_max', type=int)
         page = request.args.get('page', 1, type=int)
         per_page = request.args.get('per_page', 20, type=int)
+        # media=manifest: 미디어 URL 제외 (클라이언트가 미디어 매니페스트로 조회)
+        include_media = request.args.get('media') != 'manifest'
+
+        # 필드 프로젝션 (요청한 컬럼만 조회)
+        try:
+            fields = Hobby.parse_fields(request.args.get('fields'), extra=Hobby.STATS_FIELDS)
+        except ValueError as e:
+            return jsonify({
+                'error': 'Bad Request',
+                'message': str(e)
+            }), 400
 
         # 기본 쿼리 (삭제되지 않은 취미만)
-        query = Hobby.query.filter_by(is_deleted=False)
+        query = Hobby.query.options(*Hobby.load_options(fields)).filter_by(is_deleted=False)
 
         # 카테고리 필터
         if category:
@@ -88,21 +129,30 @@ def get_hobbies():
         )
 
         # 결과 구성
-        hobbies = [hobby.to_dict(include_stats=True) for hobby in pagination.items]
+        if fields is None:
+            hobbies = [hobby_fragment(hobby, include_media) for hobby in pagination.items]
+        else:
+            hobbies = [
+                hobby.to_dict(include_stats=True, fields=fields, include_media=include_media)
+                for hobby in pagination.items
+            ]
+
+        data = {
+            'hobbies': hobbies,
+            'pagination': {
+                'current_page': pagination.page,
+                'per_page': pagination.per_page,
+                'total_pages': pagination.pages,
+                'total_items': pagination.total,
+                'has_next': pagination.has_next,
+                'has_prev': pagination.has_prev
+            }
+        }
+        catalog_cache.set(cache_key, data, cache_version)
 
         return jsonify({
             'status': 'success',
-            'data': {
-                'hobbies': hobbies,
-                'pagination': {
-                    'current_page': pagination.page,
-                    'per_page': pagination.per_page,
-                    'total_pages': pagination.pages,
-                    'total_items': pagination.total,
-                    'has_next': pagination.has_next,
-                    'has_prev': pagination.has_prev
-                }
-            }
+            'data': data
         }), 200
 
     except Exception as e:
@@ -113,47 +163,178 @@ def get_hobbies():
         }), 500
 
 
-@hobbies_bp.route('/<int:hobby_id>', methods=['GET'])
-def get_hobby_detail(hobby_id):
+@hobbies_bp.route('/batch', methods=['GET'])
+@conditional_get('catalog')
+def get_hobbies_batch():
     """
-    취미 상세 조회
-    GET /api/hobbies/<hobby_id>
+    취미 일괄 조회 (추천/북마크 등 ID 목록을 이미 가진 화면용)
+    GET /api/hobbies/batch?ids=3,1,2
+
+    요청한 순서대로 반환하며, 없거나 삭제된 취미는 missing_ids로 알려줍니다.
+    캐시에 없는 취미만 IN 쿼리 1회로 조회합니다. (평가 통계 카운터는 함께 조인)
     """
     try:
-        hobby = Hobby.query.filter_by(hobby_id=hobby_id, is_deleted=False).first()
+        # ID 파싱 (ids=1,2,3 또는 ids=1&ids=2, 중복 제거 후 요청 순서 유지)
+        hobby_ids = []
+        try:
+            for value in request.args.getlist('ids'):
+                hobby_ids.extend(int(part) for part in value.split(',') if part.strip())
+        except ValueError:
+            return jsonify({
+                'error': 'Bad Request',
+                'message': 'ids는 쉼표로 구분된 정수여야 합니다.'
+            }), 400
 
-        if not hobby:
+        hobby_ids = list(dict.fromkeys(hobby_ids))
+        if not hobby_ids:
             return jsonify({
-                'error': 'Hobby Not Found',
-                'message': '취미를 찾을 수 없습니다.'
-            }), 404
+                'error': 'Bad Request',
+                'message': 'ids 값이 필요합니다.'
+            }), 400
 
-        # 상세 정보 구성
-        hobby_data = hobby.to_dict(include_stats=True)
+        if len(hobby_ids) > MAX_BATCH_FETCH:
+            return jsonify({
+                'error': 'Bad Request',
+                'message': f'한 번에 최대 {MAX_BATCH_FETCH}개까지 조회할 수 있습니다.'
+            }), 400
 
-        # 최근 리뷰 5개 추가 (옵션)
-        recent_reviews = UserHobbyRating.query.filter_by(
-            hobby_id=hobby_id
-        ).filter(
-            UserHobbyRating.review_text.isnot(None),
-            UserHobbyRating.review_text != ''
-        ).order_by(
-            UserHobbyRating.created_at.desc()
-        ).limit(5).all()
+        # 캐시 조회
+        cache_keys = {hobby_id: f'hobby:summary:{hobby_id}' for hobby_id in hobby_ids}
+        cache_version = catalog_cache.version()
+        cached = catalog_cache.get_many(list(cache_keys.values()), cache_version)
+        hobbies_by_id = {
+            hobby_id: cached[key]
+            for hobby_id, key in cache_keys.items()
+            if key in cached
+        }
+
+        # 캐시에 없는 취미만 DB 조회
+        missing = [hobby_id for hobby_id in hobby_ids if hobby_id not in hobbies_by_id]
+        if missing:
+            hobbies = Hobby.query.filter(
+                Hobby.hobby_id.in_(missing),
+                Hobby.is_deleted == False
+            ).all()
+
+            loaded = {}
+            for hobby in hobbies:
+                hobby_data = hobby.to_dict(include_stats=True)
+                hobbies_by_id[hobby.hobby_id] = hobby_data
+                loaded[cache_keys[hobby.hobby_id]] = hobby_data
+            catalog_cache.set_many(loaded, cache_version)
 
-        hobby_data['recent_reviews'] = [
-            {
-                'rating': review.rating,
-                'review_text': review.review_text,
-                'experienced': review.experienced,
-                'created_at': review.created_at.isoformat() if review.created_at else None
+        return jsonify({
+            'status': 'success',
+            'data': {
+                'hobbies': [hobbies_by_id[hobby_id] for hobby_id in hobby_ids if hobby_id in hobbies_by_id],
+                'missing_ids': [hobby_id for hobby_id in hobby_ids if hobby_id not in hobbies_by_id]
             }
-            for review in recent_reviews
-        ]
+        }), 200
 
+    except Exception as e:
+        logger.error(f"Error getting hobbies batch: {str(e)}", exc_info=True)
+        return jsonify({
+            'error': 'Server Error',
+            'message': '취미 일괄 조회 중 오류가 발생했습니다.'
+        }), 500
+
+
+@hobbies_bp.route('/media-manifest', methods=['GET'])
+@conditional_get('catalog')
+def get_hobby_media_manifest():
+    """
+    취미 미디어 매니페스트 (이미지/영상 URL, 크기, 해시, 버전)
+    GET /api/hobbies/media-manifest
+
+    카탈로그 버전마다 한 번 생성되며, ETag로 변경 여부를 확인할 수 있습니다.
+    """
+    try:
         return jsonify({
             'status': 'success',
-            'data': hobby_data
+            'data': get_media_manifest()
+        }), 200
+
+    except Exception as e:
+        logger.error(f"Error getting media manifest: {str(e)}", exc_info=True)
+        return jsonify({
+            'error': 'Server Error',
+            'message': '미디어 매니페스트 조회 중 오류가 발생했습니다.'
+        }), 500
+
+
+@hobbies_bp.route('/changes', methods=['GET'])
+@conditional_get('catalog', settle_config='CATALOG_CHANGES_SETTLE_SECONDS')
+def get_hobby_changes_feed():
+    """
+    취미 변경 피드 (클라이언트/엣지 캐시 동기화용)
+    GET /api/hobbies/changes?since=<token>&limit=100
+
+    since가 없으면 처음부터 전체를 순서대로 반환합니다.
+    응답의 next_token을 다음 요청의 since로 사용하고, has_more가 false가 될 때까지 반복합니다.
+    """
+    try:
+        limit = request.args.get('limit', 100, type=int)
+        limit = max(1, min(limit, 500))
+
+        try:
+            changed, deleted_ids, next_token, has_more = get_hobby_changes(
+                since=request.args.get('since'),
+                limit=limit,
+                settle_seconds=current_app.config.get('CATALOG_CHANGES_SETTLE_SECONDS', 2)
+            )
+        except InvalidChangeToken as e:
+            return jsonify({
+                'error': 'Bad Request',
+                'message': str(e)
+            }), 400
+
+        return jsonify({
+            'status': 'success',
+            'data': {
+                'changes': changed,
+                'deleted_ids': deleted_ids,
+                'next_token': next_token,
+                'has_more': has_more
+            }
+        }), 200
+
+    except Exception as e:
+        logger.error(f"Error getting hobby changes: {str(e)}", exc_info=True)
+        return jsonify({
+            'error': 'Server Error',
+            'message': '취미 변경 내역 조회 중 오류가 발생했습니다.'
+        }), 500
+
+
+@hobbies_bp.route('/<int:hobby_id>', methods=['GET'])
+@conditional_get('catalog', 'gatherings')
+def get_hobby_detail(hobby_id):
+    """
+    취미 상세 조회 (인기 모임 3개 포함)
+    GET /api/hobbies/<hobby_id>
+    """
+    try:
+        # 캐시 조회 (카탈로그가 변경되지 않았다면 DB 조회 없이 응답)
+        cache_key = f'hobby:{hobby_id}'
+        cache_version = catalog_cache.version()
+        hobby_data = catalog_cache.get(cache_key, cache_version)
+
+        if hobby_data is None:
+            # 상세 정보 구성 (최근 리뷰 포함)
+            hobby_data = build_hobby_detail(hobby_id)
+
+            if hobby_data is None:
+                return jsonify({
+                    'error': 'Hobby Not Found',
+                    'message': '취미를 찾을 수 없습니다.'
+                }), 404
+
+            catalog_cache.set(cache_key, hobby_data, cache_version)
+
+        # 인기 모임은 모임 버전으로 따로 유지되는 메모리 목록에서 (캐시 항목은 수정하지 않음)
+        return jsonify({
+            'status': 'success',
+            'data': dict(hobby_data, top_gatherings=top_gatherings(hobby_id, 3))
         }), 200
 
     except Exception as e:
@@ -164,6 +345,39 @@ def get_hobby_detail(hobby_id):
         }), 500
 
 
+@hobbies_bp.route('/<int:hobby_id>/bundle', methods=['GET'])
+@conditional_get('catalog', 'gatherings')
+def get_hobby_detail_bundle(hobby_id):
+    """
+    취미 상세 묶음 조회 (상세 + 최근 리뷰 + 유사 취미 + 인기 모임)
+    GET /api/hobbies/<hobby_id>/bundle?similar_limit=5&gatherings_limit=5
+    """
+    try:
+        similar_limit = min(max(request.args.get('similar_limit', 5, type=int), 1), 20)
+        gatherings_limit = min(max(request.args.get('gatherings_limit', 5, type=int), 1), 20)
+
+        # 캐시에 없는 항목만 스레드 풀에서 동시에 조회
+        bundle = get_hobby_bundle(hobby_id, similar_limit, gatherings_limit)
+
+        if bundle is None:
+            return jsonify({
+                'error': 'Hobby Not Found',
+                'message': '취미를 찾을 수 없습니다.'
+            }), 404
+
+        return jsonify({
+            'status': 'success',
+            'data': bundle
+        }), 200
+
+    except Exception as e:
+        logger.error(f"Error getting hobby bundle: {str(e)}", exc_info=True)
+        return jsonify({
+            'error': 'Server Error',
+            'message': '취미 상세 묶음 조회 중 오류가 발생했습니다.'
+        }), 500
+
+
 @hobbies_bp.route('/<int:hobby_id>/rate', methods=['POST'])
 @jwt_required()
 def rate_hobby(hobby_id):
@@ -182,90 +396,59 @@ def rate_hobby(hobby_id):
                 'message': '평가 데이터가 필요합니다.'
             }), 400
 
-        rating = data.get('rating')
-        review_text = data.get('review_text')
-        experienced = data.get('experienced', False)
-
-        # rating 필수 검증
-        if rating is None:
+        item, error_message = parse_rating_input(data)
+        if error_message:
             return jsonify({
                 'error': 'Bad Request',
-                'message': 'rating 값이 필요합니다.'
+                'message': error_message
             }), 400
 
-        # rating 범위 검증 (1-5)
-        try:
-            rating = int(rating)
-            if not (1 <= rating <= 5):
-                return jsonify({
-                    'error': 'Bad Request',
-                    'message': 'rating은 1과 5 사이의 값이어야 합니다.'
-                }), 400
-        except (ValueError, TypeError):
+        # 사용자 확인 (행 잠금으로 같은 사용자의 평가 쓰기 직렬화, 트랜잭션의 첫 조회)
+        user = lock_rating_user(current_user_id)
+        if not user:
+            db.session.rollback()
             return jsonify({
-                'error': 'Bad Request',
-                'message': 'rating은 정수여야 합니다.'
-            }), 400
+                'error': 'User Not Found',
+                'message': '사용자를 찾을 수 없습니다.'
+            }), 404
 
-        # 취미 존재 확인
-        hobby = Hobby.query.filter_by(hobby_id=hobby_id, is_deleted=False).first()
-        if not hobby:
+        # 취미 존재 확인 + 기존 평가 (한 번의 조회)
+        targets = find_rating_targets(user.user_id, [hobby_id])
+        if hobby_id not in targets:
+            db.session.rollback()
             return jsonify({
                 'error': 'Hobby Not Found',
                 'message': '취미를 찾을 수 없습니다.'
             }), 404
+        hobby_name = targets[hobby_id].name
 
-        # 사용자 확인
-        user = User.query.filter_by(user_id=current_user_id, is_deleted=False).first()
-        if not user:
-            return jsonify({
-                'error': 'User Not Found',
-                'message': '사용자를 찾을 수 없습니다.'
-            }), 404
-
-        # 기존 평가가 있는지 확인
-        existing_rating = UserHobbyRating.query.filter_by(
-            user_id=current_user_id,
-            hobby_id=hobby_id
-        ).first()
+        # 평가 저장 (INSERT ... ON DUPLICATE KEY UPDATE)
+        item['hobby_id'] = hobby_id
+        change = save_ratings(user, [item], targets)[0]
+        db.session.commit()
 
-        if existing_rating:
-            # 기존 평가 업데이트
-            existing_rating.rating = rating
-            existing_rating.review_text = review_text
-            existing_rating.experienced = experienced
-            message = '평가가 성공적으로 수정되었습니다.'
-        else:
-            # 새 평가 생성
-            new_rating = UserHobbyRating(
-                user_id=current_user_id,
-                hobby_id=hobby_id,
-                rating=rating,
-                review_text=review_text,
-                experienced=experienced
-            )
-            db.session.add(new_rating)
+        if change['created']:
             message = '평가가 성공적으로 등록되었습니다.'
-
-        db.session.commit()
+        else:
+            message = '평가가 성공적으로 수정되었습니다.'
 
         # 업데이트된 평점 정보
-        hobby_data = hobby.to_dict(include_stats=True)
+        stats = get_rating_stats([hobby_id])[hobby_id]
 
-        logger.info(f"User {current_user_id} rated hobby {hobby_id} with {rating} stars")
+        logger.info(f"User {current_user_id} rated hobby {hobby_id} with {item['rating']} stars")
 
         return jsonify({
             'status': 'success',
             'message': message,
             'data': {
                 'hobby_id': hobby_id,
-                'hobby_name': hobby.name,
-                'rating': rating,
-                'review_text': review_text,
-                'experienced': experienced,
+                'hobby_name': hobby_name,
+                'rating': item['rating'],
+                'review_text': item['review_text'],
+                'experienced': item['experienced'],
                 'updated_stats': {
-                    'average_rating': hobby_data['average_rating'],
-                    'rating_count': hobby_data['rating_count']
+                    'average_rating': stats['average_rating'],
+                    'rating_count': stats['rating_count']
                 }
             }
         }), 200
@@ -279,7 +462,115 @@ def rate_hobby(hobby_id):
         }), 500
 
 
+@hobbies_bp.route('/ratings/batch', methods=['POST'])
+@jwt_required()
+def rate_hobbies_batch():
+    """
+    여러 취미 일괄 평가 (온보딩 등)
+    POST /api/hobbies/ratings/batch
+    {"ratings": [{"hobby_id": 1, "rating": 5, "review_text": "...", "experienced": true}, ...]}
+    """
+    try:
+        current_user_id = get_jwt_identity()
+        data = request.get_json()
+
+        if not data or 'ratings' not in data:
+            return jsonify({
+                'error': 'Bad Request',
+                'message': '평가 데이터가 필요합니다.'
+            }), 400
+
+        ratings_data = data['ratings']
+        if not isinstance(ratings_data, list) or not ratings_data:
+            return jsonify({
+                'error': 'Bad Request',
+                'message': 'ratings는 비어 있지 않은 배열이어야 합니다.'
+            }), 400
+
+        if len(ratings_data) > MAX_BATCH_SIZE:
+            return jsonify({
+                'error': 'Bad Request',
+                'message': f'한 번에 최대 {MAX_BATCH_SIZE}개까지 평가할 수 있습니다.'
+            }), 400
+
+        # 항목별 검증
+        items = []
+        validation_errors = []
+        for i, rating_data in enumerate(ratings_data):
+            item, error_message = parse_rating_input(rating_data)
+            if error_message:
+                validation_errors.append({'index': i, 'message': error_message})
+                continue
+
+            try:
+                item['hobby_id'] = int(rating_data.get('hobby_id'))
+            except (ValueError, TypeError):
+                validation_errors.append({'index': i, 'message': 'hobby_id가 필요합니다.'})
+                continue
+
+            items.append((i, item))
+
+        # 사용자 확인 (행 잠금으로 같은 사용자의 평가 쓰기 직렬화, 트랜잭션의 첫 조회)
+        user = lock_rating_user(current_user_id)
+        if not user:
+            db.session.rollback()
+            return jsonify({
+                'error': 'User Not Found',
+                'message': '사용자를 찾을 수 없습니다.'
+            }), 404
+
+        # 취미 존재 확인 + 기존 평가 (한 번의 IN 쿼리)
+        targets = find_rating_targets(user.user_id, [item['hobby_id'] for _, item in items])
+        for i, item in items:
+            if item['hobby_id'] not in targets:
+                validation_errors.append({'index': i, 'message': f'취미 ID {item["hobby_id"]}를 찾을 수 없습니다.'})
+
+        if validation_errors:
+            db.session.rollback()
+            return jsonify({
+                'error': 'Validation Error',
+                'message': '일부 평가에 오류가 있습니다.',
+                'validation_errors': sorted(validation_errors, key=lambda e: e['index'])
+            }), 400
+
+        # 한 트랜잭션으로 저장
+        changes = save_ratings(user, [item for _, item in items], targets)
+        db.session.commit()
+
+        stats = get_rating_stats([change['hobby_id'] for change in changes])
+
+        logger.info(f"User {current_user_id} batch rated {len(changes)} hobbies")
+
+        return jsonify({
+            'status': 'success',
+            'message': f'{len(changes)}개의 평가가 저장되었습니다.',
+            'data': {
+                'ratings': [
+                    {
+                        'hobby_id': change['hobby_id'],
+                        'hobby_name': targets[change['hobby_id']].name,
+                        'rating': change['rating'],
+                        'status': 'created' if change['created'] else 'updated',
+                        'updated_stats': stats[change['hobby_id']]
+                    }
+                    for change in changes
+                ],
+                'created_count': sum(1 for change in changes if change['created']),
+                'updated_count': sum(1 for change in changes if not change['created'])
+            }
+        }), 200
+
+    except Exception as e:
+        db.session.rollback()
+        logger.error(f"Error batch rating hobbies: {str(e)}", exc_info=True)
+        return jsonify({
+            'error': 'Server Error',
+            'message': '일괄 평가 중 오류가 발생했습니다.'
+        }), 500
+
+
 @hobbies_bp.route('/categories', methods=['GET'])
+@conditional_get('catalog')
 def get_categories():
     """
     사용 가능한 카테고리 목록 조회
@@ -326,7 +617,8 @@ def get_categories():
 def get_hobby_ratings(hobby_id):
     """
     특정 취미의 모든 평가 조회
-    GET /api/hobbies/<hobby_id>/ratings?page=1&per_page=20
+    GET /api/hobbies/<hobby_id>/ratings?page=1&per_page=20&fields=...
+    GET /api/hobbies/<hobby_id>/ratings?q=검색어&cursor=...&per_page=20 (리뷰 검색)
     """
     try:
         # 취미 존재 확인
@@ -342,8 +634,44 @@ def get_hobby_ratings(hobby_id):
         per_page = request.args.get('per_page', 20, type=int)
         per_page = min(per_page, 100)  # 최대 100개
 
+        # 필드 프로젝션 (기본: 평가 ID, 점수, 리뷰, 체험 여부, 작성일)
+        try:
+            fields = UserHobbyRating.parse_fields(request.args.get('fields')) or RATING_LIST_FIELDS
+        except ValueError as e:
+            return jsonify({
+                'error': 'Bad Request',
+                'message': str(e)
+            }), 400
+
+        # 리뷰 검색 (역색인 + 커서 페이지네이션)
+        if request.args.get('q'):
+            search_args, error = _parse_review_search_args(per_page)
+            if error:
+                return error
+
+            try:
+                ratings, next_cursor = search_reviews(hobby_id=hobby_id, **search_args)
+            except ValueError as e:
+                return jsonify({
+                    'error': 'Bad Request',
+                    'message': str(e)
+                }), 400
+
+            return jsonify({
+                'status': 'success',
+                'data': {
+                    'hobby_id': hobby_id,
+                    'hobby_name': hobby.name,
+                    'query': search_args['query'],
+                    'ratings': [rating.to_dict(fields=fields) for rating in ratings],
+                    'next_cursor': next_cursor
+                }
+            }), 200
+
         # 평가 조회 (최신순)
-        pagination = UserHobbyRating.query.filter_by(
+        pagination = UserHobbyRating.query.options(
+            *UserHobbyRating.load_options(fields)
+        ).filter_by(
             hobby_id=hobby_id
         ).order_by(
             UserHobbyRating.created_at.desc()
@@ -354,16 +682,7 @@ def get_hobby_ratings(hobby_id):
         )
 
         # 결과 구성
-        ratings = [
-            {
-                'rating_id': rating.rating_id,
-                'rating': rating.rating,
-                'review_text': rating.review_text,
-                'experienced': rating.experienced,
-                'created_at': rating.created_at.isoformat() if rating.created_at else None
-            }
-            for rating in pagination.items
-        ]
+        ratings = [rating.to_dict(fields=fields) for rating in pagination.items]
 
         return jsonify({
             'status': 'success',
@@ -392,3 +711,81 @@ def get_hobby_ratings(hobby_id):
             'error': 'Server Error',
             'message': '평가 목록 조회 중 오류가 발생했습니다.'
         }), 500
+
+
+def _parse_review_search_args(limit):
+    """
+    리뷰 검색 파라미터 파싱 (q, cursor, min_rating, experienced)
+    반환: (search_reviews 인자, 오류 응답) - 오류가 없으면 오류 응답은 None
+    """
+    query = (request.args.get('q') or '').strip()
+    cursor = request.args.get('cursor', type=int)
+    min_rating = request.args.get('min_rating', type=int)
+    experienced = request.args.get('experienced')
+
+    if not query:
+        return None, (jsonify({
+            'error': 'Bad Request',
+            'message': '검색어(q)가 필요합니다.'
+        }), 400)
+
+    return {
+        'query': query,
+        'cursor': cursor,
+        'limit': limit,
+        'min_rating': min_rating,
+        'experienced': experienced.lower() == 'true' if experienced else None
+    }, None
+
+
+@hobbies_bp.route('/reviews/search', methods=['GET'])
+def search_hobby_reviews():
+    """
+    전체 취미 리뷰 검색 (모더레이션, 리뷰 탐색용)
+    GET /api/hobbies/reviews/search?q=검색어&hobby_id=1&min_rating=4&experienced=true&cursor=...&limit=20
+    """
+    try:
+        limit = request.args.get('limit', 20, type=int)
+        limit = max(1, min(limit, 100))
+
+        search_args, error = _parse_review_search_args(limit)
+        if error:
+            return error
+
+        try:
+            ratings, next_cursor = search_reviews(
+                hobby_id=request.args.get('hobby_id', type=int),
+                **search_args
+            )
+        except ValueError as e:
+            return jsonify({
+                'error': 'Bad Request',
+                'message': str(e)
+            }), 400
+
+        # 삭제된 취미의 리뷰 제외
+        hobby_names = find_active_hobbies([rating.hobby_id for rating in ratings])
+        results = []
+        for rating in ratings:
+            if rating.hobby_id not in hobby_names:
+                continue
+            rating_data = rating.to_dict(fields=RATING_LIST_FIELDS)
+            rating_data['hobby_id'] = rating.hobby_id
+            rating_data['hobby_name'] = hobby_names[rating.hobby_id]
+            results.append(rating_data)
+
+        return jsonify({
+            'status': 'success',
+            'data': {
+                'query': search_args['query'],
+                'reviews': results,
+                'next_cursor': next_cursor
+            }
+        }), 200
+
+    except Exception as e:
+        logger.error(f"Error searching reviews: {str(e)}", exc_info=True)
+        return jsonify({
+            'error': 'Server Error',
+            'message': '리뷰 검색 중 오류가 발생했습니다.'
+        }), 500
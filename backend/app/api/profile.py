@@ -7,6 +7,7 @@ from flask import Blueprint, request, jsonify
 from flask_jwt_extended import jwt_required, get_jwt_identity
 from app.models import db
 from app.models.user import User, UserProfile
+from app.services.segment_ratings import segment_of, move_user_segment
 import logging
 from datetime import datetime
 
@@ -56,7 +57,7 @@ def get_user_profile(user_id):
     GET /api/users/<user_id>
     """
     try:
-        current_user_id = get_jwt_identity()
+        current_user_id = int(get_jwt_identity())
 
         # 본인의 프로필만 조회 가능 (관리자 권한은 추후 구현)
         if current_user_id != user_id:
@@ -121,7 +122,7 @@ def update_user_profile(user_id):
     PUT /api/users/<user_id>
     """
     try:
-        current_user_id = get_jwt_identity()
+        current_user_id = int(get_jwt_identity())
 
         # 본인의 프로필만 수정 가능
         if current_user_id != user_id:
@@ -145,6 +146,9 @@ def update_user_profile(user_id):
                 'message': '사용자를 찾을 수 없습니다.'
             }), 404
 
+        # 변경 전 세그먼트 (연령대, 성별, 지역별 평가 집계 이동용)
+        old_segment = segment_of(user.age, user.gender, user.location)
+
         # 수정 가능한 필드들
         updatable_fields = ['age', 'gender', 'location']
         validation_errors = []
@@ -232,6 +236,11 @@ def update_user_profile(user_id):
             # 사용자 기본 정보 업데이트
             if updated_fields:
                 user.updated_at = datetime.utcnow()
+                move_user_segment(
+                    user.user_id,
+                    old_segment,
+                    segment_of(user.age, user.gender, user.location)
+                )
 
             # 프로필 정보 업데이트
             if profile_updates:
@@ -315,7 +324,7 @@ def change_password(user_id):
     PUT /api/users/<user_id>/password
     """
     try:
-        current_user_id = get_jwt_identity()
+        current_user_id = int(get_jwt_identity())
 
         # 본인의 비밀번호만 변경 가능
         if current_user_id != user_id:
@@ -4,10 +4,14 @@
 """
 
 from flask import Blueprint, request, jsonify
-from flask_jwt_extended import jwt_required, get_jwt_identity
+from flask_jwt_extended import jwt_required, get_jwt_identity, verify_jwt_in_request
 from app.models import db
 from app.models.hobby import Hobby, UserHobbyRating
 from app.models.user import User, UserProfile
+from app.services.encoding import hobby_fragment
+from app.services.segment_ratings import user_segment, get_segment_popular, PRIOR_COUNT, PRIOR_MEAN
+from app.services.similarity import find_similar_hobbies
+from app.services.top_gatherings import top_gatherings_many
 import logging
 from sqlalchemy import func, desc, and_
 from collections import defaultdict
@@ -151,6 +155,15 @@ def get_collaborative_filtering_score(user_id, hobby_id, top_k=10):
         return 0.0
 
 
+def _attach_top_gatherings(recommendations, limit=3):
+    """추천 항목마다 취미의 인기 모임 추가 (메모리 목록에서, 쿼리 없음)"""
+    # item['hobby']는 미리 인코딩된 취미 조각 (JSONFragment) 또는 캐시에서 읽은 dict
+    hobby_ids = [getattr(item['hobby'], 'value', item['hobby'])['hobby_id'] for item in recommendations]
+    gatherings = top_gatherings_many(hobby_ids, limit=limit)
+    for item, hobby_id in zip(recommendations, hobby_ids):
+        item['top_gatherings'] = gatherings[hobby_id]
+
+
 @recommendations_bp.route('', methods=['GET'])
 @jwt_required()
 def get_personalized_recommendations():
@@ -232,7 +245,7 @@ def get_personalized_recommendations():
                           popularity_score * 0.1)
 
             recommendations.append({
-                'hobby': hobby.to_dict(include_stats=True),
+                'hobby': hobby_fragment(hobby),
                 'recommendation_score': round(final_score, 4),
                 'match_percentage': round(final_score * 100, 1),
                 'score_breakdown': {
@@ -247,6 +260,7 @@ def get_personalized_recommendations():
 
         # 상위 N개만 반환
         top_recommendations = recommendations[:limit]
+        _attach_top_gatherings(top_recommendations)
 
         return jsonify({
             'status': 'success',
@@ -270,13 +284,18 @@ def get_popular_hobbies():
     """
     인기 취미 조회 (평점 및 평가 수 기반)
     GET /api/recommendations/popular?limit=10&period=all
+    GET /api/recommendations/popular?segment=me (나와 같은 연령대/성별/지역 기준, 로그인 필요)
     """
     try:
         limit = request.args.get('limit', 10, type=int)
         period = request.args.get('period', 'all')  # all, week, month
+        segment = request.args.get('segment')
 
         limit = min(limit, 50)
 
+        if segment == 'me':
+            return get_segment_popular_hobbies(limit)
+
         # 기본 쿼리
         query = db.session.query(
             Hobby,
@@ -316,7 +335,7 @@ def get_popular_hobbies():
                 bayesian_avg = C
 
             popular_hobbies.append({
-                'hobby': hobby.to_dict(include_stats=True),
+                'hobby': hobby_fragment(hobby),
                 'avg_rating': round(float(avg_rating), 2) if avg_rating else 0,
                 'rating_count': rating_count,
                 'popularity_score': round(bayesian_avg, 2)
@@ -345,6 +364,53 @@ def get_popular_hobbies():
         }), 500
 
 
+def get_segment_popular_hobbies(limit):
+    """
+    나와 비슷한 사람들의 인기 취미 (세그먼트 집계 테이블 기반)
+    """
+    verify_jwt_in_request(optional=True)
+    current_user_id = get_jwt_identity()
+    if not current_user_id:
+        return jsonify({
+            'error': 'Unauthorized',
+            'message': '로그인이 필요합니다.'
+        }), 401
+
+    segment = user_segment(current_user_id)
+    if segment is None:
+        return jsonify({
+            'error': 'User Not Found',
+            'message': '사용자를 찾을 수 없습니다.'
+        }), 404
+
+    # 베이지안 평균순 상위 limit개 (정렬/제한은 DB에서, 전체 인기 취미와 같은 기준)
+    top_popular = []
+    for hobby, rating_count, rating_sum in get_segment_popular(segment, limit):
+        avg_rating = rating_sum / rating_count
+        bayesian_avg = (rating_sum + PRIOR_COUNT * PRIOR_MEAN) / (rating_count + PRIOR_COUNT)
+
+        top_popular.append({
+            'hobby': hobby_fragment(hobby),
+            'avg_rating': round(avg_rating, 2),
+            'rating_count': rating_count,
+            'popularity_score': round(bayesian_avg, 2)
+        })
+
+    age_band, gender, region = segment
+    return jsonify({
+        'status': 'success',
+        'data': {
+            'popular_hobbies': top_popular,
+            'total': len(top_popular),
+            'segment': {
+                'age_band': age_band or None,
+                'gender': gender or None,
+                'region': region or None
+            }
+        }
+    }), 200
+
+
 @recommendations_bp.route('/similar/<int:hobby_id>', methods=['GET'])
 def get_similar_hobbies(hobby_id):
     """
@@ -363,43 +429,13 @@ def get_similar_hobbies(hobby_id):
                 'message': '취미를 찾을 수 없습니다.'
             }), 404
 
-        # 다른 취미들 조회
-        other_hobbies = Hobby.query.filter(
-            Hobby.hobby_id != hobby_id,
-            Hobby.is_deleted == False
-        ).all()
-
-        if not other_hobbies:
-            return jsonify({
-                'status': 'success',
-                'data': {
-                    'base_hobby': base_hobby.to_dict(include_stats=True),
-                    'similar_hobbies': [],
-                    'total': 0
-                }
-            }), 200
-
-        # 유사도 계산
-        similar_hobbies = []
-        for hobby in other_hobbies:
-            similarity_score = calculate_hobby_similarity(base_hobby, hobby)
-
-            similar_hobbies.append({
-                'hobby': hobby.to_dict(include_stats=True),
-                'similarity_score': round(similarity_score, 4),
-                'similarity_percentage': round(similarity_score * 100, 1)
-            })
-
-        # 유사도 순으로 정렬
-        similar_hobbies.sort(key=lambda x: x['similarity_score'], reverse=True)
-
-        # 상위 N개
-        top_similar = similar_hobbies[:limit]
+        # 유사도 상위 N개 (카탈로그가 변경되지 않았다면 캐시에서 조회)
+        top_similar = find_similar_hobbies(base_hobby, limit)
 
         return jsonify({
             'status': 'success',
             'data': {
-                'base_hobby': base_hobby.to_dict(include_stats=True),
+                'base_hobby': hobby_fragment(base_hobby),
                 'similar_hobbies': top_similar,
                 'total': len(top_similar)
             }
@@ -413,64 +449,6 @@ def get_similar_hobbies(hobby_id):
         }), 500
 
 
-def calculate_hobby_similarity(hobby1, hobby2):
-    """
-    두 취미 간의 유사도 계산
-    범위: 0.0 ~ 1.0
-    """
-    similarity = 0.0
-    weights = 0.0
-
-    # 1. 카테고리 일치 (가중치 0.3)
-    if hobby1.category == hobby2.category:
-        similarity += 0.3
-    weights += 0.3
-
-    # 2. 실내/외 일치 (가중치 0.15)
-    if hobby1.indoor_outdoor == hobby2.indoor_outdoor:
-        similarity += 0.15
-    elif 'both' in [hobby1.indoor_outdoor, hobby2.indoor_outdoor]:
-        similarity += 0.1
-    weights += 0.15
-
-    # 3. 사회성/개인 일치 (가중치 0.15)
-    if hobby1.social_individual == hobby2.social_individual:
-        similarity += 0.15
-    elif 'both' in [hobby1.social_individual, hobby2.social_individual]:
-        similarity += 0.1
-    weights += 0.15
-
-    # 4. 예산 유사도 (가중치 0.1)
-    budget_map = {'low': 1, 'medium': 2, 'high': 3}
-    budget_diff = abs(budget_map.get(hobby1.required_budget, 2) -
-                     budget_map.get(hobby2.required_budget, 2))
-    budget_similarity = (2 - budget_diff) / 2  # 0~1
-    similarity += budget_similarity * 0.1
-    weights += 0.1
-
-    # 5. 난이도 유사도 (가중치 0.1)
-    difficulty_diff = abs(hobby1.difficulty_level - hobby2.difficulty_level)
-    difficulty_similarity = (4 - difficulty_diff) / 4  # 0~1
-    similarity += difficulty_similarity * 0.1
-    weights += 0.1
-
-    # 6. 신체 강도 유사도 (가중치 0.1)
-    physical_diff = abs(hobby1.physical_intensity - hobby2.physical_intensity)
-    physical_similarity = (4 - physical_diff) / 4
-    similarity += physical_similarity * 0.1
-    weights += 0.1
-
-    # 7. 창의성 유사도 (가중치 0.1)
-    creativity_diff = abs(hobby1.creativity_level - hobby2.creativity_level)
-    creativity_similarity = (4 - creativity_diff) / 4
-    similarity += creativity_similarity * 0.1
-    weights += 0.1
-
-    if weights > 0:
-        return similarity / weights
-    return 0.0
-
-
 @recommendations_bp.route('/category/<category>', methods=['GET'])
 def get_recommendations_by_category(category):
     """
@@ -518,7 +496,7 @@ def get_recommendations_by_category(category):
                 bayesian_avg = C
 
             recommendations.append({
-                'hobby': hobby.to_dict(include_stats=True),
+                'hobby': hobby_fragment(hobby),
                 'avg_rating': round(float(avg_rating), 2) if avg_rating else 0,
                 'rating_count': rating_count,
                 'score': round(bayesian_avg, 2)
@@ -526,6 +504,7 @@ def get_recommendations_by_category(category):
 
         recommendations.sort(key=lambda x: x['score'], reverse=True)
         top_recommendations = recommendations[:limit]
+        _attach_top_gatherings(top_recommendations)
 
         return jsonify({
             'status': 'success',
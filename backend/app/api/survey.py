@@ -7,6 +7,7 @@ from flask import Blueprint, request, jsonify
 from flask_jwt_extended import jwt_required, get_jwt_identity
 from app.models import db
 from app.models.user import User, UserProfile, SurveyQuestion, SurveyResponse
+from app.services.http_cache import conditional_get
 import logging
 from datetime import datetime
 from sqlalchemy import func
@@ -17,6 +18,7 @@ survey_bp = Blueprint('survey', __name__, url_prefix='/api/survey')
 
 
 @survey_bp.route('/questions', methods=['GET'])
+@conditional_get('survey')
 def get_survey_questions():
     """
     설문 질문 목록 조회
@@ -0,0 +1,22 @@
+"""
+CLI 명령 패키지
+flask <그룹> <명령> 형태의 관리 명령을 제공합니다.
+"""
+
+import sys
+
+import click
+
+from app.models import db
+
+
+def run_rebuild(label, builder, message):
+    """재구성 작업 실행 → 완료 메시지 출력 (실패하면 롤백 후 종료 코드 1)"""
+    click.echo(f"🔧 {label} 시작", err=True)
+    try:
+        count = builder()
+    except Exception as e:
+        db.session.rollback()
+        click.echo(f"❌ {label} 실패: {str(e)}", err=True)
+        sys.exit(1)
+    click.echo(f"✅ 완료: {message.format(count)}", err=True)
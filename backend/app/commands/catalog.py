@@ -0,0 +1,105 @@
+"""
+카탈로그 관리 명령
+flask catalog import <hobbies|keywords|ratings> <파일>
+flask catalog export <hobbies|keywords|ratings> <파일>
+flask catalog rebuild <recent-reviews|rating-stats|segment-ratings|review-index>
+"""
+
+import sys
+
+import click
+from flask.cli import AppGroup
+
+from app.commands import run_rebuild
+from app.models import db
+from app.services import catalog_io
+from app.services.bulk import detect_format, iter_records, RecordWriter
+from app.services.rating_stats import rebuild_rating_stats
+from app.services.recent_reviews import rebuild_recent_reviews
+from app.services.review_search import rebuild_review_index
+from app.services.segment_ratings import rebuild_segment_ratings
+
+catalog_cli = AppGroup('catalog', help='카탈로그 데이터 가져오기/내보내기')
+
+ENTITIES = ['hobbies', 'keywords', 'ratings']
+
+IMPORTERS = {
+    'hobbies': catalog_io.import_hobbies,
+    'keywords': catalog_io.import_keywords,
+    'ratings': catalog_io.import_ratings,
+}
+
+EXPORTERS = {
+    'hobbies': (catalog_io.export_hobbies, catalog_io.HOBBY_FIELDS),
+    'keywords': (catalog_io.export_keywords, catalog_io.KEYWORD_FIELDS),
+    'ratings': (catalog_io.export_ratings, catalog_io.RATING_FIELDS),
+}
+
+# 평가로부터 다시 만드는 파생 테이블 → (이름, 재구성 함수, 완료 메시지)
+REBUILDERS = {
+    'recent-reviews': ('최근 리뷰 재구성', rebuild_recent_reviews, '{:,}개 취미의 최근 리뷰'),
+    'rating-stats': ('평가 통계 재구성', rebuild_rating_stats, '{:,}개 취미의 평가 통계'),
+    'segment-ratings': ('세그먼트 집계 재구성', rebuild_segment_ratings, '세그먼트 집계 {:,}행'),
+    'review-index': ('리뷰 색인 재구성', rebuild_review_index, '리뷰 {:,}건 색인'),
+}
+
+
+def _echo_progress(label):
+    def report(value):
+        count = value.processed if hasattr(value, 'processed') else value
+        click.echo(f"  {label}: {count:,}건 처리", err=True)
+    return report
+
+
+@catalog_cli.command('import')
+@click.argument('entity', type=click.Choice(ENTITIES))
+@click.argument('source', type=click.File('r', encoding='utf-8'))
+@click.option('--format', 'fmt', type=click.Choice(['jsonl', 'csv']), help='파일 형식 (기본: 확장자로 추정)')
+@click.option('--chunk-size', default=1000, show_default=True, help='한 번에 쓰는 행 수')
+def import_command(entity, source, fmt, chunk_size):
+    """JSONL/CSV 파일에서 가져오기 (SOURCE가 - 이면 표준 입력)"""
+    fmt = fmt or detect_format(source.name)
+    click.echo(f"📥 {entity} 가져오기 시작 ({fmt})", err=True)
+
+    try:
+        stats = IMPORTERS[entity](
+            iter_records(source, fmt),
+            chunk_size=chunk_size,
+            progress=_echo_progress(entity)
+        )
+    except Exception as e:
+        db.session.rollback()
+        click.echo(f"❌ 가져오기 실패: {str(e)}", err=True)
+        sys.exit(1)
+
+    click.echo(
+        f"✅ 완료: 처리 {stats.processed:,}건, 저장 {stats.written:,}건, 건너뜀 {stats.skipped:,}건",
+        err=True
+    )
+
+
+@catalog_cli.command('export')
+@click.argument('entity', type=click.Choice(ENTITIES))
+@click.argument('target', type=click.File('w', encoding='utf-8'))
+@click.option('--format', 'fmt', type=click.Choice(['jsonl', 'csv']), help='파일 형식 (기본: 확장자로 추정)')
+@click.option('--chunk-size', default=5000, show_default=True, help='한 번에 읽는 행 수')
+def export_command(entity, target, fmt, chunk_size):
+    """JSONL/CSV 파일로 내보내기 (TARGET이 - 이면 표준 출력)"""
+    fmt = fmt or detect_format(target.name)
+    exporter, fieldnames = EXPORTERS[entity]
+    click.echo(f"📤 {entity} 내보내기 시작 ({fmt})", err=True)
+
+    count = exporter(
+        RecordWriter(target, fmt, fieldnames),
+        chunk_size=chunk_size,
+        progress=_echo_progress(entity)
+    )
+    click.echo(f"✅ 완료: {count:,}건", err=True)
+
+
+@catalog_cli.command('rebuild')
+@click.argument('target', type=click.Choice(list(REBUILDERS)))
+def rebuild_command(target):
+    """원본 평가로부터 파생 테이블 재구성 (데이터 이관 후, 집계가 어긋났을 때)"""
+    label, builder, message = REBUILDERS[target]
+    run_rebuild(label, builder, message)
@@ -0,0 +1,94 @@
+"""
+모임 데이터 관리 명령
+flask gatherings sync <파일> [--source opendata] [--format jsonl|csv] [--chunk-size N] [--keep-missing]
+flask gatherings schedules [--chunk-size N]
+flask gatherings flush-member-counts
+flask gatherings rebuild <member-counts|search-index|facets>
+"""
+
+import sys
+
+import click
+from flask.cli import AppGroup
+
+from app.commands import run_rebuild
+from app.models import db
+from app.services.bulk import detect_format, iter_records
+from app.services.facets import refresh_facet_counts
+from app.services.gathering_search import rebuild_gathering_index
+from app.services.gathering_sync import DEFAULT_SOURCE, sync_gatherings
+from app.services.membership import flush_member_counts, rebuild_member_counts
+from app.services.schedules import rebuild_schedules
+
+gatherings_cli = AppGroup('gatherings', help='모임 데이터 관리')
+
+# 원본 모임/가입 정보로부터 다시 만드는 파생 데이터 → (이름, 재구성 함수, 완료 메시지)
+REBUILDERS = {
+    'member-counts': ('회원 수 재계산', rebuild_member_counts, '{:,}개 모임의 회원 수'),
+    'search-index': ('모임 색인 재구성', rebuild_gathering_index, '모임 {:,}개 색인'),
+    'facets': ('패싯 집계 갱신', refresh_facet_counts, '패싯 집계 {:,}건 갱신'),
+}
+
+
+@gatherings_cli.command('sync')
+@click.argument('source_file', type=click.File('r', encoding='utf-8'))
+@click.option('--source', default=DEFAULT_SOURCE, show_default=True, help='데이터 출처 이름')
+@click.option('--format', 'fmt', type=click.Choice(['jsonl', 'csv']), help='파일 형식 (기본: 확장자로 추정)')
+@click.option('--chunk-size', default=1000, show_default=True, help='한 번에 비교/쓰는 레코드 수')
+@click.option('--keep-missing', is_flag=True, help='피드에 없는 모임을 비활성화하지 않음 (부분 피드용)')
+def sync_command(source_file, source, fmt, chunk_size, keep_missing):
+    """외부 모임 피드 파일을 모임 테이블에 동기화 (SOURCE_FILE이 - 이면 표준 입력)"""
+    fmt = fmt or detect_format(source_file.name)
+    click.echo(f"🔄 모임 동기화 시작 ({source}, {fmt})", err=True)
+
+    def report(stats):
+        click.echo(f"  gatherings: {stats.processed:,}건 처리", err=True)
+
+    try:
+        stats = sync_gatherings(
+            iter_records(source_file, fmt),
+            source=source,
+            chunk_size=chunk_size,
+            deactivate_missing=not keep_missing,
+            progress=report
+        )
+    except Exception as e:
+        db.session.rollback()
+        click.echo(f"❌ 동기화 실패: {str(e)}", err=True)
+        sys.exit(1)
+
+    click.echo(
+        f"✅ 완료: 처리 {stats.processed:,}건, 추가 {stats.inserted:,}건, 변경 {stats.updated:,}건, "
+        f"동일 {stats.unchanged:,}건, 비활성화 {stats.deactivated:,}건, 건너뜀 {stats.skipped:,}건",
+        err=True
+    )
+
+
+@gatherings_cli.command('schedules')
+@click.option('--chunk-size', default=1000, show_default=True, help='한 번에 커밋할 모임 수')
+def schedules_command(chunk_size):
+    """모든 모임의 schedule_info를 다시 해석해 정기 일정 테이블 재구성"""
+    click.echo("🗓️ 모임 일정 재구성 시작", err=True)
+
+    try:
+        gatherings, slots = rebuild_schedules(chunk_size=chunk_size)
+    except Exception as e:
+        db.session.rollback()
+        click.echo(f"❌ 재구성 실패: {str(e)}", err=True)
+        sys.exit(1)
+
+    click.echo(f"✅ 완료: 모임 {gatherings:,}개, 일정 {slots:,}건", err=True)
+
+
+@gatherings_cli.command('flush-member-counts')
+def flush_member_counts_command():
+    """가입/탈퇴 증분을 member_count에 합산 (MEMBER_COUNT_FLUSH_SECONDS=0일 때 cron에서 실행)"""
+    run_rebuild('회원 수 합산', flush_member_counts, '{:,}개 모임의 회원 수 합산')
+
+
+@gatherings_cli.command('rebuild')
+@click.argument('target', type=click.Choice(list(REBUILDERS)))
+def rebuild_command(target):
+    """원본으로부터 회원 수/검색 색인/패싯 집계 재구성 (데이터 이관 후, 집계가 어긋났을 때)"""
+    label, builder, message = REBUILDERS[target]
+    run_rebuild(label, builder, message)
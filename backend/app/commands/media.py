@@ -0,0 +1,36 @@
+"""
+취미 미디어 관리 명령
+flask media refresh [--hobby-id N ...] [--force]
+"""
+
+import sys
+
+import click
+from flask import current_app
+from flask.cli import AppGroup
+
+from app.models import db
+from app.services.media_manifest import refresh_media
+
+media_cli = AppGroup('media', help='취미 이미지/영상 메타데이터 관리')
+
+
+@media_cli.command('refresh')
+@click.option('--hobby-id', 'hobby_ids', type=int, multiple=True, help='대상 취미 ID (여러 번 지정 가능, 기본: 전체)')
+@click.option('--force', is_flag=True, help='URL이 바뀌지 않은 항목도 다시 수집')
+def refresh_command(hobby_ids, force):
+    """이미지 크기/해시를 수집하여 미디어 매니페스트 갱신"""
+    click.echo("🖼️ 미디어 메타데이터 수집 시작", err=True)
+
+    try:
+        refreshed, failed = refresh_media(
+            hobby_ids=list(hobby_ids) or None,
+            force=force,
+            timeout=current_app.config['MEDIA_FETCH_TIMEOUT']
+        )
+    except Exception as e:
+        db.session.rollback()
+        click.echo(f"❌ 수집 실패: {str(e)}", err=True)
+        sys.exit(1)
+
+    click.echo(f"✅ 완료: {refreshed:,}건 수집, 실패 {failed:,}건", err=True)
@@ -0,0 +1,46 @@
+"""
+삭제 데이터 정리 명령
+flask purge run [--retention-days N] [--chunk-size N] [--dry-run]
+"""
+
+import sys
+
+import click
+from flask import current_app
+from flask.cli import AppGroup
+
+from app.models import db
+from app.services.purge import purge_deleted
+
+purge_cli = AppGroup('purge', help='보관 기간이 지난 소프트 삭제 데이터 정리')
+
+
+@purge_cli.command('run')
+@click.option('--retention-days', type=int, help='삭제 후 보관 기간 (기본: PURGE_RETENTION_DAYS)')
+@click.option('--chunk-size', type=int, help='한 트랜잭션에서 처리할 취미/사용자 수 (기본: PURGE_CHUNK_SIZE)')
+@click.option('--dry-run', is_flag=True, help='삭제하지 않고 대상 수만 출력')
+def run_command(retention_days, chunk_size, dry_run):
+    """삭제된 취미/사용자와 평가, 설문 응답을 보관 테이블로 이동"""
+    if retention_days is None:
+        retention_days = current_app.config['PURGE_RETENTION_DAYS']
+    if chunk_size is None:
+        chunk_size = current_app.config['PURGE_CHUNK_SIZE']
+    click.echo(f"🧹 삭제 데이터 정리 시작 (보관 기간 {retention_days}일)", err=True)
+
+    try:
+        stats = purge_deleted(retention_days=retention_days, chunk_size=chunk_size, dry_run=dry_run)
+    except Exception as e:
+        db.session.rollback()
+        click.echo(f"❌ 정리 실패: {str(e)}", err=True)
+        sys.exit(1)
+
+    if dry_run:
+        click.echo(f"🔍 정리 대상: 취미 {stats.hobbies:,}개, 사용자 {stats.users:,}명", err=True)
+        return
+
+    click.echo(
+        f"✅ 완료: 취미 {stats.hobbies:,}개, 사용자 {stats.users:,}명, "
+        f"평가 {stats.ratings:,}건, 설문 응답 {stats.responses:,}건, "
+        f"모임 {stats.gatherings:,}개, 모임 가입 {stats.members:,}건 보관",
+        err=True
+    )
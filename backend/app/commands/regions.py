@@ -0,0 +1,39 @@
+"""
+지역 사전 관리 명령
+flask regions sync [--all] [--chunk-size N]
+"""
+
+import sys
+
+import click
+from flask.cli import AppGroup
+
+from app.models import db
+from app.services.regions import seed_provinces, seed_districts, backfill_gathering_regions
+from app.services.facets import refresh_facet_counts
+
+regions_cli = AppGroup('regions', help='지역 사전 관리')
+
+
+@regions_cli.command('sync')
+@click.option('--all', 'reassign_all', is_flag=True, help='region_id가 이미 있는 모임도 다시 지정')
+@click.option('--chunk-size', type=int, default=500, show_default=True, help='한 번에 커밋할 모임 수')
+def sync_command(reassign_all, chunk_size):
+    """시/도, 시/군/구를 등록하고 모임의 region_id를 주소로부터 채움"""
+    click.echo("🗺️ 지역 사전 동기화 시작", err=True)
+
+    try:
+        added = seed_provinces()
+        districts_added = seed_districts()
+        assigned, unresolved = backfill_gathering_regions(
+            chunk_size=chunk_size,
+            only_missing=not reassign_all
+        )
+        # 지역 패싯은 region_id의 시/도로 집계하므로 다시 맞춤
+        refresh_facet_counts()
+    except Exception as e:
+        db.session.rollback()
+        click.echo(f"❌ 동기화 실패: {str(e)}", err=True)
+        sys.exit(1)
+
+    click.echo(f"✅ 완료: 시/도 {added}개, 시/군/구 {districts_added}개 추가, 모임 {assigned:,}개 지정, 지역 미확인 {unresolved:,}개", err=True)
@@ -10,8 +10,10 @@ db = SQLAlchemy()
 
 # 모델 임포트 (순환 참조 방지를 위해 여기서 임포트)
 from .user import User, UserProfile, SurveyQuestion, SurveyResponse
-from .hobby import Hobby, UserHobbyRating, Gathering
+from .hobby import Hobby, HobbyKeyword, HobbyMedia, UserHobbyRating, HobbyRecentReview, HobbySegmentRating, ReviewTerm, HobbyRatingStats, Gathering, GatheringMember, GatheringMemberShard, GatheringSchedule, GatheringTerm, GatheringFacetCount
+from .region import Region
 from .admin import AdminUser, AdminActivityLog, UserFeedback, Announcement, UserNotification
+from .archive import ARCHIVE_TABLES
 
 __all__ = [
     'db',
@@ -20,11 +22,24 @@ __all__ = [
     'SurveyQuestion',
     'SurveyResponse',
     'Hobby',
+    'HobbyKeyword',
+    'HobbyMedia',
     'UserHobbyRating',
+    'HobbyRecentReview',
+    'HobbySegmentRating',
+    'ReviewTerm',
+    'HobbyRatingStats',
     'Gathering',
+    'GatheringMember',
+    'GatheringMemberShard',
+    'GatheringSchedule',
+    'GatheringTerm',
+    'GatheringFacetCount',
+    'Region',
     'AdminUser',
     'AdminActivityLog',
     'UserFeedback',
     'Announcement',
-    'UserNotification'
+    'UserNotification',
+    'ARCHIVE_TABLES'
 ]
\ No newline at end of file
@@ -0,0 +1,42 @@
+"""
+삭제 데이터 보관 테이블
+정리 작업(app.services.purge)이 보관 기간이 지난 소프트 삭제 행을 옮겨 두는 테이블입니다.
+원본 테이블의 컬럼을 그대로 복사하고 보관 시각(archived_at)을 추가합니다.
+(외래키/유니크 제약 없음 - 원본에서 참조 대상이 먼저 삭제될 수 있고, 같은 이름이 다시 보관될 수 있음)
+"""
+
+from datetime import datetime
+
+from . import db
+from .user import User, SurveyResponse
+from .hobby import Hobby, UserHobbyRating, Gathering, GatheringMember
+
+
+def _archive_table(source):
+    columns = [
+        db.Column(column.name, column.type.copy(), primary_key=column.primary_key, autoincrement=False)
+        for column in source.__table__.columns
+    ]
+    return db.Table(
+        f'{source.__tablename__}_archive',
+        db.metadata,
+        *columns,
+        db.Column('archived_at', db.DateTime, nullable=False, default=datetime.utcnow, index=True)
+    )
+
+
+hobbies_archive = _archive_table(Hobby)
+users_archive = _archive_table(User)
+user_hobby_ratings_archive = _archive_table(UserHobbyRating)
+survey_responses_archive = _archive_table(SurveyResponse)
+gatherings_archive = _archive_table(Gathering)
+gathering_members_archive = _archive_table(GatheringMember)
+
+# 원본 테이블 이름 → 보관 테이블
+ARCHIVE_TABLES = {
+    table.name[:-len('_archive')]: table
+    for table in (
+        hobbies_archive, users_archive, user_hobby_ratings_archive, survey_responses_archive,
+        gatherings_archive, gathering_members_archive
+    )
+}
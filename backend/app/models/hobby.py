@@ -1,16 +1,34 @@
 """
 취미 관련 모델
-Hobby, UserHobbyRating, Gathering
+Hobby, HobbyKeyword, HobbyMedia, UserHobbyRating, HobbyRecentReview, HobbySegmentRating, ReviewTerm, HobbyRatingStats,
+Gathering, GatheringMember, GatheringMemberShard
 """
 
+import math
 from datetime import datetime
 from . import db
+from .projection import ProjectionMixin
+from .soft_delete import SoftDeleteMixin, active_only
 from sqlalchemy import CheckConstraint
 
 
-class Hobby(db.Model):
+class Hobby(SoftDeleteMixin, ProjectionMixin, db.Model):
     """취미 마스터 테이블"""
     __tablename__ = 'hobbies'
+
+    PROJECTABLE_FIELDS = (
+        'hobby_id', 'name', 'category', 'description',
+        'difficulty_level', 'physical_intensity', 'creativity_level',
+        'indoor_outdoor', 'social_individual', 'required_budget', 'time_commitment',
+        'tutorial_video_url', 'image_url'
+    )
+    STATS_FIELDS = (
+        'average_rating', 'rating_count',
+        'rating_histogram', 'median_rating', 'rating_percentiles'
+    )
+    # 미디어 매니페스트(GET /api/hobbies/media-manifest)로 대신 받을 수 있는 필드
+    MEDIA_FIELDS = ('tutorial_video_url', 'image_url')
+    PROJECTION_REQUIRED = ('hobby_id',)
     
     hobby_id = db.Column(db.Integer, primary_key=True)
     name = db.Column(db.String(100), unique=True, nullable=False)
@@ -32,8 +50,8 @@ class Hobby(db.Model):
     tutorial_video_url = db.Column(db.String(500))
     image_url = db.Column(db.String(500))
     
-    # 소프트 삭제
-    is_deleted = db.Column(db.Boolean, default=False, index=True)
+    # 소프트 삭제 (삭제 시각은 SoftDeleteMixin.deleted_at, 인덱스는 idx_hobbies_purge)
+    is_deleted = db.Column(db.Boolean, default=False)
     
     # 타임스탬프
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
@@ -42,6 +60,11 @@ class Hobby(db.Model):
     # 관계
     ratings = db.relationship('UserHobbyRating', backref='hobby', cascade='all, delete-orphan')
     gatherings = db.relationship('Gathering', backref='hobby', cascade='all, delete-orphan')
+    keywords = db.relationship('HobbyKeyword', backref='hobby', cascade='all, delete-orphan')
+    # 평가 통계 카운터 (취미 조회 시 함께 조인하여 통계 계산에 추가 쿼리 없음)
+    rating_stats = db.relationship(
+        'HobbyRatingStats', uselist=False, lazy='joined', cascade='all, delete-orphan'
+    )
     
     # 제약조건
     __table_args__ = (
@@ -49,28 +72,56 @@ class Hobby(db.Model):
         CheckConstraint('physical_intensity >= 1 AND physical_intensity <= 5', name='chk_physical'),
         CheckConstraint('creativity_level >= 1 AND creativity_level <= 5', name='chk_creativity'),
         db.Index('idx_hobby_attributes', 'indoor_outdoor', 'social_individual', 'required_budget', 'difficulty_level'),
-        db.Index('idx_hobbies_active', 'is_deleted', 'category'),
+        # PostgreSQL/SQLite는 부분 인덱스, MySQL(운영)은 (is_deleted, category) 복합 인덱스로 활성 행 범위만 조회
+        db.Index('idx_hobbies_active', 'is_deleted', 'category', **active_only(is_deleted)),
+        db.Index('idx_hobbies_purge', 'is_deleted', 'deleted_at'),
+        db.Index('idx_hobbies_updated', 'updated_at', 'hobby_id'),
     )
     
+    def _stats(self):
+        """평가 통계 카운터 (평가가 없으면 빈 카운터)"""
+        return self.rating_stats or HobbyRatingStats.empty()
+
     def get_average_rating(self):
-        """평균 평점 계산"""
-        try:
-            if not self.ratings:
-                return 0.0
-            total = sum(r.rating for r in self.ratings)
-            return round(total / len(self.ratings), 2)
-        except Exception as e:
-            return 0.0
+        """평균 평점 (카운터 기반)"""
+        return self._stats().average()
     
     def get_rating_count(self):
-        """평가 개수"""
-        try:
-            return len(self.ratings)
-        except Exception:
-            return 0
+        """평가 개수 (카운터 기반)"""
+        return self._stats().rating_count or 0
+
+    def get_rating_histogram(self):
+        """별점별 평가 수 {'1': n, ..., '5': n}"""
+        return self._stats().histogram()
+
+    def get_median_rating(self):
+        """평점 중앙값"""
+        return self._stats().median()
+
+    def get_rating_percentiles(self):
+        """평점 백분위수 (p25, p75, p90)"""
+        return self._stats().percentiles()
     
-    def to_dict(self, include_stats=False):
-        """딕셔너리 변환"""
+    def to_dict(self, include_stats=False, fields=None, include_media=True):
+        """
+        딕셔너리 변환 (fields가 있으면 해당 필드만)
+        include_media=False면 미디어 URL을 제외 (클라이언트가 미디어 매니페스트를 사용하는 경우)
+        """
+        if fields is not None and not include_media:
+            fields = [name for name in fields if name not in self.MEDIA_FIELDS]
+        if fields is not None:
+            computed = {}
+            if include_stats:
+                computed = {
+                    'average_rating': self.get_average_rating,
+                    'rating_count': self.get_rating_count,
+                    'rating_histogram': self.get_rating_histogram,
+                    'median_rating': self.get_median_rating,
+                    'rating_percentiles': self.get_rating_percentiles
+                }
+            names = [name for name in fields if include_stats or name not in self.STATS_FIELDS]
+            return self.project(names, computed)
+
         data = {
             'hobby_id': self.hobby_id,
             'name': self.name,
@@ -86,10 +137,17 @@ class Hobby(db.Model):
             'tutorial_video_url': self.tutorial_video_url,
             'image_url': self.image_url
         }
+        if not include_media:
+            for name in self.MEDIA_FIELDS:
+                del data[name]
         
         if include_stats:
-            data['average_rating'] = self.get_average_rating()
-            data['rating_count'] = self.get_rating_count()
+            stats = self._stats()
+            data['average_rating'] = stats.average()
+            data['rating_count'] = stats.rating_count or 0
+            data['rating_histogram'] = stats.histogram()
+            data['median_rating'] = stats.median()
+            data['rating_percentiles'] = stats.percentiles()
         
         return data
     
@@ -97,9 +155,77 @@ class Hobby(db.Model):
         return f'<Hobby {self.name}>'
 
 
-class UserHobbyRating(db.Model):
+class HobbyKeyword(db.Model):
+    """취미 키워드 (검색 및 추천용)"""
+    __tablename__ = 'hobby_keywords'
+
+    keyword_id = db.Column(db.Integer, primary_key=True)
+    hobby_id = db.Column(db.Integer, db.ForeignKey('hobbies.hobby_id', ondelete='CASCADE'), nullable=False)
+    keyword = db.Column(db.String(50), nullable=False, index=True)
+
+    __table_args__ = (
+        db.UniqueConstraint('hobby_id', 'keyword', name='unique_hobby_keyword'),
+    )
+
+    def to_dict(self):
+        """딕셔너리 변환"""
+        return {
+            'keyword_id': self.keyword_id,
+            'hobby_id': self.hobby_id,
+            'keyword': self.keyword
+        }
+
+    def __repr__(self):
+        return f'<HobbyKeyword hobby={self.hobby_id} {self.keyword}>'
+
+
+class HobbyMedia(db.Model):
+    """
+    취미 미디어(이미지/영상) 메타데이터
+    flask media refresh로 수집하며, 미디어 매니페스트 응답에 사용됩니다.
+    """
+    __tablename__ = 'hobby_media'
+
+    # 종류 → 취미 컬럼
+    KINDS = {'image': 'image_url', 'video': 'tutorial_video_url'}
+
+    hobby_id = db.Column(db.Integer, db.ForeignKey('hobbies.hobby_id', ondelete='CASCADE'), primary_key=True)
+    kind = db.Column(db.Enum('image', 'video'), primary_key=True)
+    url = db.Column(db.String(500), nullable=False)
+    content_type = db.Column(db.String(100))
+    width = db.Column(db.Integer)
+    height = db.Column(db.Integer)
+    byte_size = db.Column(db.Integer)
+    content_hash = db.Column(db.String(64))  # SHA-256 (16진수)
+    version = db.Column(db.Integer, nullable=False, default=1)  # 내용이 바뀔 때마다 증가 (캐시 무효화용)
+    checked_at = db.Column(db.DateTime, default=datetime.utcnow)
+
+    def to_manifest(self):
+        """매니페스트 항목 (값이 없는 키는 생략)"""
+        entry = {
+            'url': self.url,
+            'type': self.content_type,
+            'w': self.width,
+            'h': self.height,
+            'size': self.byte_size,
+            'hash': self.content_hash[:16] if self.content_hash else None,
+            'v': self.version
+        }
+        return {key: value for key, value in entry.items() if value is not None}
+
+    def __repr__(self):
+        return f'<HobbyMedia {self.hobby_id}:{self.kind}>'
+
+
+class UserHobbyRating(ProjectionMixin, db.Model):
     """사용자의 취미 평가"""
     __tablename__ = 'user_hobby_ratings'
+
+    PROJECTABLE_FIELDS = (
+        'rating_id', 'user_id', 'hobby_id', 'rating',
+        'review_text', 'experienced', 'created_at'
+    )
+    PROJECTION_REQUIRED = ('rating_id',)
     
     rating_id = db.Column(db.Integer, primary_key=True)
     user_id = db.Column(db.Integer, db.ForeignKey('users.user_id', ondelete='CASCADE'), nullable=False)
@@ -117,8 +243,11 @@ class UserHobbyRating(db.Model):
         CheckConstraint('rating >= 1 AND rating <= 5', name='chk_rating_range'),
     )
     
-    def to_dict(self):
-        """딕셔너리 변환"""
+    def to_dict(self, fields=None):
+        """딕셔너리 변환 (fields가 있으면 해당 필드만)"""
+        if fields is not None:
+            return self.project(fields)
+
         return {
             'rating_id': self.rating_id,
             'user_id': self.user_id,
@@ -133,9 +262,161 @@ class UserHobbyRating(db.Model):
         return f'<UserHobbyRating user={self.user_id} hobby={self.hobby_id} rating={self.rating}>'
 
 
-class Gathering(db.Model):
+class HobbyRecentReview(db.Model):
+    """
+    취미별 최근 리뷰 (상세 페이지용)
+    평가 저장 시 갱신되며 취미당 최대 MAX_PER_HOBBY개만 유지합니다.
+    """
+    __tablename__ = 'hobby_recent_reviews'
+
+    MAX_PER_HOBBY = 5
+
+    review_id = db.Column(db.Integer, primary_key=True)
+    hobby_id = db.Column(db.Integer, db.ForeignKey('hobbies.hobby_id', ondelete='CASCADE'), nullable=False)
+    user_id = db.Column(db.Integer, db.ForeignKey('users.user_id', ondelete='CASCADE'), nullable=False)
+    rating = db.Column(db.Integer, nullable=False)
+    review_text = db.Column(db.Text, nullable=False)
+    experienced = db.Column(db.Boolean, default=False)
+    created_at = db.Column(db.DateTime, nullable=False)  # 원본 평가의 작성 시각
+
+    __table_args__ = (
+        db.UniqueConstraint('hobby_id', 'user_id', name='unique_recent_review'),
+        db.Index('idx_recent_review_hobby', 'hobby_id', db.text('created_at DESC')),
+    )
+
+    def to_dict(self):
+        """딕셔너리 변환 (취미 상세의 recent_reviews 형식)"""
+        return {
+            'rating': self.rating,
+            'review_text': self.review_text,
+            'experienced': self.experienced,
+            'created_at': self.created_at.isoformat() if self.created_at else None
+        }
+
+    def __repr__(self):
+        return f'<HobbyRecentReview hobby={self.hobby_id} user={self.user_id}>'
+
+
+class HobbySegmentRating(db.Model):
+    """
+    사용자 세그먼트(연령대, 성별, 지역)별 취미 평가 집계
+    평가 저장 시 증분으로 갱신되며, 세그먼트 인기 취미를 기본키 범위 조회 한 번으로 읽습니다.
+    (알 수 없는 값은 빈 문자열)
+    """
+    __tablename__ = 'hobby_segment_ratings'
+
+    age_band = db.Column(db.String(10), primary_key=True)
+    gender = db.Column(db.String(10), primary_key=True)
+    region = db.Column(db.String(50), primary_key=True)
+    hobby_id = db.Column(db.Integer, db.ForeignKey('hobbies.hobby_id', ondelete='CASCADE'), primary_key=True)
+    rating_count = db.Column(db.Integer, nullable=False, default=0)
+    rating_sum = db.Column(db.Integer, nullable=False, default=0)
+
+    def __repr__(self):
+        return f'<HobbySegmentRating {self.age_band}/{self.gender}/{self.region} hobby={self.hobby_id}>'
+
+
+class HobbyRatingStats(db.Model):
+    """
+    취미별 평가 통계 카운터 (별점별 평가 수, 평가 수, 평점 합계)
+    평가 저장 시 증분으로 갱신되며, 평균/히스토그램/백분위수를 집계 쿼리 없이 계산합니다.
+    """
+    __tablename__ = 'hobby_rating_stats'
+
+    PERCENTILES = (25, 75, 90)
+
+    hobby_id = db.Column(db.Integer, db.ForeignKey('hobbies.hobby_id', ondelete='CASCADE'), primary_key=True)
+    count_1 = db.Column(db.Integer, nullable=False, default=0)
+    count_2 = db.Column(db.Integer, nullable=False, default=0)
+    count_3 = db.Column(db.Integer, nullable=False, default=0)
+    count_4 = db.Column(db.Integer, nullable=False, default=0)
+    count_5 = db.Column(db.Integer, nullable=False, default=0)
+    rating_count = db.Column(db.Integer, nullable=False, default=0)
+    rating_sum = db.Column(db.Integer, nullable=False, default=0)
+
+    @classmethod
+    def empty(cls):
+        return cls(
+            count_1=0, count_2=0, count_3=0, count_4=0, count_5=0,
+            rating_count=0, rating_sum=0
+        )
+
+    def counts(self):
+        """별점 1~5의 평가 수 리스트"""
+        return [self.count_1 or 0, self.count_2 or 0, self.count_3 or 0, self.count_4 or 0, self.count_5 or 0]
+
+    def average(self):
+        if not self.rating_count:
+            return 0.0
+        return round(self.rating_sum / self.rating_count, 2)
+
+    def histogram(self):
+        return {str(star): count for star, count in enumerate(self.counts(), start=1)}
+
+    def _value_at(self, rank):
+        """정렬된 평점에서 rank번째(1부터) 값"""
+        cumulative = 0
+        for star, count in enumerate(self.counts(), start=1):
+            cumulative += count
+            if cumulative >= rank:
+                return star
+        return 5
+
+    def median(self):
+        total = sum(self.counts())
+        if not total:
+            return None
+        middle = (self._value_at((total + 1) // 2) + self._value_at(total // 2 + 1)) / 2
+        return float(middle)
+
+    def percentiles(self):
+        """백분위수 (nearest-rank 방식)"""
+        total = sum(self.counts())
+        if not total:
+            return {f'p{p}': None for p in self.PERCENTILES}
+        return {
+            f'p{p}': self._value_at(max(1, math.ceil(p / 100 * total)))
+            for p in self.PERCENTILES
+        }
+
+    def __repr__(self):
+        return f'<HobbyRatingStats hobby={self.hobby_id} count={self.rating_count}>'
+
+
+class ReviewTerm(db.Model):
+    """
+    리뷰 역색인 (색인어 → 평가)
+    평가 저장 시 리뷰가 바뀐 평가만 다시 색인합니다.
+    (term, rating_id) 순서로 정렬되어 있어 검색 결과를 최신순 키셋으로 페이지네이션합니다.
+    """
+    __tablename__ = 'review_terms'
+
+    term = db.Column(db.String(20), primary_key=True)
+    rating_id = db.Column(
+        db.Integer,
+        db.ForeignKey('user_hobby_ratings.rating_id', ondelete='CASCADE'),
+        primary_key=True
+    )
+    hobby_id = db.Column(db.Integer, nullable=False)
+
+    __table_args__ = (
+        db.Index('idx_review_term_hobby', 'term', 'hobby_id', 'rating_id'),
+    )
+
+    def __repr__(self):
+        return f'<ReviewTerm {self.term} rating={self.rating_id}>'
+
+
+class Gathering(ProjectionMixin, db.Model):
     """모임/동아리 정보"""
     __tablename__ = 'gatherings'
+
+    PROJECTABLE_FIELDS = (
+        'gathering_id', 'hobby_id', 'name', 'description', 'location', 'region', 'region_id',
+        'latitude', 'longitude', 'meeting_type', 'schedule_info', 'member_count', 'contact_info',
+        'website_url', 'is_active', 'created_at'
+    )
+    PROJECTION_REQUIRED = ('gathering_id', 'hobby_id')
     
     gathering_id = db.Column(db.Integer, primary_key=True)
     hobby_id = db.Column(db.Integer, db.ForeignKey('hobbies.hobby_id', ondelete='CASCADE'), nullable=False)
@@ -143,21 +424,36 @@ class Gathering(db.Model):
     description = db.Column(db.Text)
     location = db.Column(db.String(200))
     region = db.Column(db.String(50), index=True)
+    region_id = db.Column(db.Integer, db.ForeignKey('regions.region_id', ondelete='SET NULL'))  # 정규화된 지역 (시/군/구 또는 시/도)
+    latitude = db.Column(db.Float)
+    longitude = db.Column(db.Float)
+    geohash = db.Column(db.String(12), index=True)  # 반경 검색용 (set_coordinates로 갱신)
     meeting_type = db.Column(db.Enum('online', 'offline', 'hybrid'), default='offline')
     schedule_info = db.Column(db.Text)
-    member_count = db.Column(db.Integer, default=0)
+    member_count = db.Column(db.Integer, default=0)  # 가입/탈퇴 증분을 주기적으로 합산 (GatheringMemberShard)
     contact_info = db.Column(db.String(200))
     website_url = db.Column(db.String(500))
     is_active = db.Column(db.Boolean, default=True, index=True)
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
+
+    # 외부 데이터 동기화 (flask gatherings sync, 직접 등록한 모임은 NULL)
+    source = db.Column(db.String(30))          # 데이터 출처 (예: opendata)
+    external_id = db.Column(db.String(100))    # 출처의 모임 ID
+    content_hash = db.Column(db.String(40))    # 마지막으로 반영한 레코드 내용의 해시
     
     # 복합 인덱스
     __table_args__ = (
-        db.Index('idx_gathering_location', 'hobby_id', 'region', 'is_active'),
+        db.UniqueConstraint('source', 'external_id', name='uq_gathering_source_external'),
+        db.Index('idx_gathering_location', 'hobby_id', 'region_id', 'is_active'),
+        db.Index('idx_gathering_region', 'region_id', 'is_active'),
+        db.Index('idx_gathering_popular', 'is_active', 'member_count'),
     )
     
-    def to_dict(self):
-        """딕셔너리 변환"""
+    def to_dict(self, fields=None):
+        """딕셔너리 변환 (fields가 있으면 해당 필드만)"""
+        if fields is not None:
+            return self.project(fields)
+
         return {
             'gathering_id': self.gathering_id,
             'hobby_id': self.hobby_id,
@@ -165,6 +461,9 @@ class Gathering(db.Model):
             'description': self.description,
             'location': self.location,
             'region': self.region,
+            'region_id': self.region_id,
+            'latitude': self.latitude,
+            'longitude': self.longitude,
             'meeting_type': self.meeting_type,
             'schedule_info': self.schedule_info,
             'member_count': self.member_count,
@@ -174,5 +473,125 @@ class Gathering(db.Model):
             'created_at': self.created_at.isoformat() if self.created_at else None
         }
     
+    def set_coordinates(self, latitude, longitude):
+        """좌표 설정 (geohash 함께 갱신, 둘 다 None이면 좌표 제거)"""
+        from app.services.geo import encode_geohash
+
+        if latitude is None and longitude is None:
+            self.latitude = self.longitude = self.geohash = None
+            return
+
+        latitude, longitude = float(latitude), float(longitude)
+        if not (-90.0 <= latitude <= 90.0 and -180.0 <= longitude <= 180.0):
+            raise ValueError('위도는 -90~90, 경도는 -180~180 범위여야 합니다.')
+
+        self.latitude = latitude
+        self.longitude = longitude
+        self.geohash = encode_geohash(latitude, longitude)
+
+    def __repr__(self):
+        return f'<Gathering {self.name}>'
+
+
+class GatheringMember(db.Model):
+    """모임 가입 정보"""
+    __tablename__ = 'gathering_members'
+
+    gathering_id = db.Column(db.Integer, db.ForeignKey('gatherings.gathering_id', ondelete='CASCADE'), primary_key=True)
+    user_id = db.Column(db.Integer, db.ForeignKey('users.user_id', ondelete='CASCADE'), primary_key=True, index=True)
+    joined_at = db.Column(db.DateTime, default=datetime.utcnow)
+
+    def __repr__(self):
+        return f'<GatheringMember {self.gathering_id}:{self.user_id}>'
+
+
+class GatheringMemberShard(db.Model):
+    """
+    모임 회원 수 증분 카운터 (모임당 여러 행으로 나누어 가입/탈퇴가 한 행의 잠금을 기다리지 않도록 함)
+    주기적으로 gatherings.member_count에 합산되고 합산한 만큼 차감됩니다.
+    """
+    __tablename__ = 'gathering_member_shards'
+
+    gathering_id = db.Column(db.Integer, db.ForeignKey('gatherings.gathering_id', ondelete='CASCADE'), primary_key=True)
+    shard = db.Column(db.SmallInteger, primary_key=True)
+    delta = db.Column(db.Integer, nullable=False, default=0)
+
+    def __repr__(self):
+        return f'<GatheringMemberShard {self.gathering_id}:{self.shard} {self.delta:+d}>'
+
+
+class GatheringSchedule(db.Model):
+    """
+    모임 정기 일정 (schedule_info를 해석한 요일/시간대)
+    요일(0=월요일)과 분 단위 시간대로 저장해 "이번 주말" 같은 기간 조회가 (weekday, start_minute, end_minute) 인덱스를 사용합니다.
+    """
+    __tablename__ = 'gathering_schedules'
+
+    schedule_id = db.Column(db.Integer, primary_key=True)
+    gathering_id = db.Column(db.Integer, db.ForeignKey('gatherings.gathering_id', ondelete='CASCADE'), nullable=False, index=True)
+    weekday = db.Column(db.SmallInteger, nullable=False)          # 0=월요일 ~ 6=일요일
+    start_minute = db.Column(db.SmallInteger, nullable=False)     # 0 ~ 1439
+    end_minute = db.Column(db.SmallInteger, nullable=False)       # 1 ~ 1440 (시간 미정이면 하루 전체)
+    frequency = db.Column(db.Enum('weekly', 'biweekly', 'monthly'), nullable=False, default='weekly')
+    week_of_month = db.Column(db.SmallInteger)                    # 매월 N째 주 (1~5, 마지막 주 -1)
+
+    __table_args__ = (
+        db.Index('idx_schedule_window', 'weekday', 'start_minute', 'end_minute'),
+    )
+
+    def to_dict(self):
+        """딕셔너리 변환"""
+        return {
+            'weekday': self.weekday,
+            'start_time': f'{self.start_minute // 60:02d}:{self.start_minute % 60:02d}',
+            'end_time': f'{self.end_minute // 60:02d}:{self.end_minute % 60:02d}',
+            'frequency': self.frequency,
+            'week_of_month': self.week_of_month
+        }
+
+    def __repr__(self):
+        return f'<GatheringSchedule {self.gathering_id} weekday={self.weekday}>'
+
+
+class GatheringTerm(db.Model):
+    """
+    모임 검색 역색인 (색인어 → 활성 모임)
+    모임명/설명의 색인어마다 한 행이며, 취미/지역/모임 유형을 함께 두어 필터를 색인 안에서 적용합니다.
+    weight는 색인어가 나온 필드의 가중치 합(모임명 3, 설명 1)으로 관련도 정렬에 사용합니다.
+    """
+    __tablename__ = 'gathering_terms'
+
+    term = db.Column(db.String(20), primary_key=True)
+    gathering_id = db.Column(
+        db.Integer,
+        db.ForeignKey('gatherings.gathering_id', ondelete='CASCADE'),
+        primary_key=True
+    )
+    hobby_id = db.Column(db.Integer, nullable=False)
+    region_id = db.Column(db.Integer)
+    meeting_type = db.Column(db.String(10))
+    weight = db.Column(db.SmallInteger, nullable=False, default=1)
+
+    __table_args__ = (
+        db.Index('idx_gathering_term_hobby', 'term', 'hobby_id'),
+        db.Index('idx_gathering_term_region', 'term', 'region_id'),
+        db.Index('idx_gathering_term_gathering', 'gathering_id'),
+    )
+
+    def __repr__(self):
+        return f'<GatheringTerm {self.term} gathering={self.gathering_id}>'
+
+
+class GatheringFacetCount(db.Model):
+    """
+    모임 패싯 집계 (지역/모임 유형/취미별 활성 모임 수)
+    모임 생성/수정/삭제 시 증분으로 갱신하고 주기적으로 원본과 맞춥니다. (app/services/facets.py)
+    """
+    __tablename__ = 'gathering_facet_counts'
+
+    facet = db.Column(db.String(20), primary_key=True)   # region, meeting_type, hobby
+    value = db.Column(db.String(50), primary_key=True)   # 지역명, 모임 유형, 취미 ID
+    count = db.Column(db.Integer, nullable=False, default=0)
+
     def __repr__(self):
-        return f'<Gathering {self.name}>'
\ No newline at end of file
+        return f'<GatheringFacetCount {self.facet}={self.value} count={self.count}>'
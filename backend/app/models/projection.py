@@ -0,0 +1,60 @@
+"""
+필드 프로젝션 (?fields=...)
+목록 API에서 클라이언트가 요청한 필드만 조회/직렬화하도록
+쿼리 옵션(load_only)과 딕셔너리 변환을 함께 제공합니다.
+"""
+
+from datetime import datetime
+
+from sqlalchemy.orm import load_only
+
+
+class ProjectionMixin:
+    """
+    모델 믹스인
+    - PROJECTABLE_FIELDS: ?fields=로 선택 가능한 필드 (컬럼명 또는 계산 필드명)
+    - PROJECTION_REQUIRED: 항상 포함되는 필드 (기본키, 후처리에 필요한 외래키 등)
+    """
+
+    PROJECTABLE_FIELDS = ()
+    PROJECTION_REQUIRED = ()
+
+    @classmethod
+    def parse_fields(cls, raw, extra=()):
+        """
+        fields 파라미터 파싱
+        값이 없으면 None (전체 필드), 알 수 없는 필드가 있으면 ValueError
+        """
+        if not raw:
+            return None
+
+        names = [name.strip() for name in raw.split(',') if name.strip()]
+        allowed = set(cls.PROJECTABLE_FIELDS) | set(extra)
+        unknown = [name for name in names if name not in allowed]
+        if unknown:
+            raise ValueError(f"알 수 없는 필드입니다: {', '.join(unknown)}")
+
+        return list(dict.fromkeys(list(cls.PROJECTION_REQUIRED) + names))
+
+    @classmethod
+    def load_options(cls, fields):
+        """요청 필드에 해당하는 컬럼만 로드하는 쿼리 옵션 (TEXT 등 나머지 컬럼은 조회하지 않음)"""
+        if fields is None:
+            return []
+
+        column_names = set(cls.__mapper__.column_attrs.keys())
+        columns = [getattr(cls, name) for name in fields if name in column_names]
+        return [load_only(*columns)]
+
+    def project(self, fields, computed=None):
+        """요청 필드만 딕셔너리로 변환 (로드하지 않은 컬럼에는 접근하지 않음)"""
+        computed = computed or {}
+        data = {}
+        for name in fields:
+            if name in computed:
+                data[name] = computed[name]()
+                continue
+
+            value = getattr(self, name)
+            data[name] = value.isoformat() if isinstance(value, datetime) else value
+        return data
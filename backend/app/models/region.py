@@ -0,0 +1,50 @@
+"""
+지역 모델
+Region (시/도 → 시/군/구 2단계 계층)
+"""
+
+from . import db
+
+
+class Region(db.Model):
+    """
+    정규화된 지역 사전
+    시/도와 시/군/구는 flask regions sync로 등록됩니다. (app/services/regions.py의 PROVINCES, DISTRICTS)
+    """
+    __tablename__ = 'regions'
+
+    LEVEL_PROVINCE = 1  # 시/도
+    LEVEL_DISTRICT = 2  # 시/군/구
+
+    region_id = db.Column(db.Integer, primary_key=True)
+    parent_id = db.Column(db.Integer, db.ForeignKey('regions.region_id', ondelete='CASCADE'))
+    level = db.Column(db.SmallInteger, nullable=False)
+    name = db.Column(db.String(50), nullable=False)        # 정식 명칭 (예: 서울특별시, 강남구)
+    aliases = db.Column(db.String(200))                    # 별칭 (쉼표 구분, 예: 서울,서울시)
+    # 시/도만 이름, 시/군/구는 NULL (parent_id가 NULL이면 uq_region_parent_name이 중복을 막지 못하므로)
+    province_name = db.Column(
+        db.String(50),
+        db.Computed('CASE WHEN parent_id IS NULL THEN name END', persisted=True)
+    )
+
+    __table_args__ = (
+        db.UniqueConstraint('parent_id', 'name', name='uq_region_parent_name'),
+        db.UniqueConstraint('province_name', name='uq_region_province_name'),
+    )
+
+    def alias_list(self):
+        """별칭 목록"""
+        return [alias.strip() for alias in (self.aliases or '').split(',') if alias.strip()]
+
+    def to_dict(self):
+        """딕셔너리 변환"""
+        return {
+            'region_id': self.region_id,
+            'parent_id': self.parent_id,
+            'level': self.level,
+            'name': self.name,
+            'aliases': self.alias_list()
+        }
+
+    def __repr__(self):
+        return f'<Region {self.name}>'
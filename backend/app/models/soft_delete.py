@@ -0,0 +1,44 @@
+"""
+소프트 삭제
+삭제 시각(deleted_at)을 함께 기록하여, 보관 기간이 지난 행을
+정리 작업(app.services.purge)이 보관 테이블로 옮길 수 있도록 합니다.
+"""
+
+from datetime import datetime
+
+from sqlalchemy import false
+
+from . import db
+
+
+class SoftDeleteMixin:
+    """
+    모델 믹스인 (모델에 is_deleted 컬럼이 있어야 함)
+    - deleted_at: 소프트 삭제 시각 (복구하면 None)
+    """
+
+    deleted_at = db.Column(db.DateTime)
+
+    def soft_delete(self):
+        """소프트 삭제 (커밋은 호출자가 수행)"""
+        self.is_deleted = True
+        self.deleted_at = datetime.utcnow()
+
+    def restore(self):
+        """소프트 삭제 복구 (커밋은 호출자가 수행)"""
+        self.is_deleted = False
+        self.deleted_at = None
+
+
+def active_only(column):
+    """
+    활성 행만 담는 부분 인덱스 조건 (PostgreSQL/SQLite 전용)
+    MySQL은 부분 인덱스를 지원하지 않아 이 조건이 무시되고 일반 인덱스로 만들어집니다.
+    MySQL에서는 is_deleted가 앞에 오는 복합 인덱스((is_deleted, category) 등)가 is_deleted = FALSE 범위만 읽어
+    같은 역할을 하므로, 이 조건을 쓰는 인덱스는 항상 is_deleted를 첫 컬럼으로 둡니다.
+    (삭제된 행은 정리 작업으로 줄어듦)
+    """
+    return {
+        'postgresql_where': column == false(),
+        'sqlite_where': column == false(),
+    }
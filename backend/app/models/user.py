@@ -5,11 +5,12 @@ User, UserProfile, SurveyQuestion, SurveyResponse
 
 from datetime import datetime
 from . import db
+from .soft_delete import SoftDeleteMixin
 from sqlalchemy import CheckConstraint
 from werkzeug.security import generate_password_hash, check_password_hash
 
 
-class User(db.Model):
+class User(SoftDeleteMixin, db.Model):
     """사용자 기본 정보"""
     __tablename__ = 'users'
     
@@ -28,8 +29,8 @@ class User(db.Model):
     failed_login_attempts = db.Column(db.Integer, default=0)
     account_locked_until = db.Column(db.DateTime)
     
-    # 소프트 삭제
-    is_deleted = db.Column(db.Boolean, default=False, index=True)
+    # 소프트 삭제 (삭제 시각은 SoftDeleteMixin.deleted_at, 인덱스는 idx_users_purge)
+    is_deleted = db.Column(db.Boolean, default=False)
     
     # 타임스탬프
     created_at = db.Column(db.DateTime, default=datetime.utcnow, index=True)
@@ -42,6 +43,10 @@ class User(db.Model):
     notifications = db.relationship('UserNotification', backref='user', cascade='all, delete-orphan')
     feedback = db.relationship('UserFeedback', backref='user')
     
+    __table_args__ = (
+        db.Index('idx_users_purge', 'is_deleted', 'deleted_at'),
+    )
+    
     def set_password(self, password):
         """비밀번호 해싱"""
         try:
@@ -0,0 +1,4 @@
+"""
+서비스 패키지 초기화
+캐시, 집계 등 API 엔드포인트가 공유하는 기능을 제공합니다.
+"""
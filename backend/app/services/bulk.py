@@ -0,0 +1,146 @@
+"""
+벌크 쓰기 유틸리티
+INSERT ... ON DUPLICATE KEY UPDATE 기반 업서트와
+JSONL/CSV 스트리밍 읽기/쓰기를 제공합니다.
+(MySQL 외에 개발용 SQLite/PostgreSQL의 ON CONFLICT도 지원)
+"""
+
+import csv
+import json
+from itertools import islice
+
+from app.models import db
+
+
+def upsert(model, rows, conflict_columns, update_columns):
+    """
+    여러 행을 한 문장으로 업서트 (커밋은 호출자가 수행)
+
+    :param model: 대상 모델 클래스
+    :param rows: 컬럼명 → 값 딕셔너리 리스트
+    :param conflict_columns: 유니크 키 컬럼 (ON CONFLICT 대상)
+    :param update_columns: 중복 시 갱신할 컬럼
+    """
+    if not rows:
+        return None
+
+    table = model.__table__
+    dialect = db.session.get_bind().dialect.name
+
+    if dialect == 'mysql':
+        from sqlalchemy.dialects.mysql import insert
+        stmt = insert(table)
+        stmt = stmt.on_duplicate_key_update(
+            {column: stmt.inserted[column] for column in update_columns}
+        )
+    elif dialect in ('sqlite', 'postgresql'):
+        if dialect == 'sqlite':
+            from sqlalchemy.dialects.sqlite import insert
+        else:
+            from sqlalchemy.dialects.postgresql import insert
+        stmt = insert(table)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=conflict_columns,
+            set_={column: stmt.excluded[column] for column in update_columns}
+        )
+    else:
+        raise NotImplementedError(f'업서트를 지원하지 않는 데이터베이스입니다: {dialect}')
+
+    return db.session.execute(stmt, rows)
+
+
+def upsert_increment(model, rows, conflict_columns, increment_columns):
+    """
+    카운터 업서트 (없으면 삽입, 있으면 기존 값에 더함, 커밋은 호출자가 수행)
+    집계 테이블을 읽지 않고 증분만 반영할 때 사용합니다.
+    """
+    if not rows:
+        return None
+
+    table = model.__table__
+    dialect = db.session.get_bind().dialect.name
+
+    if dialect == 'mysql':
+        from sqlalchemy.dialects.mysql import insert
+        stmt = insert(table)
+        stmt = stmt.on_duplicate_key_update(
+            {column: table.c[column] + stmt.inserted[column] for column in increment_columns}
+        )
+    elif dialect in ('sqlite', 'postgresql'):
+        if dialect == 'sqlite':
+            from sqlalchemy.dialects.sqlite import insert
+        else:
+            from sqlalchemy.dialects.postgresql import insert
+        stmt = insert(table)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=conflict_columns,
+            set_={column: table.c[column] + stmt.excluded[column] for column in increment_columns}
+        )
+    else:
+        raise NotImplementedError(f'업서트를 지원하지 않는 데이터베이스입니다: {dialect}')
+
+    return db.session.execute(stmt, rows)
+
+
+# ============================================
+# 스트리밍 읽기/쓰기 (JSONL, CSV)
+# ============================================
+
+def detect_format(filename, default='jsonl'):
+    """파일 확장자로 형식 추정"""
+    name = (filename or '').lower()
+    if name.endswith('.csv'):
+        return 'csv'
+    if name.endswith('.jsonl') or name.endswith('.ndjson'):
+        return 'jsonl'
+    return default
+
+
+def iter_records(stream, fmt):
+    """
+    레코드를 한 건씩 읽음 (파일 전체를 메모리에 올리지 않음)
+    CSV의 빈 문자열은 None으로 변환합니다.
+    """
+    if fmt == 'csv':
+        for row in csv.DictReader(stream):
+            yield {key: (value if value != '' else None) for key, value in row.items()}
+    elif fmt == 'jsonl':
+        for line in stream:
+            line = line.strip()
+            if line:
+                yield json.loads(line)
+    else:
+        raise ValueError(f'지원하지 않는 형식입니다: {fmt}')
+
+
+def chunked(iterable, size):
+    """이터러블을 size개씩 묶어서 반환"""
+    iterator = iter(iterable)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+class RecordWriter:
+    """레코드를 JSONL 또는 CSV로 한 건씩 기록"""
+
+    def __init__(self, stream, fmt, fieldnames):
+        self.stream = stream
+        self.fmt = fmt
+        self.fieldnames = fieldnames
+        self._csv = None
+
+        if fmt == 'csv':
+            self._csv = csv.DictWriter(stream, fieldnames=fieldnames, extrasaction='ignore')
+            self._csv.writeheader()
+        elif fmt != 'jsonl':
+            raise ValueError(f'지원하지 않는 형식입니다: {fmt}')
+
+    def write(self, record):
+        if self._csv is not None:
+            self._csv.writerow({key: ('' if value is None else value) for key, value in record.items()})
+        else:
+            self.stream.write(json.dumps(record, ensure_ascii=False, default=str))
+            self.stream.write('\n')
@@ -0,0 +1,491 @@
+"""
+카탈로그 캐시
+취미 상세/목록 응답을 직렬화된 형태로 캐싱합니다.
+
+- 1단계: 프로세스 로컬 LRU 캐시 (TTL 지원)
+- 2단계: 공유 백엔드 (Redis 또는 인메모리)
+
+두 단계 모두 같은 표현(JSON으로 인코딩했다가 다시 읽은 값)을 보관하므로
+로컬에서 찾든 공유 백엔드에서 찾든 조회 결과의 형태가 같습니다.
+인메모리 백엔드는 프로세스마다 따로 존재하므로 워커가 여러 개이면
+(WEB_CONCURRENCY > 1) Redis 백엔드를 사용해야 합니다.
+
+캐시 키에는 카탈로그 버전이 포함되며, 취미나 평가가 변경되어 커밋되면
+버전이 올라가 이전 버전의 항목은 더 이상 조회되지 않습니다.
+모임(gatherings), 설문(survey) 등 다른 네임스페이스의 버전도 함께 관리하여
+조건부 GET(ETag) 계산에 사용합니다.
+"""
+
+import json
+import logging
+import threading
+import time
+import uuid
+from collections import OrderedDict
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+logger = logging.getLogger(__name__)
+
+
+class LRUCache:
+    """프로세스 로컬 LRU 캐시 (TTL 지원)"""
+
+    def __init__(self, max_size=1024, ttl=300):
+        self.max_size = max_size
+        self.ttl = ttl
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        """값 조회 (없거나 만료되면 None)"""
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                return None
+
+            value, expires_at = item
+            if expires_at is not None and expires_at < time.monotonic():
+                del self._data[key]
+                return None
+
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key, value, ttl=None):
+        """값 저장 (용량 초과 시 가장 오래 사용하지 않은 항목 제거)"""
+        ttl = self.ttl if ttl is None else ttl
+        expires_at = time.monotonic() + ttl if ttl else None
+
+        with self._lock:
+            self._data[key] = (value, expires_at)
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_size:
+                self._data.popitem(last=False)
+
+    def delete(self, key):
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self):
+        return len(self._data)
+
+
+class InMemoryBackend:
+    """공유 백엔드의 인메모리 구현 (단일 프로세스 및 테스트용)"""
+
+    def __init__(self):
+        self._data = {}
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                return None
+
+            value, expires_at = item
+            if expires_at is not None and expires_at < time.time():
+                del self._data[key]
+                return None
+            return value
+
+    def set(self, key, value, ttl=None):
+        with self._lock:
+            self._data[key] = (value, time.time() + ttl if ttl else None)
+
+    def get_many(self, keys):
+        return [self.get(key) for key in keys]
+
+    def set_many(self, mapping, ttl=None):
+        for key, value in mapping.items():
+            self.set(key, value, ttl)
+
+    def delete(self, key):
+        with self._lock:
+            self._data.pop(key, None)
+
+    def incr(self, key):
+        with self._lock:
+            value, expires_at = self._data.get(key, (0, None))
+            value = int(value) + 1
+            self._data[key] = (value, expires_at)
+            return value
+
+
+class RedisBackend:
+    """Redis 공유 백엔드 (여러 프로세스/서버 간 캐시 공유)"""
+
+    def __init__(self, url):
+        import redis  # 선택 의존성
+
+        self._client = redis.Redis.from_url(url)
+
+    def get(self, key):
+        value = self._client.get(key)
+        return value.decode('utf-8') if value is not None else None
+
+    def set(self, key, value, ttl=None):
+        self._client.set(key, value, ex=ttl or None)
+
+    def get_many(self, keys):
+        values = self._client.mget(keys)
+        return [value.decode('utf-8') if value is not None else None for value in values]
+
+    def set_many(self, mapping, ttl=None):
+        pipeline = self._client.pipeline(transaction=False)
+        for key, value in mapping.items():
+            pipeline.set(key, value, ex=ttl or None)
+        pipeline.execute()
+
+    def delete(self, key):
+        self._client.delete(key)
+
+    def incr(self, key):
+        return int(self._client.incr(key))
+
+
+class CatalogCache:
+    """
+    카탈로그 읽기 캐시
+    로컬 LRU에서 먼저 찾고, 없으면 공유 백엔드를 조회합니다.
+    """
+
+    EPOCH_KEY = 'catalog:epoch'
+
+    def __init__(self, app=None, backend=None):
+        self.enabled = True
+        self.ttl = 300
+        self.version_poll_interval = 1.0
+        self.backend = backend or InMemoryBackend()
+        self.local = LRUCache()
+        self.dumps = lambda value: json.dumps(value, ensure_ascii=False)
+
+        self._versions = {}
+        self._epoch = None
+        self._lock = threading.Lock()
+
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        """Flask 앱 설정으로 캐시 초기화"""
+        self.enabled = app.config.get('CATALOG_CACHE_ENABLED', True)
+        self.ttl = app.config.get('CATALOG_CACHE_TTL', 300)
+        self.version_poll_interval = app.config.get('CATALOG_CACHE_VERSION_POLL', 1.0)
+        self.local = LRUCache(
+            max_size=app.config.get('CATALOG_CACHE_SIZE', 1024),
+            ttl=self.ttl
+        )
+
+        # 워커가 여러 개이면 버전과 캐시를 프로세스 간에 공유해야 합니다.
+        # 인메모리 백엔드에서는 워커마다 버전이 따로 올라가 오래된 데이터와 ETag가 남습니다.
+        workers = app.config.get('WEB_WORKERS', 1)
+        backend_name = app.config.get('CATALOG_CACHE_BACKEND', 'memory')
+        if workers > 1 and backend_name != 'redis':
+            raise RuntimeError(
+                f"CATALOG_CACHE_BACKEND=redis is required with {workers} workers "
+                f"(got '{backend_name}')"
+            )
+
+        if backend_name == 'redis':
+            try:
+                self.backend = RedisBackend(app.config.get('REDIS_URL', 'redis://localhost:6379/0'))
+            except Exception as e:
+                if workers > 1:
+                    raise RuntimeError(f"Redis backend unavailable with {workers} workers: {str(e)}")
+                logger.warning(f"Redis backend unavailable, using in-memory cache: {str(e)}")
+                self.backend = InMemoryBackend()
+        else:
+            self.backend = InMemoryBackend()
+
+        # 공유 백엔드 저장 시 앱의 JSON 프로바이더 사용 (미리 인코딩된 조각 포함 값 지원)
+        self.dumps = app.json.dumps
+
+        self._versions = {}
+        self._epoch = None
+        app.extensions['catalog_cache'] = self
+        _register_invalidation_listeners()
+
+    # ----------------------------------------
+    # 버전 (네임스페이스별)
+    # ----------------------------------------
+
+    @staticmethod
+    def _version_key(namespace):
+        return f'{namespace}:version'
+
+    def epoch(self):
+        """
+        백엔드 세대 식별자
+        인메모리 백엔드가 재시작되어 버전이 0부터 다시 시작해도 ETag가 겹치지 않도록 합니다.
+        """
+        if self._epoch is not None:
+            return self._epoch
+
+        try:
+            epoch = self.backend.get(self.EPOCH_KEY)
+            if epoch is None:
+                epoch = f'{time.time():.0f}-{uuid.uuid4().hex[:8]}'
+                self.backend.set(self.EPOCH_KEY, epoch)
+        except Exception as e:
+            logger.warning(f"Catalog epoch lookup failed: {str(e)}")
+            epoch = f'{time.time():.0f}-{uuid.uuid4().hex[:8]}'
+
+        self._epoch = epoch
+        return epoch
+
+    def version_info(self, namespace='catalog'):
+        """
+        (버전, 마지막 변경 시각) 조회
+        공유 백엔드는 poll 간격마다 한 번만 확인합니다.
+        """
+        now = time.monotonic()
+        cached = self._versions.get(namespace)
+        if cached is not None and now - cached[2] < self.version_poll_interval:
+            return cached[0], cached[1]
+
+        try:
+            value = self.backend.get(self._version_key(namespace))
+            version = int(value) if value is not None else 0
+            changed_at = self.backend.get(f'{namespace}:changed_at')
+            changed_at = float(changed_at) if changed_at is not None else None
+        except Exception as e:
+            logger.warning(f"Version lookup failed for {namespace}: {str(e)}")
+            version, changed_at = cached[:2] if cached else (0, None)
+
+        with self._lock:
+            if namespace == 'catalog' and cached is not None and cached[0] != version:
+                self.local.clear()
+            self._versions[namespace] = (version, changed_at, now)
+        return version, changed_at
+
+    def version(self, namespace='catalog'):
+        """현재 버전"""
+        return self.version_info(namespace)[0]
+
+    def bump_version(self, namespace='catalog'):
+        """버전 증가 (catalog 네임스페이스는 이전 버전의 캐시 항목도 무효화)"""
+        changed_at = time.time()
+        version = self.version_info(namespace)[0] + 1
+        try:
+            version = self.backend.incr(self._version_key(namespace))
+            self.backend.set(f'{namespace}:changed_at', f'{changed_at:.3f}')
+        except Exception as e:
+            logger.warning(f"Version bump failed for {namespace}: {str(e)}")
+
+        with self._lock:
+            if namespace == 'catalog':
+                self.local.clear()
+            self._versions[namespace] = (version, changed_at, time.monotonic())
+        return version
+
+    # ----------------------------------------
+    # 조회/저장
+    # ----------------------------------------
+
+    def _key(self, name, version=None):
+        if version is None:
+            version = self.version()
+        return f'catalog:v{version}:{name}'
+
+    # DB에서 읽어 캐시에 채우는 경우(read-through)에는 읽기 전에 version()을 한 번 구해
+    # get/set에 같은 version을 넘겨야 합니다. 읽는 도중 버전이 오르면 이전 데이터가
+    # 새 버전 키에 저장되어 TTL 동안 남는 것을 막습니다.
+
+    def get(self, name, version=None):
+        """
+        캐시 조회 (없으면 None)
+        반환된 객체는 캐시와 공유되므로 수정하지 말아야 합니다.
+        로컬/공유 백엔드 어느 쪽에서 찾든 JSON에서 읽은 기본 타입(dict, list 등)입니다.
+        """
+        if not self.enabled:
+            return None
+
+        key = self._key(name, version)
+        value = self.local.get(key)
+        if value is not None:
+            return value
+
+        try:
+            raw = self.backend.get(key)
+        except Exception as e:
+            logger.warning(f"Catalog cache backend get failed: {str(e)}")
+            return None
+
+        if raw is None:
+            return None
+
+        value = json.loads(raw)
+        self.local.set(key, value)
+        return value
+
+    def set(self, name, value, version=None):
+        """
+        캐시 저장 (JSON 직렬화 가능한 값, version은 데이터를 읽기 전에 구한 버전)
+        로컬에도 공유 백엔드와 같은 표현(인코딩 후 다시 읽은 값)을 보관합니다.
+        """
+        if not self.enabled:
+            return
+
+        key = self._key(name, version)
+        encoded = self.dumps(value)
+        self.local.set(key, json.loads(encoded))
+        try:
+            self.backend.set(key, encoded, self.ttl)
+        except Exception as e:
+            logger.warning(f"Catalog cache backend set failed: {str(e)}")
+
+    def get_many(self, names, version=None):
+        """
+        여러 항목을 한 번에 조회 → {name: value} (없는 항목은 제외)
+        로컬에 없는 항목만 공유 백엔드에서 한 번에 가져옵니다.
+        """
+        if not self.enabled or not names:
+            return {}
+
+        if version is None:
+            version = self.version()
+        found = {}
+        remote = {}
+        for name in names:
+            key = self._key(name, version)
+            value = self.local.get(key)
+            if value is not None:
+                found[name] = value
+            else:
+                remote[key] = name
+
+        if not remote:
+            return found
+
+        try:
+            raws = self.backend.get_many(list(remote))
+        except Exception as e:
+            logger.warning(f"Catalog cache backend get_many failed: {str(e)}")
+            return found
+
+        for key, raw in zip(remote, raws):
+            if raw is None:
+                continue
+            value = json.loads(raw)
+            self.local.set(key, value)
+            found[remote[key]] = value
+        return found
+
+    def set_many(self, values, version=None):
+        """여러 항목을 한 번에 저장 ({name: value}, version은 데이터를 읽기 전에 구한 버전, 표현은 set과 동일)"""
+        if not self.enabled or not values:
+            return
+
+        if version is None:
+            version = self.version()
+        serialized = {}
+        for name, value in values.items():
+            key = self._key(name, version)
+            encoded = self.dumps(value)
+            self.local.set(key, json.loads(encoded))
+            serialized[key] = encoded
+
+        try:
+            self.backend.set_many(serialized, self.ttl)
+        except Exception as e:
+            logger.warning(f"Catalog cache backend set_many failed: {str(e)}")
+
+    def get_or_set_local(self, name, builder):
+        """
+        프로세스 로컬 캐시에만 보관 (직렬화할 수 없는 객체용)
+        키에 카탈로그 버전이 포함되므로 변경 시 함께 무효화됩니다.
+        공유 백엔드에는 저장하지 않으므로 get/set과 이름을 공유하지 말아야 합니다.
+        """
+        if not self.enabled:
+            return builder()
+
+        key = self._key(name)
+        value = self.local.get(key)
+        if value is None:
+            value = builder()
+            self.local.set(key, value)
+        return value
+
+    def get_or_set(self, name, builder):
+        """캐시에 없으면 builder()로 생성 후 조회 시점의 버전 키에 저장"""
+        version = self.version()
+        value = self.get(name, version)
+        if value is None:
+            value = builder()
+            if value is not None:
+                self.set(name, value, version)
+        return value
+
+
+catalog_cache = CatalogCache()
+
+
+# ============================================
+# 변경 감지 (커밋 시 네임스페이스 버전 증가)
+# ============================================
+
+_listeners_registered = False
+
+
+def _watched_models():
+    """모델 클래스 → 버전 네임스페이스"""
+    from app.models.hobby import (
+        Hobby, HobbyKeyword, HobbyMedia, UserHobbyRating, HobbyRecentReview, HobbyRatingStats, Gathering
+    )
+    from app.models.user import SurveyQuestion
+    from app.models.region import Region
+    return {
+        Hobby: 'catalog',
+        HobbyKeyword: 'catalog',
+        HobbyMedia: 'catalog',
+        UserHobbyRating: 'catalog',
+        HobbyRecentReview: 'catalog',
+        HobbyRatingStats: 'catalog',
+        Gathering: 'gatherings',
+        Region: 'regions',
+        SurveyQuestion: 'survey',
+    }
+
+
+def _register_invalidation_listeners():
+    global _listeners_registered
+    if _listeners_registered:
+        return
+
+    event.listen(Session, 'after_flush', _mark_catalog_dirty)
+    event.listen(Session, 'after_commit', _bump_if_dirty)
+    event.listen(Session, 'after_soft_rollback', _clear_dirty)
+    _listeners_registered = True
+
+
+def mark_dirty(session, namespace='catalog'):
+    """
+    커밋 시 해당 네임스페이스 버전이 오르도록 표시
+    ORM 플러시를 거치지 않는 Core 문(벌크 INSERT/UPDATE)을 실행한 뒤 호출합니다.
+    """
+    session.info.setdefault('dirty_namespaces', set()).add(namespace)
+
+
+def _mark_catalog_dirty(session, flush_context):
+    """플러시된 객체 중 감시 대상 모델이 있으면 해당 네임스페이스 표시"""
+    watched = _watched_models()
+    for obj in list(session.new) + list(session.dirty) + list(session.deleted):
+        namespace = watched.get(type(obj))
+        if namespace:
+            session.info.setdefault('dirty_namespaces', set()).add(namespace)
+
+
+def _bump_if_dirty(session):
+    for namespace in session.info.pop('dirty_namespaces', ()):
+        catalog_cache.bump_version(namespace)
+
+
+def _clear_dirty(session, previous_transaction):
+    session.info.pop('dirty_namespaces', None)
@@ -0,0 +1,321 @@
+"""
+카탈로그 가져오기/내보내기
+취미, 키워드, 평가 데이터를 청크 단위로 스트리밍 처리합니다.
+(메모리 사용량은 청크 크기에만 비례)
+"""
+
+import logging
+from datetime import datetime
+
+from app.models import db
+from app.models.hobby import Hobby, HobbyKeyword, UserHobbyRating
+from app.services.bulk import upsert, chunked
+from app.services.catalog_cache import mark_dirty
+
+logger = logging.getLogger(__name__)
+
+HOBBY_FIELDS = [
+    'name', 'category', 'description',
+    'difficulty_level', 'physical_intensity', 'creativity_level',
+    'indoor_outdoor', 'social_individual', 'required_budget', 'time_commitment',
+    'tutorial_video_url', 'image_url'
+]
+HOBBY_INT_FIELDS = {'difficulty_level', 'physical_intensity', 'creativity_level'}  # 1-5
+
+KEYWORD_FIELDS = ['hobby_name', 'keyword']
+
+RATING_FIELDS = ['user_id', 'hobby_name', 'rating', 'review_text', 'experienced', 'created_at']
+
+
+class ImportStats:
+    """가져오기 결과 집계"""
+
+    def __init__(self):
+        self.processed = 0
+        self.written = 0
+        self.skipped = 0
+        self.hobby_ids = set()
+
+    def to_dict(self):
+        return {
+            'processed': self.processed,
+            'written': self.written,
+            'skipped': self.skipped
+        }
+
+
+# ============================================
+# 변환 헬퍼
+# ============================================
+
+def _to_int(value):
+    if value is None or value == '':
+        return None
+    return int(value)
+
+
+def _to_bool(value):
+    if isinstance(value, bool):
+        return value
+    return str(value).strip().lower() in ('1', 'true', 'y', 'yes')
+
+
+def _to_datetime(value):
+    if value is None or value == '':
+        return None
+    if isinstance(value, datetime):
+        return value
+    return datetime.fromisoformat(str(value).replace('Z', ''))
+
+
+def _isoformat(value):
+    return value.isoformat() if value else None
+
+
+def _hobby_name_map():
+    """취미명 → hobby_id (취미 수는 많지 않으므로 한 번만 조회)"""
+    return {name: hobby_id for hobby_id, name in db.session.query(Hobby.hobby_id, Hobby.name).all()}
+
+
+def _resolve_hobby_id(record, name_map):
+    if record.get('hobby_id') not in (None, ''):
+        return int(record['hobby_id'])
+    return name_map.get(record.get('hobby_name'))
+
+
+# ============================================
+# 가져오기
+# ============================================
+
+def import_hobbies(records, chunk_size=1000, progress=None):
+    """
+    취미 가져오기 (취미명 기준 업서트)
+    레코드에 없는 컬럼은 기존 값을 유지합니다.
+    숫자 컬럼이 정수가 아니거나 1-5 범위를 벗어난 행은 건너뛰고 skipped에 집계합니다.
+    """
+    stats = ImportStats()
+
+    for chunk in chunked(records, chunk_size):
+        now = datetime.utcnow()
+        # 같은 컬럼 구성끼리 묶어서 업서트 (없는 컬럼을 NULL로 덮어쓰지 않도록)
+        groups = {}
+        for record in chunk:
+            stats.processed += 1
+            if not record.get('name') or not record.get('category'):
+                stats.skipped += 1
+                continue
+
+            row = {}
+            try:
+                for field in HOBBY_FIELDS:
+                    if field in record:
+                        value = record[field]
+                        row[field] = _to_int(value) if field in HOBBY_INT_FIELDS else value
+            except (ValueError, TypeError):
+                stats.skipped += 1
+                continue
+
+            if any(row.get(field) is not None and not (1 <= row[field] <= 5) for field in HOBBY_INT_FIELDS):
+                stats.skipped += 1
+                continue
+
+            row['is_deleted'] = False
+            row['deleted_at'] = None
+            row['updated_at'] = now
+            groups.setdefault(tuple(sorted(row)), []).append(row)
+
+        for columns, rows in groups.items():
+            upsert(
+                Hobby,
+                rows,
+                conflict_columns=['name'],
+                update_columns=[column for column in columns if column != 'name']
+            )
+            stats.written += len(rows)
+
+        mark_dirty(db.session, 'catalog')
+        db.session.commit()
+        if progress:
+            progress(stats)
+
+    return stats
+
+
+def import_keywords(records, chunk_size=1000, progress=None):
+    """키워드 가져오기 (hobby_id 또는 hobby_name, keyword)"""
+    stats = ImportStats()
+    name_map = _hobby_name_map()
+
+    for chunk in chunked(records, chunk_size):
+        rows = []
+        for record in chunk:
+            stats.processed += 1
+            try:
+                hobby_id = _resolve_hobby_id(record, name_map)
+            except (ValueError, TypeError):
+                stats.skipped += 1
+                continue
+
+            keyword = (record.get('keyword') or '').strip()
+            if not hobby_id or not keyword:
+                stats.skipped += 1
+                continue
+            rows.append({'hobby_id': hobby_id, 'keyword': keyword[:50]})
+
+        upsert(HobbyKeyword, rows, conflict_columns=['hobby_id', 'keyword'], update_columns=['keyword'])
+        stats.written += len(rows)
+
+        mark_dirty(db.session, 'catalog')
+        db.session.commit()
+        if progress:
+            progress(stats)
+
+    return stats
+
+
+def import_ratings(records, chunk_size=5000, progress=None):
+    """
+    평가 가져오기 (user_id + hobby 기준 업서트)
+    대용량 덤프를 고려해 청크마다 커밋하고, 파생 데이터는 마지막에 한 번 재구성합니다.
+    """
+    stats = ImportStats()
+    name_map = _hobby_name_map()
+    now = datetime.utcnow()
+
+    for chunk in chunked(records, chunk_size):
+        rows = []
+        for record in chunk:
+            stats.processed += 1
+            try:
+                hobby_id = _resolve_hobby_id(record, name_map)
+                user_id = _to_int(record.get('user_id'))
+                rating = _to_int(record.get('rating'))
+            except (ValueError, TypeError):
+                stats.skipped += 1
+                continue
+
+            if not hobby_id or not user_id or rating is None or not (1 <= rating <= 5):
+                stats.skipped += 1
+                continue
+
+            rows.append({
+                'user_id': user_id,
+                'hobby_id': hobby_id,
+                'rating': rating,
+                'review_text': record.get('review_text'),
+                'experienced': _to_bool(record.get('experienced', False)),
+                'created_at': _to_datetime(record.get('created_at')) or now
+            })
+            stats.hobby_ids.add(hobby_id)
+
+        upsert(
+            UserHobbyRating,
+            rows,
+            conflict_columns=['user_id', 'hobby_id'],
+            update_columns=['rating', 'review_text', 'experienced', 'created_at']
+        )
+        stats.written += len(rows)
+
+        mark_dirty(db.session, 'catalog')
+        db.session.commit()
+        if progress:
+            progress(stats)
+
+    rebuild_derived(stats.hobby_ids)
+    return stats
+
+
+def rebuild_derived(hobby_ids):
+    """평가를 벌크로 변경한 뒤 평가 기반 파생 데이터 재구성"""
+    if not hobby_ids:
+        return
+
+    from app.services.recent_reviews import rebuild_recent_reviews
+    from app.services.segment_ratings import rebuild_segment_ratings
+    from app.services.review_search import rebuild_review_index
+    from app.services.rating_stats import rebuild_rating_stats
+    rebuild_rating_stats(sorted(hobby_ids))
+    rebuild_recent_reviews(sorted(hobby_ids))
+    rebuild_segment_ratings(sorted(hobby_ids))
+    rebuild_review_index(sorted(hobby_ids))
+
+
+# ============================================
+# 내보내기
+# ============================================
+
+def _keyset_batches(query, key_column, chunk_size):
+    """기본키 기준 키셋 페이지네이션 (OFFSET 없이 일정한 비용)"""
+    last_key = None
+    while True:
+        batch_query = query
+        if last_key is not None:
+            batch_query = batch_query.filter(key_column > last_key)
+        rows = batch_query.order_by(key_column).limit(chunk_size).all()
+        if not rows:
+            return
+        yield rows
+        last_key = rows[-1][0]
+
+
+def export_hobbies(writer, chunk_size=1000, include_deleted=False, progress=None):
+    """취미 내보내기"""
+    columns = [getattr(Hobby, field) for field in HOBBY_FIELDS]
+    query = db.session.query(Hobby.hobby_id, *columns)
+    if not include_deleted:
+        query = query.filter(Hobby.is_deleted == False)
+
+    count = 0
+    for rows in _keyset_batches(query, Hobby.hobby_id, chunk_size):
+        for row in rows:
+            writer.write(dict(zip(HOBBY_FIELDS, row[1:])))
+        count += len(rows)
+        if progress:
+            progress(count)
+    return count
+
+
+def export_keywords(writer, chunk_size=5000, progress=None):
+    """키워드 내보내기 (취미명 포함)"""
+    query = db.session.query(
+        HobbyKeyword.keyword_id, Hobby.name, HobbyKeyword.keyword
+    ).join(Hobby, Hobby.hobby_id == HobbyKeyword.hobby_id)
+
+    count = 0
+    for rows in _keyset_batches(query, HobbyKeyword.keyword_id, chunk_size):
+        for _, hobby_name, keyword in rows:
+            writer.write({'hobby_name': hobby_name, 'keyword': keyword})
+        count += len(rows)
+        if progress:
+            progress(count)
+    return count
+
+
+def export_ratings(writer, chunk_size=10000, progress=None):
+    """평가 내보내기 (취미명 포함, 대용량 대응)"""
+    name_by_id = {hobby_id: name for name, hobby_id in _hobby_name_map().items()}
+    query = db.session.query(
+        UserHobbyRating.rating_id,
+        UserHobbyRating.user_id,
+        UserHobbyRating.hobby_id,
+        UserHobbyRating.rating,
+        UserHobbyRating.review_text,
+        UserHobbyRating.experienced,
+        UserHobbyRating.created_at
+    )
+
+    count = 0
+    for rows in _keyset_batches(query, UserHobbyRating.rating_id, chunk_size):
+        for _, user_id, hobby_id, rating, review_text, experienced, created_at in rows:
+            writer.write({
+                'user_id': user_id,
+                'hobby_name': name_by_id.get(hobby_id),
+                'rating': rating,
+                'review_text': review_text,
+                'experienced': bool(experienced),
+                'created_at': _isoformat(created_at)
+            })
+        count += len(rows)
+        if progress:
+            progress(count)
+    return count
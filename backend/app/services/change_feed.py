@@ -0,0 +1,87 @@
+"""
+카탈로그 변경 피드
+클라이언트/엣지 캐시가 보관 중인 취미 목록을 전체 재조회 없이 동기화하도록
+(updated_at, hobby_id) 기준 키셋으로 마지막 동기화 이후 변경분만 조회합니다.
+
+정리 작업(purge)이 원본에서 지운 취미는 보관 테이블(hobbies_archive)에서 같은 키셋으로 읽어
+deleted_ids에 포함하므로, 오래된 토큰으로 동기화해도 정리된 취미의 삭제를 놓치지 않습니다.
+"""
+
+import base64
+from datetime import datetime, timedelta
+
+from app.models import db
+from app.models.archive import hobbies_archive
+from app.models.hobby import Hobby
+
+
+class InvalidChangeToken(ValueError):
+    """잘못된 동기화 토큰"""
+
+
+def encode_token(updated_at, hobby_id):
+    """(updated_at, hobby_id) → 불투명 토큰"""
+    raw = f'{updated_at.isoformat()}|{hobby_id}'
+    return base64.urlsafe_b64encode(raw.encode('utf-8')).decode('ascii').rstrip('=')
+
+
+def decode_token(token):
+    """토큰 → (updated_at, hobby_id)"""
+    try:
+        padded = token + '=' * (-len(token) % 4)
+        updated_at, hobby_id = base64.urlsafe_b64decode(padded).decode('utf-8').split('|')
+        return datetime.fromisoformat(updated_at), int(hobby_id)
+    except (ValueError, UnicodeDecodeError) as e:
+        raise InvalidChangeToken('유효하지 않은 since 토큰입니다.') from e
+
+
+def get_hobby_changes(since=None, limit=100, settle_seconds=2):
+    """
+    변경된 취미 조회
+
+    :param since: 이전 응답의 next_token (없으면 처음부터 전체 동기화)
+    :param limit: 한 번에 반환할 최대 변경 수
+    :param settle_seconds: 최근 N초 이내 변경은 다음 요청으로 미룸
+                           (늦게 커밋된 트랜잭션이 커서 뒤에 끼어들어 누락되는 것을 방지)
+    :return: (변경된 취미 리스트, 삭제된 취미 ID 리스트(정리된 취미 포함), next_token, has_more)
+    """
+    settled_before = datetime.utcnow() - timedelta(seconds=settle_seconds)
+    since_key = decode_token(since) if since else None
+
+    def window(query, updated_at, hobby_id):
+        query = query.filter(updated_at < settled_before)
+        if since_key:
+            since_at, since_id = since_key
+            query = query.filter(db.or_(
+                updated_at > since_at,
+                db.and_(updated_at == since_at, hobby_id > since_id)
+            ))
+        return query.order_by(updated_at, hobby_id).limit(limit + 1)
+
+    hobbies = window(Hobby.query, Hobby.updated_at, Hobby.hobby_id).all()
+    purged = window(
+        db.session.query(hobbies_archive.c.updated_at, hobbies_archive.c.hobby_id),
+        hobbies_archive.c.updated_at, hobbies_archive.c.hobby_id
+    ).all()
+
+    # 두 키셋 결과를 (updated_at, hobby_id) 순으로 합침 (정리된 취미는 hobby 없음)
+    rows = sorted(
+        [(hobby.updated_at, hobby.hobby_id, hobby) for hobby in hobbies] +
+        [(updated_at, hobby_id, None) for updated_at, hobby_id in purged],
+        key=lambda row: (row[0], row[1])
+    )
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+
+    changed = []
+    deleted_ids = []
+    for _, hobby_id, hobby in rows:
+        if hobby is None or hobby.is_deleted:
+            deleted_ids.append(hobby_id)
+        else:
+            hobby_data = hobby.to_dict()
+            hobby_data['updated_at'] = hobby.updated_at.isoformat()
+            changed.append(hobby_data)
+
+    next_token = encode_token(rows[-1][0], rows[-1][1]) if rows else since
+    return changed, deleted_ids, next_token, has_more
@@ -0,0 +1,135 @@
+"""
+응답 인코딩
+- FastJSONProvider: orjson이 설치되어 있으면 orjson으로, 없으면 표준 json으로 직렬화
+- MessagePack: Accept 헤더로 application/x-msgpack을 요청하면 MessagePack으로 응답
+- JSONFragment: 미리 인코딩해 둔 조각 (여러 응답에 재사용되는 취미 객체 등)
+"""
+
+import json
+
+from flask import has_request_context, request
+from flask.json.provider import DefaultJSONProvider
+
+from app.services.catalog_cache import catalog_cache
+
+try:
+    import orjson  # 선택 의존성
+except ImportError:
+    orjson = None
+
+try:
+    import msgpack  # 선택 의존성
+except ImportError:
+    msgpack = None
+
+MSGPACK_MIMETYPES = ('application/x-msgpack', 'application/msgpack')
+
+if orjson is not None:
+    ORJSON_OPTIONS = orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+    ORJSON_HAS_FRAGMENT = hasattr(orjson, 'Fragment')
+else:
+    ORJSON_OPTIONS = 0
+    ORJSON_HAS_FRAGMENT = False
+
+
+class JSONFragment:
+    """
+    미리 인코딩된 JSON 조각
+    orjson.Fragment를 지원하면 인코딩된 바이트를 그대로 이어 붙이고,
+    그렇지 않으면 원본 값을 직렬화합니다.
+    """
+
+    __slots__ = ('value', '_encoded')
+
+    def __init__(self, value):
+        self.value = value
+        self._encoded = None
+
+    @property
+    def encoded(self):
+        if self._encoded is None:
+            self._encoded = orjson.dumps(self.value, default=_default, option=ORJSON_OPTIONS)
+        return self._encoded
+
+
+def _default(obj):
+    """JSON 기본 변환 (조각 → 원본 또는 orjson.Fragment, 그 외는 Flask 기본 규칙)"""
+    if isinstance(obj, JSONFragment):
+        if ORJSON_HAS_FRAGMENT:
+            return orjson.Fragment(obj.encoded)
+        return obj.value
+    return DefaultJSONProvider.default(obj)
+
+
+def _msgpack_default(obj):
+    if isinstance(obj, JSONFragment):
+        return obj.value
+    return DefaultJSONProvider.default(obj)
+
+
+def wants_msgpack():
+    """Accept 헤더가 JSON보다 MessagePack을 우선하는지 확인"""
+    if msgpack is None or not has_request_context():
+        return False
+
+    best = request.accept_mimetypes.best_match(('application/json',) + MSGPACK_MIMETYPES)
+    return best in MSGPACK_MIMETYPES
+
+
+class FastJSONProvider(DefaultJSONProvider):
+    """jsonify/request.get_json에서 사용하는 JSON 프로바이더"""
+
+    ensure_ascii = False  # 한글을 이스케이프하지 않음
+
+    def dumps(self, obj, **kwargs):
+        if orjson is not None and not kwargs.get('indent'):
+            return orjson.dumps(obj, default=_default, option=ORJSON_OPTIONS).decode('utf-8')
+
+        kwargs.setdefault('default', _default)
+        kwargs.setdefault('ensure_ascii', self.ensure_ascii)
+        kwargs.setdefault('sort_keys', self.sort_keys)
+        return json.dumps(obj, **kwargs)
+
+    def loads(self, s, **kwargs):
+        if orjson is not None and not kwargs:
+            return orjson.loads(s)
+        return json.loads(s, **kwargs)
+
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+
+        if wants_msgpack():
+            body = msgpack.packb(obj, default=_msgpack_default, use_bin_type=True)
+            response = self._app.response_class(body, mimetype=MSGPACK_MIMETYPES[0])
+        elif orjson is not None and not self._pretty():
+            body = orjson.dumps(obj, default=_default, option=ORJSON_OPTIONS | orjson.OPT_APPEND_NEWLINE)
+            response = self._app.response_class(body, mimetype=self.mimetype)
+        else:
+            indent = 2 if self._pretty() else None
+            separators = None if indent else (',', ':')
+            body = f'{self.dumps(obj, indent=indent, separators=separators)}\n'
+            response = self._app.response_class(body, mimetype=self.mimetype)
+
+        response.vary.add('Accept')
+        return response
+
+    def _pretty(self):
+        return self.compact is False or (self.compact is None and self._app.debug)
+
+
+# ============================================
+# 취미 조각 캐시
+# ============================================
+
+def hobby_fragment(hobby, include_media=True):
+    """
+    취미 요약(평균 평점, 평가 수 포함) 조각
+    목록, 추천, 유사 취미 응답에서 같은 취미를 다시 직렬화하지 않도록
+    카탈로그 버전별로 프로세스 로컬 캐시에 보관합니다.
+    include_media=False면 미디어 URL을 제외합니다 (미디어 매니페스트 사용 시).
+    """
+    suffix = '' if include_media else ':compact'
+    return catalog_cache.get_or_set_local(
+        f'fragment:hobby:{hobby.hobby_id}{suffix}',
+        lambda: JSONFragment(hobby.to_dict(include_stats=True, include_media=include_media))
+    )
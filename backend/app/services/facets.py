@@ -0,0 +1,195 @@
+"""
+모임 패싯 집계
+활성 모임 수를 지역(시/도)/모임 유형/취미별로 gathering_facet_counts에 미리 집계해 두고,
+목록 화면의 필터(GET /api/gatherings/regions, /facets)는 모임 테이블을 GROUP BY하지 않고 이 표를 읽습니다.
+
+모임 생성/수정/삭제는 같은 트랜잭션에서 증분(record_facet_change)으로 반영하고,
+벌크 경로(동기화, 정리, 지역 재지정)와 누락분은 refresh_facet_counts가 원본과 비교해 맞춥니다.
+
+지역 패싯은 자유 입력 region 문자열이 아니라 정규화된 region_id의 시/도로 집계하므로
+'서울', '서울시', '서울특별시'가 한 값으로 묶이고 region= 필터(시/도 이름, 하위 지역 포함)와 같은 모임을 셉니다.
+"""
+
+import logging
+import threading
+import time
+from collections import Counter
+
+from sqlalchemy import func
+
+from app.models import db
+from app.models.hobby import Gathering, GatheringFacetCount
+from app.services.bulk import upsert, upsert_increment
+from app.services.catalog_cache import mark_dirty
+from app.services.regions import region_index
+
+logger = logging.getLogger(__name__)
+
+FACET_COLUMNS = {
+    'region': Gathering.region_id,
+    'meeting_type': Gathering.meeting_type,
+    'hobby': Gathering.hobby_id,
+}
+
+
+def province_id(index, region_id):
+    """지역 ID → 시/도 ID (시/군/구면 상위 시/도, 지역 사전에 없으면 None)"""
+    if region_id not in index.level:
+        return None
+    return index.parent.get(region_id) or region_id
+
+
+def _facet_value(facet, value, index):
+    """컬럼 값 → 집계 값 (문자열, 집계하지 않으면 None)"""
+    if facet == 'region':
+        value = province_id(index, value)
+    return None if value is None else str(value)
+
+
+def facet_keys(gathering):
+    """모임 → 집계에 더해지는 (패싯, 값) 목록 (비활성 모임은 없음)"""
+    if not gathering.is_active:
+        return []
+    index = region_index()
+    keys = []
+    for facet, column in FACET_COLUMNS.items():
+        value = _facet_value(facet, getattr(gathering, column.key), index)
+        if value is not None:
+            keys.append((facet, value))
+    return keys
+
+
+def _grouped_counts(condition=None):
+    """활성 모임의 (패싯, 값) → 모임 수 (패싯마다 GROUP BY 1회)"""
+    index = region_index()
+    counts = Counter()
+    for facet, column in FACET_COLUMNS.items():
+        query = db.session.query(column, func.count(Gathering.gathering_id)).filter(
+            Gathering.is_active == True, column.isnot(None)
+        )
+        if condition is not None:
+            query = query.filter(condition)
+        for value, count in query.group_by(column):
+            value = _facet_value(facet, value, index)
+            if value is not None:
+                counts[(facet, value)] += count
+    return counts
+
+
+def _apply_deltas(deltas):
+    """증분 반영 ('facets' 버전도 같은 커밋에서 올림)"""
+    rows = [
+        {'facet': facet, 'value': value, 'count': delta}
+        for (facet, value), delta in deltas.items()
+        if delta
+    ]
+    if not rows:
+        return
+    upsert_increment(GatheringFacetCount, rows, ['facet', 'value'], ['count'])
+    mark_dirty(db.session, 'facets')
+
+
+def record_facet_change(before, after):
+    """
+    모임 하나의 변경 전/후 facet_keys 차이를 집계에 반영 (커밋은 호출자가 수행)
+    생성은 before=[], 삭제(비활성화)는 after=[]로 호출합니다.
+    """
+    deltas = Counter(after)
+    deltas.subtract(before)
+    _apply_deltas(deltas)
+
+
+def remove_gatherings(condition):
+    """조건에 맞는 모임을 지우기 전에 집계에서 차감 (커밋은 호출자가 수행)"""
+    deltas = Counter()
+    deltas.subtract(_grouped_counts(condition))
+    _apply_deltas(deltas)
+
+
+def refresh_facet_counts():
+    """
+    원본 모임으로부터 집계를 다시 계산해 바뀐 행만 반영 (패싯마다 GROUP BY 1회)
+    반환: 바뀐 (패싯, 값) 수
+    """
+    actual = _grouped_counts()
+
+    stored = {
+        (row.facet, row.value): row.count
+        for row in db.session.query(GatheringFacetCount.facet, GatheringFacetCount.value, GatheringFacetCount.count)
+    }
+
+    changed = [
+        {'facet': facet, 'value': value, 'count': count}
+        for (facet, value), count in actual.items()
+        if stored.get((facet, value)) != count
+    ]
+    stale = [key for key in stored if key not in actual]
+
+    if changed:
+        upsert(GatheringFacetCount, changed, ['facet', 'value'], ['count'])
+    for facet, value in stale:
+        GatheringFacetCount.query.filter_by(facet=facet, value=value).delete(synchronize_session=False)
+
+    if changed or stale:
+        mark_dirty(db.session, 'facets')
+        logger.info(f"Gathering facets refreshed: {len(changed)} changed, {len(stale)} removed")
+    db.session.commit()
+    return len(changed) + len(stale)
+
+
+def facet_counts():
+    """{패싯: [(값, 모임 수)]} (모임 수 내림차순, 0인 값 제외)"""
+    rows = db.session.query(
+        GatheringFacetCount.facet, GatheringFacetCount.value, GatheringFacetCount.count
+    ).filter(
+        GatheringFacetCount.count > 0
+    ).order_by(
+        GatheringFacetCount.count.desc(), GatheringFacetCount.value
+    ).all()
+
+    counts = {facet: [] for facet in FACET_COLUMNS}
+    for facet, value, count in rows:
+        counts.setdefault(facet, []).append((value, count))
+    return counts
+
+
+def region_facet(rows):
+    """지역 패싯 [(시/도 ID, 모임 수)] → [{'region_id', 'region'(정식 명칭), 'count'}] (지역 사전에 없는 ID 제외)"""
+    names = region_index().names
+    return [
+        {'region_id': int(value), 'region': names[int(value)], 'count': count}
+        for value, count in rows
+        if int(value) in names
+    ]
+
+
+# ============================================
+# 주기 실행
+# ============================================
+
+_refresher_started = False
+
+
+def start_facet_refresher(app):
+    """
+    패싯 집계를 주기적으로 원본과 맞추는 데몬 스레드 시작
+    GATHERING_FACETS_REFRESH_SECONDS가 0이면 시작하지 않습니다. (cron에서 flask gatherings rebuild facets 사용)
+    """
+    global _refresher_started
+    interval = app.config.get('GATHERING_FACETS_REFRESH_SECONDS', 0)
+    if not interval or _refresher_started:
+        return
+    _refresher_started = True
+
+    def run():
+        while True:
+            time.sleep(interval)
+            with app.app_context():
+                try:
+                    refresh_facet_counts()
+                except Exception as e:
+                    db.session.rollback()
+                    logger.error(f"Gathering facet refresh failed: {str(e)}", exc_info=True)
+
+    threading.Thread(target=run, name='gathering-facet-refresher', daemon=True).start()
+    logger.info(f"Gathering facet refresher started (every {interval}s)")
@@ -0,0 +1,231 @@
+"""
+추천 모임
+사용자의 상위 추천 취미, 거주 지역(User.location), 모임 방식 선호를 합쳐 모임 순위를 매깁니다.
+
+후보 모임은 추천 취미마다
+  - 전국 인기 모임 목록(top_gatherings, TOP_GATHERINGS_PER_HOBBY개)
+  - 사용자 시/도 안의 모임과 온라인 모임 중 회원 수 상위 RECOMMENDATION_LOCAL_CANDIDATES개 (쿼리 1회)
+를 합친 것입니다. 전국 목록만 쓰면 회원 수가 적은 동네 모임이 후보에 들지 못하므로 지역 후보를 따로 조회합니다.
+지역 후보 수를 넘는 동네 모임(회원 수가 더 적은 모임)은 후보에서 빠집니다.
+후보를 취미별 컬럼(모임, region_id, meeting_type, 회원 수 점수)으로 바꾼 뒤 지역/모임 방식 점수는 미리 만든 조회표로 계산합니다.
+전국 인기 모임의 컬럼은 인기 모임 목록이 바뀔 때('gatherings' 버전)만 다시 만들고,
+요청마다는 지역 후보 중 전국 목록에 없는 모임의 컬럼만 덧붙입니다.
+"""
+
+import heapq
+import math
+from collections import namedtuple
+
+from flask import current_app
+from sqlalchemy import func, desc, or_
+
+from app.models import db
+from app.models.hobby import Hobby, Gathering
+from app.models.region import Region
+from app.services.catalog_cache import catalog_cache
+from app.services.top_gatherings import top_gatherings_derived
+
+# 최종 점수 가중치
+HOBBY_WEIGHT = 0.5
+REGION_WEIGHT = 0.25
+MEETING_WEIGHT = 0.15
+POPULARITY_WEIGHT = 0.1
+
+NEARBY_PROVINCE_SCORE = 0.6   # 같은 시/도의 다른 시/군/구
+UNKNOWN_REGION_SCORE = 0.5    # 사용자 지역을 알 수 없을 때 (모든 모임 동일)
+MEETING_TYPES = ('offline', 'online', 'hybrid')
+
+# calculate_hobby_score가 읽는 취미 속성만 보관
+HobbyTraits = namedtuple('HobbyTraits', [
+    'hobby_id', 'indoor_outdoor', 'social_individual', 'creativity_level',
+    'difficulty_level', 'physical_intensity', 'required_budget'
+])
+
+
+def hobby_traits():
+    """활성 취미의 점수 계산용 속성 목록 (카탈로그 버전별 프로세스 로컬 캐시)"""
+    def build():
+        rows = db.session.query(*(getattr(Hobby, field) for field in HobbyTraits._fields)).filter(
+            Hobby.is_deleted == False
+        ).all()
+        return [HobbyTraits(*row) for row in rows]
+
+    return catalog_cache.get_or_set_local('hobby-traits', build)
+
+
+class GatheringTable:
+    """
+    취미 ID → (모임 목록, region_id 목록, meeting_type 목록, 회원 수 점수 목록)
+    회원 수 점수는 log(1 + 회원 수)를 max_log(없으면 목록 전체의 최대값)로 나눈 0~1 값입니다.
+    """
+
+    def __init__(self, lists, max_log=None):
+        if max_log is None:
+            max_log = max(
+                (math.log1p(gathering['member_count'] or 0) for gatherings in lists.values() for gathering in gatherings),
+                default=0.0
+            ) or 1.0
+        self.max_log = max_log
+        self.columns = {hobby_id: self._columns(gatherings) for hobby_id, gatherings in lists.items()}
+
+    def _columns(self, gatherings):
+        return (
+            gatherings,
+            [gathering['region_id'] for gathering in gatherings],
+            [gathering['meeting_type'] for gathering in gatherings],
+            [min(math.log1p(gathering['member_count'] or 0) / self.max_log, 1.0) for gathering in gatherings]
+        )
+
+    def for_hobbies(self, hobby_ids, extra):
+        """
+        hobby_ids의 컬럼에 {hobby_id: [추가 모임]}을 덧붙인 테이블 (이 테이블은 바꾸지 않음, 같은 max_log 사용)
+        추가 모임이 없는 취미는 기존 컬럼을 그대로 공유합니다.
+        """
+        table = GatheringTable({}, self.max_log)
+        for hobby_id in hobby_ids:
+            columns = self.columns.get(hobby_id)
+            added = extra.get(hobby_id)
+            if added:
+                added = self._columns(added)
+                columns = tuple(a + b for a, b in zip(columns, added)) if columns else added
+            if columns:
+                table.columns[hobby_id] = columns
+        return table
+
+
+def national_table():
+    """전국 인기 모임 테이블 (인기 모임 목록이 교체될 때까지 프로세스 메모리에 재사용)"""
+    return top_gatherings_derived('recommendation-table', GatheringTable)
+
+
+def local_gatherings(hobby_ids, region_ids, size):
+    """
+    취미별 지역(region_ids) 또는 온라인 모임 중 회원 수 상위 size개 {hobby_id: [모임 딕셔너리]}
+    region_ids가 비어 있으면(사용자 지역을 알 수 없음) 온라인 모임만 조회합니다.
+    """
+    hobby_ids = list(hobby_ids)
+    if not hobby_ids or size <= 0:
+        return {}
+
+    condition = Gathering.meeting_type == 'online'
+    if region_ids:
+        condition = or_(condition, Gathering.region_id.in_(list(region_ids)))
+
+    rank = func.row_number().over(
+        partition_by=Gathering.hobby_id,
+        order_by=(desc(Gathering.member_count), Gathering.gathering_id)
+    ).label('rank')
+    ranked = db.session.query(Gathering.gathering_id, rank).filter(
+        Gathering.hobby_id.in_(hobby_ids),
+        Gathering.is_active == True,
+        condition
+    ).subquery()
+
+    gatherings = Gathering.query.join(
+        ranked, Gathering.gathering_id == ranked.c.gathering_id
+    ).filter(
+        ranked.c.rank <= size
+    ).order_by(
+        Gathering.hobby_id, ranked.c.rank
+    ).all()
+
+    lists = {}
+    for gathering in gatherings:
+        lists.setdefault(gathering.hobby_id, []).append(gathering.to_dict())
+    return lists
+
+
+def gathering_table(hobby_ids, region_ids):
+    """
+    추천 취미의 후보 모임 테이블 (전국 인기 모임 + 지역/온라인 모임, 모임 ID 중복 제거)
+    region_ids: 사용자 시/도의 지역 ID (region_scores()의 키)
+    """
+    hobby_ids = list(hobby_ids)
+    national = national_table()
+    local = local_gatherings(hobby_ids, region_ids, current_app.config.get('RECOMMENDATION_LOCAL_CANDIDATES', 50))
+
+    extra = {}
+    for hobby_id in hobby_ids:
+        columns = national.columns.get(hobby_id)
+        seen = {gathering['gathering_id'] for gathering in columns[0]} if columns else set()
+        added = [gathering for gathering in local.get(hobby_id, []) if gathering['gathering_id'] not in seen]
+        if added:
+            extra[hobby_id] = added
+
+    return national.for_hobbies(hobby_ids, extra)
+
+
+def region_scores(index, location):
+    """
+    사용자 지역 → {region_id: 점수} 조회표
+    입력과 일치하는 지역(하위 포함)은 1.0, 같은 시/도의 나머지 지역은 NEARBY_PROVINCE_SCORE
+    """
+    matched = index.resolve(location)
+    if not matched:
+        return {}
+
+    provinces = {
+        region_id if index.level[region_id] == Region.LEVEL_PROVINCE else index.parent[region_id]
+        for region_id in matched
+    }
+    scores = dict.fromkeys(index.descendants(provinces), NEARBY_PROVINCE_SCORE)
+    scores.update(dict.fromkeys(matched, 1.0))
+    return scores
+
+
+def meeting_scores(profile, preferred=None):
+    """
+    모임 방식 → 점수 조회표
+    preferred(모임 방식 목록)가 있으면 그 방식 1.0, hybrid는 0.5 이상,
+    없으면 사회성 선호가 높을수록 오프라인, 낮을수록 온라인 모임에 높은 점수
+    """
+    if preferred:
+        scores = {meeting_type: 1.0 if meeting_type in preferred else 0.0 for meeting_type in MEETING_TYPES}
+        scores['hybrid'] = max(scores['hybrid'], 0.5)
+        return scores
+
+    social = float(profile.social_preference) if profile and profile.social_preference else 0.5
+    offline = 0.4 + 0.6 * social
+    online = 1.0 - 0.6 * social
+    return {'offline': offline, 'online': online, 'hybrid': (offline + online) / 2}
+
+
+def rank_gatherings(table, hobby_scores, regions, meetings, limit=20):
+    """
+    추천 취미의 후보 모임 점수 계산 → 상위 limit개
+    hobby_scores: {hobby_id: 0~1}, regions: region_scores() 결과, meetings: meeting_scores() 결과
+    온라인 모임은 지역과 관계없이 지역 점수 1.0
+    """
+    default_region = 0.0 if regions else UNKNOWN_REGION_SCORE
+    scored = []
+    for hobby_id, hobby_score in hobby_scores.items():
+        columns = table.columns.get(hobby_id)
+        if not columns:
+            continue
+
+        gatherings, region_ids, meeting_types, popularity = columns
+        base = hobby_score * HOBBY_WEIGHT
+        for gathering, region_id, meeting_type, popularity_score in zip(gatherings, region_ids, meeting_types, popularity):
+            region_score = 1.0 if meeting_type == 'online' else regions.get(region_id, default_region)
+            meeting_score = meetings.get(meeting_type, 0.0)
+            score = (base +
+                     region_score * REGION_WEIGHT +
+                     meeting_score * MEETING_WEIGHT +
+                     popularity_score * POPULARITY_WEIGHT)
+            scored.append((score, -gathering['gathering_id'], hobby_score, region_score, meeting_score,
+                           popularity_score, gathering))
+
+    top = heapq.nlargest(limit, scored, key=lambda item: (item[0], item[1]))
+    return [
+        {
+            'gathering': gathering,
+            'recommendation_score': round(score, 4),
+            'score_breakdown': {
+                'hobby_match': round(hobby_score, 4),
+                'region': round(region_score, 4),
+                'meeting_type': round(meeting_score, 4),
+                'popularity': round(popularity_score, 4)
+            }
+        }
+        for score, _, hobby_score, region_score, meeting_score, popularity_score, gathering in top
+    ]
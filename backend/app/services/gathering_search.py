@@ -0,0 +1,160 @@
+"""
+모임 검색
+gathering_terms 역색인으로 검색어의 색인어를 모두 가진 활성 모임을 찾고,
+색인어가 나온 필드의 가중치 합(모임명 3, 설명 1)으로 관련도를 매깁니다.
+취미/지역/모임 유형 필터는 색인 행에서 적용하므로 모임 테이블을 LIKE로 전체 스캔하지 않으며,
+후보는 색인 행이 가장 적은 색인어로 먼저 좁히고(최대 MAX_CANDIDATES개),
+바이그램 오탐('가나 나다' ↔ '가나다')은 후보 모임에서만 원문으로 확인합니다.
+"""
+
+import logging
+
+from sqlalchemy import func, or_, and_
+
+from app.models import db
+from app.models.hobby import Gathering, GatheringTerm
+from app.services.text_index import tokenize, resolve_terms, matched_groups, words
+
+logger = logging.getLogger(__name__)
+
+NAME_WEIGHT = 3
+DESCRIPTION_WEIGHT = 1
+# 검색어 하나당 확인할 최대 후보 모임 수 (가장 드문 색인어 묶음 기준, 최신 모임 우선)
+MAX_CANDIDATES = 1000
+
+_INDEX_COLUMNS = (
+    Gathering.gathering_id, Gathering.hobby_id, Gathering.region_id,
+    Gathering.meeting_type, Gathering.name, Gathering.description
+)
+
+
+def _postings(row):
+    weights = dict.fromkeys(tokenize(row.name), NAME_WEIGHT)
+    for term in tokenize(row.description):
+        weights[term] = weights.get(term, 0) + DESCRIPTION_WEIGHT
+    return [
+        {
+            'term': term,
+            'gathering_id': row.gathering_id,
+            'hobby_id': row.hobby_id,
+            'region_id': row.region_id,
+            'meeting_type': row.meeting_type,
+            'weight': weight
+        }
+        for term, weight in weights.items()
+    ]
+
+
+def reindex_gatherings(gathering_ids):
+    """
+    모임들을 다시 색인 (커밋은 호출자가 수행)
+    모임명/설명/취미/지역/모임 유형/활성 여부가 바뀐 모임에 대해 호출하며, 비활성 모임은 색인에서 빠집니다.
+    """
+    gathering_ids = list(set(gathering_ids))
+    if not gathering_ids:
+        return
+
+    GatheringTerm.query.filter(
+        GatheringTerm.gathering_id.in_(gathering_ids)
+    ).delete(synchronize_session=False)
+
+    rows = db.session.query(*_INDEX_COLUMNS).filter(
+        Gathering.gathering_id.in_(gathering_ids),
+        Gathering.is_active == True
+    ).all()
+
+    postings = []
+    for row in rows:
+        postings.extend(_postings(row))
+    if postings:
+        db.session.execute(GatheringTerm.__table__.insert(), postings)
+
+
+def _filtered(query, hobby_id, region_ids, meeting_type):
+    if hobby_id is not None:
+        query = query.filter(GatheringTerm.hobby_id == hobby_id)
+    if region_ids is not None:
+        # region_id가 아직 없는 모임은 호출자가 모임의 region 문자열로 확인 (gathering_region_condition)
+        query = query.filter(or_(GatheringTerm.region_id.in_(region_ids), GatheringTerm.region_id.is_(None)))
+    if meeting_type is not None:
+        query = query.filter(GatheringTerm.meeting_type == meeting_type)
+    return query
+
+
+def _rarest_group(groups, hobby_id, region_ids, meeting_type):
+    """필터를 적용한 색인 행 수가 가장 적은 색인어 묶음"""
+    counts = dict(_filtered(
+        db.session.query(GatheringTerm.term, func.count()).filter(
+            GatheringTerm.term.in_([term for group in groups for term in group])
+        ),
+        hobby_id, region_ids, meeting_type
+    ).group_by(GatheringTerm.term).all())
+    return min(groups, key=lambda group: sum(counts.get(term, 0) for term in group))
+
+
+def ranked_matches(query, hobby_id=None, region_ids=None, meeting_type=None):
+    """
+    검색어의 색인어를 모두 가진 모임 → (gathering_id, score) 서브쿼리
+    가장 드문 색인어 묶음의 모임(최신 MAX_CANDIDATES개)만 후보로 삼아 나머지 색인어를 확인하므로,
+    흔한 색인어가 섞여도 집계와 원문 확인은 후보 수만큼만 수행합니다.
+    :raises ValueError: 검색어에 색인어가 없을 때
+    """
+    groups = resolve_terms(GatheringTerm.term, query)
+    if not groups:
+        raise ValueError('검색어를 입력해주세요.')
+
+    rarest = _rarest_group(groups, hobby_id, region_ids, meeting_type)
+    candidates = _filtered(
+        db.session.query(GatheringTerm.gathering_id).filter(GatheringTerm.term.in_(rarest)),
+        hobby_id, region_ids, meeting_type
+    ).distinct().order_by(GatheringTerm.gathering_id.desc()).limit(MAX_CANDIDATES)
+    candidate_ids = [gathering_id for (gathering_id,) in candidates]
+
+    postings = db.session.query(
+        GatheringTerm.gathering_id,
+        func.sum(GatheringTerm.weight).label('score')
+    ).filter(
+        GatheringTerm.term.in_([term for group in groups for term in group]),
+        GatheringTerm.gathering_id.in_(candidate_ids)
+    )
+
+    return postings.group_by(
+        GatheringTerm.gathering_id
+    ).having(
+        matched_groups(GatheringTerm.term, groups) == len(groups)
+    ).subquery()
+
+
+def word_conditions(query):
+    """후보 모임의 원문 확인 조건 (검색어의 모든 단어가 모임명 또는 설명에 포함)"""
+    return [
+        or_(Gathering.name.ilike(f'%{word}%'), Gathering.description.ilike(f'%{word}%'))
+        for word in words(query)
+    ]
+
+
+def rebuild_gathering_index(chunk_size=5000):
+    """원본 모임으로부터 검색 역색인 재구성 (초기 적재, 데이터 이관 후 사용)"""
+    GatheringTerm.query.delete(synchronize_session=False)
+
+    indexed = 0
+    last_id = 0
+    while True:
+        # 기본키 키셋으로 묶음 조회 (조회 결과를 읽는 도중 INSERT를 실행하지 않도록)
+        rows = db.session.query(*_INDEX_COLUMNS).filter(
+            and_(Gathering.is_active == True, Gathering.gathering_id > last_id)
+        ).order_by(Gathering.gathering_id).limit(chunk_size).all()
+        if not rows:
+            break
+
+        postings = []
+        for row in rows:
+            postings.extend(_postings(row))
+        if postings:
+            db.session.execute(GatheringTerm.__table__.insert(), postings)
+        indexed += len(rows)
+        last_id = rows[-1].gathering_id
+
+    db.session.commit()
+    logger.info(f"Gathering index rebuilt for {indexed} gatherings")
+    return indexed
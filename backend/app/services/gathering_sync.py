@@ -0,0 +1,257 @@
+"""
+외부 모임 데이터 동기화
+공공데이터 등 외부 피드의 내보내기 파일(JSONL/CSV)을 청크 단위로 스트리밍하면서
+레코드 내용의 해시를 저장된 content_hash와 비교해 새 모임/바뀐 모임만 업서트하고,
+피드에서 사라진 모임은 비활성화합니다.
+
+메모리 사용량은 청크 크기와 피드의 external_id 집합(사라진 모임 판별용)에만 비례하고,
+바뀐 것이 없으면 청크마다 해시 조회 한 번만 실행합니다.
+"""
+
+import hashlib
+import json
+import logging
+from datetime import datetime
+
+from sqlalchemy import update
+
+from app.models import db
+from app.models.hobby import Hobby, Gathering
+from app.services.bulk import upsert, chunked
+from app.services.catalog_cache import mark_dirty
+from app.services.geo import encode_geohash
+from app.services.regions import gathering_region_id
+from app.services.schedules import replace_schedules
+from app.services.gathering_search import reindex_gatherings
+from app.services.facets import refresh_facet_counts
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SOURCE = 'opendata'
+MEETING_TYPES = ('online', 'offline', 'hybrid')
+
+# 피드 레코드에서 읽는 모임 필드 (없으면 NULL로 반영, 피드가 원본)
+FEED_FIELDS = [
+    'name', 'description', 'location', 'region', 'meeting_type',
+    'schedule_info', 'contact_info', 'website_url', 'latitude', 'longitude'
+]
+FIELD_LENGTHS = {
+    'name': 200, 'location': 200, 'region': 50, 'contact_info': 200, 'website_url': 500
+}
+
+# 바뀐 모임에서 갱신하는 컬럼 (member_count, created_at은 유지)
+UPDATE_COLUMNS = ['hobby_id'] + FEED_FIELDS + ['region_id', 'geohash', 'content_hash', 'is_active']
+
+
+class SyncStats:
+    """동기화 결과 집계"""
+
+    def __init__(self):
+        self.processed = 0
+        self.inserted = 0
+        self.updated = 0
+        self.unchanged = 0
+        self.deactivated = 0
+        self.skipped = 0
+
+    def to_dict(self):
+        return {
+            'processed': self.processed,
+            'inserted': self.inserted,
+            'updated': self.updated,
+            'unchanged': self.unchanged,
+            'deactivated': self.deactivated,
+            'skipped': self.skipped
+        }
+
+
+# ============================================
+# 레코드 정규화
+# ============================================
+
+def _text(value, field):
+    if value is None:
+        return None
+    value = str(value).strip()
+    if not value:
+        return None
+    limit = FIELD_LENGTHS.get(field)
+    return value[:limit] if limit else value
+
+
+def _coordinate(value):
+    if value is None or value == '':
+        return None
+    return float(value)
+
+
+def normalize_record(record, name_map, hobby_ids):
+    """
+    피드 레코드 → (external_id, 모임 컬럼 딕셔너리), 반영할 수 없으면 None
+    external_id(또는 id), 취미(hobby_id 또는 hobby_name), name은 필수이며,
+    취미는 삭제되지 않은 취미(hobby_ids)여야 합니다. (없는 취미 하나로 동기화 전체가 FK 오류로 멈추지 않도록)
+    """
+    external_id = _text(record.get('external_id', record.get('id')), 'external_id')
+    if record.get('hobby_id') not in (None, ''):
+        hobby_id = int(record['hobby_id'])
+    else:
+        hobby_id = name_map.get(_text(record.get('hobby_name'), 'hobby_name'))
+
+    row = {'hobby_id': hobby_id}
+    for field in FEED_FIELDS:
+        row[field] = _text(record.get(field), field)
+    if not external_id or hobby_id not in hobby_ids or not row['name']:
+        return None
+
+    if row['meeting_type'] not in MEETING_TYPES:
+        row['meeting_type'] = 'offline'
+
+    latitude, longitude = _coordinate(row['latitude']), _coordinate(row['longitude'])
+    if latitude is None or longitude is None or not (-90 <= latitude <= 90 and -180 <= longitude <= 180):
+        latitude = longitude = None
+    row['latitude'], row['longitude'] = latitude, longitude
+    return external_id[:100], row
+
+
+def content_hash(row):
+    """정규화된 레코드 내용의 해시 (필드 순서와 무관)"""
+    payload = json.dumps(row, sort_keys=True, ensure_ascii=False, separators=(',', ':'))
+    return hashlib.sha1(payload.encode('utf-8')).hexdigest()
+
+
+# ============================================
+# 동기화
+# ============================================
+
+def _existing_hashes(source, external_ids):
+    """external_id → (content_hash, is_active) (청크당 한 번 조회)"""
+    rows = db.session.query(
+        Gathering.external_id, Gathering.content_hash, Gathering.is_active
+    ).filter(
+        Gathering.source == source,
+        Gathering.external_id.in_(external_ids)
+    )
+    return {external_id: (digest, is_active) for external_id, digest, is_active in rows}
+
+
+def _deactivate_missing(source, seen, chunk_size):
+    """피드에 없는 활성 모임 비활성화 → 비활성화한 수"""
+    deactivated = 0
+    last_id = 0
+    while True:
+        rows = db.session.query(Gathering.gathering_id, Gathering.external_id).filter(
+            Gathering.source == source,
+            Gathering.is_active == True,
+            Gathering.gathering_id > last_id
+        ).order_by(Gathering.gathering_id).limit(chunk_size).all()
+        if not rows:
+            break
+
+        missing = [gathering_id for gathering_id, external_id in rows if external_id not in seen]
+        if missing:
+            db.session.execute(
+                update(Gathering.__table__)
+                .where(Gathering.__table__.c.gathering_id.in_(missing))
+                .values(is_active=False)
+            )
+            reindex_gatherings(missing)
+            mark_dirty(db.session, 'gatherings')
+            db.session.commit()
+            deactivated += len(missing)
+        last_id = rows[-1][0]
+
+    return deactivated
+
+
+def sync_gatherings(records, source=DEFAULT_SOURCE, chunk_size=1000, deactivate_missing=True, progress=None):
+    """
+    피드 레코드를 모임 테이블에 동기화
+    새 레코드는 삽입, 내용 해시가 바뀌었거나 비활성화되었던 레코드는 갱신, 같으면 건너뜁니다.
+    deactivate_missing이면 끝난 뒤 피드에 없던 이 출처의 모임을 비활성화합니다.
+    (피드에 유효한 레코드가 하나도 없으면 비활성화하지 않음)
+    """
+    stats = SyncStats()
+    name_map = {
+        name: hobby_id
+        for hobby_id, name in db.session.query(Hobby.hobby_id, Hobby.name).filter(Hobby.is_deleted == False)
+    }
+    hobby_ids = set(name_map.values())
+    seen = set()
+
+    for chunk in chunked(records, chunk_size):
+        # 청크 안에서 같은 external_id는 마지막 레코드 사용
+        pending = {}
+        for record in chunk:
+            stats.processed += 1
+            try:
+                normalized = normalize_record(record, name_map, hobby_ids)
+            except (ValueError, TypeError):
+                normalized = None
+            if normalized is None:
+                stats.skipped += 1
+                continue
+            external_id, row = normalized
+            if external_id in pending:
+                stats.skipped += 1
+            pending[external_id] = row
+        seen.update(pending)
+        if not pending:
+            continue
+
+        existing = _existing_hashes(source, list(pending))
+        now = datetime.utcnow()
+        rows = []
+        for external_id, row in pending.items():
+            digest = content_hash(row)
+            current = existing.get(external_id)
+            if current is not None and current[0] == digest and current[1]:
+                stats.unchanged += 1
+                continue
+
+            if current is None:
+                stats.inserted += 1
+            else:
+                stats.updated += 1
+            row.update(
+                source=source,
+                external_id=external_id,
+                content_hash=digest,
+                is_active=True,
+                region_id=gathering_region_id(row['region'], row['location']),
+                geohash=encode_geohash(row['latitude'], row['longitude']) if row['latitude'] is not None else None,
+                member_count=0,
+                created_at=now
+            )
+            rows.append(row)
+
+        if rows:
+            upsert(
+                Gathering,
+                rows,
+                conflict_columns=['source', 'external_id'],
+                update_columns=UPDATE_COLUMNS
+            )
+            # 반영한 모임의 정기 일정, 검색 색인 교체
+            schedule_infos = {row['external_id']: row['schedule_info'] for row in rows}
+            gathering_ids = dict(db.session.query(Gathering.external_id, Gathering.gathering_id).filter(
+                Gathering.source == source,
+                Gathering.external_id.in_(list(schedule_infos))
+            ).all())
+            replace_schedules({
+                gathering_id: schedule_infos[external_id] for external_id, gathering_id in gathering_ids.items()
+            })
+            reindex_gatherings(gathering_ids.values())
+            mark_dirty(db.session, 'gatherings')
+        db.session.commit()
+        if progress:
+            progress(stats)
+
+    if deactivate_missing and seen:
+        stats.deactivated = _deactivate_missing(source, seen, chunk_size)
+
+    # 바뀐 모임이 있으면 패싯 집계를 원본과 맞춤 (패싯마다 GROUP BY 1회)
+    if stats.inserted or stats.updated or stats.deactivated:
+        refresh_facet_counts()
+
+    logger.info(f"Gathering sync ({source}): {stats.to_dict()}")
+    return stats
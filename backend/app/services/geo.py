@@ -0,0 +1,130 @@
+"""
+위치 검색 유틸리티
+geohash 인코딩과 반경 검색용 후보 셀 계산, 거리 계산을 담당합니다.
+
+반경 검색은 반경보다 큰 geohash 셀 하나와 주변 8개 셀의 접두사로 후보를 좁힌 뒤
+(gatherings.geohash 인덱스 범위 조회) 후보에 대해서만 실제 거리를 계산합니다.
+"""
+
+import math
+
+from sqlalchemy import or_
+
+from app.models import db
+from app.models.hobby import Gathering
+
+GEOHASH_ALPHABET = '0123456789bcdefghjkmnpqrstuvwxyz'
+GEOHASH_PRECISION = 9   # 저장 정밀도 (약 5m)
+EARTH_RADIUS_KM = 6371.0088
+KM_PER_DEGREE = 111.32
+
+
+def encode_geohash(latitude, longitude, precision=GEOHASH_PRECISION):
+    """위도/경도 → geohash 문자열"""
+    lat_range = [-90.0, 90.0]
+    lng_range = [-180.0, 180.0]
+    chars = []
+    bits = 0
+    bit_count = 0
+    even = True  # 짝수 번째 비트는 경도
+
+    while len(chars) < precision:
+        value_range, value = (lng_range, longitude) if even else (lat_range, latitude)
+        mid = (value_range[0] + value_range[1]) / 2
+        bits <<= 1
+        if value >= mid:
+            bits |= 1
+            value_range[0] = mid
+        else:
+            value_range[1] = mid
+        even = not even
+
+        bit_count += 1
+        if bit_count == 5:
+            chars.append(GEOHASH_ALPHABET[bits])
+            bits = 0
+            bit_count = 0
+
+    return ''.join(chars)
+
+
+def cell_size(precision):
+    """geohash 셀 크기 (위도 각도, 경도 각도)"""
+    lng_bits = (5 * precision + 1) // 2
+    lat_bits = 5 * precision // 2
+    return 180.0 / (1 << lat_bits), 360.0 / (1 << lng_bits)
+
+
+def haversine_km(lat1, lng1, lat2, lng2):
+    """두 좌표 사이의 대원 거리 (km)"""
+    phi1, phi2 = math.radians(lat1), math.radians(lat2)
+    d_phi = phi2 - phi1
+    d_lambda = math.radians(lng2 - lng1)
+    a = math.sin(d_phi / 2) ** 2 + math.cos(phi1) * math.cos(phi2) * math.sin(d_lambda / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * math.asin(min(1.0, math.sqrt(a)))
+
+
+def search_precision(latitude, radius_km):
+    """
+    셀의 가로/세로가 모두 반경 이상인 가장 긴 정밀도
+    (중심 셀 + 주변 8개 셀이 반경 원 전체를 덮음) 없으면 None
+    """
+    # 원이 닿는 가장 높은 위도에서 경도 1도가 가장 짧음
+    max_lat = min(90.0, abs(latitude) + radius_km / KM_PER_DEGREE)
+    lng_km_per_degree = KM_PER_DEGREE * math.cos(math.radians(max_lat))
+
+    for precision in range(GEOHASH_PRECISION, 0, -1):
+        lat_deg, lng_deg = cell_size(precision)
+        if lat_deg * KM_PER_DEGREE >= radius_km and lng_deg * lng_km_per_degree >= radius_km:
+            return precision
+    return None
+
+
+def candidate_prefixes(latitude, longitude, radius_km):
+    """
+    반경 검색 후보 geohash 접두사 목록 (중복 제거, 최대 9개)
+    반경이 너무 커서 셀로 덮을 수 없으면 None (전체 조회 필요)
+    """
+    precision = search_precision(latitude, radius_km)
+    if precision is None:
+        return None
+
+    lat_deg, lng_deg = cell_size(precision)
+    prefixes = set()
+    for d_lat in (-1, 0, 1):
+        lat = latitude + d_lat * lat_deg
+        if lat < -90.0 or lat > 90.0:
+            continue
+        for d_lng in (-1, 0, 1):
+            lng = (longitude + d_lng * lng_deg + 180.0) % 360.0 - 180.0
+            prefixes.add(encode_geohash(lat, lng, precision))
+    return sorted(prefixes)
+
+
+def find_nearby_gatherings(latitude, longitude, radius_km, hobby_id=None, limit=20):
+    """
+    반경 안의 활성 모임 [(gathering_id, 거리 km)] (가까운 순)
+    후보는 geohash 접두사 범위로만 조회하고 (gathering_id, 위도, 경도) 컬럼만 읽습니다.
+    """
+    query = db.session.query(
+        Gathering.gathering_id, Gathering.latitude, Gathering.longitude
+    ).filter(
+        Gathering.is_active == True,
+        Gathering.geohash.isnot(None)
+    )
+
+    prefixes = candidate_prefixes(latitude, longitude, radius_km)
+    if prefixes is not None:
+        query = query.filter(or_(*[Gathering.geohash.like(f'{prefix}%') for prefix in prefixes]))
+
+    if hobby_id:
+        query = query.filter(Gathering.hobby_id == hobby_id)
+
+    matches = []
+    for gathering_id, lat, lng in query:
+        distance = haversine_km(latitude, longitude, lat, lng)
+        if distance <= radius_km:
+            matches.append((gathering_id, distance))
+
+    matches.sort(key=lambda match: (match[1], match[0]))
+    return matches[:limit]
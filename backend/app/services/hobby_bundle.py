@@ -0,0 +1,75 @@
+"""
+취미 상세 묶음 조회
+상세 정보(최근 리뷰 포함), 유사 취미, 인기 모임을 한 번의 요청으로 구성합니다.
+캐시에 있는 항목은 그대로 사용하고, 없는 항목만 스레드 풀에서 동시에 조회합니다.
+취미는 요청 스레드에서 한 번만 조회해 딕셔너리/튜플 값으로 바꾼 뒤 각 작업에 넘깁니다.
+(작업은 각자의 세션에서 실행되므로 요청 세션의 ORM 객체를 넘기지 않음)
+인기 모임은 메모리에 유지되는 취미별 목록(top_gatherings)에서 가져옵니다.
+"""
+
+import logging
+
+from app.models.hobby import Hobby
+from app.services.catalog_cache import catalog_cache
+from app.services.parallel import run_parallel
+from app.services.recent_reviews import get_recent_reviews
+from app.services.similarity import find_similar_hobbies, similarity_profile
+from app.services.top_gatherings import top_gatherings
+
+logger = logging.getLogger(__name__)
+
+
+def _active_hobby(hobby_id):
+    return Hobby.query.filter_by(hobby_id=hobby_id, is_deleted=False).first()
+
+
+def build_hobby_detail(hobby_id, hobby_data=None):
+    """
+    취미 상세 정보 + 최근 리뷰 (취미가 없으면 None)
+    hobby_data(이미 만든 to_dict(include_stats=True) 결과)를 넘기면 취미를 다시 조회하지 않습니다.
+    """
+    if hobby_data is None:
+        hobby = _active_hobby(hobby_id)
+        if hobby is None:
+            return None
+        hobby_data = hobby.to_dict(include_stats=True)
+
+    # 최근 리뷰 5개 (평가 저장 시 갱신되는 최근 리뷰 테이블에서 조회)
+    return dict(hobby_data, recent_reviews=get_recent_reviews(hobby_id))
+
+
+def get_hobby_bundle(hobby_id, similar_limit=5, gatherings_limit=5):
+    """
+    취미 상세 묶음 조회
+
+    :return: {'hobby', 'similar_hobbies', 'gatherings'} (취미가 없으면 None)
+    """
+    names = {
+        'hobby': f'hobby:{hobby_id}',
+        'similar_hobbies': f'similar:{hobby_id}:{similar_limit}',
+    }
+
+    version = catalog_cache.version()
+    cached = catalog_cache.get_many(list(names.values()), version)
+    bundle = {part: cached[name] for part, name in names.items() if name in cached}
+
+    missing = [part for part in names if part not in bundle]
+    if missing:
+        hobby = _active_hobby(hobby_id)
+        if hobby is None:
+            return None
+        hobby_data = hobby.to_dict(include_stats=True)
+        profile = similarity_profile(hobby)
+
+        builders = {
+            'hobby': lambda: build_hobby_detail(hobby_id, hobby_data),
+            'similar_hobbies': lambda: find_similar_hobbies(profile, similar_limit),
+        }
+        bundle.update(run_parallel({part: builders[part] for part in missing}))
+
+    # 유사 취미는 find_similar_hobbies가 같은 키로 이미 저장함
+    if 'hobby' in missing:
+        catalog_cache.set(names['hobby'], bundle['hobby'], version)
+
+    bundle['gatherings'] = top_gatherings(hobby_id, gatherings_limit)
+    return bundle
@@ -0,0 +1,45 @@
+"""
+취미 요약 맵
+모임 목록처럼 여러 행에 취미 이름/카테고리를 붙일 때 행마다 취미를 조회하지 않도록,
+캐시에 없는 취미만 (hobby_id, name, category) 컬럼으로 한 번에 조회합니다.
+"""
+
+from app.models import db
+from app.models.hobby import Hobby
+from app.services.catalog_cache import catalog_cache
+
+
+def hobby_summaries(hobby_ids):
+    """
+    취미 ID 목록 → {hobby_id: {'hobby_id', 'name', 'category'}}
+    삭제되었거나 없는 취미는 결과에 포함되지 않습니다. (쿼리 최대 1회)
+    """
+    cache_keys = {hobby_id: f'hobby:brief:{hobby_id}' for hobby_id in set(hobby_ids)}
+    if not cache_keys:
+        return {}
+
+    version = catalog_cache.version()
+    cached = catalog_cache.get_many(list(cache_keys.values()), version)
+    summaries = {
+        hobby_id: cached[key]
+        for hobby_id, key in cache_keys.items()
+        if key in cached
+    }
+
+    missing = [hobby_id for hobby_id in cache_keys if hobby_id not in summaries]
+    if missing:
+        rows = db.session.query(
+            Hobby.hobby_id, Hobby.name, Hobby.category
+        ).filter(
+            Hobby.hobby_id.in_(missing),
+            Hobby.is_deleted == False
+        ).all()
+
+        loaded = {}
+        for row in rows:
+            summary = {'hobby_id': row.hobby_id, 'name': row.name, 'category': row.category}
+            summaries[row.hobby_id] = summary
+            loaded[cache_keys[row.hobby_id]] = summary
+        catalog_cache.set_many(loaded, version)
+
+    return summaries
@@ -0,0 +1,86 @@
+"""
+조건부 GET (ETag / Last-Modified)
+응답을 만들기 전에 네임스페이스 버전만으로 ETag를 계산하고,
+클라이언트가 가진 버전과 같으면 쿼리/직렬화 없이 304를 반환합니다.
+"""
+
+import hashlib
+from datetime import datetime, timezone
+from functools import wraps
+
+from flask import current_app, make_response, request
+
+from app.services.catalog_cache import catalog_cache
+
+
+def compute_etag(namespaces):
+    """
+    현재 요청에 대한 ETag와 Last-Modified 계산
+    (백엔드 세대 + 네임스페이스 버전 + 요청 경로/쿼리 + Accept)
+    """
+    parts = [catalog_cache.epoch()]
+    last_modified = None
+
+    for namespace in namespaces:
+        version, changed_at = catalog_cache.version_info(namespace)
+        parts.append(f'{namespace}={version}')
+        if changed_at is not None and (last_modified is None or changed_at > last_modified):
+            last_modified = changed_at
+
+    parts.append(request.full_path)
+    parts.append(request.headers.get('Accept', ''))
+
+    etag = hashlib.sha1('|'.join(parts).encode('utf-8')).hexdigest()
+    if last_modified is not None:
+        last_modified = datetime.fromtimestamp(int(last_modified), tz=timezone.utc)
+    return etag, last_modified
+
+
+def _not_modified(etag, last_modified):
+    if request.if_none_match:
+        return request.if_none_match.contains(etag)
+    if last_modified is not None and request.if_modified_since is not None:
+        return last_modified <= request.if_modified_since
+    return False
+
+
+def _settling(last_modified, settle_config):
+    """마지막 변경 후 settle_config(초) 설정이 지나지 않았는지 (Last-Modified는 초 단위로 잘려 1초 여유)"""
+    if settle_config is None or last_modified is None:
+        return False
+    settle_seconds = current_app.config.get(settle_config, 0)
+    age = (datetime.now(timezone.utc) - last_modified).total_seconds()
+    return age < settle_seconds + 1
+
+
+def conditional_get(*namespaces, settle_config=None):
+    """
+    조건부 GET 데코레이터
+    사용 예: @conditional_get('catalog')
+
+    settle_config: 최근 변경을 일정 시간 뒤에 반영하는 응답의 대기 시간 설정 키 (예: 변경 피드)
+                   마지막 변경 후 그 시간이 지나기 전에는 버전이 같아도 내용이 바뀔 수 있으므로 ETag 없이 응답합니다.
+    """
+    def decorator(view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            etag, last_modified = compute_etag(namespaces)
+            if _settling(last_modified, settle_config):
+                return make_response(view(*args, **kwargs))
+
+            if _not_modified(etag, last_modified):
+                response = current_app.response_class(status=304)
+            else:
+                response = make_response(view(*args, **kwargs))
+                if response.status_code != 200:
+                    return response
+
+            response.set_etag(etag)
+            if last_modified is not None:
+                response.last_modified = last_modified
+            response.headers['Cache-Control'] = 'no-cache'
+            response.vary.add('Accept')
+            return response
+
+        return wrapper
+    return decorator
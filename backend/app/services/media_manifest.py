@@ -0,0 +1,212 @@
+"""
+취미 미디어 매니페스트
+취미 이미지/영상의 메타데이터(크기, 해시, 버전)를 hobby_media 테이블에 보관하고,
+카탈로그 버전마다 한 번 만든 매니페스트를 제공합니다.
+클라이언트는 매니페스트로 미디어를 미리 받아 캐시하고, 목록은 media=manifest로 URL 없이 조회합니다.
+"""
+
+import hashlib
+import logging
+import struct
+from datetime import datetime
+from urllib.request import Request, urlopen
+
+from app.models import db
+from app.models.hobby import Hobby, HobbyMedia
+from app.services.catalog_cache import catalog_cache
+
+logger = logging.getLogger(__name__)
+
+# 이미지 다운로드 최대 크기 (바이트)
+MAX_IMAGE_BYTES = 10 * 1024 * 1024
+
+
+# ============================================
+# 이미지 크기 판별 (PNG, GIF, JPEG, WebP 헤더)
+# ============================================
+
+def _jpeg_size(data):
+    offset = 2
+    while offset + 9 < len(data):
+        if data[offset] != 0xFF:
+            offset += 1
+            continue
+        marker = data[offset + 1]
+        if marker in (0xD8, 0x01) or 0xD0 <= marker <= 0xD7 or marker == 0xFF:
+            offset += 1 if marker == 0xFF else 2
+            continue
+        # SOF 마커 (DHT/JPG/DAC 제외)
+        if 0xC0 <= marker <= 0xCF and marker not in (0xC4, 0xC8, 0xCC):
+            height, width = struct.unpack('>HH', data[offset + 5:offset + 9])
+            return width, height
+        length = struct.unpack('>H', data[offset + 2:offset + 4])[0]
+        offset += 2 + length
+    return None
+
+
+def _webp_size(data):
+    chunk = data[12:16]
+    if chunk == b'VP8 ' and len(data) >= 30:
+        width, height = struct.unpack('<HH', data[26:30])
+        return width & 0x3FFF, height & 0x3FFF
+    if chunk == b'VP8L' and len(data) >= 25:
+        bits = int.from_bytes(data[21:25], 'little')
+        return (bits & 0x3FFF) + 1, ((bits >> 14) & 0x3FFF) + 1
+    if chunk == b'VP8X' and len(data) >= 30:
+        return int.from_bytes(data[24:27], 'little') + 1, int.from_bytes(data[27:30], 'little') + 1
+    return None
+
+
+def image_size(data):
+    """이미지 바이트 → (너비, 높이), 알 수 없는 형식이면 None"""
+    if data[:8] == b'\x89PNG\r\n\x1a\n' and len(data) >= 24:
+        return struct.unpack('>II', data[16:24])
+    if data[:6] in (b'GIF87a', b'GIF89a') and len(data) >= 10:
+        return struct.unpack('<HH', data[6:10])
+    if data[:2] == b'\xff\xd8':
+        return _jpeg_size(data)
+    if data[:4] == b'RIFF' and data[8:12] == b'WEBP':
+        return _webp_size(data)
+    return None
+
+
+# ============================================
+# 메타데이터 수집
+# ============================================
+
+def probe_image(url, timeout=10):
+    """이미지를 내려받아 메타데이터 계산 → {content_type, byte_size, content_hash, width, height}"""
+    request = Request(url, headers={'User-Agent': 'hobby-recommender-media/1.0'})
+    with urlopen(request, timeout=timeout) as response:
+        content_type = response.headers.get_content_type()
+        data = response.read(MAX_IMAGE_BYTES + 1)
+
+    if len(data) > MAX_IMAGE_BYTES:
+        raise ValueError(f'이미지가 너무 큽니다: {url}')
+
+    size = image_size(data)
+    return {
+        'content_type': content_type,
+        'byte_size': len(data),
+        'content_hash': hashlib.sha256(data).hexdigest(),
+        'width': size[0] if size else None,
+        'height': size[1] if size else None,
+    }
+
+
+def probe_video(url, timeout=10):
+    """영상은 외부 플레이어 URL이므로 내려받지 않고 URL 해시만 기록"""
+    return {'content_hash': hashlib.sha256(url.encode('utf-8')).hexdigest()}
+
+
+PROBES = {'image': probe_image, 'video': probe_video}
+
+
+def _apply_probe(media, url, metadata):
+    """수집 결과 반영 (URL이나 내용이 바뀌었으면 버전 증가)"""
+    if media.content_hash is not None and (
+        media.url != url or media.content_hash != metadata.get('content_hash')
+    ):
+        media.version = (media.version or 1) + 1
+    media.url = url
+    media.content_type = metadata.get('content_type')
+    media.width = metadata.get('width')
+    media.height = metadata.get('height')
+    media.byte_size = metadata.get('byte_size')
+    media.content_hash = metadata.get('content_hash')
+    media.checked_at = datetime.utcnow()
+
+
+def refresh_media(hobby_ids=None, force=False, timeout=10, probes=None, progress=None):
+    """
+    취미 미디어 메타데이터 수집
+
+    :param hobby_ids: 대상 취미 (없으면 삭제되지 않은 전체 취미)
+    :param force: True면 URL이 그대로인 항목도 다시 수집
+    :param probes: 종류 → 수집 함수 (기본값 PROBES)
+    :return: (수집한 항목 수, 실패한 항목 수)
+    """
+    probes = probes or PROBES
+    query = Hobby.query.filter(Hobby.is_deleted == False)
+    if hobby_ids is not None:
+        query = query.filter(Hobby.hobby_id.in_(hobby_ids))
+
+    refreshed = failed = 0
+    for hobby in query.order_by(Hobby.hobby_id).all():
+        existing = {
+            media.kind: media
+            for media in HobbyMedia.query.filter_by(hobby_id=hobby.hobby_id)
+        }
+
+        for kind, column in HobbyMedia.KINDS.items():
+            url = getattr(hobby, column)
+            media = existing.get(kind)
+
+            if not url:
+                if media is not None:
+                    db.session.delete(media)
+                continue
+            if media is not None and media.url == url and media.content_hash and not force:
+                continue
+
+            try:
+                metadata = probes[kind](url, timeout=timeout)
+            except Exception as e:
+                logger.warning(f"Media probe failed ({hobby.hobby_id}, {kind}): {str(e)}")
+                # URL만 기록하고 다음 실행에서 다시 시도
+                metadata = {}
+                failed += 1
+
+            if media is None:
+                media = HobbyMedia(hobby_id=hobby.hobby_id, kind=kind, version=1)
+                db.session.add(media)
+            _apply_probe(media, url, metadata)
+            refreshed += 1
+
+        # 취미마다 커밋 (외부 요청이 길어져도 트랜잭션을 오래 유지하지 않도록)
+        db.session.commit()
+        if progress:
+            progress(hobby.hobby_id)
+
+    logger.info(f"Media refreshed: {refreshed} items ({failed} failed)")
+    return refreshed, failed
+
+
+# ============================================
+# 매니페스트
+# ============================================
+
+def _build_manifest():
+    hobbies = db.session.query(
+        Hobby.hobby_id, Hobby.image_url, Hobby.tutorial_video_url
+    ).filter(
+        Hobby.is_deleted == False
+    ).order_by(Hobby.hobby_id).all()
+    media = {
+        (row.hobby_id, row.kind): row
+        for row in HobbyMedia.query.all()
+    }
+
+    assets = {}
+    for hobby in hobbies:
+        entry = {}
+        for kind, column in HobbyMedia.KINDS.items():
+            url = getattr(hobby, column)
+            if not url:
+                continue
+            row = media.get((hobby.hobby_id, kind))
+            # 메타데이터가 없거나 URL이 바뀐 뒤 아직 수집하지 않았으면 URL만 제공
+            entry[kind] = row.to_manifest() if row is not None and row.url == url else {'url': url}
+        if entry:
+            assets[str(hobby.hobby_id)] = entry
+
+    return {
+        'version': catalog_cache.version(),
+        'total': len(assets),
+        'assets': assets
+    }
+
+
+def get_media_manifest():
+    """미디어 매니페스트 (카탈로그 버전별로 한 번만 생성)"""
+    return catalog_cache.get_or_set('media:manifest', _build_manifest)
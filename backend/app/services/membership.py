@@ -0,0 +1,211 @@
+"""
+모임 가입/탈퇴와 회원 수 카운터
+가입/탈퇴는 gathering_member_shards의 임의 샤드 행에 +1/-1만 기록하고,
+주기적으로(cron의 flask gatherings flush-member-counts 또는 MEMBER_COUNT_FLUSH_SECONDS) 샤드 합계를 gatherings.member_count에 합산합니다.
+인기 모임 정렬은 인덱스가 있는 member_count만 사용하고, 정확한 현재 값이 필요하면 member_counts()를 사용합니다.
+"""
+
+import logging
+import random
+import threading
+import time
+
+from flask import current_app
+from sqlalchemy import func, update, bindparam
+
+from app.models import db
+from app.models.hobby import Gathering, GatheringMember, GatheringMemberShard
+from app.services.bulk import upsert_increment
+from app.services.catalog_cache import mark_dirty
+
+logger = logging.getLogger(__name__)
+
+_flusher_started = False
+
+
+def _record_deltas(deltas):
+    """모임별 증감을 임의 샤드에 기록 (커밋은 호출자가 수행)"""
+    shard_count = current_app.config.get('MEMBER_COUNT_SHARDS', 8)
+    rows = [
+        {'gathering_id': gathering_id, 'shard': random.randrange(shard_count), 'delta': delta}
+        for gathering_id, delta in deltas.items()
+        if delta
+    ]
+    upsert_increment(
+        GatheringMemberShard,
+        rows,
+        conflict_columns=['gathering_id', 'shard'],
+        increment_columns=['delta']
+    )
+
+
+def join_gathering(gathering_id, user_id):
+    """모임 가입 (이미 가입했으면 False, 커밋은 호출자가 수행)"""
+    if db.session.get(GatheringMember, (gathering_id, user_id)) is not None:
+        return False
+
+    db.session.add(GatheringMember(gathering_id=gathering_id, user_id=user_id))
+    db.session.flush()
+    _record_deltas({gathering_id: 1})
+    return True
+
+
+def leave_gathering(gathering_id, user_id):
+    """모임 탈퇴 (가입하지 않았으면 False, 커밋은 호출자가 수행)"""
+    deleted = GatheringMember.query.filter_by(
+        gathering_id=gathering_id,
+        user_id=user_id
+    ).delete(synchronize_session=False)
+    if not deleted:
+        return False
+
+    _record_deltas({gathering_id: -1})
+    return True
+
+
+def remove_user_memberships(user_ids):
+    """사용자들의 가입 정보 삭제 및 회원 수 차감 (커밋은 호출자가 수행)"""
+    counts = dict(
+        db.session.query(
+            GatheringMember.gathering_id, func.count()
+        ).filter(
+            GatheringMember.user_id.in_(user_ids)
+        ).group_by(GatheringMember.gathering_id).all()
+    )
+    if not counts:
+        return
+
+    GatheringMember.query.filter(
+        GatheringMember.user_id.in_(user_ids)
+    ).delete(synchronize_session=False)
+    _record_deltas({gathering_id: -count for gathering_id, count in counts.items()})
+
+
+def member_counts(gathering_ids):
+    """합산 전 증분까지 반영한 현재 회원 수 → {gathering_id: 회원 수}"""
+    gathering_ids = list(set(gathering_ids))
+    if not gathering_ids:
+        return {}
+
+    counts = dict(
+        db.session.query(Gathering.gathering_id, Gathering.member_count).filter(
+            Gathering.gathering_id.in_(gathering_ids)
+        ).all()
+    )
+    pending = db.session.query(
+        GatheringMemberShard.gathering_id, func.sum(GatheringMemberShard.delta)
+    ).filter(
+        GatheringMemberShard.gathering_id.in_(gathering_ids)
+    ).group_by(GatheringMemberShard.gathering_id)
+
+    for gathering_id, delta in pending:
+        if gathering_id in counts:
+            counts[gathering_id] = (counts[gathering_id] or 0) + int(delta or 0)
+    return counts
+
+
+def flush_member_counts(batch_size=1000):
+    """
+    샤드 증분을 member_count에 합산 → 합산한 모임 수
+    읽은 값만큼 샤드에서 차감하므로 합산 중에 들어온 가입/탈퇴도 잃지 않습니다.
+    (member_count + 샤드 합계가 트랜잭션 전후로 같음, 여러 프로세스가 동시에 실행해도 안전)
+    """
+    gatherings_table = Gathering.__table__
+    shards_table = GatheringMemberShard.__table__
+    flushed = set()
+
+    while True:
+        shards = db.session.query(
+            GatheringMemberShard.gathering_id, GatheringMemberShard.shard, GatheringMemberShard.delta
+        ).filter(
+            GatheringMemberShard.delta != 0
+        ).order_by(
+            GatheringMemberShard.gathering_id, GatheringMemberShard.shard
+        ).limit(batch_size).all()
+        if not shards:
+            break
+
+        totals = {}
+        for gathering_id, _, delta in shards:
+            totals[gathering_id] = totals.get(gathering_id, 0) + delta
+
+        count_updates = [
+            {'g_id': gathering_id, 'g_delta': delta}
+            for gathering_id, delta in totals.items()
+            if delta
+        ]
+        if count_updates:
+            db.session.execute(
+                update(gatherings_table)
+                .where(gatherings_table.c.gathering_id == bindparam('g_id'))
+                .values(member_count=func.coalesce(gatherings_table.c.member_count, 0) + bindparam('g_delta')),
+                count_updates
+            )
+        db.session.execute(
+            update(shards_table)
+            .where(
+                shards_table.c.gathering_id == bindparam('g_id'),
+                shards_table.c.shard == bindparam('s_id')
+            )
+            .values(delta=shards_table.c.delta - bindparam('g_delta')),
+            [{'g_id': gathering_id, 's_id': shard, 'g_delta': delta} for gathering_id, shard, delta in shards]
+        )
+        mark_dirty(db.session, 'gatherings')
+        db.session.commit()
+        flushed.update(totals)
+        if len(shards) < batch_size:
+            break
+
+    # 합산이 끝나 0이 된 샤드 행 정리
+    GatheringMemberShard.query.filter(GatheringMemberShard.delta == 0).delete(synchronize_session=False)
+    db.session.commit()
+
+    if flushed:
+        logger.info(f"Member counts flushed for {len(flushed)} gatherings")
+    return len(flushed)
+
+
+def rebuild_member_counts():
+    """가입 정보로부터 member_count 재계산 (데이터 이관 후 사용) → 갱신한 모임 수"""
+    counts = dict(
+        db.session.query(GatheringMember.gathering_id, func.count()).group_by(GatheringMember.gathering_id).all()
+    )
+
+    GatheringMemberShard.query.delete(synchronize_session=False)
+    Gathering.query.update({Gathering.member_count: 0}, synchronize_session=False)
+    if counts:
+        db.session.execute(
+            update(Gathering.__table__)
+            .where(Gathering.__table__.c.gathering_id == bindparam('g_id'))
+            .values(member_count=bindparam('g_count')),
+            [{'g_id': gathering_id, 'g_count': count} for gathering_id, count in counts.items()]
+        )
+    mark_dirty(db.session, 'gatherings')
+    db.session.commit()
+    return len(counts)
+
+
+def start_member_count_flusher(app):
+    """
+    회원 수 합산을 주기적으로 실행하는 데몬 스레드 시작
+    기본 30초마다 합산하며, MEMBER_COUNT_FLUSH_SECONDS가 0이면 시작하지 않습니다. (cron에서 flask gatherings flush-member-counts 사용)
+    워커마다 실행되어도 합산은 동시 실행에 안전합니다.
+    """
+    global _flusher_started
+    interval = app.config.get('MEMBER_COUNT_FLUSH_SECONDS', 0)
+    if not interval or _flusher_started:
+        return
+    _flusher_started = True
+
+    def run():
+        while True:
+            time.sleep(interval)
+            with app.app_context():
+                try:
+                    flush_member_counts()
+                except Exception as e:
+                    db.session.rollback()
+                    logger.error(f"Member count flush failed: {str(e)}", exc_info=True)
+
+    threading.Thread(target=run, name='member-count-flusher', daemon=True).start()
+    logger.info(f"Member count flusher started (every {interval}s)")
@@ -0,0 +1,59 @@
+"""
+병렬 하위 조회
+한 응답을 구성하는 독립적인 조회들을 제한된 스레드 풀에서 동시에 실행합니다.
+각 작업은 별도의 앱 컨텍스트(= 별도의 DB 세션)에서 실행되므로
+작업 함수는 ORM 객체가 아닌 딕셔너리 등 직렬화 가능한 값을 받고 반환해야 합니다.
+
+한 작업이 실패하거나 시간을 넘기면 아직 시작하지 않은 작업은 취소하고,
+이미 실행 중이라 멈출 수 없는 작업은 경고 로그를 남깁니다. (결과는 버려짐)
+"""
+
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from flask import current_app
+
+logger = logging.getLogger(__name__)
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def _get_executor(app):
+    """앱 설정(PARALLEL_QUERY_WORKERS)으로 스레드 풀을 한 번만 생성"""
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(
+                    max_workers=app.config.get('PARALLEL_QUERY_WORKERS', 4),
+                    thread_name_prefix='parallel-query'
+                )
+    return _executor
+
+
+def run_parallel(tasks, timeout=None):
+    """
+    작업들을 동시에 실행하고 결과를 모아서 반환
+
+    :param tasks: 이름 → 인자 없는 함수 딕셔너리
+    :param timeout: 작업별 최대 대기 시간 (초, 기본값은 PARALLEL_QUERY_TIMEOUT 설정)
+    :return: 이름 → 결과 딕셔너리 (작업에서 발생한 예외는 그대로 전달)
+    """
+    app = current_app._get_current_object()
+    timeout = timeout or app.config.get('PARALLEL_QUERY_TIMEOUT', 10)
+    executor = _get_executor(app)
+
+    def run_in_context(task):
+        with app.app_context():
+            return task()
+
+    futures = {name: executor.submit(run_in_context, task) for name, task in tasks.items()}
+    try:
+        return {name: future.result(timeout=timeout) for name, future in futures.items()}
+    except Exception:
+        for name, future in futures.items():
+            if not future.done() and not future.cancel():
+                logger.warning(f"Parallel task '{name}' is still running after the request gave up on it")
+        raise
@@ -0,0 +1,239 @@
+"""
+소프트 삭제 데이터 정리
+보관 기간(PURGE_RETENTION_DAYS)이 지난 삭제 취미/사용자와 그 평가, 설문 응답, 모임, 모임 가입 정보를
+보관 테이블(*_archive)로 옮기고 원본 테이블에서 삭제합니다.
+모임 일정/검색 색인/회원 수 증분, 평가 집계처럼 원본 행에서 다시 만들 수 있는 파생 데이터는 보관하지 않고 삭제합니다.
+작은 묶음 단위로 커밋하므로 운영 중에도 긴 잠금 없이 실행할 수 있습니다.
+
+실행 방법:
+- flask purge run (cron 등 외부 스케줄러에서 주기적으로 실행 권장)
+- PURGE_INTERVAL_HOURS 설정 시 앱 프로세스 안에서 주기적으로 실행
+"""
+
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+
+from sqlalchemy import insert, select, literal
+
+from app.models import db
+from app.models.archive import ARCHIVE_TABLES
+from app.models.admin import UserFeedback, UserNotification
+from app.models.hobby import (
+    Hobby, HobbyKeyword, HobbyMedia, UserHobbyRating, HobbyRecentReview, HobbySegmentRating,
+    ReviewTerm, HobbyRatingStats, Gathering, GatheringMember, GatheringMemberShard, GatheringSchedule, GatheringTerm
+)
+from app.models.user import User, UserProfile, SurveyResponse
+from app.services.catalog_cache import mark_dirty
+from app.services.facets import remove_gatherings
+from app.services.membership import remove_user_memberships
+from app.services.rating_stats import apply_rating_removals
+from app.services.recent_reviews import remove_user_reviews
+from app.services.segment_ratings import segment_of, record_rating_removals
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class PurgeStats:
+    """정리 결과 (보관 테이블로 옮긴 행 수)"""
+    hobbies: int = 0
+    users: int = 0
+    ratings: int = 0
+    responses: int = 0
+    gatherings: int = 0
+    members: int = 0
+
+
+def stamp_deleted_at(model, now=None):
+    """
+    삭제 시각이 없는 삭제 행에 현재 시각 기록 (커밋은 호출자가 수행)
+    직접 is_deleted만 바꾼 행도 이 시점부터 보관 기간을 계산합니다.
+    """
+    return model.query.filter(
+        model.is_deleted == True,
+        model.deleted_at.is_(None)
+    ).update({model.deleted_at: now or datetime.utcnow()}, synchronize_session=False)
+
+
+def expired_ids(model, cutoff, limit=None):
+    """보관 기간이 지난 삭제 행의 기본키 (idx_*_purge 범위 조회)"""
+    primary_key = model.__mapper__.primary_key[0]
+    query = db.session.query(primary_key).filter(
+        model.is_deleted == True,
+        model.deleted_at < cutoff
+    ).order_by(primary_key)
+    if limit is not None:
+        query = query.limit(limit)
+    return [value for (value,) in query.all()]
+
+
+def _archive(model, condition, now):
+    """조건에 맞는 행을 보관 테이블로 복사 → 복사한 행 수"""
+    source = model.__table__
+    archive = ARCHIVE_TABLES[source.name]
+    names = [column.name for column in source.columns]
+    result = db.session.execute(
+        insert(archive).from_select(
+            names + ['archived_at'],
+            select(*source.columns, literal(now, db.DateTime)).where(condition)
+        )
+    )
+    return result.rowcount
+
+
+def _delete(model, condition):
+    model.query.filter(condition).delete(synchronize_session=False)
+
+
+def _purge_hobbies(hobby_ids, now, stats):
+    """
+    취미 묶음 정리 (취미, 평가, 모임, 모임 가입 정보는 보관, 파생 데이터는 삭제)
+    모임 일정(schedule_info), 검색 색인(모임명/설명), 회원 수 증분(가입 정보)은 보관한 모임/가입 정보로 다시 만들 수 있습니다.
+    """
+    gathering_ids = db.session.query(Gathering.gathering_id).filter(Gathering.hobby_id.in_(hobby_ids))
+    stats.hobbies += _archive(Hobby, Hobby.hobby_id.in_(hobby_ids), now)
+    stats.ratings += _archive(UserHobbyRating, UserHobbyRating.hobby_id.in_(hobby_ids), now)
+    stats.gatherings += _archive(Gathering, Gathering.hobby_id.in_(hobby_ids), now)
+    stats.members += _archive(GatheringMember, GatheringMember.gathering_id.in_(gathering_ids), now)
+
+    _delete(ReviewTerm, ReviewTerm.hobby_id.in_(hobby_ids))
+    _delete(HobbyRecentReview, HobbyRecentReview.hobby_id.in_(hobby_ids))
+    _delete(HobbySegmentRating, HobbySegmentRating.hobby_id.in_(hobby_ids))
+    _delete(HobbyRatingStats, HobbyRatingStats.hobby_id.in_(hobby_ids))
+    _delete(HobbyKeyword, HobbyKeyword.hobby_id.in_(hobby_ids))
+    _delete(HobbyMedia, HobbyMedia.hobby_id.in_(hobby_ids))
+    _delete(GatheringMember, GatheringMember.gathering_id.in_(gathering_ids))
+    _delete(GatheringMemberShard, GatheringMemberShard.gathering_id.in_(gathering_ids))
+    _delete(GatheringSchedule, GatheringSchedule.gathering_id.in_(gathering_ids))
+    _delete(GatheringTerm, GatheringTerm.gathering_id.in_(gathering_ids))
+    remove_gatherings(Gathering.hobby_id.in_(hobby_ids))
+    _delete(Gathering, Gathering.hobby_id.in_(hobby_ids))
+    _delete(UserHobbyRating, UserHobbyRating.hobby_id.in_(hobby_ids))
+    _delete(Hobby, Hobby.hobby_id.in_(hobby_ids))
+
+    mark_dirty(db.session, 'catalog')
+    mark_dirty(db.session, 'gatherings')
+
+
+def _purge_users(user_ids, now, stats):
+    """사용자 묶음 정리 (사용자, 평가, 설문 응답, 모임 가입 정보는 보관, 집계에서 평가/회원 수 차감)"""
+    ratings = db.session.query(
+        UserHobbyRating.user_id, UserHobbyRating.hobby_id, UserHobbyRating.rating
+    ).filter(UserHobbyRating.user_id.in_(user_ids)).all()
+    users = db.session.query(
+        User.user_id, User.age, User.gender, User.location
+    ).filter(User.user_id.in_(user_ids)).all()
+
+    # 평가 통계/세그먼트 집계에서 차감
+    apply_rating_removals([(hobby_id, rating) for _, hobby_id, rating in ratings])
+    for user in users:
+        record_rating_removals(
+            segment_of(user.age, user.gender, user.location),
+            [(hobby_id, rating) for user_id, hobby_id, rating in ratings if user_id == user.user_id]
+        )
+
+    stats.users += _archive(User, User.user_id.in_(user_ids), now)
+    stats.ratings += _archive(UserHobbyRating, UserHobbyRating.user_id.in_(user_ids), now)
+    stats.responses += _archive(SurveyResponse, SurveyResponse.user_id.in_(user_ids), now)
+    stats.members += _archive(GatheringMember, GatheringMember.user_id.in_(user_ids), now)
+
+    rating_ids = db.session.query(UserHobbyRating.rating_id).filter(
+        UserHobbyRating.user_id.in_(user_ids)
+    )
+    _delete(ReviewTerm, ReviewTerm.rating_id.in_(rating_ids))
+    _delete(UserHobbyRating, UserHobbyRating.user_id.in_(user_ids))
+    remove_user_reviews(user_ids)
+
+    # 문의 내역은 남기고 작성자만 비움 (외래키 ON DELETE SET NULL과 동일)
+    UserFeedback.query.filter(
+        UserFeedback.user_id.in_(user_ids)
+    ).update({UserFeedback.user_id: None}, synchronize_session=False)
+    remove_user_memberships(user_ids)
+    _delete(UserNotification, UserNotification.user_id.in_(user_ids))
+    _delete(SurveyResponse, SurveyResponse.user_id.in_(user_ids))
+    _delete(UserProfile, UserProfile.user_id.in_(user_ids))
+    _delete(User, User.user_id.in_(user_ids))
+
+    mark_dirty(db.session, 'catalog')
+
+
+def _purge_model(model, purge_chunk, cutoff, chunk_size, now, stats):
+    while True:
+        ids = expired_ids(model, cutoff, limit=chunk_size)
+        if not ids:
+            return
+        try:
+            purge_chunk(ids, now, stats)
+            db.session.commit()
+        except Exception:
+            db.session.rollback()
+            raise
+        logger.info(f"Purged {len(ids)} {model.__tablename__}")
+
+
+def purge_deleted(retention_days=30, chunk_size=100, dry_run=False, now=None):
+    """
+    보관 기간이 지난 삭제 데이터 정리
+
+    :param retention_days: 삭제 후 보관 기간 (일)
+    :param chunk_size: 한 트랜잭션에서 처리할 취미/사용자 수
+    :param dry_run: True면 변경 없이 대상 취미/사용자 수만 계산
+    :return: PurgeStats
+    """
+    now = now or datetime.utcnow()
+    cutoff = now - timedelta(days=retention_days)
+
+    if dry_run:
+        return PurgeStats(
+            hobbies=len(expired_ids(Hobby, cutoff)),
+            users=len(expired_ids(User, cutoff))
+        )
+
+    stamp_deleted_at(Hobby, now)
+    stamp_deleted_at(User, now)
+    db.session.commit()
+
+    stats = PurgeStats()
+    _purge_model(Hobby, _purge_hobbies, cutoff, chunk_size, now, stats)
+    _purge_model(User, _purge_users, cutoff, chunk_size, now, stats)
+
+    logger.info(f"Purge finished: {stats}")
+    return stats
+
+
+# ============================================
+# 주기 실행 (PURGE_INTERVAL_HOURS > 0일 때)
+# ============================================
+
+_scheduler_started = False
+
+
+def start_purge_scheduler(app):
+    """
+    앱 프로세스 안에서 정리 작업을 주기적으로 실행하는 데몬 스레드 시작
+    여러 워커 프로세스로 실행하는 경우에는 설정하지 말고 cron에서 flask purge run을 사용하세요.
+    """
+    global _scheduler_started
+    interval_hours = app.config.get('PURGE_INTERVAL_HOURS', 0)
+    if not interval_hours or _scheduler_started:
+        return
+    _scheduler_started = True
+
+    def run():
+        while True:
+            time.sleep(interval_hours * 3600)
+            with app.app_context():
+                try:
+                    purge_deleted(
+                        retention_days=app.config['PURGE_RETENTION_DAYS'],
+                        chunk_size=app.config['PURGE_CHUNK_SIZE']
+                    )
+                except Exception as e:
+                    db.session.rollback()
+                    logger.error(f"Scheduled purge failed: {str(e)}", exc_info=True)
+
+    threading.Thread(target=run, name='purge-scheduler', daemon=True).start()
+    logger.info(f"Purge scheduler started (every {interval_hours}h)")
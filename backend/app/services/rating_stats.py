@@ -0,0 +1,123 @@
+"""
+취미별 평가 통계 카운터 유지
+평가 저장 시 hobby_rating_stats의 별점별 평가 수, 평가 수, 평점 합계를 증분으로 갱신합니다.
+(취미 조회 시 카운터가 함께 조인되므로 통계 계산에 집계 쿼리가 필요 없음)
+"""
+
+import logging
+
+from sqlalchemy import func, case
+
+from app.models import db
+from app.models.hobby import UserHobbyRating, HobbyRatingStats
+from app.services.bulk import upsert_increment
+from app.services.catalog_cache import mark_dirty
+
+logger = logging.getLogger(__name__)
+
+COUNTER_COLUMNS = ['count_1', 'count_2', 'count_3', 'count_4', 'count_5', 'rating_count', 'rating_sum']
+
+
+def _empty_row(hobby_id):
+    row = {column: 0 for column in COUNTER_COLUMNS}
+    row['hobby_id'] = hobby_id
+    return row
+
+
+def _increment(rows):
+    upsert_increment(
+        HobbyRatingStats,
+        rows,
+        conflict_columns=['hobby_id'],
+        increment_columns=COUNTER_COLUMNS
+    )
+
+
+def apply_rating_changes(changes):
+    """
+    평가 저장 결과를 카운터에 반영 (커밋은 호출자가 수행)
+    changes는 save_ratings의 반환값 (rating, previous_rating, created 포함)
+    """
+    rows = []
+    for change in changes:
+        rating, previous = change['rating'], change['previous_rating']
+        if previous == rating:
+            continue
+
+        row = _empty_row(change['hobby_id'])
+        row[f'count_{rating}'] += 1
+        if previous is not None:
+            row[f'count_{previous}'] -= 1
+        row['rating_count'] = 1 if change['created'] else 0
+        row['rating_sum'] = rating - (previous or 0)
+        rows.append(row)
+
+    _increment(rows)
+
+
+def apply_rating_removals(ratings):
+    """
+    삭제되는 평가를 카운터에서 차감 (커밋은 호출자가 수행)
+    ratings는 (hobby_id, rating) 목록
+    """
+    rows = []
+    for hobby_id, rating in ratings:
+        row = _empty_row(hobby_id)
+        row[f'count_{rating}'] = -1
+        row['rating_count'] = -1
+        row['rating_sum'] = -rating
+        rows.append(row)
+
+    _increment(rows)
+
+
+def get_rating_stats(hobby_ids):
+    """취미별 평균 평점/평가 수 (카운터 조회 한 번) → {hobby_id: {...}}"""
+    stats = {
+        hobby_id: {'average_rating': 0.0, 'rating_count': 0}
+        for hobby_id in hobby_ids
+    }
+    if not stats:
+        return stats
+
+    for counter in HobbyRatingStats.query.filter(HobbyRatingStats.hobby_id.in_(stats.keys())):
+        stats[counter.hobby_id] = {
+            'average_rating': counter.average(),
+            'rating_count': counter.rating_count
+        }
+    return stats
+
+
+def rebuild_rating_stats(hobby_ids=None):
+    """
+    원본 평가로부터 카운터 재구성 (초기 적재, 데이터 이관 후 사용)
+    hobby_ids가 없으면 전체를 재구성합니다.
+    """
+    delete_query = HobbyRatingStats.query
+    aggregate_query = db.session.query(
+        UserHobbyRating.hobby_id,
+        *[
+            func.sum(case((UserHobbyRating.rating == star, 1), else_=0))
+            for star in range(1, 6)
+        ],
+        func.count(UserHobbyRating.rating_id),
+        func.sum(UserHobbyRating.rating)
+    ).group_by(UserHobbyRating.hobby_id)
+
+    if hobby_ids is not None:
+        delete_query = delete_query.filter(HobbyRatingStats.hobby_id.in_(hobby_ids))
+        aggregate_query = aggregate_query.filter(UserHobbyRating.hobby_id.in_(hobby_ids))
+
+    rows = [
+        dict(zip(['hobby_id'] + COUNTER_COLUMNS, [int(value or 0) for value in row]))
+        for row in aggregate_query.all()
+    ]
+
+    delete_query.delete(synchronize_session=False)
+    if rows:
+        db.session.execute(HobbyRatingStats.__table__.insert(), rows)
+    mark_dirty(db.session, 'catalog')
+    db.session.commit()
+
+    logger.info(f"Rating stats rebuilt for {len(rows)} hobbies")
+    return len(rows)
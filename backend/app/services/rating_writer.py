@@ -0,0 +1,225 @@
+"""
+취미 평가 쓰기 경로
+단일 평가와 일괄 평가 모두 unique_user_hobby 키에 대한
+INSERT ... ON DUPLICATE KEY UPDATE 한 문장으로 저장합니다.
+
+같은 사용자의 평가 쓰기는 사용자 행 잠금(lock_rating_user)으로 직렬화합니다.
+평가 행을 잠그면(SELECT ... FOR UPDATE) 아직 없는 행에 갭 잠금이 걸려
+같은 (사용자, 취미)를 동시에 처음 평가할 때 두 INSERT가 교착 상태에 빠지기 때문입니다.
+
+한 번의 쓰기는 사용자 잠금, 취미 확인 + 기존 평가 조회(LEFT JOIN 한 번), 업서트 순으로 실행하고,
+통계/세그먼트/최근 리뷰/검색 색인은 이미 가진 이전 값과 새 값의 차이로 갱신합니다. (다시 읽지 않음)
+바뀐 것이 없는 파생 데이터는 쓰지 않습니다.
+"""
+
+import logging
+from collections import namedtuple
+from datetime import datetime
+
+from app.models import db
+from app.models.hobby import Hobby, UserHobbyRating
+from app.models.user import User
+from app.services.bulk import upsert
+from app.services.catalog_cache import mark_dirty
+from app.services.recent_reviews import record_review
+from app.services.segment_ratings import segment_of, record_rating_changes
+from app.services.rating_stats import apply_rating_changes
+from app.services.review_search import reindex_reviews
+
+logger = logging.getLogger(__name__)
+
+MAX_BATCH_SIZE = 100
+
+# experienced에 허용하는 문자열 (대소문자 무시)
+TRUE_STRINGS = ('true', '1', 'yes', 'y')
+FALSE_STRINGS = ('false', '0', 'no', 'n', '')
+
+
+def parse_bool(value):
+    """
+    JSON 불리언 입력 → bool (None은 False)
+    true/false, 0/1, 'true'/'false'/'1'/'0'/'yes'/'no'만 허용하고 그 외에는 ValueError
+    """
+    if value is None:
+        return False
+    if isinstance(value, bool):
+        return value
+    if isinstance(value, int) and value in (0, 1):
+        return bool(value)
+    if isinstance(value, str):
+        normalized = value.strip().lower()
+        if normalized in TRUE_STRINGS:
+            return True
+        if normalized in FALSE_STRINGS:
+            return False
+    raise ValueError(value)
+
+
+def parse_rating_input(data):
+    """
+    평가 입력 검증
+    반환: (정규화된 항목, 오류 메시지) - 오류가 없으면 메시지는 None
+    """
+    if not isinstance(data, dict):
+        return None, '평가 데이터가 필요합니다.'
+
+    rating = data.get('rating')
+    if rating is None:
+        return None, 'rating 값이 필요합니다.'
+
+    try:
+        rating = int(rating)
+    except (ValueError, TypeError):
+        return None, 'rating은 정수여야 합니다.'
+
+    if not (1 <= rating <= 5):
+        return None, 'rating은 1과 5 사이의 값이어야 합니다.'
+
+    try:
+        experienced = parse_bool(data.get('experienced'))
+    except ValueError:
+        return None, 'experienced는 true 또는 false여야 합니다.'
+
+    return {
+        'rating': rating,
+        'review_text': data.get('review_text'),
+        'experienced': experienced
+    }, None
+
+
+def find_active_hobbies(hobby_ids):
+    """삭제되지 않은 취미 조회 (한 번의 IN 쿼리) → {hobby_id: name}"""
+    if not hobby_ids:
+        return {}
+
+    rows = db.session.query(Hobby.hobby_id, Hobby.name).filter(
+        Hobby.hobby_id.in_(set(hobby_ids)),
+        Hobby.is_deleted == False
+    ).all()
+    return {hobby_id: name for hobby_id, name in rows}
+
+
+# 평가 대상 취미와 사용자의 기존 평가 (기존 평가가 없으면 rating_id 이하가 None)
+RatingTarget = namedtuple('RatingTarget', ['name', 'rating_id', 'rating', 'review_text', 'created_at'])
+
+
+def find_rating_targets(user_id, hobby_ids):
+    """
+    삭제되지 않은 취미 + 사용자의 기존 평가 (LEFT JOIN 한 번) → {hobby_id: RatingTarget}
+    lock_rating_user 다음에 호출해야 기존 평가가 앞선 쓰기의 커밋을 반영합니다.
+    """
+    if not hobby_ids:
+        return {}
+
+    rows = db.session.query(
+        Hobby.hobby_id, Hobby.name,
+        UserHobbyRating.rating_id, UserHobbyRating.rating,
+        UserHobbyRating.review_text, UserHobbyRating.created_at
+    ).outerjoin(
+        UserHobbyRating, db.and_(
+            UserHobbyRating.hobby_id == Hobby.hobby_id,
+            UserHobbyRating.user_id == int(user_id)
+        )
+    ).filter(
+        Hobby.hobby_id.in_(set(hobby_ids)),
+        Hobby.is_deleted == False
+    ).all()
+    return {row[0]: RatingTarget(*row[1:]) for row in rows}
+
+
+def lock_rating_user(user_id):
+    """
+    평가를 쓰는 사용자 조회 + 행 잠금 (삭제된 사용자면 None)
+    트랜잭션의 첫 조회로 호출해야 find_rating_targets의 기존 평가 조회가 앞선 쓰기의 커밋을 봅니다.
+    """
+    return User.query.filter_by(user_id=user_id, is_deleted=False).with_for_update().first()
+
+
+def save_ratings(user, items, targets):
+    """
+    평가 저장 (커밋은 호출자가 수행, lock_rating_user로 잠근 사용자와 find_rating_targets 결과를 넘김)
+
+    :param items: hobby_id, rating, review_text, experienced 딕셔너리 리스트
+                  (같은 hobby_id가 여러 번 있으면 마지막 값 사용, 모두 targets에 있어야 함)
+    :return: 항목별 변경 내역 리스트
+             (hobby_id, rating, previous_rating, created, review_text, experienced, created_at)
+    """
+    user_id = user.user_id
+    items_by_hobby = {}
+    for item in items:
+        items_by_hobby[int(item['hobby_id'])] = item
+
+    if not items_by_hobby:
+        return []
+
+    now = datetime.utcnow()
+    rows = [
+        {
+            'user_id': user_id,
+            'hobby_id': hobby_id,
+            'rating': item['rating'],
+            'review_text': item.get('review_text'),
+            'experienced': item.get('experienced', False),
+            'created_at': now
+        }
+        for hobby_id, item in items_by_hobby.items()
+    ]
+
+    upsert(
+        UserHobbyRating,
+        rows,
+        conflict_columns=['user_id', 'hobby_id'],
+        update_columns=['rating', 'review_text', 'experienced']
+    )
+    mark_dirty(db.session, 'catalog')
+
+    changes = []
+    reviews_changed = []
+    for row in rows:
+        before = targets[row['hobby_id']]
+        created = before.rating_id is None
+        change = {
+            'hobby_id': row['hobby_id'],
+            'user_id': user_id,
+            'rating': row['rating'],
+            'previous_rating': before.rating,
+            'created': created,
+            'review_text': row['review_text'],
+            'experienced': row['experienced'],
+            'created_at': now if created else before.created_at
+        }
+        changes.append(change)
+
+        if (before.review_text or None) != (row['review_text'] or None):
+            reviews_changed.append((before.rating_id, row['hobby_id'], row['review_text']))
+
+        # 최근 리뷰 목록 갱신 (같은 트랜잭션, 리뷰가 없던/없는 평가는 쓰기 없음)
+        record_review(
+            hobby_id=change['hobby_id'],
+            user_id=user_id,
+            rating=change['rating'],
+            review_text=change['review_text'],
+            experienced=change['experienced'],
+            created_at=change['created_at'],
+            previous_review=before.review_text
+        )
+
+    # 취미별 통계 카운터와 세그먼트(연령대, 성별, 지역)별 집계 갱신 (잠근 사용자 행의 세그먼트)
+    apply_rating_changes(changes)
+    record_rating_changes(segment_of(user.age, user.gender, user.location), changes)
+
+    # 리뷰가 바뀐 평가만 검색 색인 갱신 (새 평가의 rating_id만 조회)
+    if reviews_changed:
+        new_hobby_ids = [hobby_id for rating_id, hobby_id, _ in reviews_changed if rating_id is None]
+        new_ids = dict(
+            db.session.query(UserHobbyRating.hobby_id, UserHobbyRating.rating_id).filter(
+                UserHobbyRating.user_id == user_id,
+                UserHobbyRating.hobby_id.in_(new_hobby_ids)
+            ).all()
+        ) if new_hobby_ids else {}
+        reindex_reviews([
+            (rating_id or new_ids[hobby_id], hobby_id, review_text)
+            for rating_id, hobby_id, review_text in reviews_changed
+        ])
+
+    return changes
@@ -0,0 +1,161 @@
+"""
+취미별 최근 리뷰 유지
+평가 저장 시 hobby_recent_reviews 테이블을 갱신하여,
+상세 페이지는 전체 평가를 정렬하지 않고 최대 5개 행만 읽습니다.
+"""
+
+import logging
+
+from app.models import db
+from app.models.hobby import HobbyRecentReview, UserHobbyRating
+from app.services.bulk import upsert
+
+logger = logging.getLogger(__name__)
+
+
+def get_recent_reviews(hobby_id, limit=HobbyRecentReview.MAX_PER_HOBBY):
+    """최근 리뷰 조회 (최신순)"""
+    reviews = HobbyRecentReview.query.filter_by(
+        hobby_id=hobby_id
+    ).order_by(
+        HobbyRecentReview.created_at.desc()
+    ).limit(limit).all()
+
+    return [review.to_dict() for review in reviews]
+
+
+def record_review(hobby_id, user_id, rating, review_text, experienced, created_at, previous_review=None):
+    """
+    평가 저장 시 호출 (커밋은 호출자가 수행)
+    저장 전 리뷰(previous_review)와 비교해 필요한 쓰기만 수행합니다.
+    - 리뷰가 없었고 지금도 없음: 쓰기 없음
+    - 리뷰가 있었고 지금도 있음: 목록에 있으면 그 자리에서 갱신 (작성 시각이 같으므로 순서는 그대로)
+    - 리뷰가 새로 생김: 목록에 추가하고 최대 개수를 넘는 오래된 리뷰 삭제
+    - 리뷰가 지워짐: 목록에서 제거하고 원본 평가에서 빈 자리를 채움
+    """
+    values = {'rating': rating, 'review_text': review_text, 'experienced': experienced}
+
+    if not review_text:
+        if previous_review:
+            removed = HobbyRecentReview.query.filter_by(
+                hobby_id=hobby_id, user_id=user_id
+            ).delete(synchronize_session=False)
+            if removed:
+                _refill(hobby_id)
+        return
+
+    if previous_review:
+        HobbyRecentReview.query.filter_by(
+            hobby_id=hobby_id, user_id=user_id
+        ).update(values, synchronize_session=False)
+        return
+
+    values.update({'hobby_id': hobby_id, 'user_id': user_id, 'created_at': created_at})
+    upsert(
+        HobbyRecentReview,
+        [values],
+        conflict_columns=['hobby_id', 'user_id'],
+        update_columns=['rating', 'review_text', 'experienced', 'created_at']
+    )
+    _trim(hobby_id)
+
+
+def remove_user_reviews(user_ids):
+    """
+    사용자들의 최근 리뷰를 제거하고 빈 자리를 채움 (커밋은 호출자가 수행)
+    원본 평가를 삭제한 뒤 호출해야 삭제된 평가로 다시 채워지지 않습니다.
+    """
+    hobby_ids = [
+        hobby_id for (hobby_id,) in
+        db.session.query(HobbyRecentReview.hobby_id).filter(
+            HobbyRecentReview.user_id.in_(user_ids)
+        ).distinct().all()
+    ]
+    if not hobby_ids:
+        return
+
+    HobbyRecentReview.query.filter(
+        HobbyRecentReview.user_id.in_(user_ids)
+    ).delete(synchronize_session=False)
+    for hobby_id in hobby_ids:
+        _refill(hobby_id)
+
+
+def _trim(hobby_id):
+    """취미당 최대 개수를 넘는 오래된 리뷰 삭제"""
+    overflow = [
+        review_id for (review_id,) in
+        db.session.query(HobbyRecentReview.review_id).filter_by(
+            hobby_id=hobby_id
+        ).order_by(
+            HobbyRecentReview.created_at.desc()
+        ).offset(HobbyRecentReview.MAX_PER_HOBBY).all()
+    ]
+    if overflow:
+        HobbyRecentReview.query.filter(
+            HobbyRecentReview.review_id.in_(overflow)
+        ).delete(synchronize_session=False)
+
+
+def _refill(hobby_id):
+    """리뷰가 삭제되어 비어 있는 자리를 원본 평가에서 채움"""
+    current = HobbyRecentReview.query.filter_by(hobby_id=hobby_id).count()
+    missing = HobbyRecentReview.MAX_PER_HOBBY - current
+    if missing <= 0:
+        return
+
+    existing_users = db.session.query(HobbyRecentReview.user_id).filter_by(hobby_id=hobby_id)
+    candidates = UserHobbyRating.query.filter(
+        UserHobbyRating.hobby_id == hobby_id,
+        UserHobbyRating.review_text.isnot(None),
+        UserHobbyRating.review_text != '',
+        ~UserHobbyRating.user_id.in_(existing_users)
+    ).order_by(
+        UserHobbyRating.created_at.desc()
+    ).limit(missing).all()
+
+    for rating in candidates:
+        db.session.add(_from_rating(rating))
+
+
+def _from_rating(rating):
+    return HobbyRecentReview(
+        hobby_id=rating.hobby_id,
+        user_id=rating.user_id,
+        rating=rating.rating,
+        review_text=rating.review_text,
+        experienced=rating.experienced,
+        created_at=rating.created_at
+    )
+
+
+def rebuild_recent_reviews(hobby_ids=None):
+    """
+    원본 평가로부터 최근 리뷰 재구성 (초기 적재, 데이터 이관 후 사용)
+    hobby_ids가 없으면 평가가 있는 모든 취미를 대상으로 합니다.
+    """
+    if hobby_ids is None:
+        hobby_ids = [
+            hobby_id for (hobby_id,) in
+            db.session.query(UserHobbyRating.hobby_id).distinct().all()
+        ]
+
+    rebuilt = 0
+    for hobby_id in hobby_ids:
+        HobbyRecentReview.query.filter_by(hobby_id=hobby_id).delete(synchronize_session=False)
+
+        latest = UserHobbyRating.query.filter(
+            UserHobbyRating.hobby_id == hobby_id,
+            UserHobbyRating.review_text.isnot(None),
+            UserHobbyRating.review_text != ''
+        ).order_by(
+            UserHobbyRating.created_at.desc()
+        ).limit(HobbyRecentReview.MAX_PER_HOBBY).all()
+
+        for rating in latest:
+            db.session.add(_from_rating(rating))
+        rebuilt += 1
+
+    db.session.commit()
+    logger.info(f"Recent reviews rebuilt for {rebuilt} hobbies")
+    return rebuilt
@@ -0,0 +1,344 @@
+"""
+지역 사전 / 지역명 해석
+사용자가 입력한 지역명(별칭, 앞부분 일부, "서울 강남" 같은 계층 입력)을 지역 ID 목록으로 바꿔
+모임 조회가 (hobby_id, region_id, is_active) 인덱스의 IN 조건을 쓰도록 합니다.
+
+해석 인덱스는 프로세스 메모리에 두고 지역 테이블이 바뀌면('regions' 버전) 다시 만듭니다.
+"""
+
+import bisect
+import logging
+
+from sqlalchemy import and_, or_
+
+from app.models import db
+from app.models.hobby import Gathering
+from app.models.region import Region
+from app.services.catalog_cache import catalog_cache
+from app.services.gathering_search import reindex_gatherings
+
+logger = logging.getLogger(__name__)
+
+# 시/도 (정식 명칭, 별칭)
+PROVINCES = (
+    ('서울특별시', ('서울', '서울시')),
+    ('부산광역시', ('부산', '부산시')),
+    ('대구광역시', ('대구', '대구시')),
+    ('인천광역시', ('인천', '인천시')),
+    ('광주광역시', ('광주', '광주시')),
+    ('대전광역시', ('대전', '대전시')),
+    ('울산광역시', ('울산', '울산시')),
+    ('세종특별자치시', ('세종', '세종시')),
+    ('경기도', ('경기',)),
+    ('강원특별자치도', ('강원', '강원도')),
+    ('충청북도', ('충북',)),
+    ('충청남도', ('충남',)),
+    ('전북특별자치도', ('전북', '전라북도')),
+    ('전라남도', ('전남',)),
+    ('경상북도', ('경북',)),
+    ('경상남도', ('경남',)),
+    ('제주특별자치도', ('제주', '제주도')),
+)
+
+# 시/군/구 (시/도 정식 명칭 → 이름, 일반구는 상위 시로 묶음)
+# 모임 주소의 시/군/구는 이 사전에 있는 이름만 인정하며, 요청 처리 중에 지역을 추가하지 않습니다.
+DISTRICTS = {
+    '서울특별시': (
+        '종로구', '중구', '용산구', '성동구', '광진구', '동대문구', '중랑구', '성북구', '강북구',
+        '도봉구', '노원구', '은평구', '서대문구', '마포구', '양천구', '강서구', '구로구', '금천구',
+        '영등포구', '동작구', '관악구', '서초구', '강남구', '송파구', '강동구',
+    ),
+    '부산광역시': (
+        '중구', '서구', '동구', '영도구', '부산진구', '동래구', '남구', '북구', '해운대구',
+        '사하구', '금정구', '강서구', '연제구', '수영구', '사상구', '기장군',
+    ),
+    '대구광역시': ('중구', '동구', '서구', '남구', '북구', '수성구', '달서구', '달성군', '군위군'),
+    '인천광역시': (
+        # 2026년 7월 개편 (제물포구, 영종구, 검단구 신설), 개편 전 중구/동구 주소도 인정
+        '제물포구', '영종구', '중구', '동구', '미추홀구', '연수구', '남동구', '부평구', '계양구',
+        '서구', '검단구', '강화군', '옹진군',
+    ),
+    '광주광역시': ('동구', '서구', '남구', '북구', '광산구'),
+    '대전광역시': ('동구', '중구', '서구', '유성구', '대덕구'),
+    '울산광역시': ('중구', '남구', '동구', '북구', '울주군'),
+    '세종특별자치시': (),
+    '경기도': (
+        '수원시', '성남시', '고양시', '용인시', '부천시', '안산시', '안양시', '남양주시', '화성시',
+        '평택시', '의정부시', '시흥시', '파주시', '김포시', '광명시', '광주시', '군포시', '하남시',
+        '오산시', '이천시', '안성시', '의왕시', '양주시', '구리시', '포천시', '동두천시', '과천시',
+        '여주시', '양평군', '가평군', '연천군',
+    ),
+    '강원특별자치도': (
+        '춘천시', '원주시', '강릉시', '동해시', '태백시', '속초시', '삼척시', '홍천군', '횡성군',
+        '영월군', '평창군', '정선군', '철원군', '화천군', '양구군', '인제군', '고성군', '양양군',
+    ),
+    '충청북도': (
+        '청주시', '충주시', '제천시', '보은군', '옥천군', '영동군', '증평군', '진천군', '괴산군',
+        '음성군', '단양군',
+    ),
+    '충청남도': (
+        '천안시', '공주시', '보령시', '아산시', '서산시', '논산시', '계룡시', '당진시', '금산군',
+        '부여군', '서천군', '청양군', '홍성군', '예산군', '태안군',
+    ),
+    '전북특별자치도': (
+        '전주시', '군산시', '익산시', '정읍시', '남원시', '김제시', '완주군', '진안군', '무주군',
+        '장수군', '임실군', '순창군', '고창군', '부안군',
+    ),
+    '전라남도': (
+        '목포시', '여수시', '순천시', '나주시', '광양시', '담양군', '곡성군', '구례군', '고흥군',
+        '보성군', '화순군', '장흥군', '강진군', '해남군', '영암군', '무안군', '함평군', '영광군',
+        '장성군', '완도군', '진도군', '신안군',
+    ),
+    '경상북도': (
+        '포항시', '경주시', '김천시', '안동시', '구미시', '영주시', '영천시', '상주시', '문경시',
+        '경산시', '의성군', '청송군', '영양군', '영덕군', '청도군', '고령군', '성주군', '칠곡군',
+        '예천군', '봉화군', '울진군', '울릉군',
+    ),
+    '경상남도': (
+        '창원시', '진주시', '통영시', '사천시', '김해시', '밀양시', '거제시', '양산시', '의령군',
+        '함안군', '창녕군', '고성군', '남해군', '하동군', '산청군', '함양군', '거창군', '합천군',
+    ),
+    '제주특별자치도': ('제주시', '서귀포시'),
+}
+MIN_PREFIX_LENGTH = 2  # 이보다 짧은 입력은 정확히 일치하는 이름/별칭만 찾음
+
+
+def normalize(text):
+    """비교용 정규화 (공백 제거, 소문자)"""
+    return ''.join((text or '').split()).lower()
+
+
+class RegionIndex:
+    """
+    지역명 → 지역 ID 해석 인덱스
+    rows: (region_id, parent_id, level, name, aliases) 목록
+    """
+
+    def __init__(self, rows):
+        self.parent = {}
+        self.level = {}
+        self.names = {}
+        self.children = {}
+        self.by_key = {}
+        self.district_by_key = {}  # (시/도 ID, 정규화된 시/군/구 이름) → region_id
+
+        for region_id, parent_id, level, name, aliases in rows:
+            self.parent[region_id] = parent_id
+            self.level[region_id] = level
+            self.names[region_id] = name
+            if parent_id is not None:
+                self.children.setdefault(parent_id, set()).add(region_id)
+                self.district_by_key[(parent_id, normalize(name))] = region_id
+
+            keys = {normalize(name)} | {normalize(alias) for alias in (aliases or '').split(',')}
+            for key in keys - {''}:
+                self.by_key.setdefault(key, set()).add(region_id)
+
+        self.sorted_keys = sorted(self.by_key)
+
+    def _match(self, token, scope=None):
+        """토큰 하나에 해당하는 지역 (정확히 일치 우선, 없으면 앞부분 일치)"""
+        key = normalize(token)
+        if not key:
+            return set()
+
+        exact = self.by_key.get(key, set())
+        if scope is not None:
+            exact = exact & scope
+        if exact:
+            # 같은 이름이 여러 단계에 있으면 (광주광역시/경기 광주시) 상위 단계 우선
+            top_level = min(self.level[region_id] for region_id in exact)
+            return {region_id for region_id in exact if self.level[region_id] == top_level}
+
+        if len(key) < MIN_PREFIX_LENGTH:
+            return set()
+
+        matched = set()
+        start = bisect.bisect_left(self.sorted_keys, key)
+        for candidate in self.sorted_keys[start:]:
+            if not candidate.startswith(key):
+                break
+            matched |= self.by_key[candidate]
+        return matched & scope if scope is not None else matched
+
+    def descendants(self, region_ids):
+        """지역과 모든 하위 지역"""
+        result = set()
+        stack = list(region_ids)
+        while stack:
+            region_id = stack.pop()
+            if region_id in result:
+                continue
+            result.add(region_id)
+            stack.extend(self.children.get(region_id, ()))
+        return result
+
+    def resolve(self, text):
+        """
+        입력 → 지역 ID 집합 (하위 지역 포함)
+        "서울 강남"처럼 여러 단어면 앞 단어의 하위 지역 안에서 다음 단어를 찾습니다.
+        """
+        tokens = (text or '').split()
+        if not tokens:
+            return set()
+
+        matched = self._match(tokens[0])
+        for token in tokens[1:]:
+            if not matched:
+                break
+            matched = self._match(token, scope=self.descendants(matched))
+        return self.descendants(matched)
+
+    def province_for(self, text):
+        """입력에 해당하는 시/도 ID (없거나 여러 개면 None)"""
+        matched = {
+            region_id for region_id in self._match(text)
+            if self.level[region_id] == Region.LEVEL_PROVINCE
+        }
+        return matched.pop() if len(matched) == 1 else None
+
+    def province_of(self, location):
+        """주소의 첫 단어가 속한 시/도 ID (예: "서울 강남구", "강남구" → 서울특별시, 없거나 여러 개면 None)"""
+        tokens = (location or '').split()
+        if not tokens:
+            return None
+
+        provinces = set()
+        for region_id in self._match(tokens[0]):
+            while self.parent.get(region_id) is not None:
+                region_id = self.parent[region_id]
+            provinces.add(region_id)
+        return provinces.pop() if len(provinces) == 1 else None
+
+    def district_in(self, location, province_id):
+        """주소에서 시/도 안의 시/군/구 ID 찾기 (예: "서울특별시 종로구 ..." → 종로구, 지역 사전에 없으면 None)"""
+        for token in (location or '').split():
+            district_id = self.district_by_key.get((province_id, normalize(token)))
+            if district_id is not None:
+                return district_id
+        return None
+
+
+def _build_index():
+    rows = db.session.query(
+        Region.region_id, Region.parent_id, Region.level, Region.name, Region.aliases
+    ).all()
+    return RegionIndex(rows)
+
+
+def region_index():
+    """현재 지역 해석 인덱스 (프로세스 로컬 캐시)"""
+    return catalog_cache.get_or_set_local(
+        f"regions:v{catalog_cache.version('regions')}:index",
+        _build_index
+    )
+
+
+def resolve_region_ids(text):
+    """지역 입력 → 지역 ID 목록 (하위 지역 포함, 정렬)"""
+    return sorted(region_index().resolve(text))
+
+
+def gathering_region_condition(column, text, legacy_column=None):
+    """
+    지역 필터 조건 (지역 사전으로 해석한 ID, 하위 지역 포함)
+    region_id가 아직 지정되지 않은(NULL) 행도 포함하며, legacy_column(모임의 region 문자열)이 있으면
+    그런 행은 예전처럼 문자열 포함 여부로 확인합니다. (flask regions sync 전 기존 모임)
+    """
+    unassigned = column.is_(None)
+    if legacy_column is not None:
+        unassigned = and_(unassigned, legacy_column.ilike(f'%{text}%'))
+    return or_(column.in_(resolve_region_ids(text)), unassigned)
+
+
+def gathering_region_id(region, location):
+    """
+    모임의 region/location 문자열 → region_id (메모리 인덱스만 사용, DB 쓰기 없음)
+    시/도를 찾지 못하면 None, 주소의 시/군/구가 지역 사전에 없으면 시/도 ID
+    """
+    index = region_index()
+    province_id = index.province_for(region or '')
+    if province_id is None:
+        # region에 시/도가 없으면 주소 첫 단어로 시도
+        first_token = (location or '').split()[:1]
+        province_id = index.province_for(first_token[0]) if first_token else None
+
+    if province_id is None:
+        return None
+
+    return index.district_in(location, province_id) or province_id
+
+
+def assign_region(gathering):
+    """모임의 region/location 문자열로 region_id 설정 (시/도를 찾지 못하면 None)"""
+    gathering.region_id = gathering_region_id(gathering.region, gathering.location)
+    return gathering.region_id
+
+
+def seed_provinces():
+    """시/도 등록 (이미 있는 항목은 별칭만 갱신), 추가된 수 반환"""
+    existing = {
+        region.name: region
+        for region in Region.query.filter_by(level=Region.LEVEL_PROVINCE)
+    }
+    added = 0
+    for name, aliases in PROVINCES:
+        alias_text = ','.join(aliases)
+        region = existing.get(name)
+        if region is None:
+            db.session.add(Region(level=Region.LEVEL_PROVINCE, name=name, aliases=alias_text))
+            added += 1
+        elif region.aliases != alias_text:
+            region.aliases = alias_text
+    db.session.commit()
+    return added
+
+
+def seed_districts():
+    """시/군/구 등록 (DISTRICTS 사전 기준, 이미 있는 항목은 건너뜀), 추가된 수 반환"""
+    provinces = {
+        region.name: region.region_id
+        for region in Region.query.filter_by(level=Region.LEVEL_PROVINCE)
+    }
+    existing = set(
+        db.session.query(Region.parent_id, Region.name).filter(Region.level == Region.LEVEL_DISTRICT)
+    )
+    added = 0
+    for province_name, names in DISTRICTS.items():
+        province_id = provinces.get(province_name)
+        if province_id is None:
+            continue
+        for name in names:
+            if (province_id, name) not in existing:
+                db.session.add(Region(parent_id=province_id, level=Region.LEVEL_DISTRICT, name=name))
+                added += 1
+    db.session.commit()
+    return added
+
+
+def backfill_gathering_regions(chunk_size=500, only_missing=True):
+    """
+    모임 region_id 채우기 (chunk_size개씩 커밋)
+    반환: (지정된 수, 시/도를 찾지 못한 수)
+    """
+    assigned = unresolved = 0
+    last_id = 0
+    while True:
+        query = Gathering.query.filter(Gathering.gathering_id > last_id)
+        if only_missing:
+            query = query.filter(Gathering.region_id.is_(None))
+        gatherings = query.order_by(Gathering.gathering_id).limit(chunk_size).all()
+        if not gatherings:
+            break
+
+        for gathering in gatherings:
+            if assign_region(gathering) is None:
+                unresolved += 1
+            else:
+                assigned += 1
+        last_id = gatherings[-1].gathering_id
+        # 검색 색인 행의 region_id 갱신
+        reindex_gatherings(gathering.gathering_id for gathering in gatherings)
+        db.session.commit()
+
+    return assigned, unresolved
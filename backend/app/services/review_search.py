@@ -0,0 +1,160 @@
+"""
+리뷰 검색
+review_terms 역색인으로 후보 평가를 찾고, 원문에서 검색어를 확인합니다.
+평가 테이블을 LIKE로 전체 스캔하지 않으며, rating_id 기준 키셋으로 최신순 페이지네이션합니다.
+"""
+
+import logging
+
+from sqlalchemy import func
+
+from app.models import db
+from app.models.hobby import UserHobbyRating, ReviewTerm
+from app.services.text_index import tokenize, resolve_terms, matched_groups, matches
+
+logger = logging.getLogger(__name__)
+
+# 한 요청에서 확인할 최대 후보 묶음 수 (원문 확인에서 계속 걸러질 때 작업량 제한)
+MAX_CANDIDATE_ROUNDS = 5
+
+
+def _postings(rating_id, hobby_id, review_text):
+    return [
+        {'term': term, 'rating_id': rating_id, 'hobby_id': hobby_id}
+        for term in tokenize(review_text)
+    ]
+
+
+def reindex_reviews(reviews):
+    """
+    평가 리뷰를 다시 색인 (커밋은 호출자가 수행)
+    평가 저장 시 리뷰가 바뀐 항목만 (rating_id, hobby_id, review_text) 목록으로 넘깁니다. (평가를 다시 읽지 않음)
+    """
+    if not reviews:
+        return
+
+    ReviewTerm.query.filter(
+        ReviewTerm.rating_id.in_([rating_id for rating_id, _, _ in reviews])
+    ).delete(synchronize_session=False)
+
+    postings = []
+    for rating_id, hobby_id, review_text in reviews:
+        postings.extend(_postings(rating_id, hobby_id, review_text))
+    if postings:
+        db.session.execute(ReviewTerm.__table__.insert(), postings)
+
+
+def _candidate_ids(groups, hobby_id, before, size):
+    """모든 색인어 묶음에 일치하는 평가 ID (최신순)"""
+    query = db.session.query(ReviewTerm.rating_id).filter(
+        ReviewTerm.term.in_([term for group in groups for term in group])
+    )
+    if hobby_id is not None:
+        query = query.filter(ReviewTerm.hobby_id == hobby_id)
+    if before is not None:
+        query = query.filter(ReviewTerm.rating_id < before)
+
+    rows = query.group_by(
+        ReviewTerm.rating_id
+    ).having(
+        matched_groups(ReviewTerm.term, groups) == len(groups)
+    ).order_by(
+        ReviewTerm.rating_id.desc()
+    ).limit(size).all()
+    return [rating_id for (rating_id,) in rows]
+
+
+def search_reviews(query, hobby_id=None, cursor=None, limit=20, min_rating=None, experienced=None):
+    """
+    리뷰 검색
+
+    :param query: 검색어 (여러 단어는 모두 포함하는 리뷰만)
+    :param hobby_id: 특정 취미로 제한 (없으면 전체 취미)
+    :param cursor: 이전 응답의 next_cursor
+    :param min_rating: 최소 평점
+    :param experienced: 체험 여부
+    :return: (평가 리스트, next_cursor) - 다음 페이지가 없으면 next_cursor는 None
+    :raises ValueError: 검색어에 색인어가 없을 때
+    """
+    groups = resolve_terms(ReviewTerm.term, query)
+    if not groups:
+        raise ValueError('검색어를 입력해주세요.')
+
+    batch_size = max(limit * 2, 50)
+    results = []
+    before = cursor
+    exhausted = False
+
+    for _ in range(MAX_CANDIDATE_ROUNDS):
+        candidate_ids = _candidate_ids(groups, hobby_id, before, batch_size)
+        if not candidate_ids:
+            exhausted = True
+            break
+
+        ratings = {
+            rating.rating_id: rating
+            for rating in UserHobbyRating.query.filter(UserHobbyRating.rating_id.in_(candidate_ids))
+        }
+        for rating_id in candidate_ids:
+            before = rating_id
+            rating = ratings.get(rating_id)
+            if rating is None or not matches(rating.review_text, query):
+                continue
+            if min_rating is not None and rating.rating < min_rating:
+                continue
+            if experienced is not None and bool(rating.experienced) != experienced:
+                continue
+
+            results.append(rating)
+            if len(results) == limit:
+                break
+
+        if len(results) == limit:
+            break
+        if len(candidate_ids) < batch_size:
+            exhausted = True
+            break
+
+    next_cursor = None if exhausted and len(results) < limit else before
+    return results, next_cursor
+
+
+def rebuild_review_index(hobby_ids=None):
+    """
+    원본 평가로부터 리뷰 역색인 재구성 (초기 적재, 데이터 이관 후 사용)
+    hobby_ids가 없으면 전체를 재구성합니다.
+    """
+    delete_query = ReviewTerm.query
+    rating_query = db.session.query(
+        UserHobbyRating.rating_id, UserHobbyRating.hobby_id, UserHobbyRating.review_text
+    ).filter(
+        UserHobbyRating.review_text.isnot(None),
+        UserHobbyRating.review_text != ''
+    )
+    if hobby_ids is not None:
+        delete_query = delete_query.filter(ReviewTerm.hobby_id.in_(hobby_ids))
+        rating_query = rating_query.filter(UserHobbyRating.hobby_id.in_(hobby_ids))
+
+    delete_query.delete(synchronize_session=False)
+
+    indexed = 0
+    last_id = 0
+    while True:
+        # 기본키 키셋으로 묶음 조회 (조회 결과를 읽는 도중 INSERT를 실행하지 않도록)
+        rows = rating_query.filter(
+            UserHobbyRating.rating_id > last_id
+        ).order_by(UserHobbyRating.rating_id).limit(5000).all()
+        if not rows:
+            break
+
+        postings = []
+        for row in rows:
+            postings.extend(_postings(row.rating_id, row.hobby_id, row.review_text))
+        if postings:
+            db.session.execute(ReviewTerm.__table__.insert(), postings)
+        indexed += len(rows)
+        last_id = rows[-1].rating_id
+
+    db.session.commit()
+    logger.info(f"Review index rebuilt for {indexed} ratings")
+    return indexed
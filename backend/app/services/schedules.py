@@ -0,0 +1,248 @@
+"""
+모임 정기 일정
+자유 입력인 schedule_info("매주 화, 목 19:00~21:00", "매월 첫째 주 토요일 오후 2시")를
+요일/시간대/주기로 해석해 gathering_schedules에 저장하고,
+기간 조회(meets_between)를 날짜별 (요일, 시간대 겹침) 조건으로 바꿔 인덱스로 찾습니다.
+
+시간은 모임 현지 시각(KST) 기준이며, 격주 모임은 기준일이 없으므로 해당 요일이면 후보로 포함합니다.
+"""
+
+import calendar
+import re
+from collections import namedtuple
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import and_, or_, select
+
+from app.models import db
+from app.models.hobby import Gathering, GatheringSchedule
+
+MINUTES_PER_DAY = 24 * 60
+DEFAULT_DURATION_MINUTES = 120   # 끝나는 시간이 없으면 시작 후 2시간
+MEETS_BETWEEN_MAX_DAYS = 31
+LOCAL_TIMEZONE = timezone(timedelta(hours=9))  # 일정 시각 기준 (KST)
+
+ScheduleSlot = namedtuple('ScheduleSlot', ['weekday', 'start_minute', 'end_minute', 'frequency', 'week_of_month'])
+
+WEEKDAYS = '월화수목금토일'
+FREQUENCY_WORDS = {'매주': 'weekly', '격주': 'biweekly', '매월': 'monthly', '매달': 'monthly'}
+DAY_WORDS = {'매일': range(7), '평일': range(5), '주말': (5, 6)}
+WEEK_OF_MONTH_WORDS = {'첫': 1, '첫째': 1, '둘째': 2, '셋째': 3, '넷째': 4, '다섯째': 5, '마지막': -1}
+PM_WORDS = ('오후', '저녁', '밤')
+AM_WORDS = ('오전', '새벽', '아침')
+
+_MERIDIEM = r'(?:오전|오후|저녁|밤|새벽|아침|낮)'
+_TIME_STRICT = _MERIDIEM + r'?\s*(?<!\d)\d{1,2}(?::\d{2}|\s*시(?:\s*\d{1,2}\s*분|\s*반)?)'
+_TIME_BARE = _MERIDIEM + r'?\s*(?<!\d)\d{1,2}(?!\d)'
+_RANGE_SEPARATOR = r'\s*(?:~|-|–|부터)\s*'
+
+TOKEN_PATTERN = re.compile(
+    r'(?P<frequency>매주|격주|매월|매달)'
+    r'|(?P<days_word>매일|평일|주말)'
+    r'|(?P<week>첫째|첫|둘째|셋째|넷째|다섯째|마지막|[1-5]\s*(?:번째|째))\s*주(?!말)'
+    r'|(?P<time>' + _TIME_STRICT + r'(?:' + _RANGE_SEPARATOR + _TIME_STRICT + r'|' + _RANGE_SEPARATOR + _TIME_BARE + r')?'
+    r'|' + _TIME_BARE + _RANGE_SEPARATOR + _TIME_STRICT + r')'
+    r'|(?<![\d가-힣])(?P<days>[' + WEEKDAYS + r']+)(?:요일)?(?:과|와|및)?(?![가-힣])'
+)
+TIME_PART_PATTERN = re.compile(
+    r'(' + _MERIDIEM + r')?\s*(\d{1,2})(?::(\d{2})|\s*시(?:\s*(\d{1,2})\s*분|\s*(반))?)?'
+)
+
+
+# ============================================
+# 해석
+# ============================================
+
+def _parse_time_part(match, default_meridiem=None):
+    """시간 한 개 → (분, 오전/오후 표시)"""
+    meridiem, hour, minute, minute_word, half = match.groups()
+    meridiem = meridiem or default_meridiem
+    hour = int(hour)
+    minute = int(minute or minute_word or 0) + (30 if half else 0)
+    if meridiem in PM_WORDS and hour < 12:
+        hour += 12
+    elif meridiem in AM_WORDS and hour == 12:
+        hour = 0
+    if hour > 24 or minute >= 60:
+        return None, meridiem
+    return min(hour * 60 + minute, MINUTES_PER_DAY), meridiem
+
+
+def parse_time_range(text):
+    """시간대 문자열 → (시작 분, 끝 분), 해석할 수 없으면 None"""
+    parts = list(TIME_PART_PATTERN.finditer(text))
+    if not parts:
+        return None
+
+    start, meridiem = _parse_time_part(parts[0])
+    if start is None or start >= MINUTES_PER_DAY:
+        return None
+    if len(parts) < 2:
+        return start, min(start + DEFAULT_DURATION_MINUTES, MINUTES_PER_DAY)
+
+    # "오후 2시~4시" → 끝 시간도 오후
+    end, _ = _parse_time_part(parts[1], default_meridiem=meridiem if meridiem in PM_WORDS else None)
+    if end is None:
+        return start, min(start + DEFAULT_DURATION_MINUTES, MINUTES_PER_DAY)
+
+    if end <= start:
+        # "11시-1시"처럼 12시간제로 쓴 경우, 아니면 자정을 넘기므로 자정까지
+        end = end + 12 * 60 if end + 12 * 60 > start and end < 12 * 60 else MINUTES_PER_DAY
+    return start, min(end, MINUTES_PER_DAY)
+
+
+def parse_schedule_info(text):
+    """
+    schedule_info → ScheduleSlot 목록 (중복 제거, 해석한 순서)
+    요일 뒤에 오는 시간대가 그 요일들에 적용되고, 시간이 없는 요일은 하루 전체로 저장합니다.
+    """
+    slots = []
+    frequency, week_of_month = 'weekly', None
+    pending_days, last_days = [], []
+
+    def emit(days, start, end):
+        for weekday in days:
+            slot = ScheduleSlot(weekday, start, end, frequency, week_of_month if frequency == 'monthly' else None)
+            if slot not in slots:
+                slots.append(slot)
+
+    for match in TOKEN_PATTERN.finditer(text or ''):
+        kind = match.lastgroup
+        if kind == 'frequency':
+            if pending_days:
+                emit(pending_days, 0, MINUTES_PER_DAY)
+                pending_days = []
+            frequency, week_of_month = FREQUENCY_WORDS[match.group('frequency')], None
+        elif kind == 'week':
+            word = match.group('week')
+            week_of_month = int(word[0]) if word[0].isdigit() else WEEK_OF_MONTH_WORDS[word]
+            frequency = 'monthly'
+        elif kind == 'days_word':
+            pending_days.extend(DAY_WORDS[match.group('days_word')])
+        elif kind == 'days':
+            pending_days.extend(WEEKDAYS.index(char) for char in match.group('days'))
+        elif kind == 'time':
+            time_range = parse_time_range(match.group('time'))
+            days = pending_days or last_days
+            if time_range is None or not days:
+                continue
+            emit(days, *time_range)
+            last_days, pending_days = days, []
+
+    if pending_days:
+        emit(pending_days, 0, MINUTES_PER_DAY)
+    return slots
+
+
+# ============================================
+# 저장
+# ============================================
+
+def replace_schedules(schedule_infos):
+    """
+    {gathering_id: schedule_info} → 일정 행 교체 (삭제 1회 + 삽입 1회, 커밋은 호출자가 수행)
+    반환: 저장한 일정 행 수
+    """
+    if not schedule_infos:
+        return 0
+
+    GatheringSchedule.query.filter(
+        GatheringSchedule.gathering_id.in_(list(schedule_infos))
+    ).delete(synchronize_session=False)
+
+    rows = [
+        dict(slot._asdict(), gathering_id=gathering_id)
+        for gathering_id, schedule_info in schedule_infos.items()
+        for slot in parse_schedule_info(schedule_info)
+    ]
+    if rows:
+        db.session.execute(GatheringSchedule.__table__.insert(), rows)
+    return len(rows)
+
+
+def rebuild_schedules(chunk_size=1000):
+    """모든 모임의 일정 다시 해석 (chunk_size개씩 커밋) → (모임 수, 일정 행 수)"""
+    gatherings = slots = 0
+    last_id = 0
+    while True:
+        rows = db.session.query(Gathering.gathering_id, Gathering.schedule_info).filter(
+            Gathering.gathering_id > last_id
+        ).order_by(Gathering.gathering_id).limit(chunk_size).all()
+        if not rows:
+            break
+
+        slots += replace_schedules(dict(rows))
+        db.session.commit()
+        gatherings += len(rows)
+        last_id = rows[-1][0]
+
+    return gatherings, slots
+
+
+# ============================================
+# 기간 조회
+# ============================================
+
+def _local_datetime(text):
+    """ISO 날짜/시각 → KST 기준 naive datetime (시간대가 없으면 KST로 간주)"""
+    value = datetime.fromisoformat(text)
+    if value.tzinfo is not None:
+        value = value.astimezone(LOCAL_TIMEZONE).replace(tzinfo=None)
+    return value
+
+
+def parse_meets_between(value):
+    """
+    "시작,끝" (ISO 날짜/시각) → (시작, 끝) datetime
+    끝이 날짜만 있으면 그날 끝까지 포함합니다. 형식이 잘못되면 ValueError
+    """
+    parts = [part.strip() for part in (value or '').split(',')]
+    if len(parts) != 2 or not all(parts):
+        raise ValueError('meets_between은 "시작,끝" 형식이어야 합니다. (예: 2026-10-24,2026-10-25)')
+
+    start = _local_datetime(parts[0])
+    end = _local_datetime(parts[1])
+    if len(parts[1]) == 10:
+        end += timedelta(days=1)
+
+    if end <= start:
+        raise ValueError('meets_between의 끝은 시작보다 늦어야 합니다.')
+    if end - start > timedelta(days=MEETS_BETWEEN_MAX_DAYS):
+        raise ValueError(f'meets_between 기간은 최대 {MEETS_BETWEEN_MAX_DAYS}일입니다.')
+    return start, end
+
+
+def _weeks_of_month(day):
+    """날짜가 속한 '매월 N째 주' 값 (마지막 주면 -1 포함)"""
+    weeks = [(day.day - 1) // 7 + 1]
+    if day.day + 7 > calendar.monthrange(day.year, day.month)[1]:
+        weeks.append(-1)
+    return weeks
+
+
+def window_condition(start, end):
+    """기간과 겹치는 일정 조건 (날짜마다 요일 + 시간대 겹침, 매월 일정은 N째 주까지 확인)"""
+    conditions = []
+    day = start.replace(hour=0, minute=0, second=0, microsecond=0)
+    while day < end:
+        next_day = day + timedelta(days=1)
+        from_minute = (start - day).seconds // 60 if start > day else 0
+        to_minute = MINUTES_PER_DAY if end >= next_day else -(-(end - day).seconds // 60)
+        if to_minute > from_minute:
+            conditions.append(and_(
+                GatheringSchedule.weekday == day.weekday(),
+                GatheringSchedule.start_minute < to_minute,
+                GatheringSchedule.end_minute > from_minute,
+                or_(
+                    GatheringSchedule.frequency != 'monthly',
+                    GatheringSchedule.week_of_month.is_(None),
+                    GatheringSchedule.week_of_month.in_(_weeks_of_month(day))
+                )
+            ))
+        day = next_day
+    return or_(*conditions)
+
+
+def gatherings_meeting_between(start, end):
+    """기간 안에 모이는 모임 ID 서브쿼리 (Gathering.gathering_id.in_()에 사용)"""
+    return select(GatheringSchedule.gathering_id).where(window_condition(start, end)).distinct()
@@ -0,0 +1,176 @@
+"""
+세그먼트별 취미 평가 집계
+(연령대, 성별, 지역, 취미)별 평가 수와 평점 합계를 평가 저장 시 증분으로 갱신하여,
+"나와 비슷한 사람들의 인기 취미"를 요청 시점의 users × ratings 조인 없이 조회합니다.
+지역은 지역 사전으로 해석한 시/도 정식 명칭이므로 ('서울', '서울시' → '서울특별시')
+해석 규칙이나 지역 사전이 바뀌면 rebuild_segment_ratings로 재구성합니다.
+"""
+
+import logging
+from collections import defaultdict
+
+from app.models import db
+from app.models.hobby import Hobby, UserHobbyRating, HobbySegmentRating
+from app.models.user import User
+from app.services.bulk import upsert_increment, chunked
+from app.services.regions import region_index
+
+logger = logging.getLogger(__name__)
+
+SEGMENT_COLUMNS = ('age_band', 'gender', 'region')
+
+# 인기 순위의 베이지안 평균 사전값 (전체 인기 취미와 같은 기준)
+PRIOR_COUNT = 5  # 최소 평가 수
+PRIOR_MEAN = 3.0  # 전체 평균 평점
+
+
+def age_band(age):
+    """나이 → 연령대 (예: 63 → '60s', 알 수 없으면 '')"""
+    if not age:
+        return ''
+    return f'{(int(age) // 10) * 10}s'
+
+
+def region_of(location):
+    """지역명 → 시/도 정식 명칭 (예: '서울 강남구' → '서울특별시', 해석할 수 없으면 '')"""
+    index = region_index()
+    province_id = index.province_of(location)
+    if province_id is None:
+        return ''
+    return index.names[province_id]
+
+
+def segment_of(age, gender, location):
+    """사용자 정보 → (연령대, 성별, 지역)"""
+    return (age_band(age), gender or '', region_of(location))
+
+
+def user_segment(user_id):
+    """사용자 ID → 세그먼트 (사용자가 없으면 None)"""
+    user = db.session.get(User, int(user_id))
+    if user is None:
+        return None
+    return segment_of(user.age, user.gender, user.location)
+
+
+def _segment_row(segment, hobby_id, count, total):
+    row = dict(zip(SEGMENT_COLUMNS, segment))
+    row.update({'hobby_id': hobby_id, 'rating_count': count, 'rating_sum': total})
+    return row
+
+
+def _apply(rows):
+    rows = [row for row in rows if row['rating_count'] or row['rating_sum']]
+    upsert_increment(
+        HobbySegmentRating,
+        rows,
+        conflict_columns=list(SEGMENT_COLUMNS) + ['hobby_id'],
+        increment_columns=['rating_count', 'rating_sum']
+    )
+
+
+def record_rating_changes(segment, changes):
+    """
+    평가 저장 결과를 평가한 사용자의 세그먼트 집계에 반영 (커밋은 호출자가 수행)
+    changes는 save_ratings의 반환값 (rating, previous_rating, created 포함)
+    """
+    if not changes:
+        return
+
+    _apply([
+        _segment_row(
+            segment,
+            change['hobby_id'],
+            1 if change['created'] else 0,
+            change['rating'] - (change['previous_rating'] or 0)
+        )
+        for change in changes
+    ])
+
+
+def move_user_segment(user_id, old_segment, new_segment):
+    """
+    사용자의 연령/성별/지역이 바뀌었을 때 기존 평가를 새 세그먼트로 이동 (커밋은 호출자가 수행)
+    """
+    if old_segment == new_segment:
+        return
+
+    ratings = db.session.query(
+        UserHobbyRating.hobby_id, UserHobbyRating.rating
+    ).filter(
+        UserHobbyRating.user_id == int(user_id)
+    ).all()
+
+    rows = []
+    for hobby_id, rating in ratings:
+        rows.append(_segment_row(old_segment, hobby_id, -1, -rating))
+        rows.append(_segment_row(new_segment, hobby_id, 1, rating))
+    _apply(rows)
+
+
+def record_rating_removals(segment, ratings):
+    """
+    삭제되는 평가를 세그먼트 집계에서 차감 (커밋은 호출자가 수행)
+    ratings는 (hobby_id, rating) 목록
+    """
+    _apply([_segment_row(segment, hobby_id, -1, -rating) for hobby_id, rating in ratings])
+
+
+def get_segment_popular(segment, limit):
+    """
+    세그먼트에서 베이지안 평균이 높은 취미 limit개 (기본키 범위 조회 한 번, 정렬/제한은 DB에서)
+    반환: [(Hobby, rating_count, rating_sum)]
+    """
+    age, gender, region = segment
+    # (n / (n + m)) * (합계 / n) + (m / (n + m)) * C = (합계 + m * C) / (n + m)
+    bayesian_avg = (HobbySegmentRating.rating_sum + PRIOR_COUNT * PRIOR_MEAN) / (
+        HobbySegmentRating.rating_count + PRIOR_COUNT
+    )
+    return db.session.query(
+        Hobby, HobbySegmentRating.rating_count, HobbySegmentRating.rating_sum
+    ).join(
+        Hobby, Hobby.hobby_id == HobbySegmentRating.hobby_id
+    ).filter(
+        HobbySegmentRating.age_band == age,
+        HobbySegmentRating.gender == gender,
+        HobbySegmentRating.region == region,
+        HobbySegmentRating.rating_count > 0,
+        Hobby.is_deleted == False
+    ).order_by(
+        bayesian_avg.desc(), Hobby.hobby_id
+    ).limit(limit).all()
+
+
+def rebuild_segment_ratings(hobby_ids=None):
+    """
+    원본 평가로부터 세그먼트 집계 재구성 (초기 적재, 데이터 이관 후 사용)
+    hobby_ids가 없으면 전체를 재구성합니다.
+    """
+    delete_query = HobbySegmentRating.query
+    rating_query = db.session.query(
+        UserHobbyRating.hobby_id, UserHobbyRating.rating, User.age, User.gender, User.location
+    ).join(
+        User, User.user_id == UserHobbyRating.user_id
+    )
+    if hobby_ids is not None:
+        delete_query = delete_query.filter(HobbySegmentRating.hobby_id.in_(hobby_ids))
+        rating_query = rating_query.filter(UserHobbyRating.hobby_id.in_(hobby_ids))
+
+    delete_query.delete(synchronize_session=False)
+
+    totals = defaultdict(lambda: [0, 0])
+    for hobby_id, rating, age, gender, location in rating_query.yield_per(5000):
+        total = totals[(segment_of(age, gender, location), hobby_id)]
+        total[0] += 1
+        total[1] += rating
+
+    rows = (
+        _segment_row(segment, hobby_id, count, rating_sum)
+        for (segment, hobby_id), (count, rating_sum) in totals.items()
+    )
+    for chunk in chunked(rows, 5000):
+        _apply(chunk)
+    db.session.commit()
+
+    logger.info(f"Segment ratings rebuilt: {len(totals)} rows")
+    return len(totals)
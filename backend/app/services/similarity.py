@@ -0,0 +1,114 @@
+"""
+취미 간 유사도
+카테고리, 실내/외, 사회성, 예산, 난이도, 신체 강도, 창의성을 가중 비교하여
+유사한 취미를 찾습니다.
+"""
+
+from collections import namedtuple
+
+from app.models.hobby import Hobby
+from app.services.catalog_cache import catalog_cache
+from app.services.encoding import hobby_fragment
+
+
+# 유사도 계산에 쓰는 취미 속성만 담은 값 (다른 스레드/세션에 넘길 수 있음)
+SimilarityProfile = namedtuple('SimilarityProfile', [
+    'hobby_id', 'category', 'indoor_outdoor', 'social_individual', 'required_budget',
+    'difficulty_level', 'physical_intensity', 'creativity_level'
+])
+
+
+def similarity_profile(hobby):
+    """취미 → SimilarityProfile"""
+    return SimilarityProfile(*(getattr(hobby, field) for field in SimilarityProfile._fields))
+
+
+def calculate_hobby_similarity(hobby1, hobby2):
+    """
+    두 취미 간의 유사도 계산
+    범위: 0.0 ~ 1.0
+    """
+    similarity = 0.0
+    weights = 0.0
+
+    # 1. 카테고리 일치 (가중치 0.3)
+    if hobby1.category == hobby2.category:
+        similarity += 0.3
+    weights += 0.3
+
+    # 2. 실내/외 일치 (가중치 0.15)
+    if hobby1.indoor_outdoor == hobby2.indoor_outdoor:
+        similarity += 0.15
+    elif 'both' in [hobby1.indoor_outdoor, hobby2.indoor_outdoor]:
+        similarity += 0.1
+    weights += 0.15
+
+    # 3. 사회성/개인 일치 (가중치 0.15)
+    if hobby1.social_individual == hobby2.social_individual:
+        similarity += 0.15
+    elif 'both' in [hobby1.social_individual, hobby2.social_individual]:
+        similarity += 0.1
+    weights += 0.15
+
+    # 4. 예산 유사도 (가중치 0.1)
+    budget_map = {'low': 1, 'medium': 2, 'high': 3}
+    budget_diff = abs(budget_map.get(hobby1.required_budget, 2) -
+                     budget_map.get(hobby2.required_budget, 2))
+    budget_similarity = (2 - budget_diff) / 2  # 0~1
+    similarity += budget_similarity * 0.1
+    weights += 0.1
+
+    # 5. 난이도 유사도 (가중치 0.1)
+    difficulty_diff = abs(hobby1.difficulty_level - hobby2.difficulty_level)
+    difficulty_similarity = (4 - difficulty_diff) / 4  # 0~1
+    similarity += difficulty_similarity * 0.1
+    weights += 0.1
+
+    # 6. 신체 강도 유사도 (가중치 0.1)
+    physical_diff = abs(hobby1.physical_intensity - hobby2.physical_intensity)
+    physical_similarity = (4 - physical_diff) / 4
+    similarity += physical_similarity * 0.1
+    weights += 0.1
+
+    # 7. 창의성 유사도 (가중치 0.1)
+    creativity_diff = abs(hobby1.creativity_level - hobby2.creativity_level)
+    creativity_similarity = (4 - creativity_diff) / 4
+    similarity += creativity_similarity * 0.1
+    weights += 0.1
+
+    if weights > 0:
+        return similarity / weights
+    return 0.0
+
+
+def _rank_similar_hobbies(base_hobby, limit):
+    other_hobbies = Hobby.query.filter(
+        Hobby.hobby_id != base_hobby.hobby_id,
+        Hobby.is_deleted == False
+    ).all()
+
+    similar_hobbies = []
+    for hobby in other_hobbies:
+        similarity_score = calculate_hobby_similarity(base_hobby, hobby)
+
+        similar_hobbies.append({
+            'hobby': hobby_fragment(hobby),
+            'similarity_score': round(similarity_score, 4),
+            'similarity_percentage': round(similarity_score * 100, 1)
+        })
+
+    # 유사도 순으로 정렬 후 상위 N개
+    similar_hobbies.sort(key=lambda x: x['similarity_score'], reverse=True)
+    return similar_hobbies[:limit]
+
+
+def find_similar_hobbies(base_hobby, limit=5):
+    """
+    유사한 취미 상위 N개 (카탈로그 버전별로 캐시)
+    base_hobby는 Hobby 또는 SimilarityProfile (병렬 작업에는 SimilarityProfile을 넘김)
+    반환: [{'hobby', 'similarity_score', 'similarity_percentage'}]
+    """
+    return catalog_cache.get_or_set(
+        f'similar:{base_hobby.hobby_id}:{limit}',
+        lambda: _rank_similar_hobbies(base_hobby, limit)
+    )
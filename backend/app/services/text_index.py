@@ -0,0 +1,94 @@
+"""
+역색인용 텍스트 토큰화
+형태소 분석기 없이 한국어를 검색할 수 있도록 한글은 2글자 단위(바이그램)로,
+영문/숫자는 단어 단위로 색인어를 만듭니다. (1글자 한글 단어는 글자 그대로)
+
+색인(tokenize)과 검색(query_terms)은 같은 규칙을 사용하며,
+1글자 검색어('차' → '녹차')는 그 글자로 시작하거나 끝나는 색인어로 확장해 찾습니다. (resolve_terms)
+
+예: '수채화 그리기 2회차' → {'수채', '채화', '그리', '리기', '2', '회차'}
+"""
+
+import operator
+import re
+from functools import reduce
+
+from sqlalchemy import case, func, or_
+
+from app.models import db
+
+TOKEN_PATTERN = re.compile(r'[가-힣]+|[0-9a-z]+')
+MAX_TERM_LENGTH = 20
+# 1글자 검색어를 확장할 최대 색인어 수
+MAX_CHAR_EXPANSIONS = 50
+
+
+def words(text):
+    """텍스트 → 단어 리스트 (소문자, 한글/영문/숫자 단위로 분리)"""
+    if not text:
+        return []
+    return TOKEN_PATTERN.findall(text.lower())
+
+
+def _word_terms(word):
+    """단어 → 검색 색인어 (한글 2글자 이상은 바이그램, 그 외는 단어)"""
+    if '가' <= word[0] <= '힣' and len(word) > 1:
+        return [word[i:i + 2] for i in range(len(word) - 1)]
+    return [word[:MAX_TERM_LENGTH]]
+
+
+def query_terms(text):
+    """검색어 → 색인어 집합"""
+    terms = set()
+    for word in words(text):
+        terms.update(_word_terms(word))
+    return terms
+
+
+def tokenize(text):
+    """텍스트 → 색인어 집합 (검색어와 같은 규칙)"""
+    return query_terms(text)
+
+
+def _is_char(term):
+    return len(term) == 1 and '가' <= term <= '힣'
+
+
+def resolve_terms(term_column, query):
+    """
+    검색어 → 색인어 묶음 리스트 (묶음마다 색인어 하나 이상이 있어야 일치)
+    1글자 한글 단어는 그 글자로 시작하거나 끝나는 색인어로 확장하며 (최대 MAX_CHAR_EXPANSIONS개),
+    나머지 색인어는 한 개짜리 묶음입니다.
+    """
+    groups = []
+    for term in sorted(query_terms(query)):
+        if not _is_char(term):
+            groups.append([term])
+            continue
+
+        rows = db.session.query(term_column).filter(
+            or_(term_column == term, term_column.like(f'{term}%'), term_column.like(f'%{term}'))
+        ).distinct().order_by(term_column).limit(MAX_CHAR_EXPANSIONS).all()
+        groups.append([expanded for (expanded,) in rows] or [term])
+    return groups
+
+
+def matched_groups(term_column, groups):
+    """색인 행들이 일치한 묶음 수 (HAVING에서 len(groups)와 비교)"""
+    terms = [term for group in groups for term in group]
+    if len(set(terms)) == len(terms) == len(groups):
+        return func.count(term_column)
+    # 확장된 색인어는 여러 묶음에 속할 수 있으므로 ('차', '녹' → '녹차') 묶음마다 따로 확인
+    return reduce(operator.add, (
+        func.max(case((term_column.in_(group), 1), else_=0))
+        for group in groups
+    ))
+
+
+def matches(text, query):
+    """
+    텍스트가 검색어의 모든 단어를 포함하는지 확인
+    바이그램이 모두 있어도 순서가 다른 경우('가나 나다' ↔ '가나다')를 걸러냅니다.
+    """
+    normalized = (text or '').lower()
+    return all(word in normalized for word in words(query))
@@ -0,0 +1,162 @@
+"""
+취미별 인기 모임 목록
+취미마다 활성 모임을 회원 수 순으로 TOP_GATHERINGS_PER_HOBBY개씩, 활성 모임 수와 함께 프로세스 메모리에 유지합니다.
+모임 생성/수정/비활성화와 회원 수 합산은 'gatherings' 버전을 올리므로,
+버전이 바뀐 뒤 처음 조회할 때 백그라운드 스레드 하나가 두 번의 쿼리(순위 조회 + 취미별 개수)로 목록을 다시 만들어 교체합니다.
+요청은 다시 만드는 동안 이전 목록을 그대로 사용하며(잠시 늦게 반영), 만드는 중에 들어온 변경은 한 번의 재생성으로 합쳐집니다.
+프로세스에 목록이 없을 때(시작 직후)만 요청 안에서 만듭니다.
+
+취미 상세, 상세 묶음, 추천 응답, 취미별 모임 첫 페이지가 이 목록을 사용합니다.
+반환된 목록과 딕셔너리는 공유되므로 수정하지 말아야 합니다.
+"""
+
+import logging
+import threading
+
+from flask import current_app
+from sqlalchemy import func, desc
+
+from app.models import db
+from app.models.hobby import Gathering
+from app.services.catalog_cache import catalog_cache
+
+logger = logging.getLogger(__name__)
+
+_lock = threading.Lock()
+_index = None
+_rebuilding = False
+
+
+class TopGatheringsIndex:
+    """버전별 취미 → 인기 모임 목록, 활성 모임 수"""
+
+    def __init__(self, app, version, size, lists, totals):
+        self.app = app
+        self.version = version
+        self.size = size
+        self.lists = lists
+        self.totals = totals
+        self.derived = {}  # 목록에서 만든 값 (top_gatherings_derived)
+
+
+def _build(app, version, size):
+    rank = func.row_number().over(
+        partition_by=Gathering.hobby_id,
+        order_by=(desc(Gathering.member_count), Gathering.gathering_id)
+    ).label('rank')
+    ranked = db.session.query(Gathering.gathering_id, rank).filter(
+        Gathering.is_active == True
+    ).subquery()
+
+    gatherings = Gathering.query.join(
+        ranked, Gathering.gathering_id == ranked.c.gathering_id
+    ).filter(
+        ranked.c.rank <= size
+    ).order_by(
+        Gathering.hobby_id, ranked.c.rank
+    ).all()
+
+    lists = {}
+    for gathering in gatherings:
+        lists.setdefault(gathering.hobby_id, []).append(gathering.to_dict())
+
+    totals = dict(
+        db.session.query(Gathering.hobby_id, func.count()).filter(
+            Gathering.is_active == True
+        ).group_by(Gathering.hobby_id).all()
+    )
+
+    logger.info(f"Top gatherings rebuilt for {len(lists)} hobbies (gatherings v{version})")
+    return TopGatheringsIndex(app, version, size, lists, totals)
+
+
+def _rebuild_in_background(app):
+    """목록을 다시 만드는 스레드 시작 (이미 만드는 중이면 그 스레드가 최신 버전까지 반영)"""
+    global _rebuilding
+    with _lock:
+        if _rebuilding:
+            return
+        _rebuilding = True
+
+    def run():
+        global _index, _rebuilding
+        try:
+            with app.app_context():
+                size = app.config.get('TOP_GATHERINGS_PER_HOBBY', 20)
+                while True:
+                    version = catalog_cache.version('gatherings')
+                    _index = _build(app, version, size)
+                    # 만드는 동안 버전이 다시 올랐으면 한 번 더
+                    if catalog_cache.version('gatherings') == version:
+                        break
+        except Exception as e:
+            logger.error(f"Top gatherings rebuild failed: {str(e)}", exc_info=True)
+        finally:
+            with _lock:
+                _rebuilding = False
+
+    threading.Thread(target=run, name='top-gatherings-rebuild', daemon=True).start()
+
+
+def _current():
+    """
+    'gatherings' 버전의 목록
+    버전이 바뀌었으면 백그라운드에서 다시 만들고, 그동안은 이전 목록을 반환합니다.
+    """
+    global _index
+    app = current_app._get_current_object()
+    version = catalog_cache.version('gatherings')
+    size = app.config.get('TOP_GATHERINGS_PER_HOBBY', 20)
+
+    index = _index
+    if index is not None and index.app is app and index.size == size:
+        if index.version != version:
+            _rebuild_in_background(app)
+        return index
+
+    # 목록이 없거나 설정이 바뀐 경우만 요청 안에서 생성
+    with _lock:
+        index = _index
+        if index is None or index.app is not app or index.size != size:
+            index = _build(app, version, size)
+            _index = index
+    return index
+
+
+def top_gatherings_size():
+    """취미별로 유지하는 모임 수"""
+    return current_app.config.get('TOP_GATHERINGS_PER_HOBBY', 20)
+
+
+def top_gatherings(hobby_id, limit=3, offset=0):
+    """취미의 활성 모임을 회원 수 순으로 (offset + limit이 유지 개수를 넘으면 유지 개수까지만)"""
+    return _current().lists.get(hobby_id, [])[offset:offset + limit]
+
+
+def top_gatherings_many(hobby_ids, limit=3):
+    """여러 취미의 인기 모임 → {hobby_id: [...]}"""
+    lists = _current().lists
+    return {hobby_id: lists.get(hobby_id, [])[:limit] for hobby_id in hobby_ids}
+
+
+def top_gathering_lists():
+    """전체 취미의 인기 모임 → {hobby_id: [...]} (버전이 같으면 같은 객체)"""
+    return _current().lists
+
+
+def top_gatherings_derived(name, builder):
+    """
+    인기 모임 목록에서 만든 값 builder(lists) (목록이 교체될 때까지 재사용)
+    목록과 함께 교체되므로 백그라운드 재생성 중에도 목록과 어긋나지 않습니다.
+    """
+    index = _current()
+    value = index.derived.get(name)
+    if value is None:
+        value = builder(index.lists)
+        index.derived[name] = value
+    return value
+
+
+def active_gathering_count(hobby_id):
+    """취미의 활성 모임 수"""
+    return _current().totals.get(hobby_id, 0)
@@ -8,10 +8,13 @@ CREATE TABLE users (
     age INT,
     gender ENUM('male', 'female', 'other'),
     location VARCHAR(100),
+    is_deleted BOOLEAN DEFAULT FALSE COMMENT '소프트 삭제',
+    deleted_at DATETIME NULL COMMENT '소프트 삭제 시각 (보관 기간 계산용)',
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
     INDEX idx_email (email),
-    INDEX idx_created_at (created_at)
+    INDEX idx_created_at (created_at),
+    INDEX idx_users_purge (is_deleted, deleted_at) COMMENT '삭제 데이터 정리'
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
 
 -- 2. 설문 질문 테이블
@@ -67,10 +70,15 @@ CREATE TABLE hobbies (
     creativity_level INT DEFAULT 1 COMMENT '1-5 scale',
     tutorial_video_url VARCHAR(500),
     image_url VARCHAR(500),
+    is_deleted BOOLEAN DEFAULT FALSE COMMENT '소프트 삭제',
+    deleted_at DATETIME NULL COMMENT '소프트 삭제 시각 (보관 기간 계산용)',
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
     INDEX idx_category (category),
-    INDEX idx_difficulty (difficulty_level)
+    INDEX idx_difficulty (difficulty_level),
+    INDEX idx_hobbies_active (is_deleted, category),
+    INDEX idx_hobbies_updated (updated_at, hobby_id) COMMENT '변경 피드 (소프트 삭제 포함)',
+    INDEX idx_hobbies_purge (is_deleted, deleted_at) COMMENT '삭제 데이터 정리'
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
 
 -- 6. 취미 키워드 테이블 (검색 및 추천용)
@@ -80,7 +88,23 @@ CREATE TABLE hobby_keywords (
     keyword VARCHAR(50) NOT NULL,
     FOREIGN KEY (hobby_id) REFERENCES hobbies(hobby_id) ON DELETE CASCADE,
     INDEX idx_keyword (keyword),
-    INDEX idx_hobby_keyword (hobby_id, keyword)
+    UNIQUE KEY unique_hobby_keyword (hobby_id, keyword)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
+
+-- 6-1. 취미 미디어 메타데이터 테이블 (flask media refresh로 수집, 미디어 매니페스트용)
+CREATE TABLE hobby_media (
+    hobby_id INT NOT NULL,
+    kind ENUM('image', 'video') NOT NULL,
+    url VARCHAR(500) NOT NULL,
+    content_type VARCHAR(100),
+    width INT,
+    height INT,
+    byte_size INT,
+    content_hash CHAR(64) COMMENT 'SHA-256 (영상은 URL 해시)',
+    version INT NOT NULL DEFAULT 1 COMMENT '내용이 바뀔 때마다 증가 (캐시 무효화용)',
+    checked_at DATETIME,
+    PRIMARY KEY (hobby_id, kind),
+    FOREIGN KEY (hobby_id) REFERENCES hobbies(hobby_id) ON DELETE CASCADE
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
 
 -- 7. 사용자 취미 평가 테이블
@@ -99,6 +123,69 @@ CREATE TABLE user_hobby_ratings (
     INDEX idx_created_at (created_at)
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
 
+-- 7-1. 취미별 최근 리뷰 테이블 (상세 페이지용, 취미당 최대 5개 유지)
+CREATE TABLE hobby_recent_reviews (
+    review_id INT AUTO_INCREMENT PRIMARY KEY,
+    hobby_id INT NOT NULL,
+    user_id INT NOT NULL,
+    rating INT NOT NULL,
+    review_text TEXT NOT NULL,
+    experienced BOOLEAN DEFAULT FALSE,
+    created_at TIMESTAMP NOT NULL COMMENT '원본 평가 작성 시각',
+    FOREIGN KEY (hobby_id) REFERENCES hobbies(hobby_id) ON DELETE CASCADE,
+    FOREIGN KEY (user_id) REFERENCES users(user_id) ON DELETE CASCADE,
+    UNIQUE KEY unique_recent_review (hobby_id, user_id),
+    INDEX idx_recent_review_hobby (hobby_id, created_at DESC)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
+
+-- 7-2. 세그먼트별 취미 평가 집계 테이블 (연령대, 성별, 지역별 인기 취미용)
+CREATE TABLE hobby_segment_ratings (
+    age_band VARCHAR(10) NOT NULL COMMENT '연령대 (예: 60s, 알 수 없으면 빈 문자열)',
+    gender VARCHAR(10) NOT NULL,
+    region VARCHAR(50) NOT NULL COMMENT '시/도 단위 지역',
+    hobby_id INT NOT NULL,
+    rating_count INT NOT NULL DEFAULT 0,
+    rating_sum INT NOT NULL DEFAULT 0,
+    PRIMARY KEY (age_band, gender, region, hobby_id),
+    FOREIGN KEY (hobby_id) REFERENCES hobbies(hobby_id) ON DELETE CASCADE
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
+
+-- 7-3. 리뷰 역색인 테이블 (리뷰 검색용, 한글 2글자·1글자 단위/영문·숫자 단어 단위 색인어)
+CREATE TABLE review_terms (
+    term VARCHAR(20) NOT NULL,
+    rating_id INT NOT NULL,
+    hobby_id INT NOT NULL,
+    PRIMARY KEY (term, rating_id),
+    FOREIGN KEY (rating_id) REFERENCES user_hobby_ratings(rating_id) ON DELETE CASCADE,
+    INDEX idx_review_term_hobby (term, hobby_id, rating_id)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_bin;
+
+-- 7-4. 취미별 평가 통계 카운터 테이블 (평균, 히스토그램, 백분위수 계산용)
+CREATE TABLE hobby_rating_stats (
+    hobby_id INT PRIMARY KEY,
+    count_1 INT NOT NULL DEFAULT 0 COMMENT '별점 1 평가 수',
+    count_2 INT NOT NULL DEFAULT 0,
+    count_3 INT NOT NULL DEFAULT 0,
+    count_4 INT NOT NULL DEFAULT 0,
+    count_5 INT NOT NULL DEFAULT 0,
+    rating_count INT NOT NULL DEFAULT 0,
+    rating_sum INT NOT NULL DEFAULT 0,
+    FOREIGN KEY (hobby_id) REFERENCES hobbies(hobby_id) ON DELETE CASCADE
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
+
+-- 7-5. 지역 사전 테이블 (시/도 → 시/군/구, flask regions sync로 시/도, 시/군/구 등록)
+CREATE TABLE regions (
+    region_id INT AUTO_INCREMENT PRIMARY KEY,
+    parent_id INT NULL COMMENT '상위 지역 (시/도는 NULL)',
+    level SMALLINT NOT NULL COMMENT '1: 시/도, 2: 시/군/구',
+    name VARCHAR(50) NOT NULL COMMENT '정식 명칭',
+    aliases VARCHAR(200) COMMENT '별칭 (쉼표 구분)',
+    province_name VARCHAR(50) AS (CASE WHEN parent_id IS NULL THEN name END) STORED COMMENT '시/도 이름 (시/군/구는 NULL, 시/도 중복 방지)',
+    FOREIGN KEY (parent_id) REFERENCES regions(region_id) ON DELETE CASCADE,
+    UNIQUE KEY uq_region_parent_name (parent_id, name),
+    UNIQUE KEY uq_region_province_name (province_name)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
+
 -- 8. 모임/동아리 정보 테이블
 CREATE TABLE gatherings (
     gathering_id INT AUTO_INCREMENT PRIMARY KEY,
@@ -108,6 +195,10 @@ CREATE TABLE gatherings (
     location VARCHAR(200),
     region VARCHAR(50) COMMENT '시/도',
     district VARCHAR(50) COMMENT '구/군',
+    region_id INT NULL COMMENT '정규화된 지역 (regions)',
+    latitude DOUBLE COMMENT '위도',
+    longitude DOUBLE COMMENT '경도',
+    geohash VARCHAR(12) COMMENT '좌표 geohash (반경 검색용)',
     meeting_type ENUM('online', 'offline', 'hybrid') DEFAULT 'offline',
     schedule_info TEXT COMMENT '정기 모임 일정',
     member_count INT DEFAULT 0,
@@ -116,9 +207,74 @@ CREATE TABLE gatherings (
     is_active BOOLEAN DEFAULT TRUE,
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+    source VARCHAR(30) NULL COMMENT '외부 데이터 출처 (flask gatherings sync)',
+    external_id VARCHAR(100) NULL COMMENT '출처의 모임 ID',
+    content_hash CHAR(40) NULL COMMENT '마지막으로 반영한 레코드 내용의 해시',
     FOREIGN KEY (hobby_id) REFERENCES hobbies(hobby_id) ON DELETE CASCADE,
-    INDEX idx_hobby_location (hobby_id, region),
-    INDEX idx_active (is_active)
+    FOREIGN KEY (region_id) REFERENCES regions(region_id) ON DELETE SET NULL,
+    UNIQUE KEY uq_gathering_source_external (source, external_id),
+    INDEX idx_gathering_location (hobby_id, region_id, is_active),
+    INDEX idx_gathering_region (region_id, is_active),
+    INDEX idx_gathering_popular (is_active, member_count),
+    INDEX idx_active (is_active),
+    INDEX idx_geohash (geohash)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
+
+-- 8-1. 모임 가입 테이블
+CREATE TABLE gathering_members (
+    gathering_id INT NOT NULL,
+    user_id INT NOT NULL,
+    joined_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (gathering_id, user_id),
+    FOREIGN KEY (gathering_id) REFERENCES gatherings(gathering_id) ON DELETE CASCADE,
+    FOREIGN KEY (user_id) REFERENCES users(user_id) ON DELETE CASCADE,
+    INDEX idx_gathering_members_user (user_id)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
+
+-- 8-2. 모임 회원 수 증분 테이블 (가입/탈퇴 시 임의 샤드에 +1/-1, 주기적으로 gatherings.member_count에 합산)
+CREATE TABLE gathering_member_shards (
+    gathering_id INT NOT NULL,
+    shard SMALLINT NOT NULL,
+    delta INT NOT NULL DEFAULT 0,
+    PRIMARY KEY (gathering_id, shard),
+    FOREIGN KEY (gathering_id) REFERENCES gatherings(gathering_id) ON DELETE CASCADE
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
+
+-- 8-3. 모임 정기 일정 테이블 (schedule_info를 요일/시간대로 해석, meets_between 기간 조회용)
+CREATE TABLE gathering_schedules (
+    schedule_id INT AUTO_INCREMENT PRIMARY KEY,
+    gathering_id INT NOT NULL,
+    weekday SMALLINT NOT NULL COMMENT '0=월요일 ~ 6=일요일',
+    start_minute SMALLINT NOT NULL COMMENT '시작 (0시부터 분)',
+    end_minute SMALLINT NOT NULL COMMENT '끝 (0시부터 분, 최대 1440)',
+    frequency ENUM('weekly', 'biweekly', 'monthly') NOT NULL DEFAULT 'weekly',
+    week_of_month SMALLINT NULL COMMENT '매월 N째 주 (마지막 주 -1)',
+    FOREIGN KEY (gathering_id) REFERENCES gatherings(gathering_id) ON DELETE CASCADE,
+    INDEX idx_gathering_schedules_gathering_id (gathering_id),
+    INDEX idx_schedule_window (weekday, start_minute, end_minute)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
+
+-- 8-4. 모임 검색 역색인 테이블 (모임명/설명 색인어 → 활성 모임, 취미/지역/모임 유형 필터 포함)
+CREATE TABLE gathering_terms (
+    term VARCHAR(20) NOT NULL,
+    gathering_id INT NOT NULL,
+    hobby_id INT NOT NULL,
+    region_id INT NULL,
+    meeting_type VARCHAR(10) NULL,
+    weight SMALLINT NOT NULL DEFAULT 1 COMMENT '필드 가중치 합 (모임명 3, 설명 1)',
+    PRIMARY KEY (term, gathering_id),
+    FOREIGN KEY (gathering_id) REFERENCES gatherings(gathering_id) ON DELETE CASCADE,
+    INDEX idx_gathering_term_hobby (term, hobby_id),
+    INDEX idx_gathering_term_region (term, region_id),
+    INDEX idx_gathering_term_gathering (gathering_id)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_bin;
+
+-- 8-5. 모임 패싯 집계 테이블 (지역/모임 유형/취미별 활성 모임 수, 모임 변경 시 증분 갱신)
+CREATE TABLE gathering_facet_counts (
+    facet VARCHAR(20) NOT NULL COMMENT 'region, meeting_type, hobby',
+    value VARCHAR(50) NOT NULL COMMENT '지역명, 모임 유형, 취미 ID',
+    count INT NOT NULL DEFAULT 0,
+    PRIMARY KEY (facet, value)
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
 
 -- 9. 추천 기록 테이블 (ML 모델 학습용)
@@ -143,4 +299,31 @@ CREATE TABLE system_config (
     config_value TEXT,
     description TEXT,
     updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP
-) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
\ No newline at end of file
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
+
+-- 11. 삭제 데이터 보관 테이블 (flask purge run, 보관 기간이 지난 소프트 삭제 행 이동)
+-- 원본과 같은 컬럼 + archived_at (외래키/유니크 제약 없음)
+CREATE TABLE hobbies_archive LIKE hobbies;
+CREATE TABLE users_archive LIKE users;
+CREATE TABLE user_hobby_ratings_archive LIKE user_hobby_ratings;
+CREATE TABLE survey_responses_archive LIKE survey_responses;
+CREATE TABLE gatherings_archive LIKE gatherings;
+CREATE TABLE gathering_members_archive LIKE gathering_members;
+
+ALTER TABLE hobbies_archive
+    MODIFY hobby_id INT NOT NULL, DROP INDEX name,
+    ADD COLUMN archived_at DATETIME NOT NULL, ADD INDEX idx_archived_at (archived_at);
+ALTER TABLE users_archive
+    MODIFY user_id INT NOT NULL, DROP INDEX username, DROP INDEX email,
+    ADD COLUMN archived_at DATETIME NOT NULL, ADD INDEX idx_archived_at (archived_at);
+ALTER TABLE user_hobby_ratings_archive
+    MODIFY rating_id INT NOT NULL, DROP INDEX unique_user_hobby,
+    ADD COLUMN archived_at DATETIME NOT NULL, ADD INDEX idx_archived_at (archived_at);
+ALTER TABLE survey_responses_archive
+    MODIFY response_id INT NOT NULL,
+    ADD COLUMN archived_at DATETIME NOT NULL, ADD INDEX idx_archived_at (archived_at);
+ALTER TABLE gatherings_archive
+    MODIFY gathering_id INT NOT NULL, DROP INDEX uq_gathering_source_external,
+    ADD COLUMN archived_at DATETIME NOT NULL, ADD INDEX idx_archived_at (archived_at);
+ALTER TABLE gathering_members_archive
+    ADD COLUMN archived_at DATETIME NOT NULL, ADD INDEX idx_archived_at (archived_at);
@@ -5,6 +5,7 @@
 
 from app import app, db
 from app.models.hobby import Hobby
+from app.services.catalog_io import import_hobbies
 import logging
 
 logging.basicConfig(level=logging.INFO)
@@ -255,30 +256,10 @@ def create_sample_hobbies():
     ]
 
     with app.app_context():
-        # 기존 데이터 확인
-        existing_count = Hobby.query.filter_by(is_deleted=False).count()
-
-        if existing_count > 0:
-            logger.info(f"이미 {existing_count}개의 취미 데이터가 존재합니다.")
-            choice = input("기존 데이터를 삭제하고 새로 생성하시겠습니까? (y/N): ")
-            if choice.lower() != 'y':
-                logger.info("데이터 생성을 취소합니다.")
-                return
-
-            # 기존 데이터 삭제 (소프트 삭제)
-            Hobby.query.update({'is_deleted': True})
-            db.session.commit()
-            logger.info("기존 데이터를 삭제했습니다.")
-
-        # 새 데이터 생성
-        created_count = 0
-        for hobby_data in hobbies_data:
-            hobby = Hobby(**hobby_data)
-            db.session.add(hobby)
-            created_count += 1
-
-        db.session.commit()
-        logger.info(f"✅ {created_count}개의 취미 데이터가 성공적으로 생성되었습니다!")
+        # 취미명 기준 업서트 (여러 번 실행해도 중복 생성되지 않음)
+        # 대량 데이터는 flask catalog import hobbies <파일> 을 사용하세요.
+        stats = import_hobbies(hobbies_data)
+        logger.info(f"✅ {stats.written}개의 취미 데이터가 성공적으로 반영되었습니다!")
 
         # 카테고리별 통계
         categories = db.session.query(
@@ -0,0 +1,45 @@
+"""
+DB를 사용하는 테스트 공통 설정
+서버 없이 임시 SQLite DB로 app.py를 불러오며, 백그라운드 스레드는 끄고 로그는 임시 디렉터리에 기록합니다.
+테스트 모듈마다 새 DB를 사용합니다. (스크립트로 직접 실행할 때는 load_app()을 호출)
+"""
+
+import importlib.util
+import os
+import sys
+import tempfile
+
+import pytest
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND_DIR)
+
+# 앱 프로세스 안에서 주기 실행하는 작업은 테스트에서 사용하지 않음
+os.environ['MEMBER_COUNT_FLUSH_SECONDS'] = '0'
+os.environ['GATHERING_FACETS_REFRESH_SECONDS'] = '0'
+os.environ['PURGE_INTERVAL_HOURS'] = '0'
+os.environ.setdefault('LOG_FILE', os.path.join(tempfile.mkdtemp(), 'app.log'))
+
+
+def load_app():
+    """임시 SQLite DB를 사용하는 Flask 앱 (호출할 때마다 새 DB)"""
+    db_dir = tempfile.mkdtemp()
+    os.environ['DATABASE_URL'] = f"sqlite:///{os.path.join(db_dir, 'test.db')}"
+
+    # backend/app.py는 app 패키지와 이름이 같아 파일 경로로 불러옴
+    spec = importlib.util.spec_from_file_location('hobby_app_main', os.path.join(BACKEND_DIR, 'app.py'))
+    main = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(main)
+    return main.app
+
+
+def auth_headers(app, user_id):
+    """user_id로 발급한 액세스 토큰 헤더"""
+    from flask_jwt_extended import create_access_token
+    with app.app_context():
+        return {'Authorization': 'Bearer ' + create_access_token(identity=str(user_id))}
+
+
+@pytest.fixture(scope='module')
+def app():
+    return load_app()
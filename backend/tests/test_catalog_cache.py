@@ -0,0 +1,150 @@
+"""
+카탈로그 캐시 테스트 스크립트
+서버 없이 LRU 캐시, 인메모리 백엔드, 버전 무효화를 테스트합니다.
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.services.catalog_cache import LRUCache, InMemoryBackend, CatalogCache
+
+
+def test_lru_eviction():
+    """용량 초과 시 가장 오래 사용하지 않은 항목 제거"""
+    cache = LRUCache(max_size=2, ttl=60)
+    cache.set('a', 1)
+    cache.set('b', 2)
+    cache.get('a')
+    cache.set('c', 3)
+
+    assert cache.get('a') == 1
+    assert cache.get('b') is None
+    assert cache.get('c') == 3
+    print("✅ LRU 제거 테스트 통과")
+
+
+def test_lru_ttl():
+    """TTL 만료 항목은 조회되지 않음"""
+    cache = LRUCache(max_size=10, ttl=0.05)
+    cache.set('a', 1)
+    assert cache.get('a') == 1
+    time.sleep(0.1)
+    assert cache.get('a') is None
+    print("✅ LRU TTL 테스트 통과")
+
+
+def test_shared_backend_read_through():
+    """로컬 캐시에 없으면 공유 백엔드에서 조회"""
+    backend = InMemoryBackend()
+    writer = CatalogCache(backend=backend)
+    reader = CatalogCache(backend=backend)
+
+    writer.set('hobby:1', {'hobby_id': 1, 'name': '요가'})
+    assert reader.get('hobby:1') == {'hobby_id': 1, 'name': '요가'}
+    print("✅ 공유 백엔드 조회 테스트 통과")
+
+
+def test_version_invalidation():
+    """카탈로그 버전이 올라가면 이전 항목은 조회되지 않음"""
+    backend = InMemoryBackend()
+    writer = CatalogCache(backend=backend)
+    reader = CatalogCache(backend=backend)
+    reader.version_poll_interval = 0
+
+    writer.set('hobby:1', {'hobby_id': 1})
+    assert reader.get('hobby:1') is not None
+
+    writer.bump_version()
+    assert writer.get('hobby:1') is None
+    assert reader.get('hobby:1') is None
+    print("✅ 버전 무효화 테스트 통과")
+
+
+def test_namespace_versions():
+    """네임스페이스별 버전은 서로 독립적으로 증가"""
+    cache = CatalogCache(backend=InMemoryBackend())
+    cache.set('hobby:1', {'hobby_id': 1})
+
+    cache.bump_version('gatherings')
+    assert cache.version('gatherings') == 1
+    assert cache.version('catalog') == 0
+    assert cache.get('hobby:1') is not None
+
+    version, changed_at = cache.version_info('gatherings')
+    assert version == 1 and changed_at is not None
+    print("✅ 네임스페이스 버전 테스트 통과")
+
+
+def test_get_or_set():
+    """캐시 미스 시에만 builder 호출"""
+    cache = CatalogCache(backend=InMemoryBackend())
+    calls = []
+
+    def builder():
+        calls.append(1)
+        return {'value': len(calls)}
+
+    assert cache.get_or_set('key', builder) == {'value': 1}
+    assert cache.get_or_set('key', builder) == {'value': 1}
+    assert len(calls) == 1
+    print("✅ get_or_set 테스트 통과")
+
+
+def test_get_or_set_bump_during_build():
+    """읽는 도중 버전이 오르면 읽은 값은 이전 버전 키에 저장되어 새 버전에서 보이지 않음"""
+    cache = CatalogCache(backend=InMemoryBackend())
+
+    def stale_builder():
+        cache.bump_version()  # DB에서 읽는 동안 다른 요청이 쓰기를 커밋
+        return {'value': 'stale'}
+
+    assert cache.get_or_set('key', stale_builder) == {'value': 'stale'}
+    assert cache.get('key') is None
+    assert cache.get_or_set('key', lambda: {'value': 'fresh'}) == {'value': 'fresh'}
+    print("✅ 읽는 중 버전 변경 테스트 통과")
+
+
+def test_get_many():
+    """여러 항목 조회 시 로컬/공유 백엔드 항목을 합쳐서 반환"""
+    backend = InMemoryBackend()
+    writer = CatalogCache(backend=backend)
+    reader = CatalogCache(backend=backend)
+
+    writer.set_many({'hobby:summary:1': {'hobby_id': 1}, 'hobby:summary:2': {'hobby_id': 2}})
+    reader.set('hobby:summary:3', {'hobby_id': 3})
+
+    found = reader.get_many(['hobby:summary:1', 'hobby:summary:3', 'hobby:summary:4'])
+    assert found == {'hobby:summary:1': {'hobby_id': 1}, 'hobby:summary:3': {'hobby_id': 3}}
+    print("✅ get_many 테스트 통과")
+
+
+def test_get_or_set_local():
+    """로컬 전용 항목은 공유 백엔드에 저장되지 않고 버전 변경 시 무효화"""
+    backend = InMemoryBackend()
+    cache = CatalogCache(backend=backend)
+    fragment = object()
+
+    assert cache.get_or_set_local('fragment:hobby:1', lambda: fragment) is fragment
+    assert cache.get_or_set_local('fragment:hobby:1', object) is fragment
+    assert CatalogCache(backend=backend).get('fragment:hobby:1') is None
+
+    cache.bump_version()
+    assert cache.get_or_set_local('fragment:hobby:1', object) is not fragment
+    print("✅ get_or_set_local 테스트 통과")
+
+
+if __name__ == '__main__':
+    print("🧪 카탈로그 캐시 테스트 시작\n")
+    test_lru_eviction()
+    test_lru_ttl()
+    test_shared_backend_read_through()
+    test_version_invalidation()
+    test_namespace_versions()
+    test_get_or_set()
+    test_get_or_set_bump_during_build()
+    test_get_many()
+    test_get_or_set_local()
+    print("\n✅ 모든 테스트 완료!")
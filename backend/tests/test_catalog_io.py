@@ -0,0 +1,46 @@
+"""
+카탈로그 가져오기 테스트 스크립트
+서버 없이 임시 SQLite DB로 앱을 띄워, 잘못된 행을 건너뛰고 나머지를 가져오는지 확인합니다.
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.models import db
+from app.models.hobby import Hobby, HobbyKeyword
+from app.services.catalog_io import import_hobbies, import_keywords
+
+HOBBIES = [
+    {'name': '가져오기 취미 1', 'category': '운동', 'difficulty_level': '2'},
+    {'name': '가져오기 취미 2', 'category': '예술', 'difficulty_level': '어려움'},  # 정수 아님
+    {'name': '가져오기 취미 3', 'category': '예술', 'creativity_level': '7'},       # 범위 밖
+    {'name': '가져오기 취미 4', 'category': '음악', 'physical_intensity': ''},
+    {'name': '', 'category': '음악'},                                                # 이름 없음
+]
+
+
+def test_import_skips_bad_rows(app):
+    """잘못된 셀이 있는 행은 건너뛰고 skipped에 집계, 나머지는 가져옴"""
+    with app.app_context():
+        db.create_all()
+        stats = import_hobbies(iter(HOBBIES), chunk_size=2)
+        assert stats.to_dict() == {'processed': 5, 'written': 2, 'skipped': 3}
+        names = {hobby.name for hobby in Hobby.query.filter(Hobby.name.like('가져오기 취미%'))}
+        assert names == {'가져오기 취미 1', '가져오기 취미 4'}
+
+        stats = import_keywords(iter([
+            {'hobby_name': '가져오기 취미 1', 'keyword': '달리기'},
+            {'hobby_id': 'abc', 'keyword': '잘못된 ID'},
+        ]))
+        assert stats.to_dict() == {'processed': 2, 'written': 1, 'skipped': 1}
+        assert [keyword.keyword for keyword in HobbyKeyword.query.all()] == ['달리기']
+        print("✅ 잘못된 행 건너뛰기 테스트 통과")
+
+
+if __name__ == '__main__':
+    from conftest import load_app
+    print("🧪 카탈로그 가져오기 테스트 시작\n")
+    test_import_skips_bad_rows(load_app())
+    print("\n✅ 모든 테스트 완료!")
@@ -0,0 +1,100 @@
+"""
+카탈로그 변경 피드 테스트 스크립트
+서버 없이 임시 SQLite DB로 앱을 띄워, /api/hobbies/changes의 키셋 페이지와 삭제/정리된 취미의 deleted_ids를 확인합니다.
+"""
+
+import os
+import sys
+from datetime import timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.models import db
+from app.models.hobby import Hobby
+from app.services.purge import purge_deleted
+
+CHANGES_URL = '/api/hobbies/changes'
+
+
+def _sync(client, since=None, limit=2):
+    """has_more가 false가 될 때까지 조회 → (변경된 취미 ID, 삭제된 취미 ID, next_token, 요청 수)"""
+    changed, deleted, requests = [], [], 0
+    while True:
+        query = f'?limit={limit}' + (f'&since={since}' if since else '')
+        response = client.get(CHANGES_URL + query)
+        assert response.status_code == 200
+        data = response.get_json()['data']
+        changed += [hobby['hobby_id'] for hobby in data['changes']]
+        deleted += data['deleted_ids']
+        since = data['next_token']
+        requests += 1
+        if not data['has_more']:
+            return changed, deleted, since, requests
+
+
+def test_change_feed_paging(app):
+    """최근 변경은 대기 시간 뒤에 반영하고, limit 단위로 (updated_at, hobby_id) 순서대로 페이지 조회"""
+    with app.app_context():
+        db.create_all()
+        hobbies = [Hobby(name=f'변경 피드 테스트 취미{i}', category='운동') for i in range(5)]
+        db.session.add_all(hobbies)
+        db.session.commit()
+        hobby_ids = [hobby.hobby_id for hobby in hobbies]
+
+    client = app.test_client()
+
+    # 대기 시간 안의 변경은 아직 반환하지 않음 (ETag도 붙이지 않음)
+    app.config['CATALOG_CHANGES_SETTLE_SECONDS'] = 60
+    response = client.get(CHANGES_URL)
+    assert response.get_json()['data']['changes'] == []
+    assert 'ETag' not in response.headers
+
+    app.config['CATALOG_CHANGES_SETTLE_SECONDS'] = 0
+    changed, deleted, token, requests = _sync(client)
+    assert changed == hobby_ids and deleted == []
+    assert requests == 3
+
+    # 변경이 없으면 같은 토큰 유지
+    assert _sync(client, token)[:3] == ([], [], token)
+
+    assert client.get(f'{CHANGES_URL}?since=not-a-token').status_code == 400
+    print("✅ 변경 피드 페이지 테스트 통과")
+
+
+def test_change_feed_deleted_and_purged(app):
+    """수정된 취미는 changes로, 소프트 삭제/정리된 취미는 deleted_ids로 반환"""
+    app.config['CATALOG_CHANGES_SETTLE_SECONDS'] = 0
+    client = app.test_client()
+    token = _sync(client)[2]
+
+    with app.app_context():
+        updated, soft_deleted, purged = Hobby.query.order_by(Hobby.hobby_id).limit(3).all()
+        updated_id, soft_deleted_id, purged_id = updated.hobby_id, soft_deleted.hobby_id, purged.hobby_id
+        updated.description = '수정된 설명'
+        soft_deleted.soft_delete()
+        purged.soft_delete()
+        db.session.commit()
+
+        # 보관 기간이 지난 취미만 정리 (소프트 삭제만 된 취미는 원본에 남음)
+        purged.deleted_at -= timedelta(days=2)
+        db.session.commit()
+        assert purge_deleted(retention_days=1).hobbies == 1
+        assert db.session.get(Hobby, purged_id) is None
+
+    changed, deleted, _, _ = _sync(client, token)
+    assert changed == [updated_id]
+    assert sorted(deleted) == sorted([soft_deleted_id, purged_id])
+
+    # 처음부터 동기화해도 정리된 취미의 삭제가 포함됨
+    changed, deleted, _, _ = _sync(client)
+    assert purged_id not in changed and purged_id in deleted
+    print("✅ 변경 피드 삭제/정리 테스트 통과")
+
+
+if __name__ == '__main__':
+    from conftest import load_app
+    app = load_app()
+    print("🧪 카탈로그 변경 피드 테스트 시작\n")
+    test_change_feed_paging(app)
+    test_change_feed_deleted_and_purged(app)
+    print("\n✅ 모든 테스트 완료!")
@@ -0,0 +1,67 @@
+"""
+조건부 GET 테스트 스크립트
+서버 없이 임시 SQLite DB로 앱을 띄워, 취미 목록의 ETag/304 응답과 쓰기 후 ETag 변경을 확인합니다.
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from conftest import auth_headers
+from app.models import db
+from app.models.hobby import Hobby
+from app.models.user import User
+
+
+def _setup_data():
+    """취미 1개와 사용자 1명 생성 → (hobby_id, user_id)"""
+    db.create_all()
+    hobby = Hobby(name='ETag 테스트 취미', category='운동')
+    user = User(username='etag_user', email='etag_user@test.com', password_hash='x')
+    db.session.add_all([hobby, user])
+    db.session.commit()
+    return hobby.hobby_id, user.user_id
+
+
+def test_hobby_list_etag(app):
+    """같은 버전이면 304, 평가 저장 후에는 ETag가 바뀌고 200"""
+    with app.app_context():
+        hobby_id, user_id = _setup_data()
+
+    client = app.test_client()
+    response = client.get('/api/hobbies')
+    assert response.status_code == 200
+    etag = response.headers['ETag']
+    assert response.headers['Cache-Control'] == 'no-cache'
+
+    response = client.get('/api/hobbies', headers={'If-None-Match': etag})
+    assert response.status_code == 304
+    assert response.data == b''
+
+    # 다른 쿼리는 다른 ETag
+    other = client.get('/api/hobbies?category=운동')
+    assert other.status_code == 200
+    assert other.headers['ETag'] != etag
+
+    response = client.post(
+        f'/api/hobbies/{hobby_id}/rate',
+        json={'rating': 4},
+        headers=auth_headers(app, user_id)
+    )
+    assert response.status_code == 200
+
+    response = client.get('/api/hobbies', headers={'If-None-Match': etag})
+    assert response.status_code == 200
+    assert response.headers['ETag'] != etag
+    hobby = response.get_json()['data']['hobbies'][0]
+    assert hobby['rating_count'] == 1
+    print("✅ 취미 목록 ETag 테스트 통과")
+
+
+if __name__ == '__main__':
+    from conftest import load_app
+    app = load_app()
+    print("🧪 조건부 GET 테스트 시작\n")
+    test_hobby_list_etag(app)
+    print("\n✅ 모든 테스트 완료!")
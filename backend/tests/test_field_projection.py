@@ -0,0 +1,100 @@
+"""
+필드 프로젝션 테스트 스크립트
+서버 없이 임시 SQLite DB로 앱을 띄워, 목록 API의 ?fields= 응답 필드와 알 수 없는 필드 거부를 확인합니다.
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.models import db
+from app.models.hobby import Hobby, Gathering, UserHobbyRating
+from app.models.user import User
+from app.services.rating_stats import rebuild_rating_stats
+
+
+def _setup_data():
+    """취미, 모임, 평가 1개씩 생성 → hobby_id"""
+    db.create_all()
+    hobby = Hobby(
+        name='프로젝션 테스트 취미', category='예술', description='긴 설명 ' * 50,
+        image_url='https://example.com/projection.jpg'
+    )
+    user = User(username='projection_user', email='projection_user@test.com', password_hash='x')
+    db.session.add_all([hobby, user])
+    db.session.flush()
+    db.session.add(Gathering(hobby_id=hobby.hobby_id, name='프로젝션 테스트 모임', description='모임 설명', region='서울'))
+    db.session.add(UserHobbyRating(user_id=user.user_id, hobby_id=hobby.hobby_id, rating=4, review_text='좋아요'))
+    db.session.commit()
+    rebuild_rating_stats([hobby.hobby_id])
+    return hobby.hobby_id
+
+
+def test_hobby_fields(app):
+    """취미 목록은 요청 필드와 기본키만 반환 (평가 통계 필드 포함 가능, media=manifest면 URL 제외)"""
+    with app.app_context():
+        hobby_id = _setup_data()
+
+    client = app.test_client()
+    response = client.get('/api/hobbies?fields=name,rating_count,image_url')
+    assert response.status_code == 200
+    hobby = response.get_json()['data']['hobbies'][0]
+    assert hobby == {
+        'hobby_id': hobby_id,
+        'name': '프로젝션 테스트 취미',
+        'rating_count': 1,
+        'image_url': 'https://example.com/projection.jpg'
+    }
+
+    response = client.get('/api/hobbies?fields=name,image_url&media=manifest')
+    assert response.get_json()['data']['hobbies'][0] == {'hobby_id': hobby_id, 'name': '프로젝션 테스트 취미'}
+    print("✅ 취미 필드 프로젝션 테스트 통과")
+
+
+def test_gathering_and_rating_fields(app):
+    """모임/평가 목록도 요청 필드만 반환 (모임은 취미 요약을 함께 붙임)"""
+    client = app.test_client()
+    response = client.get('/api/gatherings?fields=name')
+    assert response.status_code == 200
+    gathering = response.get_json()['data']['gatherings'][0]
+    assert set(gathering) == {'gathering_id', 'hobby_id', 'name', 'hobby'}
+    assert gathering['hobby']['name'] == '프로젝션 테스트 취미'
+
+    with app.app_context():
+        hobby_id = Hobby.query.first().hobby_id
+    response = client.get(f'/api/hobbies/{hobby_id}/ratings?fields=rating')
+    assert response.status_code == 200
+    rating = response.get_json()['data']['ratings'][0]
+    assert set(rating) == {'rating_id', 'rating'} and rating['rating'] == 4
+    print("✅ 모임/평가 필드 프로젝션 테스트 통과")
+
+
+def test_unknown_fields_rejected(app):
+    """알 수 없는 필드가 있으면 400 (필드 이름을 메시지에 포함)"""
+    client = app.test_client()
+    with app.app_context():
+        hobby_id = Hobby.query.first().hobby_id
+
+    for path in (
+        '/api/hobbies?fields=name,password_hash',
+        '/api/gatherings?fields=name,password_hash',
+        f'/api/hobbies/{hobby_id}/ratings?fields=rating,password_hash'
+    ):
+        response = client.get(path)
+        assert response.status_code == 400, path
+        assert 'password_hash' in response.get_json()['message']
+
+    # 평가 통계 필드는 취미 목록에서만 허용
+    assert client.get('/api/gatherings?fields=rating_count').status_code == 400
+    print("✅ 알 수 없는 필드 거부 테스트 통과")
+
+
+if __name__ == '__main__':
+    from conftest import load_app
+    app = load_app()
+    print("🧪 필드 프로젝션 테스트 시작\n")
+    test_hobby_fields(app)
+    test_gathering_and_rating_fields(app)
+    test_unknown_fields_rejected(app)
+    print("\n✅ 모든 테스트 완료!")
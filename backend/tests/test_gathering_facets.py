@@ -0,0 +1,134 @@
+"""
+모임 패싯 집계 테스트 스크립트
+서버 없이 임시 SQLite DB로 앱을 띄워, 증분 반영과 원본 재계산이 같은 집계를 만드는지,
+/regions, /facets 응답과 ETag를 확인합니다.
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.models import db
+from app.models.hobby import Hobby, Gathering
+from app.services.facets import facet_keys, record_facet_change, refresh_facet_counts, facet_counts, region_facet
+from app.services.regions import seed_provinces, assign_region
+from app.services.catalog_cache import catalog_cache
+
+GATHERINGS = [
+    # (지역, 모임 유형, 활성 여부)
+    ('서울', 'offline', True),
+    ('서울특별시', 'online', True),
+    ('부산', 'offline', True),
+    ('대구', 'offline', False),
+]
+
+
+def test_incremental_matches_refresh(app):
+    """생성/수정/비활성화를 증분으로 반영한 집계는 원본 재계산과 같아야 함"""
+    with app.app_context():
+        db.create_all()
+        seed_provinces()
+        hobby = Hobby(name='패싯 테스트 취미', category='운동')
+        db.session.add(hobby)
+        db.session.flush()
+        for i, (region, meeting_type, is_active) in enumerate(GATHERINGS):
+            gathering = Gathering(
+                hobby_id=hobby.hobby_id, name=f'패싯 모임 {i}',
+                region=region, meeting_type=meeting_type, is_active=is_active
+            )
+            assign_region(gathering)
+            db.session.add(gathering)
+            db.session.flush()
+            record_facet_change([], facet_keys(gathering))
+        db.session.commit()
+
+        # 지역은 별칭/정식 명칭과 관계없이 시/도로 묶임
+        counts = facet_counts()
+        assert [(r['region'], r['count']) for r in region_facet(counts['region'])] == [('서울특별시', 2), ('부산광역시', 1)]
+        assert counts['meeting_type'] == [('offline', 2), ('online', 1)]
+        assert counts['hobby'] == [(str(hobby.hobby_id), 3)]
+
+        # 지역 변경, 비활성화
+        moved = Gathering.query.filter_by(name='패싯 모임 1').one()
+        before = facet_keys(moved)
+        moved.region = '부산시'
+        assign_region(moved)
+        record_facet_change(before, facet_keys(moved))
+        closed = Gathering.query.filter_by(name='패싯 모임 2').one()
+        before = facet_keys(closed)
+        closed.is_active = False
+        record_facet_change(before, [])
+        db.session.commit()
+
+        assert [r['region'] for r in region_facet(facet_counts()['region'])] == ['서울특별시', '부산광역시']  # 모임 수가 같으면 지역 ID 순
+        assert facet_counts()['meeting_type'] == [('offline', 1), ('online', 1)]
+        assert refresh_facet_counts() == 0
+        print("✅ 증분/재계산 일치 테스트 통과")
+
+
+def test_facets_endpoint_and_etag(app):
+    """/facets는 집계를 반환하고, 변경이 없으면 304"""
+    client = app.test_client()
+    response = client.get('/api/gatherings/facets')
+    assert response.status_code == 200
+    data = response.get_json()['data']
+    assert [item['region'] for item in data['regions']] == ['서울특별시', '부산광역시']  # 모임 수가 같으면 지역 ID 순
+    assert data['hobbies'][0]['name'] == '패싯 테스트 취미'
+    assert data['hobbies'][0]['count'] == data['total'] == 2
+
+    etag = response.headers['ETag']
+    assert client.get('/api/gatherings/facets', headers={'If-None-Match': etag}).status_code == 304
+
+    regions = client.get('/api/gatherings/regions').get_json()['data']
+    assert regions['total_regions'] == 2
+
+    # 지역 목록의 이름으로 필터하면 같은 모임 수
+    for item in regions['regions']:
+        listed = client.get('/api/gatherings', query_string={'region': item['region']}).get_json()['data']
+        assert len(listed['gatherings']) == item['count']
+
+    # 주기 보정으로 집계가 바뀌면 ETag도 바뀜
+    with app.app_context():
+        Gathering.query.filter_by(name='패싯 모임 3').update({'is_active': True})  # 대구, region_id 지정됨
+        db.session.commit()
+        assert refresh_facet_counts() == 3  # 대구, offline, 취미
+    response = client.get('/api/gatherings/facets', headers={'If-None-Match': etag})
+    assert response.status_code == 200
+    assert response.get_json()['data']['total'] == 3
+    print("✅ 패싯 API/ETag 테스트 통과")
+
+
+def test_facet_change_bumps_version_and_total_skips_deleted_hobbies(app):
+    """증분 반영은 'facets' 버전을 올리고, total은 삭제된 취미의 모임을 세지 않음"""
+    with app.app_context():
+        hobby = Hobby(name='삭제될 패싯 취미', category='운동')
+        db.session.add(hobby)
+        db.session.flush()
+        gathering = Gathering(hobby_id=hobby.hobby_id, name='삭제될 취미 모임', region='서울', meeting_type='offline')
+        assign_region(gathering)
+        db.session.add(gathering)
+        db.session.flush()
+
+        version = catalog_cache.version('facets')
+        record_facet_change([], facet_keys(gathering))
+        db.session.commit()
+        assert catalog_cache.version('facets') != version
+
+        hobby.soft_delete()
+        db.session.commit()
+
+    data = app.test_client().get('/api/gatherings/facets').get_json()['data']
+    assert '삭제될 패싯 취미' not in [item['name'] for item in data['hobbies']]
+    assert data['total'] == sum(item['count'] for item in data['hobbies']) == 3
+    print("✅ 패싯 버전/합계 테스트 통과")
+
+
+if __name__ == '__main__':
+    from conftest import load_app
+    app = load_app()
+    print("🧪 모임 패싯 집계 테스트 시작\n")
+    test_incremental_matches_refresh(app)
+    test_facets_endpoint_and_etag(app)
+    test_facet_change_bumps_version_and_total_skips_deleted_hobbies(app)
+    print("\n✅ 모든 테스트 완료!")
@@ -0,0 +1,99 @@
+"""
+모임 목록 쿼리 수 테스트 스크립트
+서버 없이 임시 SQLite DB로 앱을 띄워, 모임 목록의 쿼리 수가 페이지 크기와 무관한지 확인합니다.
+(모임마다 취미를 따로 조회하는 N+1 쿼리 회귀 방지)
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import event
+
+from app.models import db
+from app.models.hobby import Hobby, Gathering
+from app.services.catalog_cache import catalog_cache
+
+GATHERING_COUNT = 30
+
+
+def _setup_data(app):
+    with app.app_context():
+        db.create_all()
+        if Gathering.query.count():
+            return
+        for i in range(1, GATHERING_COUNT + 1):
+            db.session.add(Hobby(name=f'취미{i}', category='운동' if i % 2 else '예술'))
+        db.session.flush()
+        for i in range(1, GATHERING_COUNT + 1):
+            db.session.add(Gathering(hobby_id=i, name=f'모임{i}', region='서울', member_count=i))
+        db.session.commit()
+
+
+def _count_queries(app, path):
+    """요청 한 번에 실행된 SELECT 수 (캐시를 비운 상태에서 측정)"""
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith('SELECT'):
+            statements.append(statement)
+
+    with app.app_context():
+        engine = db.engine
+    catalog_cache.local.clear()
+    catalog_cache.bump_version('catalog')
+
+    event.listen(engine, 'before_cursor_execute', record)
+    try:
+        response = app.test_client().get(path)
+    finally:
+        event.remove(engine, 'before_cursor_execute', record)
+
+    assert response.status_code == 200, response.get_json()
+    return len(statements), response.get_json()['data']
+
+
+def test_gathering_list_query_count(app):
+    """모임 목록: 페이지 크기와 관계없이 쿼리 수 일정 (개수 + 목록 + 취미 요약)"""
+    _setup_data(app)
+    small, _ = _count_queries(app, '/api/gatherings?per_page=5')
+    large, data = _count_queries(app, f'/api/gatherings?per_page={GATHERING_COUNT}')
+
+    assert len(data['gatherings']) == GATHERING_COUNT
+    assert all(g['hobby']['hobby_id'] == g['hobby_id'] for g in data['gatherings'])
+    assert large == small <= 3, (small, large)
+    print(f"✅ 모임 목록 쿼리 수 테스트 통과 ({large}회)")
+
+
+def test_popular_gatherings_query_count(app):
+    """인기 모임: 목록 + 취미 요약 2회"""
+    _setup_data(app)
+    count, data = _count_queries(app, f'/api/gatherings/popular?limit={GATHERING_COUNT}')
+
+    assert len(data['gatherings']) == GATHERING_COUNT
+    assert data['gatherings'][0]['hobby'] == {'hobby_id': GATHERING_COUNT, 'name': f'취미{GATHERING_COUNT}', 'category': '예술'}
+    assert count <= 2, count
+    print(f"✅ 인기 모임 쿼리 수 테스트 통과 ({count}회)")
+
+
+def test_gatherings_by_hobby_query_count(app):
+    """취미별 모임 첫 페이지: 메모리 인기 모임 목록 사용 (취미 확인 1회, COUNT 없음)"""
+    _setup_data(app)
+    _count_queries(app, '/api/gatherings/hobby/1')  # 인기 모임 목록 생성
+    count, data = _count_queries(app, '/api/gatherings/hobby/1')
+
+    assert [g['gathering_id'] for g in data['gatherings']] == [1]
+    assert data['pagination']['total_items'] == 1
+    assert count <= 1, count
+    print(f"✅ 취미별 모임 쿼리 수 테스트 통과 ({count}회)")
+
+
+if __name__ == '__main__':
+    from conftest import load_app
+    app = load_app()
+    print("🧪 모임 목록 쿼리 수 테스트 시작\n")
+    test_gathering_list_query_count(app)
+    test_popular_gatherings_query_count(app)
+    test_gatherings_by_hobby_query_count(app)
+    print("\n✅ 모든 테스트 완료!")
@@ -0,0 +1,148 @@
+"""
+추천 모임 점수 테스트 스크립트
+서버 없이 취미별 후보 모임 테이블의 점수 계산(지역, 모임 방식, 회원 수)과
+임시 SQLite DB에서 후보 모임 조회(전국 인기 + 지역/온라인)를 테스트합니다.
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.models import db
+from app.models.hobby import Hobby, Gathering
+from app.services.gathering_recommendations import (
+    GatheringTable, gathering_table, national_table, region_scores, meeting_scores, rank_gatherings
+)
+from app.services.regions import RegionIndex, region_index, seed_provinces, seed_districts, assign_region
+
+# (region_id, parent_id, level, name, aliases)
+ROWS = [
+    (1, None, 1, '서울특별시', '서울,서울시'),
+    (2, None, 1, '부산광역시', '부산,부산시'),
+    (11, 1, 2, '강남구', None),
+    (13, 1, 2, '종로구', None),
+    (21, 2, 2, '해운대구', None),
+]
+
+
+def _gathering(gathering_id, hobby_id, region_id, meeting_type, member_count=0):
+    return {
+        'gathering_id': gathering_id,
+        'hobby_id': hobby_id,
+        'region_id': region_id,
+        'meeting_type': meeting_type,
+        'member_count': member_count
+    }
+
+
+TABLE = GatheringTable({
+    1: [
+        _gathering(1, 1, 11, 'offline', 10),
+        _gathering(2, 1, 13, 'offline', 10),
+        _gathering(3, 1, 21, 'offline', 10),
+        _gathering(4, 1, None, 'online', 10),
+    ],
+    2: [_gathering(5, 2, 11, 'offline', 0)],
+    3: [_gathering(6, 3, 11, 'offline', 100)],
+})
+
+
+def test_region_scores():
+    """거주 지역은 1.0, 같은 시/도는 부분 점수, 알 수 없으면 빈 조회표"""
+    index = RegionIndex(ROWS)
+    scores = region_scores(index, '서울 강남구')
+    assert scores[11] == 1.0
+    assert 0 < scores[13] < 1.0 and 0 < scores[1] < 1.0
+    assert 21 not in scores
+    assert region_scores(index, '해외') == {}
+    print("✅ 지역 점수 테스트 통과")
+
+
+def test_meeting_scores():
+    """선호 모임 방식 지정, 사회성 선호 기반 추정"""
+    assert meeting_scores(None, ['online']) == {'offline': 0.0, 'online': 1.0, 'hybrid': 0.5}
+
+    class Profile:
+        social_preference = 1.0
+
+    scores = meeting_scores(Profile())
+    assert scores['offline'] > scores['hybrid'] > scores['online']
+    print("✅ 모임 방식 점수 테스트 통과")
+
+
+def test_rank_gatherings():
+    """추천 취미의 후보만, 가까운 지역/선호 방식 순"""
+    regions = region_scores(RegionIndex(ROWS), '서울 강남구')
+    ranked = rank_gatherings(TABLE, {1: 0.8, 2: 0.5}, regions, meeting_scores(None, ['offline']))
+    ids = [item['gathering']['gathering_id'] for item in ranked]
+    assert 6 not in ids                 # 추천 취미가 아닌 모임 제외
+    assert ids.index(1) < ids.index(2) < ids.index(3)  # 거주 구 > 같은 시/도 > 다른 시/도
+    assert ranked[0]['score_breakdown']['region'] == 1.0
+
+    # 온라인 선호면 지역과 관계없이 온라인 모임이 먼저
+    ranked = rank_gatherings(TABLE, {1: 0.8}, regions, meeting_scores(None, ['online']), limit=1)
+    assert ranked[0]['gathering']['gathering_id'] == 4
+
+    # 지역을 알 수 없으면 지역 점수가 같아 취미 점수/회원 수 순
+    ranked = rank_gatherings(TABLE, {1: 0.8, 2: 0.9}, {}, meeting_scores(None, ['offline']))
+    assert ranked[0]['score_breakdown']['region'] == 0.5
+    print("✅ 모임 순위 테스트 통과")
+
+
+def test_local_candidates(app):
+    """전국 인기 목록에 들지 못한 동네/온라인 모임도 후보가 되어야 함"""
+    with app.app_context():
+        db.create_all()
+        seed_provinces()
+        seed_districts()
+        hobby = Hobby(name='추천 후보 테스트 취미', category='운동')
+        db.session.add(hobby)
+        db.session.flush()
+        for name, region, location, meeting_type, member_count in [
+            ('부산 큰 모임 1', '부산', '부산 해운대구', 'offline', 100),
+            ('부산 큰 모임 2', '부산', '부산 해운대구', 'offline', 90),
+            ('부산 큰 모임 3', '부산', '부산 해운대구', 'offline', 80),
+            ('강남 작은 모임', '서울', '서울 강남구', 'offline', 1),
+            ('온라인 작은 모임', None, None, 'online', 1),
+            ('대구 작은 모임', '대구', '대구 중구', 'offline', 1),
+        ]:
+            gathering = Gathering(
+                hobby_id=hobby.hobby_id, name=name, region=region, location=location,
+                meeting_type=meeting_type, member_count=member_count
+            )
+            assign_region(gathering)
+            db.session.add(gathering)
+        db.session.commit()
+
+        app.config['TOP_GATHERINGS_PER_HOBBY'] = 2
+        try:
+            regions = region_scores(region_index(), '서울 강남구')
+            table = gathering_table([hobby.hobby_id], regions)
+            names = {gathering['name'] for gathering in table.columns[hobby.hobby_id][0]}
+            assert names == {'부산 큰 모임 1', '부산 큰 모임 2', '강남 작은 모임', '온라인 작은 모임'}
+
+            ranked = rank_gatherings(table, {hobby.hobby_id: 0.8}, regions, meeting_scores(None, ['offline']), limit=1)
+            assert ranked[0]['gathering']['name'] == '강남 작은 모임'
+
+            # 지역을 알 수 없으면 전국 인기 + 온라인
+            table = gathering_table([hobby.hobby_id], {})
+            assert len(table.columns[hobby.hobby_id][0]) == 3
+
+            # 전국 인기 모임 컬럼은 요청마다 다시 만들지 않고, 지역 후보를 덧붙여도 바뀌지 않음
+            national = national_table()
+            assert national_table() is national
+            assert len(national.columns[hobby.hobby_id][0]) == 2
+        finally:
+            app.config['TOP_GATHERINGS_PER_HOBBY'] = 20
+        print("✅ 지역 후보 모임 테스트 통과")
+
+
+if __name__ == '__main__':
+    from conftest import load_app
+    print("🧪 추천 모임 점수 테스트 시작\n")
+    test_region_scores()
+    test_meeting_scores()
+    test_rank_gatherings()
+    test_local_candidates(load_app())
+    print("\n✅ 모든 테스트 완료!")
@@ -0,0 +1,74 @@
+"""
+모임 검색 테스트 스크립트
+서버 없이 임시 SQLite DB로 앱을 띄워, 역색인 검색의 관련도 정렬과 필터, 색인 갱신을 확인합니다.
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.models import db
+from app.models.hobby import Hobby, Gathering
+from app.services.gathering_search import reindex_gatherings, rebuild_gathering_index
+
+GATHERINGS = [
+    # (이름, 설명, 모임 유형)
+    ('북한산 산책', '등산 후 점심', 'offline'),
+    ('등산 동호회', '주말 등산', 'offline'),
+    ('온라인 등산 이야기', None, 'online'),
+    ('가나 나다', None, 'offline'),
+]
+
+
+def _search(app, **params):
+    response = app.test_client().get('/api/gatherings', query_string=params)
+    if response.status_code != 200:
+        return response.status_code, None
+    return response.status_code, [item['name'] for item in response.get_json()['data']['gatherings']]
+
+
+def test_search_ranking_and_filters(app):
+    """모임명에 있는 검색어가 더 높은 순위, 필터는 색인 안에서 적용, 바이그램 오탐 제외"""
+    with app.app_context():
+        db.create_all()
+        hobby = Hobby(name='검색 테스트 취미', category='운동')
+        db.session.add(hobby)
+        db.session.flush()
+        for name, description, meeting_type in GATHERINGS:
+            db.session.add(Gathering(
+                hobby_id=hobby.hobby_id, name=name, description=description,
+                region='서울', meeting_type=meeting_type
+            ))
+        db.session.commit()
+        assert rebuild_gathering_index() == len(GATHERINGS)
+
+    assert _search(app, search='등산') == (200, ['등산 동호회', '온라인 등산 이야기', '북한산 산책'])
+    assert _search(app, search='등산', meeting_type='online') == (200, ['온라인 등산 이야기'])
+    assert _search(app, search='등산 점심') == (200, ['북한산 산책'])
+    assert _search(app, search='가나다') == (200, [])
+    assert _search(app, search='책') == (200, ['북한산 산책'])  # 한 글자 검색어
+    assert _search(app, search='!!')[0] == 400
+    print("✅ 검색 정렬/필터 테스트 통과")
+
+
+def test_reindex_removes_inactive(app):
+    """비활성화된 모임은 다시 색인하면 검색에서 제외"""
+    with app.app_context():
+        gathering = Gathering.query.filter_by(name='등산 동호회').one()
+        gathering.is_active = False
+        db.session.flush()
+        reindex_gatherings([gathering.gathering_id])
+        db.session.commit()
+
+    assert _search(app, search='등산', is_active='false') == (200, ['온라인 등산 이야기', '북한산 산책'])
+    print("✅ 비활성 모임 색인 제외 테스트 통과")
+
+
+if __name__ == '__main__':
+    from conftest import load_app
+    app = load_app()
+    print("🧪 모임 검색 테스트 시작\n")
+    test_search_ranking_and_filters(app)
+    test_reindex_removes_inactive(app)
+    print("\n✅ 모든 테스트 완료!")
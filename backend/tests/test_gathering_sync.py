@@ -0,0 +1,77 @@
+"""
+외부 모임 동기화 테스트 스크립트
+서버 없이 임시 SQLite DB로 앱을 띄워, 내용 해시로 새/변경/삭제된 모임만 반영되는지 확인합니다.
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.models import db
+from app.models.hobby import Hobby, Gathering
+from app.services.gathering_sync import sync_gatherings
+
+
+def _feed(count, changed=None):
+    """피드 레코드 count개 (changed에 있는 번호는 설명 변경)"""
+    return [
+        {
+            'external_id': f'club-{i}',
+            'hobby_name': '동기화 테스트 취미',
+            'name': f'외부 모임 {i}',
+            'description': '변경됨' if changed and i in changed else '설명',
+            'region': '서울',
+            'location': '서울 종로구',
+            'latitude': '37.57',
+            'longitude': '126.98'
+        }
+        for i in range(count)
+    ]
+
+
+def test_sync_applies_only_diff(app):
+    """두 번째 동기화는 바뀐 레코드만 갱신하고, 사라진 레코드는 비활성화"""
+    with app.app_context():
+        db.create_all()
+        db.session.add(Hobby(name='동기화 테스트 취미', category='운동'))
+        db.session.add(Hobby(name='삭제된 취미', category='운동', is_deleted=True))
+        db.session.commit()
+
+        stats = sync_gatherings(iter(_feed(25)), source='test', chunk_size=10)
+        assert (stats.inserted, stats.updated, stats.unchanged) == (25, 0, 0)
+        gathering = Gathering.query.filter_by(source='test', external_id='club-3').one()
+        assert gathering.geohash and gathering.member_count == 0
+
+        # 회원 수는 동기화로 덮어쓰지 않음
+        gathering.member_count = 7
+        db.session.commit()
+
+        # 취미가 없거나, 없는/삭제된 취미인 레코드는 건너뜀 (FK 오류로 동기화가 멈추지 않음)
+        feed = _feed(20, changed={3}) + [
+            {'external_id': 'bad', 'name': '취미 없음'},
+            {'external_id': 'bad-hobby', 'hobby_id': '9999', 'name': '없는 취미'},
+            {'external_id': 'deleted-hobby', 'hobby_name': '삭제된 취미', 'name': '삭제된 취미 모임'},
+        ]
+        stats = sync_gatherings(iter(feed), source='test', chunk_size=10)
+        assert stats.to_dict() == {
+            'processed': 23, 'inserted': 0, 'updated': 1, 'unchanged': 19,
+            'deactivated': 5, 'skipped': 3
+        }
+
+        gathering = Gathering.query.filter_by(source='test', external_id='club-3').one()
+        assert gathering.description == '변경됨' and gathering.member_count == 7
+        assert Gathering.query.filter_by(source='test', is_active=True).count() == 20
+
+        # 다시 나타난 모임은 재활성화
+        stats = sync_gatherings(iter(_feed(21, changed={3})), source='test', chunk_size=10)
+        assert (stats.updated, stats.unchanged, stats.deactivated) == (1, 20, 0)
+        print("✅ 변경분 동기화 테스트 통과")
+
+
+if __name__ == '__main__':
+    from conftest import load_app
+    app = load_app()
+    print("🧪 외부 모임 동기화 테스트 시작\n")
+    test_sync_applies_only_diff(app)
+    print("\n✅ 모든 테스트 완료!")
@@ -95,10 +95,11 @@ def test_gatherings_api():
                 'region': '서울',
                 'meeting_type': 'offline',
                 'schedule_info': '매주 토요일 오전 8시',
-                'member_count': 15,
                 'contact_info': '010-1234-5678',
                 'website_url': 'https://example.com/hiking',
-                'is_active': True
+                'is_active': True,
+                'latitude': 37.5735,
+                'longitude': 126.9788
             }
 
             response = requests.post(f'{BASE_URL}/api/gatherings',
@@ -125,8 +126,7 @@ def test_gatherings_api():
                 print(f"\n\n✏️ 5단계: 모임 정보 수정")
                 update_data = {
                     'name': '서울 등산 동호회 (수정됨)',
-                    'description': '수정된 설명입니다.',
-                    'member_count': 20
+                    'description': '수정된 설명입니다.'
                 }
 
                 response = requests.put(f'{BASE_URL}/api/gatherings/{created_gathering_id}',
@@ -134,6 +134,20 @@ def test_gatherings_api():
                                        headers=headers)
                 print_response("모임 수정", response)
 
+                # ========================================
+                # 5-1. 모임 가입/탈퇴
+                # ========================================
+                print(f"\n\n🙋 5-1단계: 모임 가입/탈퇴")
+                response = requests.post(f'{BASE_URL}/api/gatherings/{created_gathering_id}/join',
+                                        headers=headers)
+                print_response("모임 가입", response)
+                response = requests.post(f'{BASE_URL}/api/gatherings/{created_gathering_id}/join',
+                                        headers=headers)
+                print(f"중복 가입 → Status Code: {response.status_code} (409 기대)")
+                response = requests.post(f'{BASE_URL}/api/gatherings/{created_gathering_id}/leave',
+                                        headers=headers)
+                print_response("모임 탈퇴", response)
+
                 # ========================================
                 # 6. 지역별 필터링
                 # ========================================
@@ -156,6 +170,13 @@ def test_gatherings_api():
                 response = requests.get(f'{BASE_URL}/api/gatherings/regions')
                 print_response("사용 가능한 지역 목록", response)
 
+                # ========================================
+                # 8-1. 모임 패싯 조회 (지역/모임 유형/취미별 모임 수)
+                # ========================================
+                print("\n\n📊 8-1단계: 모임 패싯 조회")
+                response = requests.get(f'{BASE_URL}/api/gatherings/facets')
+                print_response("모임 패싯", response)
+
                 # ========================================
                 # 9. 인기 모임 조회
                 # ========================================
@@ -164,6 +185,23 @@ def test_gatherings_api():
                                        params={'limit': 5})
                 print_response("인기 모임 TOP 5", response)
 
+                # ========================================
+                # 9-1. 주변 모임 조회 (거리순)
+                # ========================================
+                print("\n\n🧭 9-1단계: 주변 모임 조회 (광화문 반경 5km)")
+                response = requests.get(f'{BASE_URL}/api/gatherings/nearby',
+                                       params={'lat': 37.5759, 'lng': 126.9768, 'radius_km': 5})
+                print_response("주변 모임", response)
+
+                # ========================================
+                # 9-2. 추천 모임 조회 (추천 취미 + 지역 + 모임 방식)
+                # ========================================
+                print("\n\n🎯 9-2단계: 추천 모임 조회")
+                response = requests.get(f'{BASE_URL}/api/gatherings/recommended',
+                                       params={'limit': 5},
+                                       headers=headers)
+                print_response("추천 모임 TOP 5 (프로필이 없으면 400)", response)
+
                 # ========================================
                 # 10. 모임 유형별 필터링
                 # ========================================
@@ -172,6 +210,14 @@ def test_gatherings_api():
                                        params={'meeting_type': 'offline'})
                 print_response("오프라인 모임", response)
 
+                # ========================================
+                # 10-1. 기간 필터 (정기 일정)
+                # ========================================
+                print("\n\n🗓️ 10-1단계: 기간 안에 모이는 모임 조회 (토요일 하루)")
+                response = requests.get(f'{BASE_URL}/api/gatherings',
+                                       params={'meets_between': '2026-10-24,2026-10-24'})
+                print_response("토요일 모임", response)
+
                 # ========================================
                 # 11. 검색 기능
                 # ========================================
@@ -0,0 +1,60 @@
+"""
+위치 검색 테스트 스크립트
+서버 없이 geohash 인코딩, 거리 계산, 반경 검색 후보 셀을 테스트합니다.
+"""
+
+import os
+import random
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.services.geo import (
+    encode_geohash, haversine_km, candidate_prefixes, search_precision, GEOHASH_PRECISION
+)
+
+
+def test_encode_geohash():
+    """알려진 좌표의 geohash"""
+    assert encode_geohash(57.64911, 10.40744, 11) == 'u4pruydqqvj'
+    assert encode_geohash(37.5665, 126.9780, 5) == 'wydm9'
+    assert len(encode_geohash(0, 0)) == GEOHASH_PRECISION
+    print("✅ geohash 인코딩 테스트 통과")
+
+
+def test_haversine_km():
+    """서울시청 ↔ 부산시청 약 325km"""
+    distance = haversine_km(37.5665, 126.9780, 35.1796, 129.0756)
+    assert 320 < distance < 330, distance
+    assert haversine_km(37.5, 127.0, 37.5, 127.0) == 0
+    print("✅ 거리 계산 테스트 통과")
+
+
+def test_candidate_prefixes_cover_radius():
+    """반경 안의 모든 점은 후보 접두사 중 하나로 시작해야 함 (셀 경계, 날짜변경선 포함)"""
+    rng = random.Random(42)
+    centers = [(37.5665, 126.9780), (0.0, 179.999), (-33.8688, 151.2093), (64.1466, -21.9426)]
+    for lat, lng in centers:
+        for radius_km in (0.5, 3, 20, 100):
+            prefixes = candidate_prefixes(lat, lng, radius_km)
+            assert prefixes and len(prefixes) <= 9
+            for _ in range(300):
+                point_lat = lat + rng.uniform(-1, 1) * radius_km / 111.32
+                point_lng = lng + rng.uniform(-1, 1) * radius_km / 50
+                point_lng = (point_lng + 180.0) % 360.0 - 180.0
+                if haversine_km(lat, lng, point_lat, point_lng) > radius_km:
+                    continue
+                geohash = encode_geohash(point_lat, point_lng)
+                assert any(geohash.startswith(prefix) for prefix in prefixes), (lat, lng, radius_km)
+
+    # 반경이 작을수록 정밀도가 높아짐 (후보가 좁아짐)
+    assert search_precision(37.5, 0.5) > search_precision(37.5, 20)
+    print("✅ 후보 셀 테스트 통과")
+
+
+if __name__ == '__main__':
+    print("🧪 위치 검색 테스트 시작\n")
+    test_encode_geohash()
+    test_haversine_km()
+    test_candidate_prefixes_cover_radius()
+    print("\n✅ 모든 테스트 완료!")
@@ -31,6 +31,11 @@ def test_hobbies_api():
     response = requests.get(f'{BASE_URL}/api/hobbies', params={'category': '운동'})
     print_response("카테고리 필터", response)
 
+    # 2-1. 필드 선택
+    print("\n2️⃣-1️⃣ 필드 선택 (GET /api/hobbies?fields=name,category,average_rating)")
+    response = requests.get(f'{BASE_URL}/api/hobbies', params={'fields': 'name,category,average_rating'})
+    print_response("필드 선택", response)
+
     # 3. 검색
     print("\n3️⃣ 검색 (GET /api/hobbies?search=요가)")
     response = requests.get(f'{BASE_URL}/api/hobbies', params={'search': '요가'})
@@ -41,11 +46,42 @@ def test_hobbies_api():
     response = requests.get(f'{BASE_URL}/api/hobbies/categories')
     print_response("카테고리 목록", response)
 
+    # 4-1. 조건부 GET (ETag)
+    print("\n4️⃣-1️⃣ 조건부 GET (If-None-Match)")
+    etag = response.headers.get('ETag')
+    response = requests.get(f'{BASE_URL}/api/hobbies/categories', headers={'If-None-Match': etag})
+    print(f"ETag: {etag} → Status Code: {response.status_code} (304 기대)")
+
+    # 4-2. 취미 일괄 조회 (요청 순서 유지)
+    print("\n4️⃣-2️⃣ 취미 일괄 조회 (GET /api/hobbies/batch?ids=3,1,2)")
+    response = requests.get(f'{BASE_URL}/api/hobbies/batch', params={'ids': '3,1,2'})
+    print_response("취미 일괄 조회", response)
+
+    # 4-3. 취미 변경 피드 (전체 동기화 후 다음 토큰으로 재요청)
+    print("\n4️⃣-3️⃣ 취미 변경 피드 (GET /api/hobbies/changes)")
+    response = requests.get(f'{BASE_URL}/api/hobbies/changes', params={'limit': 5})
+    print_response("변경 피드", response)
+    next_token = response.json()['data']['next_token']
+    response = requests.get(f'{BASE_URL}/api/hobbies/changes', params={'since': next_token, 'limit': 5})
+    print_response("변경 피드 (다음)", response)
+
+    # 4-4. 미디어 매니페스트 + URL 없는 목록
+    print("\n4️⃣-4️⃣ 미디어 매니페스트 (GET /api/hobbies/media-manifest)")
+    response = requests.get(f'{BASE_URL}/api/hobbies/media-manifest')
+    print_response("미디어 매니페스트", response)
+    response = requests.get(f'{BASE_URL}/api/hobbies', params={'media': 'manifest', 'per_page': 3})
+    print_response("취미 목록 (media=manifest)", response)
+
     # 5. 취미 상세 조회 (ID 1)
     print("\n5️⃣ 취미 상세 조회 (GET /api/hobbies/1)")
     response = requests.get(f'{BASE_URL}/api/hobbies/1')
     print_response("취미 상세", response)
 
+    # 5-1. 취미 상세 묶음 조회 (상세 + 유사 취미 + 모임)
+    print("\n5️⃣-1️⃣ 취미 상세 묶음 조회 (GET /api/hobbies/1/bundle)")
+    response = requests.get(f'{BASE_URL}/api/hobbies/1/bundle', params={'similar_limit': 3, 'gatherings_limit': 3})
+    print_response("취미 상세 묶음", response)
+
     # 6. 인증 필요한 API 테스트 (회원가입 & 로그인)
     print("\n6️⃣ 회원가입 및 로그인")
 
@@ -93,11 +129,32 @@ def test_hobbies_api():
                                 headers=headers)
         print_response("취미 평가", response)
 
+        # 7-1. 취미 일괄 평가
+        print("\n7️⃣-1️⃣ 취미 일괄 평가 (POST /api/hobbies/ratings/batch)")
+        batch_data = {
+            'ratings': [
+                {'hobby_id': 2, 'rating': 4},
+                {'hobby_id': 3, 'rating': 3, 'review_text': '괜찮아요'}
+            ]
+        }
+        response = requests.post(f'{BASE_URL}/api/hobbies/ratings/batch',
+                                json=batch_data,
+                                headers=headers)
+        print_response("취미 일괄 평가", response)
+
         # 8. 취미 평가 목록 조회
         print("\n8️⃣ 취미 평가 목록 (GET /api/hobbies/1/ratings)")
         response = requests.get(f'{BASE_URL}/api/hobbies/1/ratings')
         print_response("평가 목록", response)
 
+        # 8-1. 리뷰 검색 (취미 내 / 전체 취미)
+        print("\n8️⃣-1️⃣ 리뷰 검색 (GET /api/hobbies/1/ratings?q=좋아요)")
+        response = requests.get(f'{BASE_URL}/api/hobbies/1/ratings', params={'q': '좋아요'})
+        print_response("취미 내 리뷰 검색", response)
+
+        response = requests.get(f'{BASE_URL}/api/hobbies/reviews/search', params={'q': '좋아요', 'limit': 5})
+        print_response("전체 리뷰 검색", response)
+
     else:
         print(f"❌ 로그인 실패: {response.json()}")
 
@@ -0,0 +1,66 @@
+"""
+취미 일괄 조회 테스트 스크립트
+서버 없이 임시 SQLite DB로 앱을 띄워, /api/hobbies/batch의 요청 순서, missing_ids, 최대 개수 제한을 확인합니다.
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.models import db
+from app.models.hobby import Hobby
+
+BATCH_URL = '/api/hobbies/batch'
+
+
+def _setup_hobbies():
+    """취미 3개 생성 (마지막은 삭제) → hobby_ids"""
+    db.create_all()
+    hobbies = [Hobby(name=f'일괄 조회 테스트 취미{i}', category='운동') for i in range(3)]
+    db.session.add_all(hobbies)
+    db.session.flush()
+    hobbies[2].soft_delete()
+    db.session.commit()
+    return [hobby.hobby_id for hobby in hobbies]
+
+
+def test_batch_order_and_missing(app):
+    """요청 순서대로 반환하고, 없거나 삭제된 취미는 missing_ids로 (중복 ID는 한 번만)"""
+    with app.app_context():
+        first_id, second_id, deleted_id = _setup_hobbies()
+
+    client = app.test_client()
+    for _ in range(2):  # 두 번째는 캐시에서 조회
+        response = client.get(f'{BATCH_URL}?ids={second_id},999999,{first_id},{deleted_id}&ids={second_id}')
+        assert response.status_code == 200
+        data = response.get_json()['data']
+        assert [hobby['hobby_id'] for hobby in data['hobbies']] == [second_id, first_id]
+        assert data['missing_ids'] == [999999, deleted_id]
+        assert 'rating_count' in data['hobbies'][0]
+    print("✅ 일괄 조회 순서/missing_ids 테스트 통과")
+
+
+def test_batch_limits(app):
+    """ID가 없거나 정수가 아니거나 최대 개수를 넘으면 400"""
+    from app.api.hobbies import MAX_BATCH_FETCH
+
+    client = app.test_client()
+    assert client.get(BATCH_URL).status_code == 400
+    assert client.get(f'{BATCH_URL}?ids=1,a').status_code == 400
+
+    ids = ','.join(str(i) for i in range(1, MAX_BATCH_FETCH + 1))
+    assert client.get(f'{BATCH_URL}?ids={ids}').status_code == 200
+    response = client.get(f'{BATCH_URL}?ids={ids},{MAX_BATCH_FETCH + 1}')
+    assert response.status_code == 400
+    assert str(MAX_BATCH_FETCH) in response.get_json()['message']
+    print("✅ 일괄 조회 최대 개수 테스트 통과")
+
+
+if __name__ == '__main__':
+    from conftest import load_app
+    app = load_app()
+    print("🧪 취미 일괄 조회 테스트 시작\n")
+    test_batch_order_and_missing(app)
+    test_batch_limits(app)
+    print("\n✅ 모든 테스트 완료!")
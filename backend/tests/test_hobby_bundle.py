@@ -0,0 +1,95 @@
+"""
+취미 상세 묶음 조회 테스트 스크립트
+서버 없이 임시 SQLite DB로 앱을 띄워, /api/hobbies/<id>/bundle의 캐시 미스/적중 응답과 쿼리를 확인합니다.
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import event
+
+from conftest import auth_headers
+from app.models import db
+from app.models.hobby import Hobby, Gathering
+from app.models.user import User
+from app.services.catalog_cache import catalog_cache
+
+
+def _setup_data():
+    """같은 카테고리 취미 3개, 모임 2개, 사용자 1명 생성 → (hobby_id, user_id)"""
+    db.create_all()
+    hobbies = [
+        Hobby(name=f'묶음 테스트 취미{i}', category='운동', difficulty_level=1 + i, physical_intensity=2)
+        for i in range(3)
+    ]
+    user = User(username='bundle_user', email='bundle_user@test.com', password_hash='x')
+    db.session.add_all(hobbies + [user])
+    db.session.flush()
+    for i in range(2):
+        db.session.add(Gathering(hobby_id=hobbies[0].hobby_id, name=f'묶음 테스트 모임{i}', region='서울', member_count=10 + i))
+    db.session.commit()
+    return hobbies[0].hobby_id, user.user_id
+
+
+def _get_bundle(app, path):
+    """묶음 조회 → (응답 데이터, 취미 테이블을 읽은 SELECT 수)"""
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith('SELECT') and 'FROM hobbies' in statement:
+            statements.append(statement)
+
+    with app.app_context():
+        engine = db.engine
+    event.listen(engine, 'before_cursor_execute', record)
+    try:
+        response = app.test_client().get(path)
+    finally:
+        event.remove(engine, 'before_cursor_execute', record)
+
+    assert response.status_code == 200, response.get_json()
+    return response.get_json()['data'], len(statements)
+
+
+def test_bundle_miss_and_hit(app):
+    """캐시 미스는 조회해서 채우고, 적중하면 취미 테이블을 읽지 않고 같은 응답"""
+    with app.app_context():
+        hobby_id, user_id = _setup_data()
+    catalog_cache.local.clear()
+    path = f'/api/hobbies/{hobby_id}/bundle?similar_limit=2'
+
+    missed, miss_queries = _get_bundle(app, path)
+    assert miss_queries > 0
+    assert missed['hobby']['hobby_id'] == hobby_id
+    assert missed['hobby']['recent_reviews'] == []
+    assert len(missed['similar_hobbies']) == 2
+    assert hobby_id not in [item['hobby']['hobby_id'] for item in missed['similar_hobbies']]
+    assert [gathering['member_count'] for gathering in missed['gatherings']] == [11, 10]
+
+    hit, hit_queries = _get_bundle(app, path)
+    assert hit_queries == 0
+    assert hit == missed
+
+    # 평가가 저장되면 카탈로그 버전이 올라가 다시 조회
+    response = app.test_client().post(
+        f'/api/hobbies/{hobby_id}/rate',
+        json={'rating': 5, 'review_text': '묶음 리뷰'},
+        headers=auth_headers(app, user_id)
+    )
+    assert response.status_code == 200
+    refreshed, refresh_queries = _get_bundle(app, path)
+    assert refresh_queries > 0
+    assert [review['review_text'] for review in refreshed['hobby']['recent_reviews']] == ['묶음 리뷰']
+
+    assert app.test_client().get('/api/hobbies/999999/bundle').status_code == 404
+    print("✅ 묶음 조회 캐시 미스/적중 테스트 통과")
+
+
+if __name__ == '__main__':
+    from conftest import load_app
+    app = load_app()
+    print("🧪 취미 상세 묶음 조회 테스트 시작\n")
+    test_bundle_miss_and_hit(app)
+    print("\n✅ 모든 테스트 완료!")
@@ -0,0 +1,50 @@
+"""
+미디어 매니페스트 테스트 스크립트
+서버 없이 이미지 헤더 크기 판별과 매니페스트 항목 변환을 테스트합니다.
+"""
+
+import os
+import struct
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.models.hobby import HobbyMedia
+from app.services.media_manifest import image_size
+
+
+def test_image_size_png_gif():
+    """PNG/GIF 헤더에서 너비, 높이 판별"""
+    png = b'\x89PNG\r\n\x1a\n' + struct.pack('>I', 13) + b'IHDR' + struct.pack('>II', 640, 480) + b'\x08\x02\x00\x00\x00'
+    gif = b'GIF89a' + struct.pack('<HH', 320, 200) + b'\x00' * 4
+    assert image_size(png) == (640, 480)
+    assert image_size(gif) == (320, 200)
+    print("✅ PNG/GIF 크기 테스트 통과")
+
+
+def test_image_size_jpeg_webp():
+    """JPEG는 APP 세그먼트를 건너뛰고 SOF에서, WebP는 VP8X 헤더에서 판별"""
+    app0 = b'\xff\xe0' + struct.pack('>H', 16) + b'JFIF\x00' + b'\x00' * 9
+    sof0 = b'\xff\xc0' + struct.pack('>HBHH', 17, 8, 768, 1024) + b'\x03' + b'\x00' * 9
+    jpeg = b'\xff\xd8' + app0 + sof0
+    webp = b'RIFF' + b'\x00' * 4 + b'WEBP' + b'VP8X' + b'\x00' * 8 + (799).to_bytes(3, 'little') + (599).to_bytes(3, 'little')
+    assert image_size(jpeg) == (1024, 768)
+    assert image_size(webp) == (800, 600)
+    assert image_size(b'not an image') is None
+    print("✅ JPEG/WebP 크기 테스트 통과")
+
+
+def test_manifest_entry_omits_empty_values():
+    """매니페스트 항목은 값이 없는 키를 생략하고 해시는 앞 16자만"""
+    media = HobbyMedia(url='https://example.com/a.png', width=10, height=20, content_hash='a' * 64, version=2)
+    assert media.to_manifest() == {'url': 'https://example.com/a.png', 'w': 10, 'h': 20, 'hash': 'a' * 16, 'v': 2}
+    assert HobbyMedia(url='https://youtu.be/x', version=1).to_manifest() == {'url': 'https://youtu.be/x', 'v': 1}
+    print("✅ 매니페스트 항목 테스트 통과")
+
+
+if __name__ == '__main__':
+    print("🧪 미디어 매니페스트 테스트 시작\n")
+    test_image_size_png_gif()
+    test_image_size_jpeg_webp()
+    test_manifest_entry_omits_empty_values()
+    print("\n✅ 모든 테스트 완료!")
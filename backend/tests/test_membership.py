@@ -0,0 +1,63 @@
+"""
+모임 회원 수 카운터 테스트 스크립트
+서버 없이 임시 SQLite DB로 앱을 띄워, 가입/탈퇴 증분과 member_count 합산을 확인합니다.
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.models import db
+from app.models.hobby import Hobby, Gathering, GatheringMemberShard
+from app.models.user import User
+from app.services.membership import (
+    join_gathering, leave_gathering, member_counts, flush_member_counts
+)
+
+
+def _setup_gathering():
+    """회원 수 10인 모임과 사용자 5명 생성 → gathering_id"""
+    db.create_all()
+    hobby = Hobby(name='회원수 테스트 취미', category='운동')
+    db.session.add(hobby)
+    db.session.flush()
+    gathering = Gathering(hobby_id=hobby.hobby_id, name='회원수 테스트 모임', region='서울', member_count=10)
+    db.session.add(gathering)
+    for i in range(5):
+        db.session.add(User(username=f'member{i}', email=f'member{i}@test.com', password_hash='x'))
+    db.session.commit()
+    return gathering.gathering_id, [user.user_id for user in User.query.filter(User.username.like('member%'))]
+
+
+def test_member_count_flush(app):
+    """증분은 여러 샤드에 나뉘어 기록되고, 합산 후 member_count와 같아야 함"""
+    with app.app_context():
+        app.config['MEMBER_COUNT_SHARDS'] = 4
+        gathering_id, user_ids = _setup_gathering()
+
+        for user_id in user_ids:
+            assert join_gathering(gathering_id, user_id)
+        assert not join_gathering(gathering_id, user_ids[0])
+        assert leave_gathering(gathering_id, user_ids[1])
+        assert not leave_gathering(gathering_id, user_ids[1])
+        db.session.commit()
+
+        # 합산 전: member_count는 그대로, 현재 회원 수는 증분 반영
+        assert db.session.get(Gathering, gathering_id).member_count == 10
+        assert member_counts([gathering_id]) == {gathering_id: 14}
+
+        assert flush_member_counts(batch_size=2) == 1
+        db.session.expire_all()
+        assert db.session.get(Gathering, gathering_id).member_count == 14
+        assert member_counts([gathering_id]) == {gathering_id: 14}
+        assert GatheringMemberShard.query.count() == 0
+        print("✅ 회원 수 합산 테스트 통과")
+
+
+if __name__ == '__main__':
+    from conftest import load_app
+    app = load_app()
+    print("🧪 모임 회원 수 카운터 테스트 시작\n")
+    test_member_count_flush(app)
+    print("\n✅ 모든 테스트 완료!")
@@ -0,0 +1,134 @@
+"""
+삭제 데이터 정리 테스트 스크립트
+서버 없이 임시 SQLite DB로 앱을 띄워, 보관 기간이 지난 취미/사용자와 관련 행의 보관 테이블 이동과 묶음 단위 처리를 확인합니다.
+"""
+
+import os
+import sys
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import select, func
+
+from app.models import db
+from app.models.archive import ARCHIVE_TABLES
+from app.models.hobby import Hobby, UserHobbyRating, Gathering, GatheringMember
+from app.models.user import User
+from app.services import purge
+from app.services.membership import join_gathering, member_counts
+from app.services.rating_stats import rebuild_rating_stats, get_rating_stats
+
+
+def _setup_data():
+    """
+    보관 기간이 지난 삭제 취미 3개/사용자 1명과, 남아야 하는 취미/사용자 생성
+    → (남는 취미 ID, 최근 삭제 취미 ID, 남는 모임 ID)
+    """
+    db.create_all()
+    expired_at = datetime.utcnow() - timedelta(days=40)
+    kept = Hobby(name='정리 테스트 남는 취미', category='운동')
+    expired = [
+        Hobby(name=f'정리 테스트 삭제 취미{i}', category='운동', is_deleted=True, deleted_at=expired_at)
+        for i in range(3)
+    ]
+    recent = Hobby(name='정리 테스트 최근 삭제 취미', category='운동', is_deleted=True, deleted_at=datetime.utcnow())
+    user = User(username='purge_kept', email='purge_kept@test.com', password_hash='x')
+    deleted_user = User(
+        username='purge_deleted', email='purge_deleted@test.com', password_hash='x',
+        is_deleted=True, deleted_at=expired_at
+    )
+    db.session.add_all([kept, recent, user, deleted_user] + expired)
+    db.session.flush()
+
+    db.session.add_all([
+        UserHobbyRating(user_id=user.user_id, hobby_id=kept.hobby_id, rating=5),
+        UserHobbyRating(user_id=user.user_id, hobby_id=expired[0].hobby_id, rating=4),
+        UserHobbyRating(user_id=deleted_user.user_id, hobby_id=kept.hobby_id, rating=1)
+    ])
+    purged_gathering = Gathering(hobby_id=expired[0].hobby_id, name='정리 테스트 삭제 모임', region='서울')
+    kept_gathering = Gathering(hobby_id=kept.hobby_id, name='정리 테스트 남는 모임', region='서울')
+    db.session.add_all([purged_gathering, kept_gathering])
+    db.session.flush()
+    join_gathering(purged_gathering.gathering_id, user.user_id)
+    join_gathering(kept_gathering.gathering_id, user.user_id)
+    join_gathering(kept_gathering.gathering_id, deleted_user.user_id)
+    db.session.commit()
+    rebuild_rating_stats()
+    return kept.hobby_id, recent.hobby_id, kept_gathering.gathering_id
+
+
+def _archived(table_name):
+    return db.session.execute(select(func.count()).select_from(ARCHIVE_TABLES[table_name])).scalar()
+
+
+def test_purge_archives_rows(app):
+    """보관 기간이 지난 취미/사용자와 평가, 모임, 모임 가입 정보를 보관 테이블로 옮기고 집계에서 차감"""
+    with app.app_context():
+        kept_id, recent_id, kept_gathering_id = _setup_data()
+
+        dry_run = purge.purge_deleted(retention_days=30, dry_run=True)
+        assert (dry_run.hobbies, dry_run.users) == (3, 1)
+        assert Hobby.query.count() == 5
+
+        stats = purge.purge_deleted(retention_days=30, chunk_size=2)
+        assert stats == purge.PurgeStats(hobbies=3, users=1, ratings=2, responses=0, gatherings=1, members=2)
+
+        assert (_archived('hobbies'), _archived('users'), _archived('user_hobby_ratings')) == (3, 1, 2)
+        assert (_archived('gatherings'), _archived('gathering_members')) == (1, 2)
+
+        assert sorted(hobby.hobby_id for hobby in Hobby.query) == sorted([kept_id, recent_id])
+        assert User.query.count() == 1
+        assert UserHobbyRating.query.count() == 1
+        assert [gathering.gathering_id for gathering in Gathering.query] == [kept_gathering_id]
+        assert GatheringMember.query.count() == 1
+
+        stats = get_rating_stats([kept_id])[kept_id]
+        assert (stats['rating_count'], stats['average_rating']) == (1, 5.0)
+        assert member_counts([kept_gathering_id]) == {kept_gathering_id: 1}
+
+        # 다시 실행해도 옮길 행이 없음
+        assert purge.purge_deleted(retention_days=30) == purge.PurgeStats()
+        print("✅ 정리 보관 테스트 통과")
+
+
+def test_purge_chunks(app):
+    """chunk_size 단위로 나눠 커밋하며, 묶음 경계에서 빠지거나 두 번 처리되는 행이 없음"""
+    with app.app_context():
+        expired_at = datetime.utcnow() - timedelta(days=40)
+        # SQLite는 삭제된 가장 큰 ID를 다시 쓰므로 보관된 취미와 겹치지 않는 ID 지정 (MySQL AUTO_INCREMENT는 재사용하지 않음)
+        db.session.add_all([
+            Hobby(hobby_id=1000 + i, name=f'정리 묶음 테스트 취미{i}', category='예술', is_deleted=True, deleted_at=expired_at)
+            for i in range(5)
+        ])
+        db.session.commit()
+        archived_before = _archived('hobbies')
+
+        chunks = []
+        purge_hobbies = purge._purge_hobbies
+
+        def record_chunk(hobby_ids, now, stats):
+            chunks.append(list(hobby_ids))
+            purge_hobbies(hobby_ids, now, stats)
+
+        purge._purge_hobbies = record_chunk
+        try:
+            stats = purge.purge_deleted(retention_days=30, chunk_size=2)
+        finally:
+            purge._purge_hobbies = purge_hobbies
+
+        assert [len(chunk) for chunk in chunks] == [2, 2, 1]
+        assert len({hobby_id for chunk in chunks for hobby_id in chunk}) == 5
+        assert stats.hobbies == 5
+        assert _archived('hobbies') - archived_before == 5
+        assert Hobby.query.filter(Hobby.name.like('정리 묶음 테스트 취미%')).count() == 0
+        print("✅ 정리 묶음 처리 테스트 통과")
+
+
+if __name__ == '__main__':
+    from conftest import load_app
+    app = load_app()
+    print("🧪 삭제 데이터 정리 테스트 시작\n")
+    test_purge_archives_rows(app)
+    test_purge_chunks(app)
+    print("\n✅ 모든 테스트 완료!")
@@ -0,0 +1,55 @@
+"""
+평가 통계 카운터 테스트 스크립트
+서버 없이 별점별 평가 수로부터 평균, 히스토그램, 중앙값, 백분위수 계산을 테스트합니다.
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.models.hobby import HobbyRatingStats
+
+
+def make_stats(counts):
+    return HobbyRatingStats(
+        count_1=counts[0], count_2=counts[1], count_3=counts[2], count_4=counts[3], count_5=counts[4],
+        rating_count=sum(counts),
+        rating_sum=sum(star * count for star, count in enumerate(counts, start=1))
+    )
+
+
+def test_average_and_histogram():
+    """평균과 별점별 평가 수"""
+    stats = make_stats([1, 0, 0, 1, 2])
+    assert stats.average() == 3.75
+    assert stats.histogram() == {'1': 1, '2': 0, '3': 0, '4': 1, '5': 2}
+    print("✅ 평균/히스토그램 테스트 통과")
+
+
+def test_median_and_percentiles():
+    """중앙값 (짝수 개면 가운데 두 값의 평균)과 nearest-rank 백분위수"""
+    stats = make_stats([1, 1, 1, 1, 0])
+    assert stats.median() == 2.5
+    assert stats.percentiles() == {'p25': 1, 'p75': 3, 'p90': 4}
+
+    stats = make_stats([0, 0, 1, 0, 2])
+    assert stats.median() == 5.0
+    print("✅ 중앙값/백분위수 테스트 통과")
+
+
+def test_empty_stats():
+    """평가가 없으면 0 또는 None"""
+    stats = HobbyRatingStats.empty()
+    assert stats.average() == 0.0
+    assert stats.median() is None
+    assert stats.percentiles() == {'p25': None, 'p75': None, 'p90': None}
+    print("✅ 빈 통계 테스트 통과")
+
+
+if __name__ == '__main__':
+    print("🧪 평가 통계 카운터 테스트 시작\n")
+    test_average_and_histogram()
+    test_median_and_percentiles()
+    test_empty_stats()
+    print("\n✅ 모든 테스트 완료!")
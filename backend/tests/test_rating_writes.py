@@ -0,0 +1,93 @@
+"""
+평가 쓰기 테스트 스크립트
+서버 없이 임시 SQLite DB로 앱을 띄워, 일괄 평가 업서트와 experienced 입력 검증을 확인합니다.
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from conftest import auth_headers
+from app.models import db
+from app.models.hobby import Hobby, UserHobbyRating
+from app.models.user import User
+
+
+def _setup_data():
+    """취미 2개와 사용자 1명 생성 → (hobby_ids, user_id)"""
+    db.create_all()
+    hobbies = [Hobby(name=f'평가 쓰기 테스트 취미{i}', category='운동') for i in range(2)]
+    user = User(username='rating_writer', email='rating_writer@test.com', password_hash='x')
+    db.session.add_all(hobbies + [user])
+    db.session.commit()
+    return [hobby.hobby_id for hobby in hobbies], user.user_id
+
+
+def _ratings(user_id):
+    return {
+        rating.hobby_id: (rating.rating, rating.experienced)
+        for rating in UserHobbyRating.query.filter_by(user_id=user_id)
+    }
+
+
+def test_batch_upsert(app):
+    """일괄 평가는 새 평가를 만들고 기존 평가는 중복 없이 수정 ("false" 문자열은 False로 저장)"""
+    with app.app_context():
+        (first_id, second_id), user_id = _setup_data()
+
+    client = app.test_client()
+    headers = auth_headers(app, user_id)
+
+    response = client.post('/api/hobbies/ratings/batch', headers=headers, json={'ratings': [
+        {'hobby_id': first_id, 'rating': 5, 'experienced': 'false'},
+        {'hobby_id': second_id, 'rating': 3, 'experienced': 'true'}
+    ]})
+    assert response.status_code == 200
+    data = response.get_json()['data']
+    assert data['created_count'] == 2 and data['updated_count'] == 0
+    with app.app_context():
+        assert _ratings(user_id) == {first_id: (5, False), second_id: (3, True)}
+
+    response = client.post('/api/hobbies/ratings/batch', headers=headers, json={'ratings': [
+        {'hobby_id': first_id, 'rating': 2, 'experienced': 1}
+    ]})
+    assert response.status_code == 200
+    data = response.get_json()['data']
+    assert data['created_count'] == 0 and data['updated_count'] == 1
+    assert data['ratings'][0]['status'] == 'updated'
+    assert data['ratings'][0]['updated_stats']['rating_count'] == 1
+    with app.app_context():
+        assert _ratings(user_id) == {first_id: (2, True), second_id: (3, True)}
+    print("✅ 일괄 평가 업서트 테스트 통과")
+
+
+def test_batch_validation(app):
+    """잘못된 experienced 값이나 없는 취미가 있으면 아무것도 저장하지 않고 항목별 오류 반환"""
+    with app.app_context():
+        user = User(username='rating_validator', email='rating_validator@test.com', password_hash='x')
+        db.session.add(user)
+        db.session.commit()
+        user_id = user.user_id
+        hobby_id = Hobby.query.first().hobby_id
+
+    response = app.test_client().post('/api/hobbies/ratings/batch', headers=auth_headers(app, user_id), json={'ratings': [
+        {'hobby_id': hobby_id, 'rating': 4, 'experienced': 'maybe'},
+        {'hobby_id': hobby_id, 'rating': 4},
+        {'hobby_id': 999999, 'rating': 4}
+    ]})
+    assert response.status_code == 400
+    errors = response.get_json()['validation_errors']
+    assert [error['index'] for error in errors] == [0, 2]
+    with app.app_context():
+        assert _ratings(user_id) == {}
+    print("✅ 일괄 평가 검증 테스트 통과")
+
+
+if __name__ == '__main__':
+    from conftest import load_app
+    app = load_app()
+    print("🧪 평가 쓰기 테스트 시작\n")
+    test_batch_upsert(app)
+    test_batch_validation(app)
+    print("\n✅ 모든 테스트 완료!")
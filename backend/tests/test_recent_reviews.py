@@ -0,0 +1,85 @@
+"""
+최근 리뷰 테스트 스크립트
+서버 없이 임시 SQLite DB로 앱을 띄워, 평가 API로 리뷰를 쓰고 최근 리뷰 목록의 개수 제한과 빈 자리 채우기를 확인합니다.
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from conftest import auth_headers
+from app.models import db
+from app.models.hobby import Hobby, HobbyRecentReview
+from app.models.user import User
+
+REVIEWERS = HobbyRecentReview.MAX_PER_HOBBY + 2
+
+
+def _setup_data():
+    """취미 1개와 리뷰 작성자 생성 → (hobby_id, user_ids)"""
+    db.create_all()
+    hobby = Hobby(name='최근 리뷰 테스트 취미', category='예술')
+    db.session.add(hobby)
+    users = [
+        User(username=f'reviewer{i}', email=f'reviewer{i}@test.com', password_hash='x')
+        for i in range(REVIEWERS)
+    ]
+    db.session.add_all(users)
+    db.session.commit()
+    return hobby.hobby_id, [user.user_id for user in users]
+
+
+def _recent_texts(client, hobby_id):
+    response = client.get(f'/api/hobbies/{hobby_id}')
+    assert response.status_code == 200
+    return [review['review_text'] for review in response.get_json()['data']['recent_reviews']]
+
+
+def test_recent_reviews_trim_and_refill(app):
+    """최대 개수를 넘으면 오래된 리뷰가 빠지고, 리뷰를 지우면 원본 평가에서 다시 채움"""
+    with app.app_context():
+        hobby_id, user_ids = _setup_data()
+
+    client = app.test_client()
+    for i, user_id in enumerate(user_ids):
+        response = client.post(
+            f'/api/hobbies/{hobby_id}/rate',
+            json={'rating': 5, 'review_text': f'리뷰 {i}'},
+            headers=auth_headers(app, user_id)
+        )
+        assert response.status_code == 200
+
+    # 최신 5개만 유지 (최신순)
+    expected = [f'리뷰 {i}' for i in reversed(range(REVIEWERS))][:HobbyRecentReview.MAX_PER_HOBBY]
+    assert _recent_texts(client, hobby_id) == expected
+    with app.app_context():
+        assert HobbyRecentReview.query.filter_by(hobby_id=hobby_id).count() == HobbyRecentReview.MAX_PER_HOBBY
+
+    # 목록에 있는 리뷰 수정: 자리 유지
+    response = client.post(
+        f'/api/hobbies/{hobby_id}/rate',
+        json={'rating': 4, 'review_text': '수정된 리뷰'},
+        headers=auth_headers(app, user_ids[-2])
+    )
+    assert response.status_code == 200
+    expected[1] = '수정된 리뷰'
+    assert _recent_texts(client, hobby_id) == expected
+
+    # 최신 리뷰를 지우면 목록에서 빠지고 밀려났던 리뷰 중 가장 최근 것으로 채움
+    response = client.post(
+        f'/api/hobbies/{hobby_id}/rate',
+        json={'rating': 5, 'review_text': ''},
+        headers=auth_headers(app, user_ids[-1])
+    )
+    assert response.status_code == 200
+    assert _recent_texts(client, hobby_id) == expected[1:] + [f'리뷰 {REVIEWERS - HobbyRecentReview.MAX_PER_HOBBY - 1}']
+    print("✅ 최근 리뷰 개수 제한/채우기 테스트 통과")
+
+
+if __name__ == '__main__':
+    from conftest import load_app
+    app = load_app()
+    print("🧪 최근 리뷰 테스트 시작\n")
+    test_recent_reviews_trim_and_refill(app)
+    print("\n✅ 모든 테스트 완료!")
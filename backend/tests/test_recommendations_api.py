@@ -130,6 +130,12 @@ def test_recommendations_api():
                            params={'limit': 5})
     print_response("인기 취미 TOP 5", response)
 
+    # 나와 비슷한 사람들의 인기 취미 (인증 필요)
+    response = requests.get(f'{BASE_URL}/api/recommendations/popular',
+                           params={'limit': 5, 'segment': 'me'},
+                           headers=headers)
+    print_response("나와 비슷한 사람들의 인기 취미 TOP 5", response)
+
     # ========================================
     # 4. 사용자 맞춤 추천 (인증 필요)
     # ========================================
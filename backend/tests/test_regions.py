@@ -0,0 +1,76 @@
+"""
+지역 사전 테스트 스크립트
+서버 없이 지역명 해석 인덱스(별칭, 앞부분 일치, 계층 입력)를 테스트합니다.
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.services.regions import RegionIndex
+
+# (region_id, parent_id, level, name, aliases)
+ROWS = [
+    (1, None, 1, '서울특별시', '서울,서울시'),
+    (2, None, 1, '광주광역시', '광주,광주시'),
+    (3, None, 1, '경기도', '경기'),
+    (11, 1, 2, '강남구', None),
+    (12, 1, 2, '강서구', None),
+    (13, 1, 2, '종로구', None),
+    (21, 2, 2, '서구', None),
+    (31, 3, 2, '광주시', None),
+    (32, 3, 2, '수원시', None),
+]
+
+
+def test_resolve_alias_and_children():
+    """시/도 별칭은 하위 지역까지 포함"""
+    index = RegionIndex(ROWS)
+    assert index.resolve('서울') == {1, 11, 12, 13}
+    assert index.resolve('서울특별시') == {1, 11, 12, 13}
+    assert index.resolve('종로구') == {13}
+    assert index.resolve('해외') == set()
+    assert index.resolve('') == set()
+    print("✅ 별칭/하위 지역 테스트 통과")
+
+
+def test_resolve_prefix():
+    """앞부분 일치 (두 글자 이상), 한 글자는 정확히 일치할 때만"""
+    index = RegionIndex(ROWS)
+    assert index.resolve('강남') == {11}
+    assert index.resolve('강') == set()
+    assert index.resolve('수원') == {32}
+    print("✅ 앞부분 일치 테스트 통과")
+
+
+def test_resolve_hierarchy_and_ambiguity():
+    """여러 단어는 상위 지역 안에서 해석, 같은 이름은 상위 단계 우선"""
+    index = RegionIndex(ROWS)
+    assert index.resolve('광주') == {2, 21}
+    assert index.resolve('경기 광주') == {31}
+    assert index.resolve('서울 강') == set()
+    assert index.resolve('서울 강서') == {12}
+    assert index.province_for('광주시') == 2
+    assert index.province_for('강남구') is None
+    print("✅ 계층 입력 테스트 통과")
+
+
+def test_district_in_dictionary_only():
+    """주소의 시/군/구는 해당 시/도의 사전에 있는 이름만 인정 ('3시', '도시' 같은 단어 무시)"""
+    index = RegionIndex(ROWS)
+    assert index.district_in('서울특별시 종로구 세종대로 172', 1) == 13
+    assert index.district_in('서울 도시 3시 광장', 1) is None
+    assert index.district_in('경기 광주시 오포읍', 3) == 31
+    assert index.district_in('경기 광주시 오포읍', 1) is None
+    assert index.district_in('', 1) is None
+    print("✅ 시/군/구 사전 테스트 통과")
+
+
+if __name__ == '__main__':
+    print("🧪 지역 사전 테스트 시작\n")
+    test_resolve_alias_and_children()
+    test_resolve_prefix()
+    test_resolve_hierarchy_and_ambiguity()
+    test_district_in_dictionary_only()
+    print("\n✅ 모든 테스트 완료!")
@@ -0,0 +1,73 @@
+"""
+모임 일정 해석 테스트 스크립트
+서버 없이 schedule_info 자유 입력을 요일/시간대/주기로 해석하는 규칙과 기간 입력을 테스트합니다.
+"""
+
+import os
+import sys
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.services.schedules import ScheduleSlot, parse_schedule_info, parse_meets_between
+
+
+def test_parse_weekly():
+    """요일 여러 개 + 시간대, 끝 시간이 없으면 2시간"""
+    assert parse_schedule_info('매주 화, 목 19:00~21:00') == [
+        ScheduleSlot(1, 1140, 1260, 'weekly', None),
+        ScheduleSlot(3, 1140, 1260, 'weekly', None),
+    ]
+    assert parse_schedule_info('월수금 오후 7시-9시 (회비 10000원, 정원 20명)') == [
+        ScheduleSlot(day, 1140, 1260, 'weekly', None) for day in (0, 2, 4)
+    ]
+    assert parse_schedule_info('평일 오전 9시 30분')[0] == ScheduleSlot(0, 570, 690, 'weekly', None)
+    assert parse_schedule_info('주말') == [
+        ScheduleSlot(5, 0, 1440, 'weekly', None),
+        ScheduleSlot(6, 0, 1440, 'weekly', None),
+    ]
+    print("✅ 매주 일정 해석 테스트 통과")
+
+
+def test_parse_biweekly_and_monthly():
+    """격주, 매월 N째 주/마지막 주, 주기가 바뀌는 입력"""
+    assert parse_schedule_info('격주 일요일 오전 10시') == [ScheduleSlot(6, 600, 720, 'biweekly', None)]
+    assert parse_schedule_info('매월 첫째 주 토요일 오후 2시~4시') == [ScheduleSlot(5, 840, 960, 'monthly', 1)]
+    assert parse_schedule_info('매주 토요일 10시, 매월 마지막 주 일요일 14:00-16:00') == [
+        ScheduleSlot(5, 600, 720, 'weekly', None),
+        ScheduleSlot(6, 840, 960, 'monthly', -1),
+    ]
+    print("✅ 격주/매월 일정 해석 테스트 통과")
+
+
+def test_parse_ignores_non_schedule_text():
+    """요일이 아닌 단어(수영, 1일, 매월)와 빈 입력"""
+    assert parse_schedule_info('수영 모임') == []
+    assert parse_schedule_info('1일 모임') == []
+    assert parse_schedule_info('') == []
+    assert parse_schedule_info(None) == []
+    print("✅ 일정 외 텍스트 테스트 통과")
+
+
+def test_parse_meets_between():
+    """끝이 날짜만 있으면 그날 끝까지, 시간대가 있으면 KST로 변환"""
+    assert parse_meets_between('2026-10-24,2026-10-25') == (datetime(2026, 10, 24), datetime(2026, 10, 26))
+    assert parse_meets_between('2026-10-24T00:00+00:00,2026-10-24T03:00+00:00') == (
+        datetime(2026, 10, 24, 9), datetime(2026, 10, 24, 12)
+    )
+    for value in ('2026-10-24', '2026-10-25,2026-10-24', '2026-10-01,2026-12-01', 'x,y'):
+        try:
+            parse_meets_between(value)
+        except ValueError:
+            continue
+        raise AssertionError(f'{value}는 거부되어야 함')
+    print("✅ 기간 입력 테스트 통과")
+
+
+if __name__ == '__main__':
+    print("🧪 모임 일정 해석 테스트 시작\n")
+    test_parse_weekly()
+    test_parse_biweekly_and_monthly()
+    test_parse_ignores_non_schedule_text()
+    test_parse_meets_between()
+    print("\n✅ 모든 테스트 완료!")
@@ -0,0 +1,88 @@
+"""
+세그먼트 평가 집계 테스트 스크립트
+서버 없이 임시 SQLite DB로 앱을 띄워, 평가 저장 시 세그먼트 집계와 프로필 변경 시 세그먼트 이동을 확인합니다.
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from conftest import auth_headers
+from app.models import db
+from app.models.hobby import Hobby, HobbySegmentRating
+from app.models.user import User
+from app.services.regions import seed_provinces
+from app.services.segment_ratings import rebuild_segment_ratings
+
+POPULAR_URL = '/api/recommendations/popular?segment=me'
+
+
+def _setup_data():
+    """시/도, 취미 2개, 같은 세그먼트의 사용자 2명 생성 → (hobby_ids, user_ids)"""
+    db.create_all()
+    seed_provinces()
+    hobbies = [Hobby(name=f'세그먼트 테스트 취미{i}', category='운동') for i in range(2)]
+    users = [
+        User(username='segment_a', email='segment_a@test.com', password_hash='x', age=63, gender='female', location='서울 강남구'),
+        User(username='segment_b', email='segment_b@test.com', password_hash='x', age=65, gender='female', location='서울시')
+    ]
+    db.session.add_all(hobbies + users)
+    db.session.commit()
+    return [hobby.hobby_id for hobby in hobbies], [user.user_id for user in users]
+
+
+def _popular(client, headers):
+    """세그먼트 인기 취미 → (세그먼트, [(hobby_id, rating_count)])"""
+    response = client.get(POPULAR_URL, headers=headers)
+    assert response.status_code == 200
+    data = response.get_json()['data']
+    return data['segment'], [(item['hobby']['hobby_id'], item['rating_count']) for item in data['popular_hobbies']]
+
+
+def _segment_rows():
+    return sorted(
+        (row.age_band, row.gender, row.region, row.hobby_id, row.rating_count, row.rating_sum)
+        for row in HobbySegmentRating.query.filter(HobbySegmentRating.rating_count > 0)
+    )
+
+
+def test_segment_move_on_profile_change(app):
+    """지역이 바뀌면 기존 평가가 새 세그먼트로 옮겨지고, 결과는 원본 평가로 재구성한 것과 같음"""
+    with app.app_context():
+        (first_id, second_id), (user_a, user_b) = _setup_data()
+
+    client = app.test_client()
+    headers_a, headers_b = auth_headers(app, user_a), auth_headers(app, user_b)
+    client.post('/api/hobbies/ratings/batch', headers=headers_a, json={'ratings': [
+        {'hobby_id': first_id, 'rating': 5},
+        {'hobby_id': second_id, 'rating': 1}
+    ]})
+    client.post(f'/api/hobbies/{second_id}/rate', headers=headers_b, json={'rating': 5})
+
+    # '서울 강남구'와 '서울시'는 같은 시/도 세그먼트, 베이지안 평균순
+    segment, popular = _popular(client, headers_b)
+    assert segment == {'age_band': '60s', 'gender': 'female', 'region': '서울특별시'}
+    assert popular == [(first_id, 1), (second_id, 2)]
+
+    response = client.put(f'/api/users/{user_a}', headers=headers_a, json={'location': '부산 해운대구'})
+    assert response.status_code == 200
+
+    assert _popular(client, headers_b)[1] == [(second_id, 1)]
+    segment, popular = _popular(client, headers_a)
+    assert segment['region'] == '부산광역시'
+    assert popular == [(first_id, 1), (second_id, 1)]
+
+    with app.app_context():
+        moved = _segment_rows()
+        rebuild_segment_ratings()
+        assert _segment_rows() == moved
+    print("✅ 프로필 변경 세그먼트 이동 테스트 통과")
+
+
+if __name__ == '__main__':
+    from conftest import load_app
+    app = load_app()
+    print("🧪 세그먼트 평가 집계 테스트 시작\n")
+    test_segment_move_on_profile_change(app)
+    print("\n✅ 모든 테스트 완료!")
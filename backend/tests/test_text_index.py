@@ -0,0 +1,49 @@
+"""
+텍스트 색인 토큰화 테스트 스크립트
+서버 없이 한글 바이그램/영문 단어 색인어와 원문 확인 규칙을 테스트합니다.
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.services.text_index import tokenize, query_terms, matches
+
+
+def test_tokenize_korean_bigrams():
+    """한글 2글자 단위(1글자 단어는 글자), 영문/숫자는 단어 단위 (소문자), 색인과 검색은 같은 규칙"""
+    assert query_terms('수채화 그리기') == {'수채', '채화', '그리', '리기'}
+    assert query_terms('Yoga 2회차') == {'yoga', '2', '회차'}
+    assert query_terms('차 한잔') == {'차', '한잔'}
+    assert query_terms('!!') == set()
+    assert tokenize('수채화') == {'수채', '채화'}
+    assert tokenize('Yoga 2회차') == {'yoga', '2', '회차'}
+    print("✅ 토큰화 테스트 통과")
+
+
+def test_query_terms_subset_of_text():
+    """검색어의 색인어는 해당 단어를 포함한 원문의 색인어에 포함됨"""
+    text = '수채화 그리기가 정말 즐거웠어요'
+    assert query_terms('그리기') <= tokenize(text)
+    assert query_terms('즐거웠') <= tokenize(text)
+    # 한 글자 검색어는 색인에 없고, 그 글자로 시작하거나 끝나는 바이그램으로 찾음 (resolve_terms)
+    assert query_terms('차') == {'차'}
+    assert '녹차' in tokenize('녹차 마시기')
+    print("✅ 검색어 색인어 포함 테스트 통과")
+
+
+def test_matches_filters_reordered_bigrams():
+    """바이그램이 모두 있어도 단어가 이어져 있지 않으면 제외"""
+    assert query_terms('가나다') <= tokenize('가나 나다')
+    assert not matches('가나 나다', '가나다')
+    assert matches('Yoga 수업 즐거웠어요', 'yoga 즐거')
+    print("✅ 원문 확인 테스트 통과")
+
+
+if __name__ == '__main__':
+    print("🧪 텍스트 색인 테스트 시작\n")
+    test_tokenize_korean_bigrams()
+    test_query_terms_subset_of_text()
+    test_matches_filters_reordered_bigrams()
+    print("\n✅ 모든 테스트 완료!")
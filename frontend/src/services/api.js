@@ -40,8 +40,10 @@ export const api = {
   // 취미
   getHobbies: (params) => apiClient.get('/hobbies', { params }),
   getHobbyDetail: (id) => apiClient.get(`/hobbies/${id}`),
+  getHobbyBundle: (id, params) => apiClient.get(`/hobbies/${id}/bundle`, { params }),
   rateHobby: (id, ratingData) => apiClient.post(`/hobbies/${id}/rate`, ratingData),
   getCategories: () => apiClient.get('/hobbies/categories'),
+  getMediaManifest: (config) => apiClient.get('/hobbies/media-manifest', config),
 
   // 추천
   getRecommendations: (params) => apiClient.get('/recommendations', { params }),
@@ -53,6 +55,11 @@ export const api = {
   getGatheringDetail: (id) => apiClient.get(`/gatherings/${id}`),
   createGathering: (data) => apiClient.post('/gatherings', data),
   getRegions: () => apiClient.get('/gatherings/regions'),
+  getGatheringFacets: () => apiClient.get('/gatherings/facets'),
+  getNearbyGatherings: (params) => apiClient.get('/gatherings/nearby', { params }),
+  getRecommendedGatherings: (params) => apiClient.get('/gatherings/recommended', { params }),
+  joinGathering: (id) => apiClient.post(`/gatherings/${id}/join`),
+  leaveGathering: (id) => apiClient.post(`/gatherings/${id}/leave`),
 };
 
 export default apiClient;
\ No newline at end of file